@@ -5,6 +5,10 @@ Generates complete Ableton Live projects with:
 - .als file with configured tracks
 - MIDI files for each track
 - Arrangement markers for song structure
+
+Generators produce note events in memory (self.track_events). With
+embed_midi they are written straight into the .als as clips; the .mid files
+are a side output that can be switched off with export_midi=False.
 """
 
 import gzip
@@ -12,7 +16,11 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 import copy
 import json
-from typing import Dict, List, Optional
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from config import Config, DEFAULT_CONFIG
@@ -23,13 +31,14 @@ from transition_generator import TransitionGenerator, TransitionType
 from xml_utils import (
     analyze_ids, generate_safe_ids, update_ids_with_offset,
     update_next_pointee_id, set_track_name, validate_als_structure,
-    IdAnalysis, ValidationResult
+    IdAllocator, IdAnalysis, ValidationResult
 )
-from clip_embedder import ClipEmbedder
+from clip_embedder import ClipEmbedder, events_to_notes
 from device_library import add_devices_to_template
+from template_cache import load_template
 
 # Default features (always included)
-from texture_midi_export import generate_textures_for_song
+from texture_midi_export import TextureMIDIExporter, generate_song_textures
 from stem_arranger import StemArranger, GENRE_TEMPLATES
 
 
@@ -56,9 +65,14 @@ class AbletonProject:
         "texture": 60,    # Purple
     }
 
+    # General MIDI programs written to exported .mid files
+    TRACK_PROGRAMS = {
+        "lead": 81,   # Lead synth
+    }
+
     def __init__(self, spec: SongSpec, config: Config = None,
                  create_tracks: bool = False, embed_midi: bool = False,
-                 add_devices: bool = False,
+                 add_devices: bool = False, export_midi: bool = True,
                  enable_textures: bool = True, enable_stem_arranger: bool = True,
                  enable_sidechain: bool = False, enable_sends: bool = False,
                  enable_mix_templates: bool = False, enable_vst_presets: bool = False):
@@ -69,6 +83,8 @@ class AbletonProject:
         self.create_tracks = create_tracks  # Whether to create/rename tracks in .als
         self.embed_midi = embed_midi  # Whether to embed MIDI clips in .als
         self.add_devices = add_devices  # Whether to add instrument devices to tracks
+        # Whether to also write .mid files; without embedding they are the only output
+        self.export_midi = export_midi or not embed_midi
 
         # Default features (included by default)
         self.enable_textures = enable_textures
@@ -83,6 +99,9 @@ class AbletonProject:
         # Clip splitting
         self.split_sections = False  # Set via set_split_sections()
 
+        # Generated note events per lowercase track name (filled by generate())
+        self.track_events: Dict[str, List[Tuple]] = {}
+
         # Initialize generators
         self.midi_gen = MIDIGenerator(GeneratorConfig(
             key=spec.key,
@@ -124,7 +143,6 @@ class AbletonProject:
         """
         # Create directories
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.midi_dir.mkdir(parents=True, exist_ok=True)
 
         print(f"\nGenerating project: {self.spec.name}")
         print(f"Output directory: {self.output_dir}")
@@ -134,14 +152,20 @@ class AbletonProject:
             self._apply_stem_arrangement()
             print("Applied stem arrangement")
 
-        # Generate all MIDI files
-        midi_files = self._generate_all_midi()
-        print(f"Generated {len(midi_files)} MIDI files")
+        # Generate all MIDI tracks
+        self.track_events = self._generate_all_midi()
+        print(f"Generated {len(self.track_events)} MIDI tracks")
 
-        # Generate texture MIDI files (default feature)
+        # Generate texture tracks (default feature)
         if self.enable_textures:
-            texture_files = self._generate_textures()
-            print(f"Generated {len(texture_files)} texture files")
+            textures = self._generate_textures()
+            self.track_events.update(textures)
+            print(f"Generated {len(textures)} texture tracks")
+
+        # Optionally write .mid files (always without a template to embed into)
+        if self.export_midi or not self._find_template().exists():
+            midi_files = self._export_midi_files()
+            print(f"Wrote {len(midi_files)} MIDI files")
 
         # Generate optional mixing configuration
         mix_config = self._generate_mix_config()
@@ -177,15 +201,69 @@ class AbletonProject:
                 existing = set(t.lower() for t in section.active_tracks)
                 section.active_tracks = list(existing | active_stems)
 
-    def _generate_textures(self) -> Dict[str, Path]:
-        """Generate texture MIDI files."""
+    def _generate_textures(self) -> Dict[str, List[Tuple]]:
+        """Generate texture events per texture type."""
         try:
-            files = generate_textures_for_song(self.spec, self.midi_dir)
-            return files
+            textures = generate_song_textures(self.spec)
+            return {tex_type: events for tex_type, events in textures.items() if events}
         except Exception as e:
             print(f"  Warning: Texture generation failed: {e}")
             return {}
 
+    def _export_midi_files(self) -> Dict[str, Path]:
+        """Write every generated track to midi/<track>.mid."""
+        self.midi_dir.mkdir(parents=True, exist_ok=True)
+        files = {}
+        for track_name, events in self.track_events.items():
+            midi_path = self.midi_dir / f"{track_name}.mid"
+            title = "FX" if track_name == "fx" else track_name.replace("_", " ").title()
+            self._write_midi_file(midi_path, events, title, self.TRACK_PROGRAMS.get(track_name))
+            files[track_name] = midi_path
+        return files
+
+    def _write_midi_file(self, midi_path: Path, events: List[Tuple],
+                         track_name: str, program: Optional[int] = None):
+        """Write generator events to a single-track .mid file."""
+        from mido import MidiFile, MidiTrack, MetaMessage, Message
+        import mido
+
+        mid = MidiFile(ticks_per_beat=self.config.TICKS_PER_BEAT)
+        track = MidiTrack()
+        mid.tracks.append(track)
+
+        # Add tempo and track name
+        tempo_us = mido.bpm2tempo(self.spec.tempo)
+        track.append(MetaMessage("set_tempo", tempo=tempo_us, time=0))
+        track.append(MetaMessage("track_name", name=track_name, time=0))
+        if program is not None:
+            track.append(Message("program_change", program=program, time=0))
+
+        # Sort events and convert to MIDI messages
+        sorted_events = sorted(events, key=lambda x: x[0])
+        current_time = 0
+
+        for event in sorted_events:
+            abs_time, msg_type, *params = event
+            delta = abs_time - current_time
+
+            if msg_type == "note_on":
+                note, velocity = params[:2]
+                track.append(Message("note_on", note=note, velocity=velocity, time=delta))
+            elif msg_type == "note_off":
+                note = params[0] if params else 0
+                track.append(Message("note_off", note=note, velocity=0, time=delta))
+            elif msg_type == "cc":
+                control, value = params[:2]
+                track.append(Message("control_change", control=control, value=value, time=delta))
+            elif msg_type == "pitch_bend":
+                track.append(Message("pitchwheel", pitch=params[0], time=delta))
+            else:
+                continue
+            current_time = abs_time
+
+        track.append(MetaMessage("end_of_track", time=0))
+        mid.save(str(midi_path))
+
     def _generate_mix_config(self) -> Optional[Dict]:
         """Generate optional mixing configuration based on enabled features."""
         mix_config = {}
@@ -262,9 +340,9 @@ class AbletonProject:
 
         return mix_config if mix_config else None
 
-    def _generate_all_midi(self) -> Dict[str, Path]:
-        """Generate MIDI files for all tracks."""
-        files = {}
+    def _generate_all_midi(self) -> Dict[str, List[Tuple]]:
+        """Generate note events for all MIDI tracks."""
+        track_events = {}
 
         # Pre-generate all transitions
         all_transitions = self._generate_all_transitions()
@@ -278,20 +356,20 @@ class AbletonProject:
             print(f"  Generating {track_name}...")
 
             if track_name == "lead":
-                midi_path = self._generate_lead_track(all_transitions)
+                events = self._generate_lead_track(all_transitions)
             else:
-                midi_path = self._generate_pattern_track(track_name, all_transitions)
+                events = self._generate_pattern_track(track_name, all_transitions)
 
-            if midi_path:
-                files[track_name] = midi_path
+            if events:
+                track_events[track_name] = events
 
         # Generate FX tracks (riser, crash) if transitions have them
-        fx_path = self._generate_fx_track(all_transitions)
-        if fx_path:
-            files['fx'] = fx_path
+        fx_events = self._generate_fx_track(all_transitions)
+        if fx_events:
+            track_events['fx'] = fx_events
             print(f"  Generated fx (risers/crashes)")
 
-        return files
+        return track_events
 
     def _generate_all_transitions(self) -> Dict[int, dict]:
         """
@@ -330,20 +408,8 @@ class AbletonProject:
 
         return all_transitions
 
-    def _generate_lead_track(self, all_transitions: Dict[int, dict] = None) -> Path:
-        """Generate lead/melody track following song structure with chord awareness."""
-        from mido import MidiFile, MidiTrack, MetaMessage
-        import mido
-
-        mid = MidiFile(ticks_per_beat=self.config.TICKS_PER_BEAT)
-        track = MidiTrack()
-        mid.tracks.append(track)
-
-        # Add tempo
-        tempo_us = mido.bpm2tempo(self.spec.tempo)
-        track.append(MetaMessage("set_tempo", tempo=tempo_us, time=0))
-        track.append(MetaMessage("track_name", name="Lead", time=0))
-
+    def _generate_lead_track(self, all_transitions: Dict[int, dict] = None) -> List[Tuple]:
+        """Generate lead/melody events following song structure with chord awareness."""
         # Get chord progression from spec or use default
         chord_progression = self.spec.chord_progression if self.spec.chord_progression else ["Am", "F", "C", "G"]
 
@@ -371,24 +437,11 @@ class AbletonProject:
                     note.start += section.start_bar * 4
                 all_notes.extend(notes)
 
-        # Convert to MIDI track
-        if all_notes:
-            melody_track = self.melody_gen.to_midi_track(all_notes)
-            for msg in melody_track:
-                if not msg.is_meta:
-                    track.append(msg.copy())
-
-        track.append(MetaMessage("end_of_track", time=0))
-
-        midi_path = self.midi_dir / "lead.mid"
-        mid.save(str(midi_path))
-        return midi_path
-
-    def _generate_fx_track(self, all_transitions: Dict[int, dict]) -> Optional[Path]:
-        """Generate FX track with risers and crashes from transitions."""
-        from mido import MidiFile, MidiTrack, MetaMessage, Message
-        import mido
+        # Convert to events (merges overlapping notes on the same pitch)
+        return self.melody_gen.to_events(all_notes, self.config.TICKS_PER_BEAT)
 
+    def _generate_fx_track(self, all_transitions: Dict[int, dict]) -> List[Tuple]:
+        """Generate FX events with risers and crashes from transitions."""
         all_events = []
 
         # Collect riser and crash events from all transitions
@@ -400,45 +453,10 @@ class AbletonProject:
             if 'crash' in transitions:
                 all_events.extend(transitions['crash'])
 
-        if not all_events:
-            return None
-
-        # Create MIDI file
-        mid = MidiFile(ticks_per_beat=self.config.TICKS_PER_BEAT)
-        track = MidiTrack()
-        mid.tracks.append(track)
-
-        tempo_us = mido.bpm2tempo(self.spec.tempo)
-        track.append(MetaMessage("set_tempo", tempo=tempo_us, time=0))
-        track.append(MetaMessage("track_name", name="FX", time=0))
-
-        # Sort and convert events
-        sorted_events = sorted(all_events, key=lambda x: x[0])
-        current_time = 0
-
-        for event in sorted_events:
-            abs_time, msg_type, *params = event
-            delta = abs_time - current_time
-            current_time = abs_time
-
-            if msg_type == "note_on":
-                note, velocity = params
-                track.append(Message("note_on", note=note, velocity=velocity, time=delta))
-            elif msg_type == "note_off":
-                note = params[0] if params else 0
-                track.append(Message("note_off", note=note, velocity=0, time=delta))
-
-        track.append(MetaMessage("end_of_track", time=0))
-
-        midi_path = self.midi_dir / "fx.mid"
-        mid.save(str(midi_path))
-        return midi_path
-
-    def _generate_pattern_track(self, track_name: str, all_transitions: Dict[int, dict] = None) -> Optional[Path]:
-        """Generate pattern track following song structure, including transitions."""
-        from mido import MidiFile, MidiTrack, MetaMessage, Message
-        import mido
+        return all_events
 
+    def _generate_pattern_track(self, track_name: str, all_transitions: Dict[int, dict] = None) -> List[Tuple]:
+        """Generate pattern events following song structure, including transitions."""
         # Map track names to transition event keys
         TRANSITION_TRACK_MAP = {
             "kick": "kick",
@@ -584,40 +602,7 @@ class AbletonProject:
                     if "snare" in transitions:
                         all_events.extend(transitions["snare"])
 
-        if not all_events:
-            return None
-
-        # Create MIDI file
-        mid = MidiFile(ticks_per_beat=self.config.TICKS_PER_BEAT)
-        track = MidiTrack()
-        mid.tracks.append(track)
-
-        # Add tempo and track name
-        tempo_us = mido.bpm2tempo(self.spec.tempo)
-        track.append(MetaMessage("set_tempo", tempo=tempo_us, time=0))
-        track.append(MetaMessage("track_name", name=track_name.capitalize(), time=0))
-
-        # Sort events and convert to MIDI messages
-        sorted_events = sorted(all_events, key=lambda x: x[0])
-        current_time = 0
-
-        for event in sorted_events:
-            abs_time, msg_type, *params = event
-            delta = abs_time - current_time
-            current_time = abs_time
-
-            if msg_type == "note_on":
-                note, velocity = params
-                track.append(Message("note_on", note=note, velocity=velocity, time=delta))
-            elif msg_type == "note_off":
-                note = params[0]
-                track.append(Message("note_off", note=note, velocity=0, time=delta))
-
-        track.append(MetaMessage("end_of_track", time=0))
-
-        midi_path = self.midi_dir / f"{track_name}.mid"
-        mid.save(str(midi_path))
-        return midi_path
+        return all_events
 
     def _generate_als(self) -> Path:
         """Generate Ableton Live Set file."""
@@ -628,23 +613,23 @@ class AbletonProject:
             print("Creating minimal .als file...")
             return self._create_minimal_als()
 
-        # Load template
-        with gzip.open(template_path, "rb") as f:
-            xml_content = f.read().decode("utf-8")
-
-        root = ET.fromstring(xml_content)
+        # Load template (parsed once per process, see template_cache)
+        root = load_template(template_path)
         live_set = root.find("LiveSet")
 
+        # Index IDs once; every step below allocates from it
+        ids = IdAllocator(root)
+
         # Set tempo
         self._set_tempo(root, self.spec.tempo)
 
         # Add/update locators for sections
-        self._add_locators(root, live_set)
+        self._add_locators(root, live_set, ids)
 
         # Optionally create/rename tracks
         if self.create_tracks:
             try:
-                self._create_tracks(root, live_set)
+                self._create_tracks(root, live_set, ids)
                 print("  Created tracks from spec")
             except Exception as e:
                 print(f"  Warning: Track creation failed: {e}")
@@ -653,7 +638,7 @@ class AbletonProject:
         # Optionally embed MIDI clips
         if self.embed_midi:
             try:
-                self._embed_midi_clips(root)
+                self._embed_midi_clips(root, ids)
                 print("  Embedded MIDI clips")
             except Exception as e:
                 print(f"  Warning: MIDI embedding failed: {e}")
@@ -663,11 +648,10 @@ class AbletonProject:
         # Optionally add devices (instruments) to tracks
         if self.add_devices:
             try:
-                analysis = analyze_ids(root)
-                device_start_id = max(analysis.max_numeric_id, analysis.next_pointee_id) + 1000
-                next_id = add_devices_to_template(root, device_start_id, add_synths=False)
+                device_start_id = ids.next_id + 1000
+                add_devices_to_template(root, device_start_id, add_synths=False, id_allocator=ids)
                 # Update NextPointeeId
-                update_next_pointee_id(root, next_id + 100)
+                ids.write_next_pointee_id(root, headroom=100)
                 print("  Added devices to tracks")
             except Exception as e:
                 print(f"  Warning: Device insertion failed: {e}")
@@ -717,11 +701,10 @@ class AbletonProject:
         if tempo_elem is not None:
             tempo_elem.set("Value", str(float(tempo)))
 
-    def _add_locators(self, root: ET.Element, live_set: ET.Element):
+    def _add_locators(self, root: ET.Element, live_set: ET.Element, ids: IdAllocator):
         """Add arrangement locators for sections."""
-        # Get max ID to avoid conflicts
-        max_id = self._get_max_id(root)
-        locator_base_id = max_id + 10000  # Start locator IDs well above existing
+        # Start locator IDs well above existing
+        locator_base_id = ids.max_numeric_id + 10000
 
         locators_container = live_set.find("Locators")
         if locators_container is None:
@@ -733,14 +716,14 @@ class AbletonProject:
 
         # Clear existing locators
         for loc in list(locators):
+            ids.unregister(loc)
             locators.remove(loc)
 
         # Add markers for each section
-        max_locator_id = locator_base_id
         for i, section in enumerate(self.spec.structure):
             beat = section.start_bar * 4  # Convert bars to beats
             loc_id = locator_base_id + i
-            max_locator_id = loc_id
+            ids.claim(loc_id)
             loc = ET.SubElement(locators, "Locator", {"Id": str(loc_id)})
             ET.SubElement(loc, "LomId", {"Value": "0"})
             ET.SubElement(loc, "Time", {"Value": str(beat)})
@@ -749,32 +732,7 @@ class AbletonProject:
             ET.SubElement(loc, "IsSongStart", {"Value": "true" if i == 0 else "false"})
 
         # Update NextPointeeId to account for the new locators
-        next_pointee = live_set.find("NextPointeeId")
-        if next_pointee is not None:
-            next_pointee.set("Value", str(max_locator_id + 1))
-
-    def _get_max_id(self, root: ET.Element) -> int:
-        """Find the maximum numeric ID in the document."""
-        max_id = 0
-        for elem in root.iter():
-            if "Id" in elem.attrib:
-                try:
-                    val = int(elem.attrib["Id"])
-                    if val > max_id:
-                        max_id = val
-                except ValueError:
-                    pass
-        return max_id
-
-    def _update_ids_in_element(self, elem: ET.Element, id_offset: int):
-        """Update all numeric IDs in an element tree by adding offset."""
-        for e in elem.iter():
-            if "Id" in e.attrib:
-                try:
-                    old_id = int(e.attrib["Id"])
-                    e.set("Id", str(old_id + id_offset))
-                except ValueError:
-                    pass
+        ids.write_next_pointee_id(root)
 
     def _set_track_name(self, track: ET.Element, name: str, color: int):
         """Set the track name and color."""
@@ -791,7 +749,7 @@ class AbletonProject:
         if color_elem is not None:
             color_elem.set("Value", str(color))
 
-    def _create_tracks(self, root: ET.Element, live_set: ET.Element):
+    def _create_tracks(self, root: ET.Element, live_set: ET.Element, ids: IdAllocator):
         """
         Create and configure tracks based on song spec.
 
@@ -814,27 +772,18 @@ class AbletonProject:
         midi_template = midi_tracks[0]
         audio_template = audio_tracks[0] if audio_tracks else None
 
-        # Analyze IDs to understand the document structure
-        analysis = analyze_ids(root)
-        print(f"  ID analysis: max={analysis.max_numeric_id}, next={analysis.next_pointee_id}, refs={len(analysis.referenced_ids)}")
-
-        # Count IDs we need per track (estimate by counting IDs in template)
-        ids_per_track = sum(1 for e in midi_template.iter() if 'Id' in e.attrib)
-        total_tracks = len([t for t in self.spec.tracks if t.track_type in ("midi", "audio")])
-        total_ids_needed = ids_per_track * total_tracks + total_tracks  # +1 for each track root
-
-        # Generate safe IDs - start from a safe point
-        next_id = max(analysis.max_numeric_id, analysis.next_pointee_id) + 1
+        print(f"  ID analysis: max={ids.max_numeric_id}, next={ids.next_pointee_id}, refs={len(ids.referenced_ids)}")
 
         # Find return tracks (we'll insert before them)
         return_tracks = tracks_elem.findall("ReturnTrack")
 
         # Remove existing MIDI and Audio tracks
         for track in midi_tracks + audio_tracks:
+            ids.unregister(track)
             tracks_elem.remove(track)
 
-        # Track the highest ID we use
-        max_used_id = next_id - 1
+        # New tracks go before the return tracks, in spec order
+        insert_at = list(tracks_elem).index(return_tracks[0]) if return_tracks else len(tracks_elem)
 
         # Create tracks from spec
         for track_spec in self.spec.tracks:
@@ -845,64 +794,32 @@ class AbletonProject:
             else:
                 continue  # Skip if no template available
 
-            # Build mapping of old IDs to new IDs for this track
-            id_mapping = {}
-
-            # First pass: assign new IDs to ALL elements with Id attribute
-            for elem in new_track.iter():
-                if 'Id' in elem.attrib:
-                    old_id = elem.attrib['Id']
-                    new_id = next_id
-                    next_id += 1
-                    id_mapping[old_id] = str(new_id)
-                    elem.set('Id', str(new_id))
-                    max_used_id = max(max_used_id, new_id)
-
-            # Second pass: update Pointee references within this track
-            for elem in new_track.iter():
-                if elem.tag == 'Pointee' and 'Id' in elem.attrib:
-                    old_ref = elem.attrib['Id']
-                    if old_ref in id_mapping:
-                        elem.set('Id', id_mapping[old_ref])
-
-            # Also update PointeeId elements (different format)
-            for elem in new_track.iter():
-                if elem.tag == 'PointeeId' and 'Value' in elem.attrib:
-                    old_ref = elem.attrib['Value']
-                    if old_ref in id_mapping:
-                        elem.set('Value', id_mapping[old_ref])
+            # New IDs for all elements, internal PointeeId references follow
+            ids.renumber(new_track)
 
             # Set name and color using xml_utils function
             color = self.TRACK_COLORS.get(track_spec.name.lower(), 0)
             set_track_name(new_track, track_spec.name, color)
 
             # Insert before return tracks
-            if return_tracks:
-                idx = list(tracks_elem).index(return_tracks[0])
-                tracks_elem.insert(idx, new_track)
-            else:
-                tracks_elem.append(new_track)
+            tracks_elem.insert(insert_at, new_track)
+            insert_at += 1
 
         # Update NextPointeeId to be higher than all used IDs
-        update_next_pointee_id(root, max_used_id + 1)
-        print(f"  Updated NextPointeeId to {max_used_id + 1}")
+        next_pointee_id = ids.write_next_pointee_id(root)
+        print(f"  Updated NextPointeeId to {next_pointee_id}")
 
-    def _embed_midi_clips(self, root: ET.Element):
-        """Embed MIDI clips from midi/ folder into tracks."""
-        # Get current max ID for clip IDs
-        analysis = analyze_ids(root)
-        start_id = max(analysis.max_numeric_id, analysis.next_pointee_id) + 1
+    def _embed_midi_clips(self, root: ET.Element, ids: IdAllocator):
+        """Embed the generated note events into tracks as clips."""
 
         # Create embedder
         embedder = ClipEmbedder(ticks_per_beat=self.config.TICKS_PER_BEAT)
 
-        # Build track name -> MIDI file mapping
-        track_mapping = {}
-        for track_spec in self.spec.tracks:
-            track_name = track_spec.name.lower()
-            midi_file = f"{track_name}.mid"
-            if (self.midi_dir / midi_file).exists():
-                track_mapping[track_name] = midi_file
+        # Track name -> notes, straight from the generators
+        track_notes = {
+            track_name: events_to_notes(events, self.config.TICKS_PER_BEAT)
+            for track_name, events in self.track_events.items()
+        }
 
         # Build sections list if splitting is enabled
         sections = None
@@ -914,17 +831,17 @@ class AbletonProject:
             print(f"  Splitting clips into {len(sections)} sections")
 
         # Embed clips
-        next_id = embedder.embed_midi_files(
+        embedder.embed_notes(
             root,
-            self.midi_dir,
-            track_mapping,
+            track_notes,
             self.spec.total_bars,
-            start_id,
-            sections=sections
+            ids.next_id,
+            sections=sections,
+            id_allocator=ids
         )
 
         # Update NextPointeeId
-        update_next_pointee_id(root, next_id + 1)
+        ids.write_next_pointee_id(root, headroom=1)
 
     def _create_minimal_als(self) -> Path:
         """Create a minimal .als file when no template is available."""
@@ -971,6 +888,68 @@ def generate_project(spec: SongSpec, config: Config = None) -> Path:
     return project.generate()
 
 
+@dataclass
+class BatchResult:
+    """Outcome of one project in generate_batch()."""
+    name: str
+    als_path: Optional[Path] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+def _generate_batch_item(spec: SongSpec, config: Config, options: Dict) -> BatchResult:
+    """Generate one project of a batch (runs in a worker process for workers > 1)."""
+    start = time.perf_counter()
+    try:
+        split_sections = options.pop("split_sections", False)
+        project = AbletonProject(spec, config, **options)
+        project.split_sections = split_sections
+        als_path = project.generate()
+        return BatchResult(spec.name, als_path=als_path, seconds=time.perf_counter() - start)
+    except Exception as e:
+        return BatchResult(spec.name, error=f"{type(e).__name__}: {e}",
+                           seconds=time.perf_counter() - start)
+
+
+def generate_batch(specs: List[SongSpec], config: Config = None,
+                   workers: int = 1, **options) -> List[BatchResult]:
+    """
+    Generate many projects in one process (or a pool of processes).
+
+    Templates and device prototypes are parsed once per process (see
+    template_cache), so every project after the first skips the setup cost.
+    A failing project is reported in its BatchResult and does not stop the
+    batch.
+
+    Args:
+        specs: Song specifications; names must be unique (they name the
+               output folders)
+        config: Optional configuration
+        workers: Worker processes; 1 generates in this process
+        **options: AbletonProject keyword arguments (create_tracks,
+                   embed_midi, export_midi, ...) plus split_sections
+
+    Returns:
+        BatchResult per spec, in input order
+    """
+    config = config or DEFAULT_CONFIG
+    name_counts = Counter(spec.name for spec in specs)
+    duplicates = sorted(name for name, count in name_counts.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate song names in batch: {', '.join(duplicates)}")
+
+    if workers <= 1 or len(specs) <= 1:
+        return [_generate_batch_item(spec, config, dict(options)) for spec in specs]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(specs))) as pool:
+        futures = [pool.submit(_generate_batch_item, spec, config, dict(options)) for spec in specs]
+        return [future.result() for future in futures]
+
+
 def demo():
     """Demo the project generator."""
     print("=" * 60)
@@ -415,6 +415,11 @@ def main():
         action="store_true",
         help="Split MIDI into separate clips per section (requires --embed-midi)"
     )
+    parser.add_argument(
+        "--no-midi-files",
+        action="store_true",
+        help="With --embed-midi, skip writing the separate .mid files"
+    )
 
     # Default features (can be disabled)
     parser.add_argument(
@@ -642,6 +647,7 @@ def main():
         create_tracks=args.create_tracks,
         embed_midi=args.embed_midi,
         add_devices=args.add_devices,
+        export_midi=not args.no_midi_files,
         enable_textures=not args.no_textures,
         enable_stem_arranger=not args.no_stem_arrange,
         enable_sidechain=enable_sidechain,
@@ -666,6 +672,8 @@ def main():
     print(f"  Ableton file:   {als_path.name}")
     if args.embed_midi:
         print(f"  MIDI:           Embedded in .als (ready to play!)")
+        if project.export_midi:
+            print(f"  MIDI files:     {project.midi_dir}")
     else:
         print(f"  MIDI files:     {project.midi_dir}")
         print(f"                  (drag onto tracks in Ableton)")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Preset Search Benchmark - PresetIndex vs scoring every preset.
+
+Builds a synthetic preset catalog, times the one-off index build, then runs
+suggest_for_song and a batch of random searches through the indexed
+VSTPresetMatcher.search and through the brute-force scorer it replaced.
+Both must return the same presets; any mismatch is reported.
+
+Usage:
+    python benchmark_preset_search.py                    # 50k presets
+    python benchmark_preset_search.py --presets 200000   # Bigger catalog
+    python benchmark_preset_search.py --queries 500      # More random searches
+"""
+
+import argparse
+import copy
+import random
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from vst_preset_matcher import VSTPresetMatcher
+from tests.preset_fixtures import brute_force_search, random_search, synthetic_catalog
+
+
+def brute_force_matcher(matcher: VSTPresetMatcher) -> VSTPresetMatcher:
+    """Copy of matcher whose search (and so suggest_for_song) scores every preset."""
+    reference = copy.copy(matcher)
+    reference.search = partial(brute_force_search, reference)
+    return reference
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indexed preset search")
+    parser.add_argument("--presets", "-n", type=int, default=50000,
+                        help="Synthetic presets in the catalog (default: 50000)")
+    parser.add_argument("--queries", "-q", type=int, default=100,
+                        help="Random searches to time (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="Catalog and query seed (default: 0)")
+    args = parser.parse_args()
+
+    catalog = synthetic_catalog(args.presets, seed=args.seed)
+    matcher, build_ms = timed(VSTPresetMatcher, catalog)
+    reference = brute_force_matcher(matcher)
+    rng = random.Random(args.seed)
+    searches = [random_search(rng) for _ in range(args.queries)]
+
+    print(f"\nPreset search benchmark: {args.presets} synthetic presets, "
+          f"{args.queries} random searches\n")
+    print(f"Index build: {build_ms:.0f} ms\n")
+    print(f"{'Workload':<28} {'Brute force (ms)':>17} {'Indexed (ms)':>13} {'Speedup':>8}")
+    print("-" * 70)
+
+    indexed, indexed_ms = timed(matcher.suggest_for_song, "trance", "euphoric")
+    expected, brute_ms = timed(reference.suggest_for_song, "trance", "euphoric")
+    mismatches = int(indexed != expected)
+    print(f"{'suggest_for_song':<28} {brute_ms:>17.1f} {indexed_ms:>13.1f} "
+          f"{brute_ms / indexed_ms:>7.1f}x")
+
+    brute_total = indexed_total = 0.0
+    for kwargs in searches:
+        indexed, indexed_ms = timed(matcher.search, **kwargs)
+        expected, brute_ms = timed(reference.search, **kwargs)
+        indexed_total += indexed_ms
+        brute_total += brute_ms
+        mismatches += indexed != expected
+    count = max(1, len(searches))
+    print(f"{'search (mean per query)':<28} {brute_total / count:>17.1f} "
+          f"{indexed_total / count:>13.1f} {brute_total / max(indexed_total, 1e-9):>7.1f}x")
+
+    print(f"\nResult mismatches against brute force: {mismatches}\n")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
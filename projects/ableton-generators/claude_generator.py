@@ -32,7 +32,7 @@ from datetime import datetime
 
 from config import Config, DEFAULT_CONFIG
 from song_spec import SongSpec, SectionSpec, SectionType, TrackSpec
-from ableton_project import AbletonProject
+from ableton_project import AbletonProject, generate_batch
 
 
 # Genre templates with typical characteristics
@@ -366,6 +366,61 @@ def generate_from_spec_dict(spec_dict: Dict[str, Any], open_in_ableton: bool = F
     return result
 
 
+def generate_from_presets(
+    presets: List[str],
+    count: int = 1,
+    workers: int = 1,
+    output_dir: Path = None,
+) -> List[Dict[str, Any]]:
+    """
+    Generate draft projects for several presets in one run.
+
+    The template and device library are parsed once per process and reused
+    for every draft; with workers > 1 the drafts are spread over a process
+    pool.
+
+    Args:
+        presets: Preset names (see list_presets())
+        count: Drafts per preset
+        workers: Worker processes (1 = generate in this process)
+        output_dir: Optional output directory override
+
+    Returns:
+        One result dict per draft with success, name, preset, als_path
+        (or error) and seconds
+    """
+    from ai_song_generator import create_spec_from_preset
+
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    specs, spec_presets = [], []
+    for preset in presets:
+        for i in range(count):
+            name = f"{preset}_{stamp}" if count == 1 else f"{preset}_{stamp}_{i + 1:02d}"
+            specs.append(create_spec_from_preset(preset, name))
+            spec_presets.append(preset)
+
+    config = DEFAULT_CONFIG
+    if output_dir:
+        config = Config()
+        config.OUTPUT_BASE = output_dir
+
+    results = []
+    for preset, batch_result in zip(spec_presets, generate_batch(specs, config, workers=workers)):
+        result = {
+            "success": batch_result.success,
+            "name": batch_result.name,
+            "preset": preset,
+            "seconds": round(batch_result.seconds, 2),
+        }
+        if batch_result.success:
+            result["als_path"] = str(batch_result.als_path)
+            result["project_dir"] = str(batch_result.als_path.parent)
+        else:
+            result["error"] = batch_result.error
+        results.append(result)
+    return results
+
+
 def list_presets() -> Dict[str, str]:
     """List all available presets with descriptions."""
     from ai_song_generator import PRESETS
@@ -737,6 +792,9 @@ if __name__ == "__main__":
     parser.add_argument("--open", action="store_true", help="Open in Ableton")
     parser.add_argument("--list-presets", action="store_true")
     parser.add_argument("--interactive", "-i", action="store_true", help="Interactive guided mode")
+    parser.add_argument("--presets", nargs="+", metavar="PRESET", help="Batch: generate drafts for these presets")
+    parser.add_argument("--count", type=int, default=1, help="Batch: drafts per preset")
+    parser.add_argument("--workers", type=int, default=1, help="Batch: worker processes")
 
     args = parser.parse_args()
 
@@ -746,6 +804,16 @@ if __name__ == "__main__":
             print(f"  {name}: {desc}")
         sys.exit(0)
 
+    if args.presets:
+        results = generate_from_presets(args.presets, count=args.count, workers=args.workers)
+        print("\nBatch results:")
+        for result in results:
+            if result["success"]:
+                print(f"  [OK] {result['name']} ({result['seconds']}s): {result['als_path']}")
+            else:
+                print(f"  [FAIL] {result['name']}: {result['error']}")
+        sys.exit(0 if all(r["success"] for r in results) else 1)
+
     if args.interactive or args.description is None:
         # Run interactive mode
         result = interactive_mode(open_in_ableton=args.open)
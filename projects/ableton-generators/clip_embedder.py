@@ -1,16 +1,25 @@
 """
 MIDI Clip Embedder for Ableton Live Sets
 
-Converts MIDI files to Ableton's MidiClip XML format and embeds them
+Converts MIDI data to Ableton's MidiClip XML format and embeds it
 directly into .als files so projects are immediately playable.
+
+Two sources are supported:
+- Generator events in memory: (tick, 'note_on', pitch, velocity) and
+  (tick, 'note_off', pitch) tuples, as produced by MIDIGenerator,
+  TextureGenerator and MelodyGenerator.to_events(). See events_to_notes()
+  and ClipEmbedder.embed_notes(); no .mid file is involved
+- .mid files on disk (read_midi_file(), ClipEmbedder.embed_midi_files())
 """
 
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import mido
 
+from xml_utils import IdAllocator
+
 
 @dataclass
 class MidiNote:
@@ -33,6 +42,43 @@ class MidiClipData:
     color_index: int = 0
 
 
+def events_to_notes(events: List[Tuple], ticks_per_beat: int = 480) -> List[MidiNote]:
+    """
+    Pair generator note events into notes.
+
+    Events are taken in time order (stable for equal ticks), exactly as
+    they would be written to and read back from a .mid file. Events other
+    than note_on/note_off (cc, pitch_bend) are ignored.
+
+    Args:
+        events: (tick, 'note_on', pitch, velocity) / (tick, 'note_off', pitch, ...)
+        ticks_per_beat: Ticks per beat of the event times
+
+    Returns:
+        List of MidiNote objects
+    """
+    notes = []
+    active_notes: Dict[int, Tuple[float, int]] = {}  # pitch -> (start_time, velocity)
+
+    for event in sorted(events, key=lambda e: e[0]):
+        tick, msg_type = event[0], event[1]
+        if msg_type == 'note_on' and event[3] > 0:
+            active_notes[event[2]] = (tick / ticks_per_beat, event[3])
+        elif msg_type == 'note_off' or (msg_type == 'note_on' and event[3] == 0):
+            if event[2] in active_notes:
+                start_time, velocity = active_notes.pop(event[2])
+                duration = tick / ticks_per_beat - start_time
+                if duration > 0:
+                    notes.append(MidiNote(
+                        pitch=event[2],
+                        time=start_time,
+                        duration=duration,
+                        velocity=velocity
+                    ))
+
+    return notes
+
+
 def read_midi_file(path: Path, ticks_per_beat: int = 480) -> List[MidiNote]:
     """
     Read a MIDI file and extract notes.
@@ -286,7 +332,23 @@ def midi_file_to_clips(midi_path: Path, track_name: str,
         List of MidiClipData (one clip per section if sections provided, else one big clip)
     """
     notes = read_midi_file(midi_path, ticks_per_beat)
+    return notes_to_clips(notes, track_name, total_bars, sections)
+
+
+def notes_to_clips(notes: List[MidiNote], track_name: str, total_bars: int,
+                   sections: List[Tuple[str, int, int]] = None) -> List[MidiClipData]:
+    """
+    Arrange notes as clip data for the full arrangement.
+
+    Args:
+        notes: Notes with times in beats from the song start
+        track_name: Name for the clip
+        total_bars: Total number of bars in the song
+        sections: Optional list of (name, start_bar, end_bar) to split into separate clips
 
+    Returns:
+        List of MidiClipData (one clip per section if sections provided, else one big clip)
+    """
     if not notes:
         return []
 
@@ -347,9 +409,31 @@ class ClipEmbedder:
     def __init__(self, ticks_per_beat: int = 480):
         self.ticks_per_beat = ticks_per_beat
 
+    def embed_notes(self, root: ET.Element, track_notes: Dict[str, List[MidiNote]],
+                    total_bars: int, start_id: int,
+                    sections: List[Tuple[str, int, int]] = None,
+                    id_allocator: IdAllocator = None) -> int:
+        """
+        Embed in-memory notes into tracks.
+
+        Args:
+            root: Ableton Live Set root element
+            track_notes: Dict of lowercase track_name -> notes (see events_to_notes())
+            total_bars: Total bars in the song
+            start_id: Starting ID for clip elements
+            sections: Optional list of (name, start_bar, end_bar) to split clips
+            id_allocator: Optional IdAllocator of the set; the clip IDs are
+                          recorded in it as they are assigned
+
+        Returns:
+            Next available ID
+        """
+        return self._embed(root, track_notes.get, total_bars, start_id, sections, id_allocator)
+
     def embed_midi_files(self, root: ET.Element, midi_dir: Path,
                          track_mapping: Dict[str, str], total_bars: int,
-                         start_id: int, sections: List[Tuple[str, int, int]] = None) -> int:
+                         start_id: int, sections: List[Tuple[str, int, int]] = None,
+                         id_allocator: IdAllocator = None) -> int:
         """
         Embed MIDI files into tracks.
 
@@ -360,10 +444,32 @@ class ClipEmbedder:
             total_bars: Total bars in the song
             start_id: Starting ID for clip elements
             sections: Optional list of (name, start_bar, end_bar) to split clips
+            id_allocator: Optional IdAllocator of the set; the clip IDs are
+                          recorded in it as they are assigned
 
         Returns:
             Next available ID
         """
+        def read_notes(track_name: str) -> Optional[List[MidiNote]]:
+            # Check if we have MIDI for this track
+            midi_filename = track_mapping.get(track_name)
+            if midi_filename is None:
+                # Try to find by track name directly
+                midi_path = midi_dir / f"{track_name}.mid"
+            else:
+                midi_path = midi_dir / midi_filename
+            if not midi_path.exists():
+                return None
+            return read_midi_file(midi_path, self.ticks_per_beat)
+
+        return self._embed(root, read_notes, total_bars, start_id, sections, id_allocator)
+
+    def _embed(self, root: ET.Element,
+               notes_for: Callable[[str], Optional[List[MidiNote]]],
+               total_bars: int, start_id: int,
+               sections: List[Tuple[str, int, int]],
+               id_allocator: Optional[IdAllocator]) -> int:
+        """Embed the notes returned by notes_for(track_name) into each named MIDI track."""
         tracks_elem = root.find(".//Tracks")
         if tracks_elem is None:
             return start_id
@@ -381,29 +487,25 @@ class ClipEmbedder:
 
             track_name = name_elem.get("Value", "").lower()
 
-            # Check if we have MIDI for this track
-            midi_filename = track_mapping.get(track_name)
-            if midi_filename is None:
-                # Try to find by track name directly
-                midi_path = midi_dir / f"{track_name}.mid"
-                if not midi_path.exists():
-                    continue
-            else:
-                midi_path = midi_dir / midi_filename
-                if not midi_path.exists():
-                    continue
+            notes = notes_for(track_name)
+            if notes is None:
+                continue
 
-            # Convert MIDI to clips
-            clips = midi_file_to_clips(
-                midi_path,
+            # Convert notes to clips
+            clips = notes_to_clips(
+                notes,
                 track_name.title(),
                 total_bars,
-                self.ticks_per_beat,
                 sections=sections
             )
 
             if clips:
+                if id_allocator is not None:
+                    current_id = max(current_id, id_allocator.next_id)
+                clip_start_id = current_id
                 current_id = embed_clips_in_track(track, clips, current_id)
+                if id_allocator is not None:
+                    id_allocator.claim_range(clip_start_id, current_id)
                 total_notes = sum(len(c.notes) for c in clips)
                 if sections:
                     print(f"    Embedded {total_notes} notes in {len(clips)} clips for {track_name}")
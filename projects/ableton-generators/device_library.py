@@ -29,6 +29,9 @@ import json
 import copy
 import re
 
+from template_cache import get_device_library
+from xml_utils import IdAllocator
+
 
 @dataclass
 class DeviceTemplate:
@@ -87,12 +90,19 @@ class DeviceLibrary:
     """Manages a library of device templates."""
 
     def __init__(self, library_path: str = None):
-        self.library_path = Path(library_path) if library_path else \
-            Path(__file__).parent / "device_templates"
+        self.library_path = self.resolve_library_path(library_path)
         self.library_path.mkdir(parents=True, exist_ok=True)
         self.devices: Dict[str, DeviceTemplate] = {}
+        # Parsed (and path-converted) device XML, copied on each get_device_xml()
+        self._prototypes: Dict[str, ET.Element] = {}
         self._load_library()
 
+    @staticmethod
+    def resolve_library_path(library_path: str = None) -> Path:
+        """Library directory for a path argument (default: device_templates/)."""
+        return Path(library_path) if library_path else \
+            Path(__file__).parent / "device_templates"
+
     def _load_library(self):
         """Load all devices from library."""
         index_file = self.library_path / "index.json"
@@ -199,6 +209,7 @@ class DeviceLibrary:
             template.name = f"{base_name}_{i}"
 
         self.devices[template.name] = template
+        self._prototypes.pop(template.name, None)
         self._save_library()
 
     def get_device(self, name: str) -> Optional[DeviceTemplate]:
@@ -218,10 +229,15 @@ class DeviceLibrary:
         if not template:
             return None
 
-        elem = ET.fromstring(template.xml_element)
+        prototype = self._prototypes.get(name)
+        if prototype is None:
+            prototype = ET.fromstring(template.xml_element)
 
-        # Convert RelativePath format from Live 9/10 to Live 11 format
-        self._convert_relative_path_format(elem)
+            # Convert RelativePath format from Live 9/10 to Live 11 format
+            self._convert_relative_path_format(prototype)
+            self._prototypes[name] = prototype
+
+        elem = copy.deepcopy(prototype)
 
         # Update IDs if specified
         if new_id is not None:
@@ -263,13 +279,21 @@ class DeviceLibrary:
 
 
 class DeviceInserter:
-    """Insert devices into Ableton projects."""
+    """Insert devices into Ableton projects.
+
+    With an IdAllocator, device IDs come from the set's own index and
+    inserted devices are registered in it; otherwise IDs count up from a
+    high fixed start.
+    """
 
-    def __init__(self, library: DeviceLibrary = None):
-        self.library = library or DeviceLibrary()
+    def __init__(self, library: DeviceLibrary = None, id_allocator: IdAllocator = None):
+        self.library = library or get_device_library()
+        self.id_allocator = id_allocator
         self.id_counter = 100000  # Start high to avoid conflicts
 
     def _get_next_id(self) -> int:
+        if self.id_allocator is not None:
+            return self.id_allocator.next_id  # Claimed when the device is registered
         self.id_counter += 1
         return self.id_counter
 
@@ -305,6 +329,8 @@ class DeviceInserter:
 
         if devices is not None:
             devices.append(device_xml)
+            if self.id_allocator is not None:
+                self.id_allocator.register(device_xml)
             return True
 
         return False
@@ -566,7 +592,8 @@ def add_simpler_to_track(track: ET.Element, name: str, sample: CoreLibrarySample
 
 
 def add_devices_to_template(root: ET.Element, start_id: int = 50000,
-                            add_synths: bool = False) -> int:
+                            add_synths: bool = False,
+                            id_allocator: IdAllocator = None) -> int:
     """
     Add default devices to template tracks based on track names.
 
@@ -576,6 +603,8 @@ def add_devices_to_template(root: ET.Element, start_id: int = 50000,
         root: Ableton Live Set root element
         start_id: Starting ID for new elements
         add_synths: If True, also add synths for melodic tracks
+        id_allocator: Optional IdAllocator of the set; inserted devices are
+                      registered in it
 
     Returns:
         Next available ID
@@ -602,7 +631,7 @@ def add_devices_to_template(root: ET.Element, start_id: int = 50000,
         return start_id
 
     current_id = start_id
-    library = DeviceLibrary()
+    library = get_device_library()
 
     for track in tracks_elem.findall("MidiTrack"):
         name_elem = track.find(".//Name/EffectiveName")
@@ -630,16 +659,19 @@ def add_devices_to_template(root: ET.Element, start_id: int = 50000,
 
         prev_id = current_id
         current_id = add_library_device_to_track(
-            track, library, device_name, current_id
+            track, library, device_name, current_id, id_allocator
         )
         if current_id > prev_id:
             print(f"  + Added {device_name} to {track_name}")
 
+    if id_allocator is not None:
+        id_allocator.skip_to(current_id)
     return current_id
 
 
 def add_library_device_to_track(track: ET.Element, library: 'DeviceLibrary',
-                                 device_name: str, start_id: int) -> int:
+                                 device_name: str, start_id: int,
+                                 id_allocator: IdAllocator = None) -> int:
     """
     Add a device from the library to a track.
 
@@ -648,6 +680,8 @@ def add_library_device_to_track(track: ET.Element, library: 'DeviceLibrary',
         library: DeviceLibrary instance
         device_name: Name of device in library
         start_id: Starting ID for new elements
+        id_allocator: Optional IdAllocator of the set; the inserted device is
+                      registered in it
 
     Returns:
         Next available ID
@@ -681,6 +715,8 @@ def add_library_device_to_track(track: ET.Element, library: 'DeviceLibrary',
         devices = ET.SubElement(inner_chain, "Devices")
 
     devices.append(device_xml)
+    if id_allocator is not None:
+        id_allocator.register(device_xml)
     return next_id
 
 
@@ -128,6 +128,7 @@ from .coordinator import (
     RhythmPattern,
     CollisionDetector,
     Collision,
+    NoteIntervalIndex,
     MotionPlanner,
     MotionType,
     RhythmicRelation,
@@ -281,6 +282,7 @@ __all__ = [
     "RhythmPattern",
     "CollisionDetector",
     "Collision",
+    "NoteIntervalIndex",
     "MotionPlanner",
     "MotionType",
     "RhythmicRelation",
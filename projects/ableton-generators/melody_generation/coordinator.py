@@ -13,8 +13,9 @@ Production-grade track coordination system:
 from __future__ import annotations
 
 import random
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from enum import Enum, auto
 
 from .models import (
@@ -177,6 +178,146 @@ class Collision:
     type: str  # "unison", "octave", "same_pitch_class"
 
 
+# Widens index lookups so float rounding never drops a note the exact test keeps
+_SLACK = 1e-9
+
+
+def _collision_type(note1: NoteEvent, note2: NoteEvent) -> Optional[str]:
+    """Collision type of two simultaneous notes, or None if they do not collide."""
+    interval = abs(note1.pitch.midi_note - note2.pitch.midi_note)
+
+    if interval == 0:
+        return "unison"
+    elif interval % 12 == 0:
+        return "octave"
+    elif note1.pitch.pitch_class == note2.pitch.pitch_class:
+        return "same_pitch_class"
+    return None
+
+
+class NoteIntervalIndex:
+    """
+    Notes of one or more tracks, indexed for time-overlap queries.
+
+    Every collision type (unison, octave, same pitch class) needs equal
+    pitch classes, so notes are bucketed by pitch class and kept sorted by
+    start beat. A query bisects to the notes starting before the query
+    window ends and walks back as far as the longest indexed note can
+    reach. It costs O(log n + m), where m counts the same-pitch-class notes
+    starting within that reach (the query span plus the longest note's
+    duration). With short notes m stays close to the number of overlaps;
+    one long note (e.g. a pad held for a whole section) widens every query,
+    and in the worst case m approaches the size of the bucket.
+
+    Notes can be added one at a time (e.g. while generating a lead), and
+    queries return notes in the order they were added.
+    """
+
+    def __init__(self, notes: Iterable[NoteEvent] = ()):
+        # pitch class -> start beats / (order, note), sorted by (start, order)
+        self._starts: Dict[int, List[float]] = {}
+        self._notes: Dict[int, List[Tuple[int, NoteEvent]]] = {}
+        self._max_duration = 0.0
+        self._count = 0
+
+        buckets: Dict[int, List[Tuple[int, NoteEvent]]] = {}
+        for note in notes:
+            buckets.setdefault(note.pitch.pitch_class.value, []).append((self._count, note))
+            self._max_duration = max(self._max_duration, note.duration_beats)
+            self._count += 1
+
+        for pitch_class, entries in buckets.items():
+            entries.sort(key=lambda entry: entry[1].start_beat)   # Stable: keeps order on ties
+            self._starts[pitch_class] = [note.start_beat for _, note in entries]
+            self._notes[pitch_class] = entries
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, note: NoteEvent):
+        """Add a note to the index."""
+        pitch_class = note.pitch.pitch_class.value
+        starts = self._starts.setdefault(pitch_class, [])
+        position = bisect_right(starts, note.start_beat)
+        starts.insert(position, note.start_beat)
+        self._notes.setdefault(pitch_class, []).insert(position, (self._count, note))
+        self._max_duration = max(self._max_duration, note.duration_beats)
+        self._count += 1
+
+    def _candidates(self, pitch_classes: Iterable[int], earliest_start: float,
+                    latest_start: float) -> List[Tuple[int, NoteEvent]]:
+        """Entries with earliest_start <= start <= latest_start, in insertion order."""
+        found = []
+        for pitch_class in pitch_classes:
+            starts = self._starts.get(pitch_class)
+            if not starts:
+                continue
+            lo = bisect_left(starts, earliest_start)
+            hi = bisect_right(starts, latest_start)
+            found.extend(self._notes[pitch_class][lo:hi])
+        found.sort(key=lambda entry: entry[0])
+        return found
+
+    def overlapping(
+        self,
+        start_beat: float,
+        end_beat: float,
+        tolerance: float = 0.0,
+        pitch_class: Optional[PitchClass] = None,
+    ) -> List[NoteEvent]:
+        """
+        Notes overlapping [start_beat, end_beat) widened by tolerance.
+
+        Args:
+            start_beat: Window start
+            end_beat: Window end
+            tolerance: Notes this close count as overlapping
+            pitch_class: Only return notes of this pitch class
+
+        Returns:
+            Notes in the order they were added
+        """
+        pitch_classes = [pitch_class.value] if pitch_class is not None else list(self._starts)
+        window_end = end_beat + tolerance
+        candidates = self._candidates(
+            pitch_classes, start_beat - tolerance - self._max_duration - _SLACK, window_end
+        )
+        return [
+            note for _, note in candidates
+            if note.start_beat < window_end and start_beat < note.end_beat + tolerance
+        ]
+
+    def notes_at(self, beat: float, tolerance: float = 0.125) -> List[NoteEvent]:
+        """Notes sounding at a beat (same rule as TrackContext.notes_at_beat)."""
+        candidates = self._candidates(
+            list(self._starts), beat - tolerance - self._max_duration - _SLACK,
+            beat + tolerance + _SLACK
+        )
+        return [
+            note for _, note in candidates
+            if note.start_beat - tolerance <= beat < note.end_beat + tolerance
+        ]
+
+    def collisions(
+        self,
+        note: NoteEvent,
+        tolerance: float = 0.125,
+    ) -> List[Tuple[NoteEvent, str]]:
+        """
+        Check a candidate note against the indexed notes.
+
+        Returns:
+            (indexed note, collision type) pairs in the order notes were added
+        """
+        result = []
+        for other in self.overlapping(note.start_beat, note.end_beat, tolerance,
+                                      note.pitch.pitch_class):
+            kind = _collision_type(note, other)
+            if kind is not None:
+                result.append((other, kind))
+        return result
+
+
 class CollisionDetector:
     """Detects and resolves pitch collisions between tracks."""
 
@@ -190,35 +331,16 @@ class CollisionDetector:
     ) -> List[Collision]:
         """Find all pitch collisions between two tracks."""
         collisions = []
+        index = NoteIntervalIndex(track2_notes)
 
         for n1 in track1_notes:
-            for n2 in track2_notes:
-                # Check time overlap
-                overlap = (
-                    n1.start_beat < n2.end_beat + tolerance and
-                    n2.start_beat < n1.end_beat + tolerance
-                )
-                if not overlap:
-                    continue
-
-                # Check pitch relationship
-                interval = abs(n1.pitch.midi_note - n2.pitch.midi_note)
-
-                if interval == 0:
-                    collision_type = "unison"
-                elif interval % 12 == 0:
-                    collision_type = "octave"
-                elif n1.pitch.pitch_class == n2.pitch.pitch_class:
-                    collision_type = "same_pitch_class"
-                else:
-                    continue  # Not a collision
-
+            for n2, kind in index.collisions(n1, tolerance):
                 collisions.append(Collision(
                     beat=max(n1.start_beat, n2.start_beat),
                     pitch=n1.pitch.midi_note,
                     track1=track1_name,
                     track2=track2_name,
-                    type=collision_type,
+                    type=kind,
                 ))
 
         return collisions
@@ -473,23 +595,24 @@ class InterTrackCoordinator:
             return notes
 
         result = []
+        bass_index = NoteIntervalIndex(context.bass_notes)
+        arp_index = NoteIntervalIndex(context.arp_notes)
 
         for note in notes:
-            # Check for collisions with each context track
-            collisions = []
-
-            for ctx_note in context.bass_notes:
-                if (note.start_beat < ctx_note.end_beat and
-                    ctx_note.start_beat < note.end_beat):
-                    interval = abs(note.pitch.midi_note - ctx_note.pitch.midi_note)
-                    if interval == 0 or interval % 12 == 0:
-                        collisions.append(ctx_note.pitch.midi_note)
-
-            for ctx_note in context.arp_notes:
-                if (note.start_beat < ctx_note.end_beat and
-                    ctx_note.start_beat < note.end_beat):
-                    if note.pitch.midi_note == ctx_note.pitch.midi_note:
-                        collisions.append(ctx_note.pitch.midi_note)
+            # Check for collisions with each context track:
+            # unison or octave with bass, unison with arp
+            pitch_class = note.pitch.pitch_class
+            collisions = [
+                ctx_note.pitch.midi_note
+                for ctx_note in bass_index.overlapping(note.start_beat, note.end_beat,
+                                                       pitch_class=pitch_class)
+            ]
+            collisions += [
+                ctx_note.pitch.midi_note
+                for ctx_note in arp_index.overlapping(note.start_beat, note.end_beat,
+                                                      pitch_class=pitch_class)
+                if ctx_note.pitch.midi_note == note.pitch.midi_note
+            ]
 
             if collisions and chord_tones_available:
                 # Resolve by moving to available chord tone
@@ -559,13 +682,16 @@ class InterTrackCoordinator:
             return lead_notes
 
         result = [lead_notes[0]]
+        context_index = NoteIntervalIndex(
+            context.bass_notes + context.arp_notes + context.chord_notes
+        )
 
         for i in range(1, len(lead_notes)):
             current = lead_notes[i]
             prev = lead_notes[i - 1]
 
             # Get context notes at this beat
-            ctx_notes = context.notes_at_beat(current.start_beat)
+            ctx_notes = context_index.notes_at(current.start_beat)
 
             if ctx_notes:
                 # Get motion suggestion
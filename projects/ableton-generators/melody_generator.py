@@ -299,25 +299,20 @@ class MelodyGenerator:
 
         return notes
 
-    def to_midi_track(
+    def to_events(
         self,
         notes: List[MelodyNote],
         ticks_per_beat: Optional[int] = None,
-        program: Optional[int] = None,
-    ) -> MidiTrack:
+    ) -> List[tuple]:
         """
-        Convert notes to a mido MidiTrack.
+        Convert notes to generator events.
 
-        Handles overlapping notes on the same pitch.
+        Returns (tick, 'note_on', pitch, velocity) / (tick, 'note_off', pitch)
+        tuples in time order, the format MIDIGenerator uses. Overlapping
+        notes on the same pitch are merged: a pitch is only released when
+        its last overlapping note ends.
         """
         tpb = ticks_per_beat or self.ticks_per_beat
-        prog = program or 81  # Lead synth
-
-        track = MidiTrack()
-        track.append(Message("program_change", program=prog, time=0))
-
-        if not notes:
-            return track
 
         # Build on/off event list
         events = []
@@ -330,25 +325,50 @@ class MelodyGenerator:
         # Sort: by tick, note-off before note-on at same tick
         events.sort(key=lambda e: (e[1], 0 if e[0] == "off" else 1))
 
-        # Emit MIDI messages with collision handling
+        # Collision handling
         active: Dict[int, int] = {}
-        current_tick = 0
+        result = []
 
         for event_type, tick, pitch, velocity in events:
-            delta = tick - current_tick
-
             if event_type == "on":
                 active[pitch] = active.get(pitch, 0) + 1
-                track.append(Message("note_on", note=pitch, velocity=velocity, time=delta))
-                current_tick = tick
+                result.append((tick, 'note_on', pitch, velocity))
             else:
                 count = active.get(pitch, 0)
                 if count > 1:
                     active[pitch] = count - 1
                 else:
                     active[pitch] = 0
-                    track.append(Message("note_off", note=pitch, velocity=0, time=delta))
-                    current_tick = tick
+                    result.append((tick, 'note_off', pitch))
+
+        return result
+
+    def to_midi_track(
+        self,
+        notes: List[MelodyNote],
+        ticks_per_beat: Optional[int] = None,
+        program: Optional[int] = None,
+    ) -> MidiTrack:
+        """
+        Convert notes to a mido MidiTrack.
+
+        Handles overlapping notes on the same pitch (see to_events()).
+        """
+        prog = program or 81  # Lead synth
+
+        track = MidiTrack()
+        track.append(Message("program_change", program=prog, time=0))
+
+        current_tick = 0
+        for event in self.to_events(notes, ticks_per_beat):
+            tick = event[0]
+            if event[1] == 'note_on':
+                track.append(Message("note_on", note=event[2], velocity=event[3],
+                                     time=tick - current_tick))
+            else:
+                track.append(Message("note_off", note=event[2], velocity=0,
+                                     time=tick - current_tick))
+            current_tick = tick
 
         return track
 
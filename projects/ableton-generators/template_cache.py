@@ -0,0 +1,127 @@
+"""
+In-Process Template Cache
+
+Generating a project used to gunzip and parse the base Live Set template
+on every AbletonProject.generate() call, and to reload the device library
+index (and re-parse each stored device) on every insertion. When dozens of
+drafts are generated in one session that setup dominates.
+
+This module keeps parsed prototypes for the life of the process:
+- Templates are keyed by (resolved path, size, mtime_ns), so an edited
+  template is picked up on the next call
+- Every caller gets its own copy (copy.deepcopy, which the C ElementTree
+  implements natively and is faster than re-parsing or a Python-level
+  clone); cached prototypes are never handed out
+- Device libraries are shared per library directory and reloaded when
+  their index.json changes
+
+Usage:
+    root = load_template(template_path)      # Fresh, mutable copy
+    library = get_device_library()           # Shared DeviceLibrary
+"""
+
+import copy
+import gzip
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+DEFAULT_MAX_TEMPLATES = 4
+
+
+class TemplateCache:
+    """Bounded cache of parsed .als templates."""
+
+    def __init__(self, max_templates: int = DEFAULT_MAX_TEMPLATES):
+        self.max_templates = max(1, max_templates)
+        self._templates: 'OrderedDict[Tuple[str, int, int], ET.Element]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(path: Path) -> Tuple[str, int, int]:
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        return str(resolved), stat.st_size, stat.st_mtime_ns
+
+    def load(self, path: Path) -> ET.Element:
+        """
+        Parsed root of a gzipped .als template.
+
+        Args:
+            path: Path to the template .als
+
+        Returns:
+            A copy of the cached tree that the caller may modify
+        """
+        key = self._key(path)
+        with self._lock:
+            prototype = self._templates.get(key)
+            if prototype is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+
+        if prototype is None:
+            with gzip.open(path, 'rb') as f:
+                prototype = ET.fromstring(f.read().decode('utf-8'))
+            with self._lock:
+                self.misses += 1
+                self._templates[key] = prototype
+                while len(self._templates) > self.max_templates:
+                    self._templates.popitem(last=False)
+
+        return copy.deepcopy(prototype)
+
+    def clear(self):
+        """Drop all cached templates."""
+        with self._lock:
+            self._templates.clear()
+
+
+_template_cache = TemplateCache()
+_libraries: Dict[str, Tuple[Optional[int], 'DeviceLibrary']] = {}
+_libraries_lock = threading.Lock()
+
+
+def load_template(path: Path) -> ET.Element:
+    """Fresh copy of a template's parsed root from the process-wide cache."""
+    return _template_cache.load(path)
+
+
+def get_template_cache() -> TemplateCache:
+    """The process-wide TemplateCache."""
+    return _template_cache
+
+
+def get_device_library(library_path: str = None) -> 'DeviceLibrary':
+    """
+    Shared DeviceLibrary for a library directory.
+
+    The library keeps parsed device prototypes, so repeated insertions of
+    the same device do not re-parse its XML. It is reloaded when the
+    directory's index.json changed since it was loaded.
+    """
+    from device_library import DeviceLibrary
+
+    directory = DeviceLibrary.resolve_library_path(library_path)
+    index_file = directory / "index.json"
+    mtime = index_file.stat().st_mtime_ns if index_file.exists() else None
+
+    with _libraries_lock:
+        cached = _libraries.get(str(directory))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        library = DeviceLibrary(str(directory))
+        _libraries[str(directory)] = (mtime, library)
+        return library
+
+
+def clear_caches():
+    """Drop all cached templates and device libraries."""
+    _template_cache.clear()
+    with _libraries_lock:
+        _libraries.clear()
@@ -0,0 +1,19 @@
+"""Shared fixtures for the ableton-generators tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import base_template
+from config import Config
+
+
+@pytest.fixture
+def project_config(tmp_path):
+    """Config writing projects to tmp_path, with the base template as Base_Template.als."""
+    base_template.build_als(str(tmp_path / "Base_Template.als"))
+    return Config(OUTPUT_BASE=tmp_path)
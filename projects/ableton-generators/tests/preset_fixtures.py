@@ -0,0 +1,135 @@
+"""
+Synthetic preset catalogs and the brute-force search that PresetIndex replaced.
+
+Shared by tests/test_vst_preset_matcher.py and benchmark_preset_search.py.
+"""
+
+import random
+from typing import Dict, List
+
+from vst_preset_matcher import (
+    PresetInfo, SoundCategory, SYNTH_DATABASE, VSTPresetMatcher
+)
+
+
+NAME_WORDS = ["trance", "supersaw", "lead", "bass", "pad", "pluck", "acid", "dark", "bright",
+              "warm", "wide", "sub", "reese", "bell", "fm", "arp", "epic", "deep", "soft",
+              "hoover", "saw", "sine", "noise", "riser", "vox", "choir", "keys", "stab"]
+TAGS = ["supersaw", "bright", "wide", "unison", "detuned", "fat", "warm", "analog", "sub",
+        "clean", "deep", "fm", "bell", "metallic", "acid", "303", "pluck", "short", "long"]
+GENRES = ["trance", "edm", "progressive", "house", "techno", "ambient", "hardstyle", "dubstep"]
+MOODS = ["euphoric", "uplifting", "dark", "warm", "aggressive", "ethereal", "energetic"]
+SYNTHS = [info.name for info in SYNTH_DATABASE.values()]
+
+
+def synthetic_catalog(size: int, seed: int = 0) -> List[PresetInfo]:
+    """Random presets drawn from small vocabularies so queries overlap many of them."""
+    rng = random.Random(seed)
+    presets = []
+    for i in range(size):
+        low = round(rng.uniform(0.0, 0.8), 2)
+        presets.append(PresetInfo(
+            name=" ".join(rng.sample(NAME_WORDS, rng.randint(1, 3))).title() + f" {i}",
+            synth=rng.choice(SYNTHS),
+            category=rng.choice(list(SoundCategory)),
+            tags=rng.sample(TAGS, rng.randint(0, 5)),
+            genres=["all"] if rng.random() < 0.05 else rng.sample(GENRES, rng.randint(0, 3)),
+            moods=["all"] if rng.random() < 0.05 else rng.sample(MOODS, rng.randint(0, 3)),
+            energy_range=(low, round(rng.uniform(low, 1.0), 2)),
+        ))
+    return presets
+
+
+def random_search(rng: random.Random) -> Dict:
+    """Keyword arguments for one random VSTPresetMatcher.search call."""
+    words = rng.sample(NAME_WORDS + TAGS + GENRES + MOODS, rng.randint(1, 3))
+    query = rng.choice([" ".join(words), words[0][:2], words[0][1:5], ""])
+    kwargs = {"query": query, "limit": rng.choice([1, 5, 10, 50])}
+    if rng.random() < 0.4:
+        kwargs["category"] = rng.choice(list(SoundCategory))
+    if rng.random() < 0.5:
+        kwargs["genre"] = rng.choice(GENRES + ["all"])
+    if rng.random() < 0.5:
+        kwargs["mood"] = rng.choice(MOODS)
+    if rng.random() < 0.5:
+        kwargs["energy"] = round(rng.random(), 2)
+    if rng.random() < 0.2:
+        kwargs["tags"] = rng.sample(TAGS, rng.randint(1, 2))
+    if rng.random() < 0.3:
+        kwargs["synth"] = rng.choice(SYNTHS + ["unknown"])
+        kwargs["include_alternatives"] = rng.random() < 0.7
+    return kwargs
+
+
+def brute_force_search(
+    matcher: VSTPresetMatcher,
+    query: str = "",
+    category: SoundCategory = None,
+    genre: str = None,
+    mood: str = None,
+    energy: float = None,
+    tags: List[str] = None,
+    synth: str = None,
+    limit: int = 10,
+    include_alternatives: bool = True
+) -> List[PresetInfo]:
+    """VSTPresetMatcher.search as it was before PresetIndex: score every preset, sort."""
+    results = []
+
+    for preset in matcher.presets:
+        score = 0.0
+
+        if query:
+            query_score = preset.matches_query(query)
+            if query_score < 0.1:
+                continue
+            score += query_score * 5
+
+        if category and preset.category != category:
+            continue
+        elif category:
+            score += 1.0
+
+        if genre:
+            if genre.lower() in [g.lower() for g in preset.genres] or "all" in preset.genres:
+                score += 2.0
+            else:
+                score -= 0.5
+
+        if mood:
+            if mood.lower() in [m.lower() for m in preset.moods] or "all" in preset.moods:
+                score += 2.0
+            else:
+                score -= 0.3
+
+        if energy is not None:
+            if preset.energy_range[0] <= energy <= preset.energy_range[1]:
+                score += 1.0
+            else:
+                continue
+
+        if tags and not preset.matches_tags(tags):
+            continue
+
+        if synth:
+            if preset.synth.lower() != synth.lower():
+                if include_alternatives:
+                    synth_info = matcher.synths.get(synth.lower())
+                    if synth_info and preset.synth.lower() not in [a.lower() for a in synth_info.alternatives]:
+                        continue
+                    score -= 0.5
+                else:
+                    continue
+        else:
+            score += 1.0
+
+        if matcher.available_synths:
+            if preset.synth.lower() in matcher.available_synths:
+                score += 2.0
+            else:
+                score -= 1.0
+
+        results.append((score, preset))
+
+    results.sort(key=lambda x: x[0], reverse=True)
+    return [preset for _, preset in results[:limit]]
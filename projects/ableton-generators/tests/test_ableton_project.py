@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for batch project generation on top of the template cache.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ableton_project import generate_batch
+from song_spec import create_default_trance_spec
+from template_cache import TemplateCache, get_template_cache
+from xml_utils import IdAllocator, load_als
+
+
+def track_names(root):
+    return [t.find("Name/EffectiveName").get("Value")
+            for t in root.find("LiveSet/Tracks") if t.tag in ("MidiTrack", "AudioTrack")]
+
+
+def test_template_cache_hands_out_copies(project_config):
+    cache = TemplateCache()
+    path = project_config.OUTPUT_BASE / "Base_Template.als"
+
+    first = cache.load(path)
+    first.find("LiveSet/Tracks").clear()
+    second = cache.load(path)
+
+    assert second is not first
+    assert len(second.find("LiveSet/Tracks")) > 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_batch_returns_independent_projects(project_config, workers):
+    specs = [create_default_trance_spec(name) for name in ("First", "Second", "Third")]
+    specs[1].tempo = 128
+    specs[1].tracks = specs[1].tracks[:3]
+    specs[2].tempo = 145
+
+    results = generate_batch(specs, project_config, workers=workers, create_tracks=True,
+                             embed_midi=True, export_midi=False)
+
+    assert [r.name for r in results] == ["First", "Second", "Third"]
+    assert all(r.success for r in results), [r.error for r in results]
+    assert len({r.als_path for r in results}) == 3
+
+    for spec, result in zip(specs, results):
+        root = load_als(result.als_path)
+        tempo = root.find(".//MasterTrack//Tempo/Manual").get("Value")
+        assert float(tempo) == spec.tempo
+        assert track_names(root) == [t.name for t in spec.tracks]
+        # Tracks of one project never leak into the next through the cached template
+        ids = IdAllocator(root)
+        for track in root.find("LiveSet/Tracks").findall("MidiTrack"):
+            track_ids = [e.get("Id") for e in track.iter() if "Id" in e.attrib]
+            assert not [i for i in track_ids if ids.id_counts[i] > 1]
+
+    # The cached prototype is still the untouched template
+    template = project_config.OUTPUT_BASE / "Base_Template.als"
+    assert track_names(get_template_cache().load(template)) == track_names(load_als(template))
+
+
+def test_generate_batch_rejects_duplicate_names(project_config):
+    specs = [create_default_trance_spec("Same"), create_default_trance_spec("Same")]
+    with pytest.raises(ValueError, match="Same"):
+        generate_batch(specs, project_config)
+
+
+def test_missing_template_still_writes_midi_files(tmp_path):
+    """Without a template there is nothing to embed into, so .mid files are written."""
+    from ableton_project import AbletonProject
+    from config import Config
+
+    project = AbletonProject(create_default_trance_spec("NoTemplate"), Config(OUTPUT_BASE=tmp_path),
+                             embed_midi=True, export_midi=False)
+    project.generate()
+
+    assert (project.output_dir / "README.txt").exists()
+    assert sorted(p.stem for p in project.midi_dir.glob("*.mid")) == sorted(project.track_events)
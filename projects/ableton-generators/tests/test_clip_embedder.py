@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for embedding generator events without intermediate .mid files.
+"""
+
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ableton_project import AbletonProject
+from clip_embedder import ClipEmbedder, events_to_notes, read_midi_file
+from song_spec import create_default_trance_spec
+from xml_utils import IdAllocator, load_als
+
+
+def note_tuples(notes):
+    return [(n.pitch, n.velocity, n.time, n.duration) for n in notes]
+
+
+def assert_same_notes(from_events, from_file):
+    assert [(n.pitch, n.velocity) for n in from_events] == [(n.pitch, n.velocity) for n in from_file]
+    # The .mid reader sums float deltas, so times may differ in the last bits
+    for a, b in zip(from_events, from_file):
+        assert a.time == pytest.approx(b.time, abs=1e-9)
+        assert a.duration == pytest.approx(b.duration, abs=1e-9)
+
+
+def with_arrangement(root):
+    """Add the ClipTimeable/ArrangerAutomation/Events chain Live sets keep on MIDI tracks."""
+    for sequencer in root.findall(".//MidiTrack/DeviceChain/MainSequencer"):
+        if sequencer.find("ClipTimeable") is None:
+            automation = ET.SubElement(ET.SubElement(sequencer, "ClipTimeable"), "ArrangerAutomation")
+            ET.SubElement(automation, "Events")
+    return root
+
+
+def track_notes(track):
+    """(pitch, velocity, absolute time, duration) of a track's arrangement clips, sorted."""
+    notes = []
+    for clip in track.iter("MidiClip"):
+        clip_start = float(clip.get("Time"))
+        for key_track in clip.iter("KeyTrack"):
+            pitch = int(key_track.find("MidiKey").get("Value"))
+            for event in key_track.iter("MidiNoteEvent"):
+                notes.append((pitch, int(event.get("Velocity")),
+                              round(clip_start + float(event.get("Time")), 6),
+                              float(event.get("Duration"))))
+    return sorted(notes, key=lambda n: (n[2], n[0]))
+
+
+@pytest.fixture
+def exported_project(project_config):
+    project = AbletonProject(create_default_trance_spec("Export"), project_config,
+                             create_tracks=True, export_midi=True)
+    project.generate()
+    return project
+
+
+def test_events_to_notes_matches_written_midi_files(exported_project):
+    project = exported_project
+    ticks = project.config.TICKS_PER_BEAT
+    assert project.track_events
+
+    for track_name, events in project.track_events.items():
+        from_file = read_midi_file(project.midi_dir / f"{track_name}.mid", ticks)
+        assert_same_notes(events_to_notes(events, ticks), from_file)
+
+
+def test_events_to_notes_edge_cases(project_config, tmp_path):
+    events = [
+        (960, 'note_off', 60, 0),
+        (0, 'note_on', 60, 100),
+        (0, 'cc', 74, 64),
+        (480, 'note_on', 64, 90),
+        (480, 'pitch_bend', 2000),
+        (960, 'note_on', 60, 80),       # Off and on again at one tick
+        (960, 'note_on', 64, 0),        # Velocity 0 ends a note
+        (1200, 'note_on', 67, 70),
+        (1200, 'note_off', 67, 0),      # Zero length, dropped
+        (1440, 'note_on', 60, 110),     # Re-trigger while held
+        (1920, 'note_off', 60, 0),
+        (2000, 'note_off', 72, 0),      # Never started
+    ]
+    project = AbletonProject(create_default_trance_spec("Edges"), project_config)
+    midi_path = tmp_path / "edges.mid"
+    project._write_midi_file(midi_path, events, "Edges")
+
+    from_events = events_to_notes(events, 480)
+    assert_same_notes(from_events, read_midi_file(midi_path, 480))
+    assert note_tuples(from_events) == [(60, 100, 0.0, 2.0), (64, 90, 1.0, 1.0), (60, 110, 3.0, 1.0)]
+
+
+def test_embed_notes_matches_embed_midi_files(exported_project):
+    # One clip per track: with sections, a note read back from a .mid at
+    # 191.9999... instead of 192 lands in the earlier clip
+    project = exported_project
+    als_path = project.output_dir / f"{project.spec.name}.als"
+    ticks = project.config.TICKS_PER_BEAT
+
+    from_files = with_arrangement(load_als(als_path))
+    from_events = with_arrangement(load_als(als_path))
+    embedder = ClipEmbedder(ticks_per_beat=ticks)
+    ids_files, ids_events = IdAllocator(from_files), IdAllocator(from_events)
+    embedder.embed_midi_files(
+        from_files, project.midi_dir, {}, project.spec.total_bars, ids_files.next_id,
+        id_allocator=ids_files)
+    embedder.embed_notes(
+        from_events, {name: events_to_notes(events, ticks)
+                      for name, events in project.track_events.items()},
+        project.spec.total_bars, ids_events.next_id, id_allocator=ids_events)
+
+    tracks_files = from_files.findall(".//Tracks/MidiTrack")
+    tracks_events = from_events.findall(".//Tracks/MidiTrack")
+    assert sum(len(track_notes(t)) for t in tracks_files) > 0
+    for a, b in zip(tracks_files, tracks_events):
+        notes_a, notes_b = track_notes(a), track_notes(b)
+        assert [n[:2] for n in notes_a] == [n[:2] for n in notes_b]
+        for na, nb in zip(notes_a, notes_b):
+            assert na[2:] == pytest.approx(nb[2:], abs=1e-6)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for NoteIntervalIndex against the nested loops it replaced.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from melody_generation.coordinator import Collision, CollisionDetector, NoteIntervalIndex
+from melody_generation.models import NoteEvent, Pitch, TrackContext
+
+
+def random_notes(rng: random.Random, count: int, grid: bool) -> list:
+    """Notes over 32 beats; on a 1/8 grid (exact boundary hits) or at float starts."""
+    notes = []
+    for _ in range(count):
+        if grid:
+            start = rng.randrange(0, 256) * 0.125
+            duration = rng.randint(1, 16) * 0.125
+        else:
+            start = rng.uniform(0, 32)
+            duration = rng.choice([rng.uniform(0.01, 0.5), rng.uniform(0.5, 8.0)])
+        notes.append(NoteEvent(Pitch.from_midi(rng.randint(36, 84)), start, duration))
+    return notes
+
+
+def nested_collisions(track1, track2, tolerance):
+    """CollisionDetector.find_collisions as a plain nested loop."""
+    collisions = []
+    for n1 in track1:
+        for n2 in track2:
+            if not (n1.start_beat < n2.end_beat + tolerance and
+                    n2.start_beat < n1.end_beat + tolerance):
+                continue
+            interval = abs(n1.pitch.midi_note - n2.pitch.midi_note)
+            if interval == 0:
+                kind = "unison"
+            elif interval % 12 == 0:
+                kind = "octave"
+            elif n1.pitch.pitch_class == n2.pitch.pitch_class:
+                kind = "same_pitch_class"
+            else:
+                continue
+            collisions.append(Collision(max(n1.start_beat, n2.start_beat), n1.pitch.midi_note,
+                                        "track1", "track2", kind))
+    return collisions
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_find_collisions_matches_nested_loop(seed):
+    rng = random.Random(seed)
+    grid = seed % 2 == 0
+    tolerance = rng.choice([0.0, 0.125, 0.25, 1.0, rng.uniform(0, 0.5)])
+    track1 = random_notes(rng, rng.randint(0, 40), grid)
+    track2 = random_notes(rng, rng.randint(0, 60), grid)
+
+    assert CollisionDetector.find_collisions(track1, track2, tolerance=tolerance) == \
+        nested_collisions(track1, track2, tolerance)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_incremental_add_matches_nested_loop(seed):
+    """Notes added one at a time (a long note late) answer like a bulk-built index."""
+    rng = random.Random(seed)
+    grid = seed % 2 == 0
+    tolerance = rng.choice([0.0, 0.125, 0.5])
+    context = random_notes(rng, 40, grid)
+    # A long note added after short ones must widen later lookbacks
+    context.insert(30, NoteEvent(Pitch.from_midi(60), 1.0, 24.0))
+
+    index = NoteIntervalIndex()
+    for i, note in enumerate(context, 1):
+        index.add(note)
+        assert len(index) == i
+
+    bulk = NoteIntervalIndex(context)
+    for candidate in random_notes(rng, 40, grid) + [NoteEvent(Pitch.from_midi(72), 20.0, 0.5)]:
+        expected = []
+        for other in context:
+            for collision in nested_collisions([candidate], [other], tolerance):
+                expected.append((other, collision.type))
+        got = index.collisions(candidate, tolerance)
+        assert [(id(n), kind) for n, kind in got] == [(id(n), kind) for n, kind in expected]
+        assert got == bulk.collisions(candidate, tolerance)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_notes_at_matches_track_context(seed):
+    rng = random.Random(seed)
+    grid = seed % 2 == 0
+    context = TrackContext(bass_notes=random_notes(rng, 30, grid),
+                           arp_notes=random_notes(rng, 30, grid))
+    index = NoteIntervalIndex(context.bass_notes + context.arp_notes)
+
+    for _ in range(50):
+        beat = rng.randrange(0, 300) * 0.125 if grid else rng.uniform(-1, 34)
+        tolerance = rng.choice([0.0, 0.125, 0.3])
+        assert index.notes_at(beat, tolerance) == context.notes_at_beat(beat, tolerance)
+
+
+def test_overlapping_boundaries():
+    note = NoteEvent(Pitch.from_midi(60), 4.0, 1.0)     # [4, 5)
+    index = NoteIntervalIndex([note])
+
+    assert index.overlapping(5.0, 6.0) == []
+    assert index.overlapping(3.0, 4.0) == []
+    assert index.overlapping(4.99, 6.0) == [note]
+    assert index.overlapping(5.125, 6.0, tolerance=0.125) == []
+    assert index.overlapping(5.1, 6.0, tolerance=0.125) == [note]
+    assert index.overlapping(0.0, 10.0, pitch_class=Pitch.from_midi(61).pitch_class) == []
+
+
+def test_float_rounding_at_window_edges():
+    """Cases where the index bounds round past the exact test without _SLACK."""
+    # 0.9 - 0.2 <= 0.7, but 0.7 + 0.2 rounds below 0.9
+    note = NoteEvent(Pitch.from_midi(60), 0.9, 0.5)
+    assert NoteIntervalIndex([note]).notes_at(0.7, tolerance=0.2) == [note]
+
+    # 3.6 < 1.8 + 1.1 + 0.7, but 3.6 - 0.7 - 1.1 rounds above 1.8
+    note = NoteEvent(Pitch.from_midi(60), 1.8, 1.1)
+    index = NoteIntervalIndex([note])
+    assert index.overlapping(3.6, 4.0, tolerance=0.7) == [note]
+    assert index.notes_at(3.6, tolerance=0.7) == [note]
+    candidate = NoteEvent(Pitch.from_midi(72), 3.6, 0.5)
+    assert index.collisions(candidate, tolerance=0.7) == [(note, "octave")]
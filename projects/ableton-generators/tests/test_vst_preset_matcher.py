@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the PresetIndex-backed VSTPresetMatcher.search.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from vst_preset_matcher import PRESET_DATABASE, SoundCategory, VSTPresetMatcher
+
+from tests.preset_fixtures import brute_force_search, random_search, synthetic_catalog
+
+
+@pytest.mark.parametrize("available", [[], ["Serum", "Vital", "Operator"]])
+def test_search_matches_brute_force_on_synthetic_catalog(available):
+    matcher = VSTPresetMatcher(synthetic_catalog(1000, seed=1), available_synths=available)
+    rng = random.Random(2)
+
+    for _ in range(300):
+        kwargs = random_search(rng)
+        assert matcher.search(**kwargs) == brute_force_search(matcher, **kwargs), kwargs
+
+
+def test_search_matches_brute_force_on_builtin_presets():
+    matcher = VSTPresetMatcher()
+    for track_type in ["kick", "bass", "lead", "pad", "arp", "fx", "atmosphere"]:
+        kwargs = dict(query=track_type, genre="trance", mood="euphoric", energy=0.7, limit=5)
+        assert matcher.search(**kwargs) == brute_force_search(matcher, **kwargs)
+
+    kwargs = dict(query="fat supersaw lead", category=SoundCategory.LEAD, synth="serum", limit=20)
+    assert matcher.search(**kwargs) == brute_force_search(matcher, **kwargs)
+
+
+def test_index_follows_replaced_preset_list():
+    matcher = VSTPresetMatcher()
+    assert matcher.search("supersaw", limit=50)
+
+    matcher.presets = synthetic_catalog(200, seed=3)
+    assert matcher.search("supersaw", limit=50) == \
+        brute_force_search(matcher, "supersaw", limit=50)
+
+    matcher.presets.append(PRESET_DATABASE[0])
+    assert matcher.search("trance supersaw", limit=50) == \
+        brute_force_search(matcher, "trance supersaw", limit=50)
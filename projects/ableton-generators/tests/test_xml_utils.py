@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for IdAllocator ID bookkeeping on cloned template tracks.
+"""
+
+import copy
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import base_template
+from xml_utils import IdAllocator, load_als, validate_als_structure
+
+
+@pytest.fixture
+def template_root(tmp_path):
+    path = tmp_path / "base_template.als"
+    base_template.build_als(str(path), num_midi_tracks=2, num_audio_tracks=1)
+    return load_als(path)
+
+
+def _clone_midi_tracks(root, count):
+    """Replace the template tracks with `count` clones, like _create_tracks."""
+    tracks_elem = root.find("LiveSet/Tracks")
+    template = tracks_elem.find("MidiTrack")
+    ids = IdAllocator(root)
+
+    for track in tracks_elem.findall("MidiTrack") + tracks_elem.findall("AudioTrack"):
+        ids.unregister(track)
+        tracks_elem.remove(track)
+
+    clones = []
+    for i in range(count):
+        new_track = copy.deepcopy(template)
+        ids.renumber(new_track)
+        tracks_elem.insert(i, new_track)
+        clones.append(new_track)
+
+    ids.write_next_pointee_id(root)
+    return clones, ids
+
+
+def test_template_shares_ids_between_pointee_and_other_elements(template_root):
+    """The case the renumbering must handle: one old Id, two element kinds."""
+    track = template_root.find("LiveSet/Tracks/MidiTrack")
+    pointee_ids = {e.get("Id") for e in track.iter("Pointee")}
+    other_ids = {e.get("Id") for e in track.iter() if "Id" in e.attrib and e.tag != "Pointee"}
+    assert pointee_ids & other_ids
+
+
+def test_cloned_tracks_have_no_duplicate_ids(template_root):
+    clones, _ = _clone_midi_tracks(template_root, 4)
+
+    clone_ids = [e.get("Id") for track in clones for e in track.iter() if "Id" in e.attrib]
+    assert len(clone_ids) == len(set(clone_ids))
+
+    cloned = set(map(id, (e for track in clones for e in track.iter())))
+    rest_ids = {e.get("Id") for e in template_root.iter()
+                if "Id" in e.attrib and id(e) not in cloned}
+    assert not set(clone_ids) & rest_ids
+
+    result = validate_als_structure(template_root)
+    assert result.is_valid, result.errors
+    assert not any(dup in clone_ids for dup in IdAllocator(template_root).duplicates)
+
+
+@pytest.mark.parametrize("owner", ["Mixer", "MainSequencer"])
+def test_cloned_pointee_id_follows_its_pointee(template_root, owner):
+    # The Mixer Pointee shares its Id with a ClipSlot, the MainSequencer one does not
+    template = template_root.find("LiveSet/Tracks/MidiTrack")
+    old_id = template.find(f".//{owner}/Pointee").get("Id")
+    ET.SubElement(template, "PointeeId", Value=old_id)
+
+    clones, ids = _clone_midi_tracks(template_root, 3)
+
+    for track in clones:
+        pointees = {e.get("Id") for e in track.iter("Pointee")}
+        refs = [e.get("Value") for e in track.iter("PointeeId")]
+        assert refs == [track.find(f".//{owner}/Pointee").get("Id")]
+        assert set(refs) <= pointees
+
+    assert not ids.referenced_ids - ids.all_ids
+    assert old_id not in ids.referenced_ids
@@ -134,26 +134,16 @@ class TextureMIDIExporter:
         return result
 
 
-def generate_textures_for_song(
-    spec: SongSpec,
-    output_dir: Path = None
-) -> Dict[str, str]:
+def generate_song_textures(spec: SongSpec) -> Dict[str, List[Tuple]]:
     """
-    Generate all texture MIDI files for a song specification.
+    Generate all texture events for a song specification in memory.
 
     Args:
         spec: SongSpec with structure and mood
-        output_dir: Directory for MIDI files (default: spec output dir)
 
     Returns:
-        Dict of texture_type -> filepath
+        Dict of texture_type -> events (tuples in TextureGenerator format)
     """
-    if output_dir is None:
-        output_dir = DEFAULT_CONFIG.get_midi_dir(spec.name)
-
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
     # Create texture generator with song parameters
     mood = get_mood_from_string(spec.mood)
     gen = TextureGenerator(
@@ -171,8 +161,30 @@ def generate_textures_for_song(
         structure[section.name] = section.bars
         energy_curve[section.name] = section.energy
 
-    # Generate textures
-    textures = gen.generate_full_song_textures(structure, energy_curve)
+    return gen.generate_full_song_textures(structure, energy_curve)
+
+
+def generate_textures_for_song(
+    spec: SongSpec,
+    output_dir: Path = None
+) -> Dict[str, str]:
+    """
+    Generate all texture MIDI files for a song specification.
+
+    Args:
+        spec: SongSpec with structure and mood
+        output_dir: Directory for MIDI files (default: spec output dir)
+
+    Returns:
+        Dict of texture_type -> filepath
+    """
+    if output_dir is None:
+        output_dir = DEFAULT_CONFIG.get_midi_dir(spec.name)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    textures = generate_song_textures(spec)
 
     # Export to MIDI
     exporter = TextureMIDIExporter()
@@ -17,11 +17,13 @@ Features:
 - Tag-based filtering
 - Genre-specific recommendations
 - Fallback chains for missing synths
+- Inverted index (PresetIndex) so searches scale to large preset catalogs
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Iterable, List, Dict, Set, Optional, Tuple
 from enum import Enum
+import heapq
 import re
 
 
@@ -72,44 +74,16 @@ class PresetInfo:
         Returns 0-1 match score.
         """
         query_lower = query.lower()
-        query_words = set(re.findall(r'\w+', query_lower))
-
-        score = 0.0
-        max_score = 0.0
-
-        # Name match (high weight)
-        max_score += 3.0
-        if query_lower in self.name.lower():
-            score += 3.0
-        else:
-            name_words = set(re.findall(r'\w+', self.name.lower()))
-            name_overlap = len(query_words & name_words) / max(1, len(query_words))
-            score += name_overlap * 2.0
-
-        # Tag matches (high weight)
-        max_score += 3.0
-        tag_set = set(t.lower() for t in self.tags)
-        tag_overlap = len(query_words & tag_set) / max(1, len(query_words))
-        score += tag_overlap * 3.0
-
-        # Genre matches
-        max_score += 2.0
-        genre_set = set(g.lower() for g in self.genres)
-        if query_words & genre_set:
-            score += 2.0
-
-        # Mood matches
-        max_score += 2.0
-        mood_set = set(m.lower() for m in self.moods)
-        if query_words & mood_set:
-            score += 2.0
-
-        # Category match
-        max_score += 1.0
-        if self.category.value in query_lower:
-            score += 1.0
-
-        return score / max_score if max_score > 0 else 0.0
+        return _query_score(
+            query_lower,
+            _words(query_lower),
+            self.name.lower(),
+            _words(self.name.lower()),
+            set(t.lower() for t in self.tags),
+            set(g.lower() for g in self.genres),
+            set(m.lower() for m in self.moods),
+            self.category.value,
+        )
 
     def matches_tags(self, required_tags: List[str]) -> bool:
         """Check if preset has all required tags."""
@@ -133,6 +107,56 @@ class PresetInfo:
         }
 
 
+def _words(text: str) -> Set[str]:
+    """Word tokens of an already lower-cased text."""
+    return set(re.findall(r'\w+', text))
+
+
+def _query_score(
+    query_lower: str,
+    query_words: Set[str],
+    name_lower: str,
+    name_words: Set[str],
+    tag_set: Set[str],
+    genre_set: Set[str],
+    mood_set: Set[str],
+    category_value: str,
+) -> float:
+    """0-1 match score of a query against a preset's lower-cased fields."""
+    score = 0.0
+    max_score = 0.0
+
+    # Name match (high weight)
+    max_score += 3.0
+    if query_lower in name_lower:
+        score += 3.0
+    else:
+        name_overlap = len(query_words & name_words) / max(1, len(query_words))
+        score += name_overlap * 2.0
+
+    # Tag matches (high weight)
+    max_score += 3.0
+    tag_overlap = len(query_words & tag_set) / max(1, len(query_words))
+    score += tag_overlap * 3.0
+
+    # Genre matches
+    max_score += 2.0
+    if query_words & genre_set:
+        score += 2.0
+
+    # Mood matches
+    max_score += 2.0
+    if query_words & mood_set:
+        score += 2.0
+
+    # Category match
+    max_score += 1.0
+    if category_value in query_lower:
+        score += 1.0
+
+    return score / max_score if max_score > 0 else 0.0
+
+
 @dataclass
 class SynthInfo:
     """Information about a synthesizer."""
@@ -585,6 +609,193 @@ PRESET_DATABASE: List[PresetInfo] = [
 ]
 
 
+# =============================================================================
+# PRESET INDEX
+# =============================================================================
+
+ENERGY_BUCKETS = 20       # Energy-range buckets over 0-1
+NAME_GRAM_SIZE = 3        # Length of the indexed name substrings (n-grams)
+
+# Set bit positions of every byte value
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+@dataclass
+class _IndexedPreset:
+    """Lower-cased, pre-tokenized fields of one preset."""
+    preset: PresetInfo
+    name_lower: str
+    name_words: Set[str]
+    tag_set: Set[str]
+    genre_set: Set[str]
+    mood_set: Set[str]
+    synth_lower: str
+    all_genres: bool        # "all" in genres
+    all_moods: bool         # "all" in moods
+
+
+class PresetIndex:
+    """
+    Inverted index over a preset list.
+
+    Postings are bitsets (Python ints, bit i = i-th preset) so filters are
+    combined with a few big-int ANDs:
+    - word -> presets with that word in name, tags, genres or moods
+    - name trigram -> presets (substring matches of the whole query)
+    - category, tag, genre, mood and synth -> presets
+    - energy bucket -> presets whose energy range reaches into it
+
+    Built once; VSTPresetMatcher rebuilds it when its preset list changes.
+    """
+
+    def __init__(self, presets: List[PresetInfo]):
+        self.presets = presets
+        self.size = len(presets)
+        self.entries: List[_IndexedPreset] = []
+
+        words: Dict[str, List[int]] = {}
+        grams: Dict[str, List[int]] = {}
+        categories: Dict[SoundCategory, List[int]] = {}
+        tags: Dict[str, List[int]] = {}
+        genres: Dict[str, List[int]] = {}
+        moods: Dict[str, List[int]] = {}
+        synths: Dict[str, List[int]] = {}
+        energy: List[List[int]] = [[] for _ in range(ENERGY_BUCKETS)]
+
+        for i, preset in enumerate(presets):
+            name_lower = preset.name.lower()
+            entry = _IndexedPreset(
+                preset=preset,
+                name_lower=name_lower,
+                name_words=_words(name_lower),
+                tag_set=set(t.lower() for t in preset.tags),
+                genre_set=set(g.lower() for g in preset.genres),
+                mood_set=set(m.lower() for m in preset.moods),
+                synth_lower=preset.synth.lower(),
+                all_genres="all" in preset.genres,
+                all_moods="all" in preset.moods,
+            )
+            self.entries.append(entry)
+
+            for word in entry.name_words | entry.tag_set | entry.genre_set | entry.mood_set:
+                words.setdefault(word, []).append(i)
+            for gram in self._name_grams(name_lower):
+                grams.setdefault(gram, []).append(i)
+            categories.setdefault(preset.category, []).append(i)
+            for tag in entry.tag_set:
+                tags.setdefault(tag, []).append(i)
+            for genre in entry.genre_set:
+                genres.setdefault(genre, []).append(i)
+            for mood in entry.mood_set:
+                moods.setdefault(mood, []).append(i)
+            synths.setdefault(entry.synth_lower, []).append(i)
+            low, high = preset.energy_range
+            for bucket in range(self._bucket(low), self._bucket(high) + 1):
+                energy[bucket].append(i)
+
+        self.all_mask = (1 << self.size) - 1
+        self.words = self._masks(words)
+        self.grams = self._masks(grams)
+        self.categories = self._masks(categories)
+        self.tags = self._masks(tags)
+        self.genres = self._masks(genres)
+        self.moods = self._masks(moods)
+        self.synths = self._masks(synths)
+        self.energy = [self._mask(indices) for indices in energy]
+        self.all_genres_mask = self._mask([i for i, e in enumerate(self.entries) if e.all_genres])
+        self.all_moods_mask = self._mask([i for i, e in enumerate(self.entries) if e.all_moods])
+
+    def genre_mask(self, genre: str) -> int:
+        """Presets tagged with a genre (or with "all")."""
+        return self.genres.get(genre.lower(), 0) | self.all_genres_mask
+
+    def mood_mask(self, mood: str) -> int:
+        """Presets tagged with a mood (or with "all")."""
+        return self.moods.get(mood.lower(), 0) | self.all_moods_mask
+
+    # ==================== BITSETS ====================
+
+    def _mask(self, indices: List[int]) -> int:
+        bits = bytearray((self.size + 7) // 8)
+        for i in indices:
+            bits[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(bits, 'little')
+
+    def _masks(self, postings: Dict) -> Dict:
+        return {key: self._mask(indices) for key, indices in postings.items()}
+
+    def indices(self, mask: int) -> List[int]:
+        """Positions of the set bits of a mask, ascending."""
+        data = mask.to_bytes((self.size + 7) // 8, 'little')
+        return [
+            byte_index * 8 + bit
+            for byte_index, value in enumerate(data) if value
+            for bit in _BYTE_BITS[value]
+        ]
+
+    # ==================== KEYS ====================
+
+    @staticmethod
+    def _name_grams(name_lower: str) -> Set[str]:
+        """All substrings of NAME_GRAM_SIZE characters."""
+        return {
+            name_lower[start:start + NAME_GRAM_SIZE]
+            for start in range(len(name_lower) - NAME_GRAM_SIZE + 1)
+        }
+
+    @staticmethod
+    def _bucket(energy: float) -> int:
+        return min(ENERGY_BUCKETS - 1, max(0, int(energy * ENERGY_BUCKETS)))
+
+    # ==================== CANDIDATES ====================
+
+    def query_mask(self, query_lower: str, query_words: Set[str], within: int) -> int:
+        """
+        Presets (of the candidates in within) that can reach the minimum query score.
+
+        A preset scores nothing for a query unless it shares a word with
+        it or its name contains the whole query; the category bonus alone
+        stays below the search threshold.
+        """
+        mask = 0
+        for word in query_words:
+            mask |= self.words.get(word, 0)
+        mask &= within
+
+        # Name substring: the name holds every trigram of the query
+        if len(query_lower) >= NAME_GRAM_SIZE:
+            substring = within
+            for start in range(len(query_lower) - NAME_GRAM_SIZE + 1):
+                substring &= self.grams.get(query_lower[start:start + NAME_GRAM_SIZE], 0)
+                if not substring:
+                    break
+            return mask | substring
+
+        # Shorter than a trigram: check the remaining candidates' names
+        return mask | self._mask([
+            i for i in self.indices(within & ~mask)
+            if query_lower in self.entries[i].name_lower
+        ])
+
+    def energy_mask(self, energy: float) -> int:
+        """Superset of the presets whose energy range contains energy."""
+        return self.energy[self._bucket(energy)]
+
+    def tags_mask(self, tags: Iterable[str]) -> int:
+        """Presets having all tags."""
+        mask = self.all_mask
+        for tag in tags:
+            mask &= self.tags.get(tag.lower(), 0)
+        return mask
+
+    def synth_mask(self, synths: Iterable[str]) -> int:
+        """Presets of any of the (lower-case) synths."""
+        mask = 0
+        for synth in synths:
+            mask |= self.synths.get(synth, 0)
+        return mask
+
+
 # =============================================================================
 # PRESET MATCHER CLASS
 # =============================================================================
@@ -609,6 +820,14 @@ class VSTPresetMatcher:
         self.presets = preset_db or PRESET_DATABASE
         self.synths = synth_db or SYNTH_DATABASE
         self.available_synths = set(s.lower() for s in (available_synths or []))
+        self._index = PresetIndex(self.presets)
+
+    @property
+    def index(self) -> PresetIndex:
+        """Index of self.presets (rebuilt if the list was replaced or resized)."""
+        if self._index.presets is not self.presets or self._index.size != len(self.presets):
+            self._index = PresetIndex(self.presets)
+        return self._index
 
     def set_available_synths(self, synths: List[str]):
         """Set which synths are available on this system."""
@@ -643,77 +862,101 @@ class VSTPresetMatcher:
         Returns:
             List of matching PresetInfo objects, sorted by relevance
         """
+        index = self.index
+        candidates = index.all_mask
+
+        # Category filter
+        if category:
+            candidates &= index.categories.get(category, 0)
+
+        genre_lower = genre.lower() if genre else None
+        mood_lower = mood.lower() if mood else None
+
+        # Energy filter (strict; buckets narrow it, the range check below is exact)
+        if energy is not None:
+            candidates &= index.energy_mask(energy)
+
+        # Tag filter
+        if tags:
+            candidates &= index.tags_mask(tags)
+
+        # Synth filter
+        if synth:
+            synth_lower = synth.lower()
+            if not include_alternatives:
+                candidates &= index.synth_mask([synth_lower])
+            else:
+                synth_info = self.synths.get(synth_lower)
+                if synth_info:
+                    candidates &= index.synth_mask(
+                        [synth_lower] + [a.lower() for a in synth_info.alternatives]
+                    )
+
+        # Query matching (last, so short queries only scan the remaining candidates)
+        if query:
+            query_lower = query.lower()
+            query_words = _words(query_lower)
+            candidates = index.query_mask(query_lower, query_words, candidates)
+
         results = []
 
-        for preset in self.presets:
+        for i in index.indices(candidates):
+            entry = index.entries[i]
+            preset = entry.preset
             score = 0.0
 
-            # Query matching
             if query:
-                query_score = preset.matches_query(query)
+                query_score = _query_score(
+                    query_lower, query_words, entry.name_lower, entry.name_words,
+                    entry.tag_set, entry.genre_set, entry.mood_set, preset.category.value
+                )
                 if query_score < 0.1:
                     continue
                 score += query_score * 5
 
-            # Category filter
-            if category and preset.category != category:
-                continue
-            elif category:
+            if category:
                 score += 1.0
 
-            # Genre filter
             if genre:
-                genre_lower = genre.lower()
-                if genre_lower in [g.lower() for g in preset.genres] or "all" in preset.genres:
+                if genre_lower in entry.genre_set or entry.all_genres:
                     score += 2.0
                 else:
                     score -= 0.5  # Penalty but don't exclude
 
-            # Mood filter
             if mood:
-                mood_lower = mood.lower()
-                if mood_lower in [m.lower() for m in preset.moods] or "all" in preset.moods:
+                if mood_lower in entry.mood_set or entry.all_moods:
                     score += 2.0
                 else:
                     score -= 0.3
 
-            # Energy filter
             if energy is not None:
                 if preset.energy_range[0] <= energy <= preset.energy_range[1]:
                     score += 1.0
                 else:
-                    continue  # Strict energy filtering
-
-            # Tag filter
-            if tags and not preset.matches_tags(tags):
-                continue
+                    continue
 
-            # Synth filter
             if synth:
-                if preset.synth.lower() != synth.lower():
-                    if include_alternatives:
-                        synth_info = self.synths.get(synth.lower())
-                        if synth_info and preset.synth.lower() not in [a.lower() for a in synth_info.alternatives]:
-                            continue
-                        score -= 0.5  # Penalty for alternative
-                    else:
-                        continue
+                if entry.synth_lower != synth_lower:
+                    score -= 0.5  # Penalty for alternative
             else:
                 score += 1.0
 
             # Availability bonus
             if self.available_synths:
-                if preset.synth.lower() in self.available_synths:
+                if entry.synth_lower in self.available_synths:
                     score += 2.0
                 else:
                     score -= 1.0  # Penalty but still include
 
-            results.append((score, preset))
+            results.append((score, i))
 
-        # Sort by score descending
-        results.sort(key=lambda x: x[0], reverse=True)
+        # Top results by score; ties keep catalog order
+        if limit >= 0:
+            top = heapq.nlargest(limit, results, key=lambda x: x[0])
+        else:
+            top = sorted(results, key=lambda x: x[0], reverse=True)[:limit]
 
-        return [preset for _, preset in results[:limit]]
+        return [index.entries[i].preset for _, i in top]
 
     def get_preset_for_track(
         self,
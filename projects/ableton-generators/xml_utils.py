@@ -53,48 +53,201 @@ def analyze_ids(root: ET.Element) -> IdAnalysis:
     - next_pointee_id: Value of NextPointeeId element
     - duplicates: Any duplicate IDs found
     """
-    all_ids: Set[str] = set()
-    id_counts: Dict[str, int] = {}
-    max_numeric = 0
+    return IdAllocator(root).analysis()
 
-    # Collect all IDs
-    for elem in root.iter():
-        if 'Id' in elem.attrib:
-            id_val = elem.attrib['Id']
-            all_ids.add(id_val)
-            id_counts[id_val] = id_counts.get(id_val, 0) + 1
-            try:
-                num_id = int(id_val)
-                if num_id > max_numeric:
-                    max_numeric = num_id
-            except ValueError:
-                pass
 
-    # Collect referenced IDs (Pointee elements)
-    referenced_ids: Set[str] = set()
-    for elem in root.findall('.//Pointee'):
-        if 'Id' in elem.attrib:
-            referenced_ids.add(elem.attrib['Id'])
-
-    # Collect PointeeId references (different format)
-    for elem in root.findall('.//PointeeId'):
-        if 'Value' in elem.attrib:
-            referenced_ids.add(elem.attrib['Value'])
-
-    # Get NextPointeeId
-    next_id_elem = root.find('.//LiveSet/NextPointeeId')
-    next_pointee_id = int(next_id_elem.get('Value')) if next_id_elem is not None else max_numeric + 1
-
-    # Find duplicates
-    duplicates = {k: v for k, v in id_counts.items() if v > 1}
-
-    return IdAnalysis(
-        all_ids=all_ids,
-        referenced_ids=referenced_ids,
-        max_numeric_id=max_numeric,
-        next_pointee_id=next_pointee_id,
-        duplicates=duplicates,
-    )
+def _numeric_id(id_val: str) -> Optional[int]:
+    try:
+        return int(id_val)
+    except ValueError:
+        return None
+
+
+class IdAllocator:
+    """
+    Incremental ID index for one Live Set.
+
+    Built with a single walk over the document, then kept up to date as
+    subtrees are cloned or inserted, so generating a set never walks the
+    whole tree again:
+    - renumber(): give a cloned subtree fresh IDs and rewrite its internal
+      Pointee/PointeeId references (one pass over the subtree)
+    - register() / unregister(): index a subtree inserted as-is / removed
+    - take() / claim(): hand out new IDs / record IDs assigned elsewhere
+    - write_next_pointee_id(): store the counter in LiveSet/NextPointeeId
+
+    Usage:
+        ids = IdAllocator(root)
+        ids.renumber(copy.deepcopy(template_track))
+        next_id = embed_clips_in_track(track, clips, ids.next_id)
+        ids.claim_range(start_id, next_id)
+        ids.write_next_pointee_id(root)
+    """
+
+    def __init__(self, root: Optional[ET.Element] = None):
+        self.id_counts: Dict[str, int] = {}
+        self.ref_counts: Dict[str, int] = {}
+        self.max_numeric_id = 0
+        self.next_pointee_id = 0
+        self.next_id = 1
+
+        if root is not None:
+            self.register(root)
+            next_id_elem = root.find('.//LiveSet/NextPointeeId')
+            if next_id_elem is not None:
+                self.next_pointee_id = int(next_id_elem.get('Value'))
+            else:
+                self.next_pointee_id = self.max_numeric_id + 1
+
+        # First ID that is neither used nor below NextPointeeId
+        self.next_id = max(self.max_numeric_id, self.next_pointee_id) + 1
+
+    # ==================== INDEX ====================
+
+    def _add_id(self, id_val: str):
+        self.id_counts[id_val] = self.id_counts.get(id_val, 0) + 1
+        num_id = _numeric_id(id_val)
+        if num_id is not None and num_id > self.max_numeric_id:
+            self.max_numeric_id = num_id
+            self.next_id = max(self.next_id, num_id + 1)
+
+    def _add_ref(self, id_val: str):
+        self.ref_counts[id_val] = self.ref_counts.get(id_val, 0) + 1
+
+    @staticmethod
+    def _discard(counts: Dict[str, int], key: str):
+        if counts.get(key, 0) > 1:
+            counts[key] -= 1
+        else:
+            counts.pop(key, None)
+
+    def register(self, elem: ET.Element):
+        """Index the IDs and references of a subtree inserted as-is."""
+        for e in elem.iter():
+            if 'Id' in e.attrib:
+                self._add_id(e.attrib['Id'])
+                if e.tag == 'Pointee':
+                    self._add_ref(e.attrib['Id'])
+            if e.tag == 'PointeeId' and 'Value' in e.attrib:
+                self._add_ref(e.attrib['Value'])
+
+    def unregister(self, elem: ET.Element):
+        """
+        Forget the IDs and references of a removed subtree.
+
+        Freed IDs are not handed out again, and max_numeric_id never goes down.
+        """
+        for e in elem.iter():
+            if 'Id' in e.attrib:
+                self._discard(self.id_counts, e.attrib['Id'])
+                if e.tag == 'Pointee':
+                    self._discard(self.ref_counts, e.attrib['Id'])
+            if e.tag == 'PointeeId' and 'Value' in e.attrib:
+                self._discard(self.ref_counts, e.attrib['Value'])
+
+    @property
+    def all_ids(self) -> Set[str]:
+        return set(self.id_counts)
+
+    @property
+    def referenced_ids(self) -> Set[str]:
+        """IDs referenced by Pointee/PointeeId elements."""
+        return set(self.ref_counts)
+
+    @property
+    def duplicates(self) -> Dict[str, int]:
+        return {k: v for k, v in self.id_counts.items() if v > 1}
+
+    def analysis(self) -> IdAnalysis:
+        """Current state as an IdAnalysis (same fields as analyze_ids())."""
+        return IdAnalysis(
+            all_ids=self.all_ids,
+            referenced_ids=self.referenced_ids,
+            max_numeric_id=self.max_numeric_id,
+            next_pointee_id=self.next_pointee_id,
+            duplicates=self.duplicates,
+        )
+
+    # ==================== ALLOCATION ====================
+
+    def take(self) -> int:
+        """Hand out the next free ID."""
+        new_id = self.next_id
+        self.claim(new_id)
+        return new_id
+
+    def claim(self, id_val: int):
+        """Record an ID assigned outside the allocator."""
+        self._add_id(str(id_val))
+
+    def skip_to(self, next_id: int):
+        """Never hand out IDs below next_id (e.g. a block reserved by a caller)."""
+        self.next_id = max(self.next_id, next_id)
+
+    def claim_range(self, start: int, stop: int):
+        """Record the consecutive IDs start..stop-1 (e.g. from embed_clips_in_track)."""
+        for id_val in range(start, stop):
+            self.id_counts[str(id_val)] = self.id_counts.get(str(id_val), 0) + 1
+        if stop - 1 > self.max_numeric_id:
+            self.max_numeric_id = stop - 1
+        self.next_id = max(self.next_id, stop)
+
+    def renumber(self, elem: ET.Element) -> Dict[str, str]:
+        """
+        Give every Id in a (cloned) subtree a fresh ID and rewrite the
+        subtree's PointeeId references to match.
+
+        Pointee elements get a fresh ID like any other element. Templates
+        reuse small IDs across element kinds (e.g. a Mixer Pointee and a
+        ClipSlot both "7"), so PointeeId references resolve to the
+        renumbered Pointee first and to other elements only if no Pointee
+        had that ID.
+
+        Returns:
+            Dict mapping old_id -> new_id
+        """
+        id_mapping: Dict[str, str] = {}
+        pointee_mapping: Dict[str, str] = {}
+        pointee_ids: List[ET.Element] = []
+
+        for e in elem.iter():
+            if 'Id' in e.attrib:
+                old_id = e.attrib['Id']
+                new_id = str(self.take())
+                e.set('Id', new_id)
+                if e.tag == 'Pointee':
+                    pointee_mapping[old_id] = new_id
+                    self._add_ref(new_id)
+                id_mapping[old_id] = new_id
+            if e.tag == 'PointeeId' and 'Value' in e.attrib:
+                pointee_ids.append(e)
+
+        id_mapping.update(pointee_mapping)
+
+        for e in pointee_ids:
+            old_ref = e.attrib['Value']
+            if old_ref in id_mapping:
+                e.set('Value', id_mapping[old_ref])
+            self._add_ref(e.attrib['Value'])
+
+        return id_mapping
+
+    def write_next_pointee_id(self, root: ET.Element, headroom: int = 0) -> int:
+        """
+        Set LiveSet/NextPointeeId above every ID handed out so far.
+
+        Args:
+            root: Ableton Live Set root element
+            headroom: Extra IDs to leave unused
+
+        Returns:
+            The value written
+        """
+        value = self.next_id + headroom
+        update_next_pointee_id(root, value)
+        self.next_pointee_id = value
+        self.next_id = max(self.next_id, value)
+        return value
 
 
 def get_max_id(root: ET.Element) -> int:
@@ -10,6 +10,7 @@ Usage:
     als-doctor db list          List all scanned projects
     als-doctor db history <song> Show version history for a song
     als-doctor db status        Show library status summary
+    als-doctor db snapshots     Show/backfill stored project snapshots
     als-doctor scan <dir>       Scan directory for .als files
     als-doctor diagnose <file>  Analyze a single .als file
     als-doctor best <song>      Find the best version of a song
@@ -61,6 +62,7 @@ from database import (
     persist_reference_comparison, get_reference_insights, get_reference_history,
     ReferenceInsights, StoredReferenceComparison, ReferenceRecommendationPattern
 )
+from als_scan import ScanManifest, build_scan_result, plan_without_manifest, scan_files
 from cli_formatter import get_formatter, CLIFormatter, reset_formatter
 from midi_analyzer import MIDIAnalyzer, MIDIAnalysisResult, get_midi_issues
 from html_reports import (
@@ -640,6 +642,63 @@ def _format_change_type(change_type: str) -> str:
     return display_names.get(change_type, change_type)
 
 
+@db.command('snapshots')
+@click.option('--backfill', is_flag=True, help='Create snapshots for versions that have none')
+@click.option('--project', 'include_project', is_flag=True,
+              help='Also store full project data (clips, notes, structure)')
+@click.option('--force', is_flag=True, help='Rebuild snapshots even if they are current')
+@click.pass_context
+def db_snapshots_cmd(ctx, backfill: bool, include_project: bool, force: bool):
+    """Show or build stored project snapshots.
+
+    Snapshots keep each version's device analysis next to the database,
+    so history, change tracking and comparisons don't re-parse old .als
+    files. New scans saved with --save store them automatically; use
+    --backfill once for versions scanned before snapshots existed.
+
+    Example:
+        als-doctor db snapshots
+        als-doctor db snapshots --backfill
+        als-doctor db snapshots --backfill --project
+    """
+    from project_snapshots import backfill_snapshots, get_snapshot_store
+
+    fmt = ctx.obj.get('formatter', get_formatter())
+    database = get_db()
+
+    if not database.is_initialized():
+        fmt.error("Database not initialized. Run 'als-doctor db init' first.")
+        raise SystemExit(1)
+
+    if backfill:
+        def progress(index: int, total: int, filename: str):
+            print(f"\r[{index}/{total}] {filename[:50]:<50}", end="", flush=True)
+
+        result = backfill_snapshots(include_project=include_project, force=force, progress=progress)
+        print()
+        fmt.success(
+            f"Snapshots: {result.created} created, {result.up_to_date} up to date, "
+            f"{result.missing_files} missing .als, {result.failed} failed"
+        )
+        for error in result.errors:
+            fmt.warning(error, prefix="  WARN: ")
+        fmt.print("")
+
+    store = get_snapshot_store()
+    snapshots = store.list_snapshots()
+    stats = database.get_stats()
+    versions_covered = len({info.version_id for info in snapshots if info.kind == 'devices'})
+    total_mb = sum(info.size_bytes for info in snapshots) / (1024 * 1024)
+
+    fmt.header("PROJECT SNAPSHOTS")
+    fmt.print(f"Location: {store.directory}")
+    fmt.print(f"Versions with snapshots: {versions_covered}/{stats['versions']}")
+    fmt.print(f"Total size: {total_mb:.1f} MB ({len(snapshots)} file(s))")
+    if versions_covered < stats['versions'] and not backfill:
+        fmt.print("")
+        fmt.print("Run 'als-doctor db snapshots --backfill' to snapshot the remaining versions.")
+
+
 @db.command('insights')
 @click.pass_context
 def db_insights_cmd(ctx):
@@ -2417,53 +2476,8 @@ def _analyze_als_file_full(als_path: Path, fmt: Optional[CLIFormatter] = None):
         fmt = get_formatter()
 
     try:
-        # Import analysis modules
-        from device_chain_analyzer import analyze_als_devices
-        from effect_chain_doctor import EffectChainDoctor
-
-        # Analyze the project
-        analysis = analyze_als_devices(str(als_path))
-        doctor = EffectChainDoctor()
-        diagnosis = doctor.diagnose(analysis)
-
-        # Convert issues to ScanResultIssue format
-        issues = []
-
-        # Add global issues
-        for issue in diagnosis.global_issues:
-            issues.append(ScanResultIssue(
-                track_name=issue.track_name,
-                severity=issue.severity.value,
-                category=issue.category.value,
-                description=issue.description,
-                fix_suggestion=issue.recommendation
-            ))
-
-        # Add track issues
-        for track_diag in diagnosis.track_diagnoses:
-            for issue in track_diag.issues:
-                issues.append(ScanResultIssue(
-                    track_name=issue.track_name,
-                    severity=issue.severity.value,
-                    category=issue.category.value,
-                    description=issue.description,
-                    fix_suggestion=issue.recommendation
-                ))
-
-        scan_result = ScanResult(
-            als_path=str(als_path),
-            health_score=diagnosis.overall_health,
-            grade=_calculate_grade(diagnosis.overall_health),
-            total_issues=diagnosis.total_issues,
-            critical_issues=diagnosis.critical_issues,
-            warning_issues=diagnosis.warning_issues,
-            total_devices=diagnosis.total_devices,
-            disabled_devices=diagnosis.total_disabled,
-            clutter_percentage=diagnosis.clutter_percentage,
-            issues=issues
-        )
-
-        return (scan_result, analysis)
+        scan_result = build_scan_result(als_path)
+        return (scan_result, scan_result.device_analysis)
     except Exception as e:
         fmt.error(f"analyzing {als_path.name}: {e}", prefix="  ERROR ")
         return None
@@ -2473,17 +2487,23 @@ def _analyze_als_file_full(als_path: Path, fmt: Optional[CLIFormatter] = None):
 @click.argument('directory', type=click.Path(exists=True))
 @click.option('--save', is_flag=True, help='Save results to database')
 @click.option('--limit', '-l', type=int, default=None, help='Limit number of files to scan')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=1,
+              help='Analyze files in N parallel processes')
+@click.option('--full', is_flag=True, help='With --save, re-analyze files that did not change since the last saved scan')
 @click.pass_context
-def scan_cmd(ctx, directory: str, save: bool, limit: Optional[int]):
+def scan_cmd(ctx, directory: str, save: bool, limit: Optional[int], jobs: int, full: bool):
     """Scan a directory for .als files.
 
     Recursively scans the directory for Ableton Live Set files
-    and analyzes their health.
+    and analyzes their health. With --save, files whose size, mtime
+    or content did not change since their last saved scan are skipped.
 
     Example:
         als-doctor scan "D:/Ableton Projects"
         als-doctor scan "D:/Ableton Projects" --save
         als-doctor scan "D:/Ableton Projects" --save --limit 10
+        als-doctor scan "D:/Ableton Projects" --save --jobs 8
+        als-doctor scan "D:/Ableton Projects" --save --full
     """
     fmt = ctx.obj.get('formatter', get_formatter())
     dir_path = Path(directory)
@@ -2494,61 +2514,72 @@ def scan_cmd(ctx, directory: str, save: bool, limit: Optional[int]):
 
     fmt.print(f"Found {len(als_files)} .als file(s) in {directory}")
 
-    if save:
-        database = get_db()
-        if not database.is_initialized():
-            fmt.error("Database not initialized. Run 'als-doctor db init' first.")
-            raise SystemExit(1)
+    database = get_db()
+    if save and not database.is_initialized():
+        fmt.error("Database not initialized. Run 'als-doctor db init' first.")
+        raise SystemExit(1)
 
     if not als_files:
         fmt.print("No .als files found.")
         return
 
-    # Analyze each file
-    results = []
+    # With --save, skip files that are unchanged since their last saved scan;
+    # without it every file is analyzed so the report covers all of them
+    manifest = ScanManifest() if save else None
+    plan = manifest.plan(als_files, full=full) if manifest else plan_without_manifest(als_files)
+    if manifest and plan.touched:
+        manifest.refresh(plan.touched)
+    to_analyze = plan.to_analyze
+
+    if plan.skipped:
+        fmt.print(f"Skipping {len(plan.skipped)} unchanged file(s) (use --full to re-analyze)")
+    if not to_analyze:
+        fmt.success("Everything is up to date.")
+        return
+
+    # Analyze each file; with --save, persist each result as it finishes
     success_count = 0
     fail_count = 0
+    saved_count = 0
 
     fmt.print("")
-    for i, als_path in enumerate(als_files, 1):
+    for i, outcome in enumerate(scan_files(to_analyze, jobs=jobs), 1):
+        name = Path(outcome.als_path).name
         # Use print for progress since we need inline output
-        print(f"[{i}/{len(als_files)}] Analyzing {als_path.name}...", end="", flush=True)
-
-        scan_result = _analyze_als_file(als_path, fmt)
+        print(f"[{i}/{len(to_analyze)}] {name}...", end="", flush=True)
 
-        if scan_result:
-            results.append(scan_result)
-            grade = scan_result.grade
-            score = scan_result.health_score
-
-            # Format grade with color
-            grade_str = fmt.grade_text(grade)
-            if fmt.use_rich:
-                print(f" {grade_str} {score}/100, {scan_result.total_issues} issues")
-            else:
-                print(f" [{grade}] {score}/100, {scan_result.total_issues} issues")
-            success_count += 1
-        else:
-            print()  # Newline after error
+        scan_result = outcome.result
+        if scan_result is None:
+            print()  # Newline before error
+            fmt.error(f"analyzing {name}: {outcome.error}", prefix="  ERROR ")
             fail_count += 1
+            continue
 
-    fmt.print("")
-    fmt.print(f"Scanned: {success_count} successful, {fail_count} failed")
+        grade = scan_result.grade
+        score = scan_result.health_score
 
-    if save and results:
-        fmt.print("")
-        fmt.print("Saving to database...")
+        # Format grade with color
+        grade_str = fmt.grade_text(grade)
+        if fmt.use_rich:
+            print(f" {grade_str} {score}/100, {scan_result.total_issues} issues")
+        else:
+            print(f" [{grade}] {score}/100, {scan_result.total_issues} issues")
+        success_count += 1
 
-        saved_count = 0
-        for result in results:
-            success, message, _ = persist_scan_result(result)
+        if save:
+            success, message, version_id = persist_scan_result(scan_result)
             if success:
+                manifest.record(outcome, version_id)
                 saved_count += 1
             else:
                 fmt.warning(message, prefix="  WARN: ")
 
+    fmt.print("")
+    fmt.print(f"Scanned: {success_count} successful, {fail_count} failed")
+
+    if save:
         fmt.success(f"Saved {saved_count} scan result(s) to database.")
-    elif not save:
+    else:
         fmt.print("")
         fmt.print("Use --save to persist results to database.")
 
@@ -3602,9 +3633,15 @@ def _display_template_similarity_gauge(score: int, fmt: CLIFormatter):
               help='Enable desktop notifications for analysis events')
 @click.option('--notify-level', type=click.Choice(['all', 'important', 'critical']),
               default='all', help='Filter notifications by importance level')
+@click.option('--workers', '-w', type=click.IntRange(min=1), default=2,
+              help='Files analyzed at the same time (default: 2)')
+@click.option('--executor', type=click.Choice(['thread', 'process']), default='thread',
+              help='Run analyses in worker threads or worker processes (default: thread)')
+@click.option('--max-queue', type=click.IntRange(min=1), default=32,
+              help='Changed files waiting for a worker before new ones are held back (default: 32)')
 @click.pass_context
 def watch_cmd(ctx, folder: str, debounce: float, quiet: bool, no_save: bool,
-              notify: bool, notify_level: str):
+              notify: bool, notify_level: str, workers: int, executor: str, max_queue: int):
     """Watch a folder for .als file changes and auto-analyze.
 
     Monitors the specified folder (recursively) for changes to Ableton Live Set
@@ -3614,6 +3651,7 @@ def watch_cmd(ctx, folder: str, debounce: float, quiet: bool, no_save: bool,
     - Recursive monitoring of all subfolders
     - Automatically excludes Backup folders
     - Debounces rapid changes (configurable, default 5 seconds)
+    - Analyzes several changed files at once (--workers)
     - Logs results to data/watch.log
     - Press Ctrl+C to stop watching
 
@@ -3627,6 +3665,7 @@ def watch_cmd(ctx, folder: str, debounce: float, quiet: bool, no_save: bool,
         als-doctor watch "D:/Ableton Projects" --no-save
         als-doctor watch "D:/Ableton Projects" --notify
         als-doctor watch "D:/Ableton Projects" --notify --notify-level important
+        als-doctor watch "D:/Ableton Projects" --workers 4 --executor process
     """
     fmt = ctx.obj.get('formatter', get_formatter())
     save_to_db = not no_save
@@ -3674,6 +3713,7 @@ def watch_cmd(ctx, folder: str, debounce: float, quiet: bool, no_save: bool,
     fmt.print("")
     fmt.print(f"  Folder: {folder_path}")
     fmt.print(f"  Debounce: {debounce}s")
+    fmt.print(f"  Workers: {workers} ({executor})")
     fmt.print(f"  Save to DB: {'Yes' if save_to_db else 'No'}")
     fmt.print(f"  Notifications: {'Yes (' + notify_level + ')' if notify else 'No'}")
     fmt.print("")
@@ -3685,12 +3725,23 @@ def watch_cmd(ctx, folder: str, debounce: float, quiet: bool, no_save: bool,
     if notification_manager:
         notification_manager.watch_started(str(folder_path))
 
+    def notify_result(result):
+        if result.success:
+            notification_manager.analysis_complete(
+                Path(result.file_path).stem, result.health_score,
+                result.grade, result.total_issues
+            )
+
     # Create and start watcher
     watcher = FolderWatcher(
         folder_path=str(folder_path),
         debounce_seconds=debounce,
         quiet=quiet,
-        save_to_db=save_to_db
+        save_to_db=save_to_db,
+        workers=workers,
+        max_queue=max_queue,
+        executor=executor,
+        on_result=notify_result if notification_manager else None
     )
 
     try:
@@ -3713,6 +3764,12 @@ def watch_cmd(ctx, folder: str, debounce: float, quiet: bool, no_save: bool,
         fmt.print(f"  Duration: {stats.uptime_formatted}")
         fmt.print(f"  Files Analyzed: {stats.files_analyzed}")
         fmt.print(f"  Files Failed: {stats.files_failed}")
+        if stats.latencies:
+            fmt.print(f"  Latency: p50 {stats.latency_p50:.1f}s, p95 {stats.latency_p95:.1f}s, "
+                      f"p99 {stats.latency_p99:.1f}s (change to result)")
+        if stats.events_coalesced or stats.backpressure_waits:
+            fmt.print(f"  Coalesced Events: {stats.events_coalesced}, "
+                      f"Queue Peak: {stats.max_queue_depth}/{max_queue}")
 
         if stats.results:
             # Show last few results
@@ -3884,6 +3941,7 @@ def schedule_add_cmd(ctx, folder: str, frequency: str, name: Optional[str],
     fmt.print("  - Manually: als-doctor schedule run <id>")
     fmt.print("  - Via cron: als-doctor schedule install <id>")
     fmt.print("  - Or run: python run_scheduled_scans.py")
+    fmt.print("  - Or keep a scheduler running: als-doctor schedule daemon")
 
 
 @schedule.command('list')
@@ -4017,30 +4075,44 @@ def schedule_remove_cmd(ctx, schedule_id: str, force: bool):
 @schedule.command('run')
 @click.argument('schedule_id')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress output')
+@click.option('--skip-if-daemon', is_flag=True,
+              help='Do nothing while the scheduler daemon is running (used by cron entries)')
+@click.option('--full', is_flag=True,
+              help='Re-analyze files that did not change since the last saved scan')
 @click.option('--notify', is_flag=True,
               help='Send desktop notification when complete')
 @click.option('--notify-level', type=click.Choice(['all', 'important', 'critical']),
               default='all', help='Filter notifications by importance level')
 @click.pass_context
-def schedule_run_cmd(ctx, schedule_id: str, quiet: bool, notify: bool, notify_level: str):
+def schedule_run_cmd(ctx, schedule_id: str, quiet: bool, skip_if_daemon: bool,
+                     full: bool, notify: bool, notify_level: str):
     """Run a scheduled scan immediately.
 
     Executes a specific schedule right now, regardless of whether it's due.
-    Results are saved to the database.
+    Only new files and files changed since their last saved scan are
+    analyzed; use --full to re-analyze every file. Results are saved to
+    the database.
 
     Example:
         als-doctor schedule run schedule_abc12345
         als-doctor schedule run "My Projects" --quiet
+        als-doctor schedule run schedule_abc12345 --full
         als-doctor schedule run schedule_abc12345 --notify
     """
     fmt = ctx.obj.get('formatter', get_formatter())
 
     try:
         from scheduler import run_schedule, get_schedule_by_id
+        from schedule_daemon import is_daemon_running
     except ImportError as e:
         fmt.error(f"Failed to import scheduler module: {e}")
         raise SystemExit(1)
 
+    if skip_if_daemon and is_daemon_running():
+        if not quiet:
+            fmt.print("Scheduler daemon is running; leaving the schedule to it.")
+        return
+
     # Set up notifications if enabled
     notification_manager = None
     if notify:
@@ -4072,7 +4144,7 @@ def schedule_run_cmd(ctx, schedule_id: str, quiet: bool, notify: bool, notify_le
         fmt.print(f"  Folder: {sched.folder_path}")
         fmt.print("")
 
-    result, msg = run_schedule(schedule_id, quiet=quiet)
+    result, msg = run_schedule(schedule_id, quiet=quiet, full=full)
 
     if result.success:
         fmt.success(f"Completed: {result.summary}")
@@ -4098,31 +4170,42 @@ def schedule_run_cmd(ctx, schedule_id: str, quiet: bool, notify: bool, notify_le
 
 @schedule.command('run-due')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress output')
+@click.option('--full', is_flag=True,
+              help='Re-analyze files that did not change since the last saved scan')
 @click.option('--notify', is_flag=True,
               help='Send desktop notification when complete')
 @click.option('--notify-level', type=click.Choice(['all', 'important', 'critical']),
               default='all', help='Filter notifications by importance level')
 @click.pass_context
-def schedule_run_due_cmd(ctx, quiet: bool, notify: bool, notify_level: str):
+def schedule_run_due_cmd(ctx, quiet: bool, full: bool, notify: bool, notify_level: str):
     """Run all schedules that are due.
 
     Checks all enabled schedules and runs those that are overdue
     based on their frequency. This is typically called by a cron job
-    or task scheduler.
+    or task scheduler. While 'als-doctor schedule daemon' is running,
+    due schedules are left to it. Only new and changed files are
+    analyzed unless --full is given.
 
     Example:
         als-doctor schedule run-due
         als-doctor schedule run-due --quiet
+        als-doctor schedule run-due --full
         als-doctor schedule run-due --notify
     """
     fmt = ctx.obj.get('formatter', get_formatter())
 
     try:
         from scheduler import check_due_schedules, run_due_schedules
+        from schedule_daemon import is_daemon_running
     except ImportError as e:
         fmt.error(f"Failed to import scheduler module: {e}")
         raise SystemExit(1)
 
+    if is_daemon_running():
+        if not quiet:
+            fmt.print("Scheduler daemon is running; leaving due schedules to it.")
+        return
+
     # Set up notifications if enabled
     notification_manager = None
     if notify:
@@ -4154,7 +4237,7 @@ def schedule_run_due_cmd(ctx, quiet: bool, notify: bool, notify_level: str):
         fmt.print(f"Running {len(due_schedules)} due schedule(s)...")
         fmt.print("")
 
-    results = run_due_schedules(quiet=quiet)
+    results = run_due_schedules(quiet=quiet, full=full)
 
     success_count = sum(1 for r in results if r.success)
     fail_count = sum(1 for r in results if not r.success)
@@ -4179,6 +4262,104 @@ def schedule_run_due_cmd(ctx, quiet: bool, notify: bool, notify_level: str):
         raise SystemExit(1)
 
 
+@schedule.command('daemon')
+@click.option('--max-concurrent', '-c', type=click.IntRange(min=1), default=1,
+              help='Schedules allowed to run at the same time (default: 1)')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=1,
+              help='Analysis worker processes shared by all runs (default: 1)')
+@click.option('--tick', type=click.FloatRange(min=1, max=60), default=30.0,
+              help='Seconds between checks for schedule changes (default: 30)')
+@click.option('--quiet', '-q', is_flag=True, help='Only print run results')
+@click.option('--notify', is_flag=True,
+              help='Send desktop notification when each run completes')
+@click.option('--notify-level', type=click.Choice(['all', 'important', 'critical']),
+              default='all', help='Filter notifications by importance level')
+@click.pass_context
+def schedule_daemon_cmd(ctx, max_concurrent: int, jobs: int, tick: float,
+                        quiet: bool, notify: bool, notify_level: str):
+    """Run schedules from a resident process until Ctrl+C.
+
+    Keeps every enabled schedule in an in-memory queue and runs each one
+    at its slot, without starting a new process per run. Only files that
+    changed since their last saved scan are analyzed, and every run goes
+    to the run log. Edits made with 'schedule add/remove/enable/disable'
+    are picked up while running.
+
+    While the daemon runs, cron entries calling 'schedule run-due' or
+    run_scheduled_scans.py skip their work, so they can stay installed
+    as a fallback.
+
+    Examples:
+        als-doctor schedule daemon
+        als-doctor schedule daemon --jobs 4 --max-concurrent 2
+    """
+    fmt = ctx.obj.get('formatter', get_formatter())
+
+    try:
+        from schedule_daemon import ScheduleDaemon, is_daemon_running, read_daemon_state
+    except ImportError as e:
+        fmt.error(f"Failed to import scheduler module: {e}")
+        raise SystemExit(1)
+
+    database = get_db()
+    if not database.is_initialized():
+        fmt.error("Database not initialized. Run 'als-doctor db init' first.")
+        raise SystemExit(1)
+
+    if is_daemon_running():
+        fmt.error(f"A scheduler daemon is already running (pid {read_daemon_state()['pid']}).")
+        raise SystemExit(1)
+
+    # Set up notifications if enabled
+    notification_manager = None
+    if notify:
+        try:
+            from notifications import configure_notifications, is_plyer_available
+            if is_plyer_available():
+                notification_manager = configure_notifications(
+                    enabled=True,
+                    level=notify_level,
+                    rate_limit=30
+                )
+        except ImportError:
+            pass  # Notifications not available
+
+    def on_result(run):
+        timestamp = run.started_at.strftime("%Y-%m-%d %H:%M:%S")
+        if run.result.success:
+            fmt.print(f"[{timestamp}] {run.schedule_name}: {run.result.summary}")
+        else:
+            fmt.print(f"[{timestamp}] {run.schedule_name}: Failed: {run.result.error_message}")
+        if notification_manager:
+            notification_manager.schedule_complete(
+                schedule_name=run.schedule_name,
+                files_scanned=run.result.files_scanned,
+                success=run.result.success,
+                error_message=run.result.error_message
+            )
+
+    daemon = ScheduleDaemon(max_concurrent=max_concurrent, jobs=jobs, tick_seconds=tick,
+                            quiet=quiet, on_result=on_result)
+    daemon.start()
+
+    queued = daemon.queued()
+    fmt.header("SCHEDULER DAEMON")
+    fmt.print(f"  Schedules: {len(queued)} enabled")
+    fmt.print(f"  Concurrency: {max_concurrent} run(s), {jobs} analysis worker(s)")
+    if not quiet:
+        for when, sched in queued:
+            fmt.print(f"    {when:%Y-%m-%d %H:%M}  {sched.name} ({sched.frequency})")
+    fmt.print("")
+    fmt.print("Press Ctrl+C to stop.")
+    fmt.print("")
+
+    daemon.run_forever()
+
+    runs = list(daemon.history)
+    failed = sum(1 for run in runs if not run.result.success)
+    fmt.print(f"Ran {len(runs)} schedule(s), {failed} failed.")
+
+
 @schedule.command('enable')
 @click.argument('schedule_id')
 @click.pass_context
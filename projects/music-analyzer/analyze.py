@@ -36,6 +36,10 @@ from reference_comparator import ReferenceComparator
 from reference_storage import ReferenceStorage
 from reference_analyzer import ReferenceAnalyzer
 from config import load_config, get_config
+from result_cache import ResultCache
+from pcm_cache import configure_pcm_cache_from_config
+from als_cache import configure_als_cache_from_config
+from batch_audio import BatchOptions, find_audio_files, run_batch, write_batch_summary
 
 
 def print_header():
@@ -69,9 +73,22 @@ def print_recommendation(num: int, text: str):
     print(f"  {Fore.GREEN}{num}.{Style.RESET_ALL} {text}")
 
 
+def print_cache_stats(cache):
+    """Print result cache hit/miss statistics if the cache was consulted."""
+    if cache is None or cache.hits + cache.misses == 0:
+        return
+    print(f"\n  {Fore.CYAN}Analysis cache:{Style.RESET_ALL} {cache.stats().summary()}")
+
+
 @click.command()
 @click.option('--audio', '-a', type=click.Path(exists=True),
               help='Path to audio file (WAV/FLAC) to analyze')
+@click.option('--audio-dir', 'audio_dir', type=click.Path(exists=True, file_okay=False),
+              help='Batch-analyze every audio file in a directory on a process pool')
+@click.option('--workers', 'workers', type=int, default=None,
+              help='Worker processes for --audio-dir (default: CPU count)')
+@click.option('--file-timeout', 'file_timeout', type=float, default=None,
+              help='Per-file timeout in seconds for --audio-dir (default: none)')
 @click.option('--stems', '-s', type=click.Path(exists=True),
               help='Path to directory containing stem files')
 @click.option('--als', type=click.Path(exists=True),
@@ -108,6 +125,10 @@ def print_recommendation(num: int, text: str):
               help='Path to custom config.yaml file')
 @click.option('--no-sections', 'no_sections', is_flag=True,
               help='Skip section/timeline analysis')
+@click.option('--streaming', 'streaming', is_flag=True,
+              help='Analyze the mix block by block with bounded memory (for long DJ mixes)')
+@click.option('--no-cache', 'no_cache', is_flag=True,
+              help='Re-analyze even if a cached result exists (and do not store new results)')
 @click.option('--no-stems', 'no_stems', is_flag=True,
               help='Skip stem analysis even if stems provided')
 @click.option('--no-midi', 'no_midi', is_flag=True,
@@ -147,9 +168,9 @@ def print_recommendation(num: int, text: str):
 @click.option('--learning-db', 'learning_db_path', type=click.Path(),
               default='learning_data.db',
               help='Path to learning database (default: learning_data.db)')
-def main(audio, stems, als, reference, master, output, output_format, verbose,
+def main(audio, audio_dir, workers, file_timeout, stems, als, reference, master, output, output_format, verbose,
          separate, compare_ref, analyze_reference, deep_analysis, add_reference, reference_id, list_references, genre, tags,
-         config_path, no_sections, no_stems, no_midi, ai_recommend, genre_preset, trance_score, arrangement_score, gap_analysis,
+         config_path, no_sections, streaming, no_cache, no_stems, no_midi, ai_recommend, genre_preset, trance_score, arrangement_score, gap_analysis,
          prescriptive_fixes, build_embeddings, embedding_output, find_similar, embedding_index, top_k,
          collect_feedback, learning_stats, tune_profile, tuned_output, reset_learning, learning_db_path):
     """
@@ -161,6 +182,18 @@ def main(audio, stems, als, reference, master, output, output_format, verbose,
     Analyze a single mixdown:
         python analyze.py --audio my_mix.wav
 
+    \b
+    Analyze a long DJ mix with bounded memory:
+        python analyze.py --audio dj_mix.flac --streaming
+
+    \b
+    Batch-analyze a folder of bounces on 8 worker processes:
+        python analyze.py --audio-dir ./bounces --workers 8 --file-timeout 600
+
+    \b
+    Force a fresh analysis instead of reusing cached results:
+        python analyze.py --audio my_mix.wav --no-cache
+
     \b
     Analyze stems for frequency clashes:
         python analyze.py --stems ./exported_stems/
@@ -242,13 +275,15 @@ def main(audio, stems, als, reference, master, output, output_format, verbose,
 
     # Apply CLI overrides to stage config
     if no_sections:
-        cfg._config['stages']['section_analysis'] = False
+        cfg.override_stages({'section_analysis': False})
     if no_stems:
-        cfg._config['stages']['stem_analysis'] = False
+        cfg.override_stages({'stem_analysis': False})
     if no_midi:
-        cfg._config['stages']['midi_humanization'] = False
-        cfg._config['stages']['midi_quantization'] = False
-        cfg._config['stages']['midi_chord_detection'] = False
+        cfg.override_stages({
+            'midi_humanization': False,
+            'midi_quantization': False,
+            'midi_chord_detection': False,
+        })
 
     if verbose:
         print(f"{Fore.CYAN}Configuration loaded{Style.RESET_ALL}")
@@ -259,6 +294,16 @@ def main(audio, stems, als, reference, master, output, output_format, verbose,
             print(f"  Disabled stages: {', '.join(disabled)}")
         print()
 
+    # Decoded audio (memory-mapped on reuse) and parsed .als results shared by every analyzer
+    configure_pcm_cache_from_config(cfg)
+    configure_als_cache_from_config(cfg)
+
+    # Persistent result cache, keyed by audio content + analyzer version + config
+    result_cache = None
+    if not no_cache and cfg.get('cache', 'enabled', default=True):
+        cache_dir = cfg.get('cache', 'directory') or str(Path(output) / "cache" / "analysis")
+        result_cache = ResultCache(cache_dir, max_size_mb=cfg.get('cache', 'max_size_mb', default=2048))
+
     # Handle --reset-learning
     if reset_learning:
         print_section("Reset Learning Data")
@@ -425,7 +470,8 @@ def main(audio, stems, als, reference, master, output, output_format, verbose,
             analyzer = ReferenceAnalyzer(
                 include_stems=deep_analysis,
                 verbose=verbose,
-                config=cfg
+                config=cfg,
+                cache=result_cache
             )
 
             print(f"  Analyzing: {Path(analyze_reference).name}")
@@ -506,6 +552,45 @@ def main(audio, stems, als, reference, master, output, output_format, verbose,
             if verbose:
                 import traceback
                 traceback.print_exc()
+        print_cache_stats(result_cache)
+        return
+
+    # Handle --audio-dir (batch analysis on a process pool)
+    if audio_dir:
+        print_section("Batch Audio Analysis")
+        files = find_audio_files(audio_dir)
+        if not files:
+            print(f"  {Fore.YELLOW}No audio files found in {audio_dir}{Style.RESET_ALL}")
+            return
+
+        options = BatchOptions(
+            config_path=config_path,
+            stage_overrides=dict(cfg.stages),
+            genre_preset=genre_preset,
+            streaming=streaming,
+            trance_score=trance_score,
+            arrangement_score=arrangement_score,
+            cache_dir=str(result_cache.cache_dir) if result_cache else None,
+            cache_max_size_mb=cfg.get('cache', 'max_size_mb', default=2048)
+        )
+
+        def batch_progress_cb(item, completed, total):
+            color = Fore.GREEN if item.status == 'ok' else Fore.RED if item.status == 'error' else Fore.YELLOW
+            detail = f"{item.integrated_lufs:.1f} LUFS" if item.status == 'ok' else item.error
+            print(f"  [{completed:3}/{total}] {color}{item.status:7}{Style.RESET_ALL} "
+                  f"{Path(item.file_path).name} ({item.elapsed_seconds:.1f}s) {detail}")
+
+        print(f"  Files: {len(files)} | Workers: {min(workers or os.cpu_count() or 1, len(files))}"
+              f"{f' | Timeout: {file_timeout:g}s' if file_timeout else ''}")
+        print()
+        batch = run_batch(files, options, workers=workers, timeout=file_timeout,
+                          progress_callback=batch_progress_cb)
+
+        json_path, html_path = write_batch_summary(batch, output)
+        print(f"\n  {batch.ok_count} ok, {batch.error_count} errors, {batch.timeout_count} timeouts "
+              f"in {batch.elapsed_seconds:.1f}s")
+        print(f"  {Fore.GREEN}[OK] Summary saved to: {json_path}{Style.RESET_ALL}")
+        print(f"  {Fore.GREEN}[OK] HTML summary: {html_path}{Style.RESET_ALL}")
         return
 
     # Handle --trance-score (standalone trance DNA analysis)
@@ -519,7 +604,10 @@ def main(audio, stems, als, reference, master, output, output_format, verbose,
             print(f"  Computing trance-specific features...")
             print()
 
-            features = extract_all_trance_features(audio, verbose=verbose)
+            features = extract_all_trance_features(
+                audio, verbose=verbose,
+                pitch_method=cfg.get('reference', 'pitch_method', default='fast')
+            )
 
             # Print formatted report
             report = format_trance_features_report(features)
@@ -1206,14 +1294,15 @@ def main(audio, stems, als, reference, master, output, output_format, verbose,
     if audio and cfg.stage_enabled('audio_analysis'):
         print_section("Analyzing Audio Mix")
         try:
-            analyzer = AudioAnalyzer(verbose=verbose, config=cfg)
+            analyzer = AudioAnalyzer(verbose=verbose, config=cfg, cache=result_cache)
             reference_tempo = als_result.tempo if als_result else None
 
             print(f"  Analyzing: {Path(audio).name}")
             audio_result = analyzer.analyze(
                 audio,
                 reference_tempo=reference_tempo,
-                genre_preset=genre_preset
+                genre_preset=genre_preset,
+                streaming=streaming
             )
 
             # Display results
@@ -1404,6 +1493,8 @@ Report: {report_base}.{output_format}
     if mastering_result and mastering_result.success:
         print(f"Mastered: {mastering_result.output_path}")
 
+    print_cache_stats(result_cache)
+
     # Next step: AI-powered recommendations
     prompts_dir = "C:\\claude-workspace\\AbletonAIAnalysis\\docs\\ai\\RecommendationGuide\\prompts"
 
@@ -6,7 +6,7 @@ Scans all .als files in the Ableton projects folder, analyzes them,
 identifies the top 3 versions per project, and stores results in the database.
 
 Usage:
-    python batch_analyze_all.py [--ableton-path PATH] [--top N] [--verbose]
+    python batch_analyze_all.py [--ableton-path PATH] [--top N] [--jobs N] [--verbose]
 """
 
 import os
@@ -27,6 +27,7 @@ from database import (
 # Default paths
 DEFAULT_ABLETON_PATH = r"D:\OneDrive\Music\Projects\Ableton\Ableton Projects"
 DEFAULT_TOP_N = 3
+DEFAULT_JOBS = os.cpu_count() or 4
 
 
 def extract_project_name(als_path: str) -> str:
@@ -78,7 +79,9 @@ def song_summary_to_scan_result(song: SongSummary) -> ScanResult:
 def analyze_all_projects(
     ableton_path: str = DEFAULT_ABLETON_PATH,
     top_n: int = DEFAULT_TOP_N,
-    verbose: bool = False
+    verbose: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    executor: str = "process"
 ) -> Tuple[Dict[str, List[SongSummary]], BatchScanResult]:
     """
     Analyze all Ableton projects and identify top versions.
@@ -87,6 +90,8 @@ def analyze_all_projects(
         ableton_path: Path to Ableton projects folder
         top_n: Number of top versions to identify per project
         verbose: Print verbose output
+        jobs: Parallel scan workers
+        executor: 'process', 'thread' or 'serial'
 
     Returns:
         Tuple of (top_versions_by_project, full_scan_result)
@@ -103,8 +108,11 @@ def analyze_all_projects(
     scanner = BatchScanner(verbose=verbose)
 
     # Scan all .als files
-    print("Scanning for .als files...")
-    result = scanner.scan_directory(ableton_path, recursive=True, max_workers=4)
+    print(f"Scanning for .als files ({jobs} {executor} worker(s))...")
+    result = scanner.scan_directory(
+        ableton_path, recursive=True, max_workers=jobs, executor=executor,
+        on_result=lambda song, done, total: print(f"  {scanner.progress_line(song, done, total)}")
+    )
 
     print(f"\nFound {result.total_scanned} .als files")
     print(f"  Successful: {result.successful}")
@@ -250,6 +258,18 @@ def main():
         default=DEFAULT_TOP_N,
         help=f"Number of top versions per project (default: {DEFAULT_TOP_N})"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Parallel scan workers (default: {DEFAULT_JOBS}, the CPU count)"
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["process", "thread", "serial"],
+        default="process",
+        help="How scan workers run (default: process)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -272,7 +292,9 @@ def main():
     top_versions, full_result = analyze_all_projects(
         ableton_path=args.ableton_path,
         top_n=args.top,
-        verbose=args.verbose
+        verbose=args.verbose,
+        jobs=args.jobs,
+        executor=args.executor
     )
 
     # Generate and print report
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Batch Scan Benchmark - Scaling of BatchScanner across executors and workers.
+
+Writes a folder of synthetic Live Sets (or uses a real projects folder),
+scans it serially, then with the thread and process executors at 1, 2, 4 ...
+workers up to the CPU count, and reports wall time, files per second and
+speedup over the serial scan. Process scans should scale close to linearly
+up to the number of cores; thread scans stay near 1x because parsing and
+diagnosis hold the GIL.
+
+Usage:
+    python benchmark_batch_scan.py                          # 64 synthetic sets
+    python benchmark_batch_scan.py --files 200 --clips 40   # Bigger fixture
+    python benchmark_batch_scan.py --directory "D:/Ableton Projects"
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import click
+
+from als_cache import configure_als_cache
+from batch_scanner import BatchScanner
+from tests.als_fixtures import build_als
+
+
+def worker_counts(max_workers: int):
+    """1, 2, 4 ... up to and including max_workers."""
+    counts, n = [], 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    return counts + [max_workers]
+
+
+@click.command()
+@click.option('--files', '-n', type=int, default=64, help='Synthetic Live Sets to write (default: 64)')
+@click.option('--clips', type=int, default=20, help='Clips per track in each synthetic set (default: 20)')
+@click.option('--directory', '-d', type=click.Path(exists=True, file_okay=False),
+              help='Benchmark the .als files in this folder instead')
+@click.option('--max-workers', '-j', type=int, default=os.cpu_count() or 1,
+              help='Largest worker count to try (default: CPU count)')
+@click.option('--chunksize', type=int, default=None, help='Files per submitted task (default: balanced)')
+def main(files, clips, directory, max_workers, chunksize):
+    """Benchmark BatchScanner executors."""
+    # Every run parses every file (forked workers would inherit the parent's cache)
+    configure_als_cache(enabled=False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if directory:
+            paths = [str(p) for p in Path(directory).rglob("*.als")]
+            source = f"{len(paths)} .als files in {directory}"
+        else:
+            paths = [str(build_als(Path(tmp) / f"song_{i:03d}.als", clips_per_track=clips))
+                     for i in range(files)]
+            source = f"{files} synthetic Live Sets ({clips} clips per track)"
+
+        scanner = BatchScanner()
+        runs = [('serial', 1)] + [(executor, n) for executor in ('thread', 'process')
+                                  for n in worker_counts(max_workers)]
+
+        print(f"\nBatch scan benchmark: {source}, {os.cpu_count()} CPU(s)\n")
+        print(f"{'Executor':<10} {'Workers':>7} {'Time (s)':>9} {'Files/s':>8} {'Speedup':>8} {'Failed':>7}")
+        print("-" * 54)
+
+        serial_time = None
+        for executor, workers in runs:
+            start = time.perf_counter()
+            result = scanner.scan_files(paths, executor=executor, max_workers=workers,
+                                        chunksize=chunksize)
+            elapsed = time.perf_counter() - start
+
+            serial_time = serial_time or elapsed
+            print(f"{executor:<10} {workers:>7} {elapsed:>9.2f} {len(paths) / elapsed:>8.1f} "
+                  f"{serial_time / elapsed:>7.2f}x {result.failed:>7}")
+
+    print("\nProcess times include starting the pool and building one analyzer and")
+    print("doctor per worker; speedup is against the serial scan.\n")
+
+
+if __name__ == '__main__':
+    main()
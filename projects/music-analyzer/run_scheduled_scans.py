@@ -10,6 +10,14 @@ Usage:
     python run_scheduled_scans.py --all        # Force run all schedules
     python run_scheduled_scans.py --id <id>    # Run specific schedule
     python run_scheduled_scans.py --quiet      # Suppress output
+    python run_scheduled_scans.py --full       # Re-analyze unchanged files too
+
+Only new files and files changed since their last saved scan are analyzed
+unless --full is given.
+
+While the scheduler daemon (als-doctor schedule daemon) is running, the
+default mode leaves due schedules to it, so cron entries can stay as a
+fallback.
 
 Example cron entry (run due schedules every hour):
     0 * * * * /usr/bin/python3 /path/to/run_scheduled_scans.py >> /path/to/cron.log 2>&1
@@ -46,6 +54,11 @@ def main():
         default=None,
         help='Run specific schedule by ID or name'
     )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Re-analyze files that did not change since the last saved scan'
+    )
     parser.add_argument(
         '--quiet', '-q',
         action='store_true',
@@ -64,6 +77,7 @@ def main():
             list_schedules, run_schedule, run_due_schedules,
             check_due_schedules, get_schedule_by_id
         )
+        from schedule_daemon import is_daemon_running
         from database import get_db
     except ImportError as e:
         print(f"Error importing modules: {e}", file=sys.stderr)
@@ -103,7 +117,7 @@ def main():
         if not args.quiet:
             print(f"[{timestamp}] Running schedule: {args.id}")
 
-        result, msg = run_schedule(args.id, quiet=args.quiet)
+        result, msg = run_schedule(args.id, quiet=args.quiet, full=args.full)
 
         if result.success:
             if not args.quiet:
@@ -137,7 +151,7 @@ def main():
             if not args.quiet:
                 print(f"  Running: {schedule.name}")
 
-            result, msg = run_schedule(schedule.id, quiet=args.quiet)
+            result, msg = run_schedule(schedule.id, quiet=args.quiet, full=args.full)
 
             if result.success:
                 success_count += 1
@@ -153,7 +167,12 @@ def main():
 
         sys.exit(0 if fail_count == 0 else 1)
 
-    # Run due schedules (default)
+    # Run due schedules (default), unless the daemon is taking care of them
+    if is_daemon_running():
+        if not args.quiet:
+            print(f"[{timestamp}] Scheduler daemon is running; leaving due schedules to it.")
+        sys.exit(0)
+
     due_schedules = check_due_schedules()
 
     if not due_schedules:
@@ -164,7 +183,7 @@ def main():
     if not args.quiet:
         print(f"[{timestamp}] Running {len(due_schedules)} due schedule(s)")
 
-    results = run_due_schedules(quiet=args.quiet)
+    results = run_due_schedules(quiet=args.quiet, full=args.full)
 
     success_count = sum(1 for r in results if r.success)
     fail_count = sum(1 for r in results if not r.success)
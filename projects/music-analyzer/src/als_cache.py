@@ -0,0 +1,172 @@
+"""
+Parsed ALS Cache.
+
+A single .als file is often read by several tools in one process: the
+dashboard parses MIDI and runs the device doctor on the same project,
+ProjectDiffer re-analyzes the version it compared last time, and the
+watcher re-scans a file the dashboard already opened. Each read used to
+gunzip and stream the whole Live Set again.
+
+This module keeps parsed results in a process-wide, bounded LRU:
+- Keyed by (absolute path, size, mtime_ns, kind). A save in Live changes
+  size or mtime, so stale entries are never served
+- 'kind' separates the different extractions of the same file, e.g. the
+  device analysis and an ALSProject with a given set of parts
+- invalidate_als() drops every entry of a path; the watcher calls it on
+  each file event so coarse filesystem timestamps cannot hide a change
+
+Cached results are shared between callers. Treat them as read-only.
+
+Usage:
+    project = cached_als(path, ('project', parts), lambda: parse(path, parts))
+
+    configure_als_cache(max_entries=64)
+    configure_als_cache(enabled=False)      # Parse on every call
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+DEFAULT_MAX_ENTRIES = 32
+
+
+class ALSCache:
+    """Thread-safe LRU of parsed results keyed by file identity."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Number of results kept before the least recently
+                         used one is evicted
+        """
+        self.max_entries = max(1, int(max_entries))
+        self._entries: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _identity(als_path: str) -> Tuple[str, int, int]:
+        path = Path(als_path).absolute()
+        stat = path.stat()
+        return str(path), stat.st_size, stat.st_mtime_ns
+
+    def get_or_parse(self, als_path: str, kind: Hashable, parse: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for a file, parsing it on a miss.
+
+        Args:
+            als_path: Path to the .als file
+            kind: What `parse` extracts (part of the key)
+            parse: Zero-argument function producing the result
+
+        Returns:
+            The (shared) parsed result
+        """
+        identity = self._identity(als_path)
+        key = identity + (kind,)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        result = parse()
+
+        # Only keep the result if the file did not change while it was read
+        try:
+            unchanged = self._identity(als_path) == identity
+        except OSError:
+            unchanged = False
+        if unchanged:
+            with self._lock:
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, als_path: str) -> int:
+        """
+        Drop every cached result of a file, whatever its size and mtime.
+
+        Returns:
+            Number of entries removed
+        """
+        absolute = str(Path(als_path).absolute())
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == absolute]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> int:
+        """Remove all entries and return how many there were."""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ==================== PROCESS-WIDE DEFAULT ====================
+
+_settings: Dict[str, Any] = {'enabled': True, 'max_entries': DEFAULT_MAX_ENTRIES}
+_default_cache: Optional[ALSCache] = None
+_default_lock = threading.Lock()
+
+
+def configure_als_cache(max_entries: Optional[int] = None, enabled: bool = True) -> None:
+    """
+    Configure the cache used by cached_als().
+
+    Args:
+        max_entries: LRU size (None = DEFAULT_MAX_ENTRIES)
+        enabled: False makes cached_als() parse on every call
+    """
+    global _default_cache
+    with _default_lock:
+        _settings.update(
+            enabled=enabled,
+            max_entries=DEFAULT_MAX_ENTRIES if max_entries is None else max_entries
+        )
+        _default_cache = None
+
+
+def configure_als_cache_from_config(config) -> None:
+    """Apply the als_documents* settings of the config's cache section."""
+    configure_als_cache(
+        max_entries=config.get('cache', 'als_documents_max_entries'),
+        enabled=config.get('cache', 'als_documents', default=True)
+    )
+
+
+def get_als_cache() -> Optional[ALSCache]:
+    """The process-wide ALSCache, or None if caching is disabled."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None and _settings['enabled']:
+            _default_cache = ALSCache(_settings['max_entries'])
+        return _default_cache
+
+
+def cached_als(als_path: str, kind: Hashable, parse: Callable[[], Any]) -> Any:
+    """Parse through the process-wide cache (see ALSCache.get_or_parse)."""
+    cache = get_als_cache()
+    if cache is None:
+        return parse()
+    return cache.get_or_parse(als_path, kind, parse)
+
+
+def invalidate_als(als_path: str) -> int:
+    """Drop all cached results of a file from the process-wide cache."""
+    cache = get_als_cache()
+    return cache.invalidate(als_path) if cache is not None else 0
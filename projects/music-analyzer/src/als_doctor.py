@@ -168,7 +168,12 @@ def cmd_scan(args):
         print("No matching projects found.")
         return
 
-    result = scanner.scan_files([str(f) for f in als_files])
+    executor = args.executor if args.jobs > 1 else 'serial'
+    result = scanner.scan_files(
+        [str(f) for f in als_files], executor=executor, max_workers=args.jobs,
+        on_result=lambda song, done, total: print(scanner.progress_line(song, done, total))
+    )
+    print()
     print(scanner.generate_report(result))
 
 
@@ -1226,6 +1231,9 @@ Dashboard:
     p_scan.add_argument('--limit', type=int, help='Limit number of files to scan')
     p_scan.add_argument('--min-number', type=int, help='Only scan projects with folder names starting with this number or higher (e.g., --min-number 22)')
     p_scan.add_argument('--no-recursive', action='store_true', help='Do not scan subdirectories')
+    p_scan.add_argument('--jobs', '-j', type=int, default=1, help='Parallel workers (default: 1)')
+    p_scan.add_argument('--executor', choices=['process', 'thread', 'serial'], default='process',
+                        help='How parallel workers run when --jobs > 1 (default: process)')
     p_scan.set_defaults(func=cmd_scan)
 
     # Quick command
@@ -8,18 +8,35 @@ Parses Ableton Live Set (.als) files to extract:
 - Audio clip references
 - Device/plugin information
 
-Ableton .als files are gzipped XML documents.
+Ableton .als files are gzipped XML documents. They are streamed with
+ALSStreamReader rather than loaded whole, and callers can ask for a subset
+of the project (e.g. tracks and devices only).
 """
 
-import gzip
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
-import math
+from typing import List, Dict, Iterable, Optional, Tuple
 import base64
 import struct
 
+import numpy as np
+
+try:
+    from .als_cache import cached_als
+    from .als_stream import ALL_PARTS, ALSEvent, ALSStreamReader
+    from .midi_notes import (
+        chord_groups, note_array_from_columns, off_grid, offbeat_positions,
+        track_note_array, velocity_stats
+    )
+except ImportError:
+    from als_cache import cached_als
+    from als_stream import ALL_PARTS, ALSEvent, ALSStreamReader
+    from midi_notes import (
+        chord_groups, note_array_from_columns, off_grid, offbeat_positions,
+        track_note_array, velocity_stats
+    )
+
 
 @dataclass
 class MIDINote:
@@ -40,6 +57,9 @@ class MIDIClip:
     loop_start: float
     loop_end: float
     notes: List[MIDINote] = field(default_factory=list)
+    # Same notes as a midi_notes.NOTE_DTYPE structured array (set by the parser).
+    # Not kept in sync with in-place edits of `notes`: set it to None after editing
+    note_array: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -165,12 +185,20 @@ class ALSParser:
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
 
-    def parse(self, als_path: str) -> ALSProject:
+    def parse(self, als_path: str, include: Optional[Iterable[str]] = None) -> ALSProject:
         """
         Parse an Ableton .als file.
 
+        The file is streamed in one pass (see als_stream), so memory stays
+        flat however large the arrangement is. Results are shared through
+        the process-wide parsed ALS cache (see als_cache) until the file
+        changes; treat the returned project as read-only.
+
         Args:
             als_path: Path to the .als file
+            include: Parts to extract (default: all). For example
+                     {'tracks', 'devices'} skips clips, notes, locators,
+                     scenes and tempo automation entirely
 
         Returns:
             ALSProject with all extracted information
@@ -182,26 +210,64 @@ class ALSParser:
         if path.suffix.lower() != '.als':
             raise ValueError(f"Not an ALS file: {als_path}")
 
-        # Read and decompress the file
-        try:
-            with gzip.open(als_path, 'rb') as f:
-                xml_content = f.read()
-        except gzip.BadGzipFile:
-            # Some older versions might not be gzipped
-            with open(als_path, 'rb') as f:
-                xml_content = f.read()
+        parts = ALL_PARTS if include is None else frozenset(include)
+        return cached_als(als_path, ('project', parts), lambda: self._parse(als_path, parts))
+
+    def _parse(self, als_path: str, include: Iterable[str]) -> ALSProject:
+        """Stream the requested parts of a file into an ALSProject."""
+        path = Path(als_path)
+        reader = ALSStreamReader(als_path, include)
 
-        # Parse XML
-        root = ET.fromstring(xml_content)
+        track_results: Dict[str, List[Tuple[Optional[Track], bool]]] = {
+            'MidiTrack': [], 'AudioTrack': [], 'ReturnTrack': [], 'GroupTrack': []
+        }
+        track_clips: List = []  # Clips of the track currently being read
+        locator_events: List[Tuple[bool, Optional[Tuple[float, str]]]] = []
+        scenes: List[Scene] = []
+        tempo_events: List[Tuple[bool, TempoChange]] = []
+        plugins = set()
+
+        # Single pass over the file
+        for event in reader:
+            elem = event.element
+            if event.kind == 'clip':
+                if elem.tag == 'MidiClip':
+                    clip = self._parse_midi_clip(elem)
+                else:
+                    clip = self._parse_audio_clip(elem)
+                if clip:
+                    track_clips.append(clip)
+            elif event.kind == 'track':
+                if event.track_tag in track_results:
+                    track_results[event.track_tag].append(
+                        self._parse_track_event(event, track_clips)
+                    )
+                track_clips = []
+            elif event.kind == 'plugin':
+                self._collect_plugin(elem, plugins)
+            elif event.kind == 'locator':
+                nested = event.path[-2:] == ('Locators', 'Locators')
+                locator_events.append((nested, self._parse_locator(elem)))
+            elif event.kind == 'scene':
+                scene = self._parse_scene(elem, len(scenes))
+                if scene:
+                    scenes.append(scene)
+            elif event.kind == 'tempo':
+                change = self._parse_tempo_event(elem)
+                if change:
+                    tempo_events.append(('MasterTrack' in event.path, change))
 
         # Extract project information
-        ableton_version = self._get_version(root)
-        tempo = self._get_tempo(root)
-        time_sig = self._get_time_signature(root)
-        sample_rate = self._get_sample_rate(root)
+        ableton_version = self._get_version(reader)
+        tempo = self._get_setting(reader, 'tempo', float, 120.0)
+        time_sig = (
+            self._get_setting(reader, 'time_signature_numerator', int, 4),
+            self._get_setting(reader, 'time_signature_denominator', int, 4)
+        )
+        sample_rate = self._get_setting(reader, 'sample_rate', lambda v: int(float(v)), 44100)
 
-        # Parse tracks
-        tracks = self._parse_tracks(root)
+        # Assemble tracks in type order
+        tracks = self._assemble_tracks(track_results)
 
         # Calculate totals
         total_duration_beats = self._calculate_duration(tracks)
@@ -215,11 +281,8 @@ class ALSParser:
 
         audio_clip_count = sum(len(track.audio_clips) for track in tracks)
 
-        # Get plugin list
-        plugins = self._get_plugins(root)
-
-        # Parse project structure (locators, scenes, tempo automation)
-        project_structure = self._parse_project_structure(root)
+        # Project structure (locators, scenes, tempo automation)
+        project_structure = self._build_project_structure(locator_events, scenes, tempo_events)
 
         # Analyze MIDI tracks
         midi_analysis: Dict[str, MIDIAnalysis] = {}
@@ -257,7 +320,7 @@ class ALSParser:
             sample_rate=sample_rate,
             midi_note_count=midi_note_count,
             audio_clip_count=audio_clip_count,
-            plugin_list=plugins,
+            plugin_list=sorted(plugins),
             midi_analysis=midi_analysis,
             project_structure=project_structure,
             total_chord_count=total_chord_count,
@@ -265,104 +328,70 @@ class ALSParser:
             quantization_issues_count=total_quant_errors
         )
 
-    def _get_version(self, root: ET.Element) -> str:
-        """Extract Ableton version from the XML."""
-        # Look for version info in various places
-        ableton_elem = root.find(".//Ableton")
-        if ableton_elem is not None:
-            major = ableton_elem.get("MajorVersion", "")
-            minor = ableton_elem.get("MinorVersion", "")
+    def _get_version(self, reader: ALSStreamReader) -> str:
+        """Extract Ableton version from the streamed header."""
+        if reader.ableton_version is not None:
+            major, minor = reader.ableton_version
             if major or minor:
                 return f"{major}.{minor}"
 
         # Try alternative location
-        for elem in root.iter():
-            if "Creator" in elem.attrib:
-                return elem.attrib["Creator"]
+        if reader.creator is not None:
+            return reader.creator
 
         return "Unknown"
 
-    def _get_tempo(self, root: ET.Element) -> float:
-        """Extract project tempo."""
-        # Try multiple paths where tempo might be stored
-        tempo_paths = [
-            ".//Tempo/Manual",
-            ".//MasterTrack/DeviceChain/Mixer/Tempo/Manual",
-            ".//Transport/Tempo/Manual",
-            ".//LiveSet/MasterTrack//Tempo/Manual"
-        ]
-
-        for path in tempo_paths:
-            elem = root.find(path)
-            if elem is not None and "Value" in elem.attrib:
-                try:
-                    return float(elem.attrib["Value"])
-                except ValueError:
-                    continue
-
-        # Default tempo
-        return 120.0
-
-    def _get_time_signature(self, root: ET.Element) -> Tuple[int, int]:
-        """Extract time signature."""
-        numerator = 4
-        denominator = 4
-
-        # Look for time signature
-        num_elem = root.find(".//TimeSignature/Numerator/Manual")
-        if num_elem is not None and "Value" in num_elem.attrib:
-            try:
-                numerator = int(num_elem.attrib["Value"])
-            except ValueError:
-                pass
-
-        denom_elem = root.find(".//TimeSignature/Denominator/Manual")
-        if denom_elem is not None and "Value" in denom_elem.attrib:
+    def _get_setting(self, reader: ALSStreamReader, name: str, convert, default):
+        """Read a project setting (tempo, time signature, sample rate) with a fallback."""
+        value = reader.settings.get(name)
+        if value is not None:
             try:
-                denominator = int(denom_elem.attrib["Value"])
+                return convert(value)
             except ValueError:
                 pass
+        return default
 
-        return (numerator, denominator)
-
-    def _get_sample_rate(self, root: ET.Element) -> int:
-        """Extract sample rate."""
-        elem = root.find(".//SampleRate/Manual")
-        if elem is not None and "Value" in elem.attrib:
-            try:
-                return int(float(elem.attrib["Value"]))
-            except ValueError:
-                pass
-        return 44100  # Default
+    def _parse_track_event(self, event: ALSEvent, clips: List) -> Tuple[Optional[Track], bool]:
+        """
+        Parse a streamed track element and attach its clips.
 
-    def _parse_tracks(self, root: ET.Element) -> List[Track]:
-        """Parse all tracks from the project."""
-        tracks = []
+        Returns:
+            (track or None, whether the track has no name of its own)
+        """
+        elem = event.element
+        index = event.track_ordinal
+        unnamed = self._get_track_name(elem, None) is None
 
-        # Parse MIDI tracks
-        for i, track_elem in enumerate(root.findall(".//MidiTrack")):
-            track = self._parse_midi_track(track_elem, i)
+        if event.track_tag == 'MidiTrack':
+            track = self._parse_midi_track(elem, index)
             if track:
-                tracks.append(track)
-
-        # Parse Audio tracks
-        for i, track_elem in enumerate(root.findall(".//AudioTrack")):
-            track = self._parse_audio_track(track_elem, i + len(tracks))
+                track.midi_clips = [c for c in clips if isinstance(c, MIDIClip)]
+        elif event.track_tag == 'AudioTrack':
+            track = self._parse_audio_track(elem, index)
             if track:
-                tracks.append(track)
+                track.audio_clips = [c for c in clips if isinstance(c, AudioClip)]
+        elif event.track_tag == 'ReturnTrack':
+            track = self._parse_return_track(elem, index)
+        else:
+            track = self._parse_group_track(elem, index)
 
-        # Parse Return tracks
-        for i, track_elem in enumerate(root.findall(".//ReturnTrack")):
-            track = self._parse_return_track(track_elem, i)
-            if track:
-                tracks.append(track)
+        return track, unnamed
 
-        # Parse Group tracks
-        for i, track_elem in enumerate(root.findall(".//GroupTrack")):
-            track = self._parse_group_track(track_elem, i)
+    def _assemble_tracks(self, track_results: Dict[str, List[Tuple[Optional[Track], bool]]]) -> List[Track]:
+        """Order tracks MIDI, audio, return, group and assign IDs."""
+        tracks = [track for track, _ in track_results['MidiTrack'] if track]
+
+        # Audio track IDs continue after the tracks collected so far
+        for i, (track, unnamed) in enumerate(track_results['AudioTrack']):
             if track:
+                track.id = i + len(tracks)
+                if unnamed:
+                    track.name = f"Audio {track.id + 1}"
                 tracks.append(track)
 
+        for tag in ('ReturnTrack', 'GroupTrack'):
+            tracks.extend(track for track, _ in track_results[tag] if track)
+
         return tracks
 
     def _parse_midi_track(self, track_elem: ET.Element, index: int) -> Optional[Track]:
@@ -592,8 +621,8 @@ class ALSParser:
                 if le is not None:
                     loop_end = float(le.attrib.get("Value", loop_end))
 
-            # Parse notes
-            notes = []
+            # Parse notes into columns
+            pitches, velocities, starts, durations, mutes = [], [], [], [], []
             notes_elem = clip_elem.find(".//Notes")
             if notes_elem is not None:
                 for key_track in notes_elem.findall(".//KeyTrack"):
@@ -601,14 +630,17 @@ class ALSParser:
                     pitch = int(pitch_elem.attrib.get("Value", 60)) if pitch_elem is not None else 60
 
                     for note_elem in key_track.findall(".//MidiNoteEvent"):
-                        note = MIDINote(
-                            pitch=pitch,
-                            velocity=int(float(note_elem.attrib.get("Velocity", 100))),
-                            start_time=float(note_elem.attrib.get("Time", 0)),
-                            duration=float(note_elem.attrib.get("Duration", 0.25)),
-                            mute=note_elem.attrib.get("IsEnabled", "true").lower() == "false"
-                        )
-                        notes.append(note)
+                        attrib = note_elem.attrib
+                        pitches.append(pitch)
+                        velocities.append(int(float(attrib.get("Velocity", 100))))
+                        starts.append(float(attrib.get("Time", 0)))
+                        durations.append(float(attrib.get("Duration", 0.25)))
+                        mutes.append(attrib.get("IsEnabled", "true").lower() == "false")
+
+            notes = [
+                MIDINote(pitch=p, velocity=v, start_time=t, duration=d, mute=m)
+                for p, v, t, d, m in zip(pitches, velocities, starts, durations, mutes)
+            ]
 
             return MIDIClip(
                 name=clip_name,
@@ -616,7 +648,8 @@ class ALSParser:
                 end_time=end,
                 loop_start=loop_start,
                 loop_end=loop_end,
-                notes=notes
+                notes=notes,
+                note_array=note_array_from_columns(pitches, velocities, starts, durations, mutes)
             )
         except Exception as e:
             if self.verbose:
@@ -676,24 +709,19 @@ class ALSParser:
 
         return max_end if max_end > 0 else 16.0  # Default 4 bars
 
-    def _get_plugins(self, root: ET.Element) -> List[str]:
-        """Get list of all plugins used in the project."""
-        plugins = set()
+    def _collect_plugin(self, elem: ET.Element, plugins: set) -> None:
+        """Add the plugin named by a streamed plugin-info element."""
+        # VST plugins
+        if "PluginDesc" in elem.tag or "VstPluginInfo" in elem.tag:
+            name = elem.find(".//PlugName")
+            if name is not None and "Value" in name.attrib:
+                plugins.add(name.attrib["Value"])
 
-        # Look for VST plugins
-        for elem in root.iter():
-            if "PluginDesc" in elem.tag or "VstPluginInfo" in elem.tag:
-                name = elem.find(".//PlugName")
-                if name is not None and "Value" in name.attrib:
-                    plugins.add(name.attrib["Value"])
-
-            # AU plugins
-            if "AuPluginInfo" in elem.tag:
-                name = elem.find(".//Name")
-                if name is not None and "Value" in name.attrib:
-                    plugins.add(name.attrib["Value"])
-
-        return sorted(list(plugins))
+        # AU plugins
+        if "AuPluginInfo" in elem.tag:
+            name = elem.find(".//Name")
+            if name is not None and "Value" in name.attrib:
+                plugins.add(name.attrib["Value"])
 
     # ==================== MIDI ANALYSIS METHODS ====================
 
@@ -713,28 +741,20 @@ class ALSParser:
         if not track.midi_clips:
             return None
 
-        # Collect all notes from all clips
-        all_notes: List[MIDINote] = []
-        for clip in track.midi_clips:
-            all_notes.extend(clip.notes)
-
-        if not all_notes:
+        # All notes from all clips, as one structured array
+        notes = track_note_array(track.midi_clips)
+        if not len(notes):
             return None
 
-        # Extract velocities
-        velocities = [n.velocity for n in all_notes if not n.mute]
-        if not velocities:
+        played = notes[~notes['mute']]
+        if not len(played):
             return None
 
         # Velocity statistics
-        vel_mean = sum(velocities) / len(velocities)
-        vel_variance = sum((v - vel_mean) ** 2 for v in velocities) / len(velocities)
-        vel_std = math.sqrt(vel_variance)
-        vel_min = min(velocities)
-        vel_max = max(velocities)
+        vel_mean, vel_std, vel_min, vel_max = velocity_stats(played['velocity'])
 
         # Humanization score based on velocity variation
-        if len(set(velocities)) == 1:
+        if vel_min == vel_max:
             humanization = 'robotic'  # Single velocity value
         elif vel_std < 5:
             humanization = 'robotic'
@@ -745,26 +765,23 @@ class ALSParser:
 
         # Quantization error detection
         quant_errors = self._detect_quantization_errors(
-            all_notes, track.name, grid_resolution
+            notes, track.name, grid_resolution
         )
 
         # Note density (notes per bar)
-        if all_notes:
-            max_time = max(n.start_time + n.duration for n in all_notes)
-            num_bars = max(1, max_time / time_sig_num)
-            note_density = len(all_notes) / num_bars
-        else:
-            note_density = 0.0
+        max_time = float((notes['start'] + notes['duration']).max())
+        num_bars = max(1, max_time / time_sig_num)
+        note_density = len(notes) / num_bars
 
         # Chord detection
-        chords = self._detect_chords(all_notes)
+        chords = self._detect_chords(notes)
 
         # Swing ratio
-        swing = self._calculate_swing_ratio(all_notes, grid_resolution)
+        swing = self._calculate_swing_ratio(notes, grid_resolution)
 
         return MIDIAnalysis(
             track_name=track.name,
-            note_count=len(all_notes),
+            note_count=len(notes),
             velocity_mean=round(vel_mean, 1),
             velocity_std=round(vel_std, 1),
             velocity_range=(vel_min, vel_max),
@@ -776,96 +793,77 @@ class ALSParser:
             swing_ratio=swing
         )
 
-    def _detect_quantization_errors(self, notes: List[MIDINote], track_name: str,
+    def _detect_quantization_errors(self, notes: np.ndarray, track_name: str,
                                    grid_resolution: float = 0.25) -> List[QuantizationError]:
         """
         Find notes that are off the quantization grid.
 
         Args:
-            notes: List of MIDI notes
+            notes: Note array (midi_notes.NOTE_DTYPE); muted notes are skipped
             track_name: Name of the track for reporting
             grid_resolution: Grid resolution in beats
 
         Returns:
             List of QuantizationError objects for off-grid notes
         """
-        errors = []
+        notes = notes[~notes['mute']]
 
-        for note in notes:
-            if note.mute:
-                continue
+        # Only report notes more than 1/100 of a beat off the grid
+        index, grid_pos, error_beats = off_grid(notes['start'], grid_resolution, tolerance=0.01)
 
-            # Find nearest grid position
-            grid_pos = round(note.start_time / grid_resolution) * grid_resolution
-            error_beats = abs(note.start_time - grid_pos)
-
-            # Only report if significantly off-grid
-            if error_beats > 0.01:  # More than 1/100 of a beat
-                if error_beats >= 0.1:
-                    severity = 'severe'
-                elif error_beats >= 0.03:
-                    severity = 'notable'
-                else:
-                    severity = 'minor'
-
-                errors.append(QuantizationError(
-                    track_name=track_name,
-                    pitch=note.pitch,
-                    time=round(note.start_time, 3),
-                    nearest_grid=round(grid_pos, 3),
-                    error_beats=round(error_beats, 3),
-                    severity=severity
-                ))
+        errors = []
+        for pitch, time, grid, error in zip(notes['pitch'][index].tolist(), notes['start'][index].tolist(),
+                                            grid_pos.tolist(), error_beats.tolist()):
+            if error >= 0.1:
+                severity = 'severe'
+            elif error >= 0.03:
+                severity = 'notable'
+            else:
+                severity = 'minor'
+
+            errors.append(QuantizationError(
+                track_name=track_name,
+                pitch=pitch,
+                time=round(time, 3),
+                nearest_grid=round(grid, 3),
+                error_beats=round(error, 3),
+                severity=severity
+            ))
 
         return errors
 
-    def _detect_chords(self, notes: List[MIDINote],
+    def _detect_chords(self, notes: np.ndarray,
                        time_threshold: float = 0.05) -> List[ChordEvent]:
         """
         Detect simultaneous notes that form chords.
 
         Args:
-            notes: List of MIDI notes
+            notes: Note array (midi_notes.NOTE_DTYPE)
             time_threshold: Max time difference for notes to be considered simultaneous
 
         Returns:
             List of ChordEvent objects
         """
-        if not notes:
-            return []
-
-        # Sort notes by start time
-        sorted_notes = sorted(notes, key=lambda n: n.start_time)
-
         chords = []
-        i = 0
-
-        while i < len(sorted_notes):
-            # Find all notes starting within threshold
-            chord_notes = [sorted_notes[i]]
-            j = i + 1
-
-            while j < len(sorted_notes):
-                if sorted_notes[j].start_time - sorted_notes[i].start_time <= time_threshold:
-                    chord_notes.append(sorted_notes[j])
-                    j += 1
-                else:
-                    break
-
-            # If 3+ notes, it's a chord
-            if len(chord_notes) >= 3:
-                pitches = sorted(set(n.pitch for n in chord_notes))
-                min_duration = min(n.duration for n in chord_notes)
-                chord_name = self._identify_chord(pitches)
-
-                chords.append(ChordEvent(
-                    time=round(chord_notes[0].start_time, 3),
-                    pitches=pitches,
-                    chord_name=chord_name,
-                    duration=round(min_duration, 3)
-                ))
-
-            i = j if j > i + 1 else i + 1
+        groups = chord_groups(notes['start'], time_threshold, min_size=3)
+        if not groups:
+            return chords
+
+        pitch = notes['pitch'].tolist()
+        start = notes['start'].tolist()
+        duration = notes['duration'].tolist()
+
+        # Groups of 3+ notes starting together are chords
+        for group in groups:
+            members = group.tolist()
+            pitches = sorted({pitch[k] for k in members})
+
+            chords.append(ChordEvent(
+                time=round(start[members[0]], 3),
+                pitches=pitches,
+                chord_name=self._identify_chord(pitches),
+                duration=round(min([duration[k] for k in members]), 3)
+            ))
 
         return chords
 
@@ -917,7 +915,7 @@ class ALSParser:
 
         return f"{root_name}?"  # Unknown chord type
 
-    def _calculate_swing_ratio(self, notes: List[MIDINote],
+    def _calculate_swing_ratio(self, notes: np.ndarray,
                                grid_resolution: float = 0.25) -> Optional[float]:
         """
         Calculate swing ratio based on off-beat timing.
@@ -928,7 +926,7 @@ class ALSParser:
         - 0.6 = light swing
 
         Args:
-            notes: List of MIDI notes
+            notes: Note array (midi_notes.NOTE_DTYPE)
             grid_resolution: Grid resolution in beats
 
         Returns:
@@ -937,25 +935,14 @@ class ALSParser:
         if len(notes) < 10:
             return None
 
-        # Find off-beat notes (on the "and" of each beat)
-        off_beat_positions = []
-
-        for note in notes:
-            if note.mute:
-                continue
-
-            # Position within beat
-            beat_pos = note.start_time % 1.0
-
-            # Off-beat if around 0.5 (straight) or shifted for swing
-            if 0.3 < beat_pos < 0.8:
-                off_beat_positions.append(beat_pos)
+        # Off-beat notes (on the "and" of each beat), around 0.5 or shifted for swing
+        off_beat_positions = offbeat_positions(notes['start'][~notes['mute']], 0.3, 0.8)
 
         if len(off_beat_positions) < 5:
             return None
 
         # Average off-beat position
-        avg_offbeat = sum(off_beat_positions) / len(off_beat_positions)
+        avg_offbeat = sum(off_beat_positions.tolist()) / len(off_beat_positions)
 
         # Convert to swing ratio (0.5 = straight)
         swing_ratio = round(avg_offbeat, 2)
@@ -968,149 +955,110 @@ class ALSParser:
 
     # ==================== PROJECT STRUCTURE METHODS ====================
 
-    def _parse_locators(self, root: ET.Element) -> List[Locator]:
+    def _parse_locator(self, loc_elem: ET.Element) -> Optional[Tuple[float, str]]:
         """
-        Parse arrangement locators/markers.
+        Parse an arrangement locator/marker.
 
         Args:
-            root: XML root element
+            loc_elem: Locator element
 
         Returns:
-            List of Locator objects sorted by time
-        """
-        locators = []
-
-        # Try multiple paths for locators
-        locator_paths = [
-            ".//Locators/Locators/Locator",
-            ".//Locators/Locator",
-            ".//LiveSet/Locators/Locators/Locator"
-        ]
-
-        for path in locator_paths:
-            for loc_elem in root.findall(path):
-                try:
-                    time_elem = loc_elem.find("Time")
-                    name_elem = loc_elem.find("Name")
-
-                    if time_elem is not None and "Value" in time_elem.attrib:
-                        time = float(time_elem.attrib["Value"])
-                        name = ""
-
-                        if name_elem is not None and "Value" in name_elem.attrib:
-                            name = name_elem.attrib["Value"]
-
-                        if not name:
-                            name = f"Marker {len(locators) + 1}"
-
-                        locators.append(Locator(time=time, name=name))
-                except Exception:
-                    continue
-
-            if locators:
-                break
-
-        # Sort by time
-        return sorted(locators, key=lambda l: l.time)
-
-    def _parse_scenes(self, root: ET.Element) -> List[Scene]:
+            (time, name) with name possibly empty, or None if it has no time
         """
-        Parse Session View scenes.
+        try:
+            time_elem = loc_elem.find("Time")
+            name_elem = loc_elem.find("Name")
 
-        Args:
-            root: XML root element
+            if time_elem is not None and "Value" in time_elem.attrib:
+                time = float(time_elem.attrib["Value"])
+                name = ""
 
-        Returns:
-            List of Scene objects
-        """
-        scenes = []
+                if name_elem is not None and "Value" in name_elem.attrib:
+                    name = name_elem.attrib["Value"]
 
-        scene_paths = [
-            ".//Scenes/Scene",
-            ".//LiveSet/Scenes/Scene"
-        ]
+                return (time, name)
+        except Exception:
+            pass
+        return None
 
-        for path in scene_paths:
-            for i, scene_elem in enumerate(root.findall(path)):
-                try:
-                    name = f"Scene {i + 1}"
-                    tempo = None
-
-                    # Get scene name
-                    name_elem = scene_elem.find(".//Name")
-                    if name_elem is not None and "Value" in name_elem.attrib:
-                        scene_name = name_elem.attrib["Value"]
-                        if scene_name:
-                            name = scene_name
-
-                    # Get scene tempo
-                    tempo_elem = scene_elem.find(".//Tempo")
-                    if tempo_elem is not None and "Value" in tempo_elem.attrib:
-                        try:
-                            tempo = float(tempo_elem.attrib["Value"])
-                        except ValueError:
-                            pass
-
-                    scenes.append(Scene(index=i, name=name, tempo=tempo))
-                except Exception:
-                    continue
-
-            if scenes:
-                break
-
-        return scenes
-
-    def _parse_tempo_automation(self, root: ET.Element) -> List[TempoChange]:
+    def _parse_scene(self, scene_elem: ET.Element, index: int) -> Optional[Scene]:
         """
-        Parse tempo automation points.
+        Parse a Session View scene.
 
         Args:
-            root: XML root element
+            scene_elem: Scene element
+            index: Scene index
 
         Returns:
-            List of TempoChange objects sorted by time
+            Scene, or None if it cannot be parsed
         """
-        tempo_changes = []
-
-        # Look for tempo automation in various locations
-        automation_paths = [
-            ".//MasterTrack//Tempo//Automation//Events//FloatEvent",
-            ".//MasterTrack//Tempo//AutomationEnvelope//Automation//Events//FloatEvent",
-            ".//Tempo//Automation//Events//FloatEvent"
-        ]
-
-        for path in automation_paths:
-            for event in root.findall(path):
+        try:
+            name = f"Scene {index + 1}"
+            tempo = None
+
+            # Get scene name
+            name_elem = scene_elem.find(".//Name")
+            if name_elem is not None and "Value" in name_elem.attrib:
+                scene_name = name_elem.attrib["Value"]
+                if scene_name:
+                    name = scene_name
+
+            # Get scene tempo
+            tempo_elem = scene_elem.find(".//Tempo")
+            if tempo_elem is not None and "Value" in tempo_elem.attrib:
                 try:
-                    time = float(event.attrib.get("Time", 0))
-                    value = float(event.attrib.get("Value", 120))
-
-                    tempo_changes.append(TempoChange(time=time, tempo=value))
-                except Exception:
-                    continue
+                    tempo = float(tempo_elem.attrib["Value"])
+                except ValueError:
+                    pass
 
-            if tempo_changes:
-                break
+            return Scene(index=index, name=name, tempo=tempo)
+        except Exception:
+            return None
 
-        # Sort by time
-        return sorted(tempo_changes, key=lambda t: t.time)
+    def _parse_tempo_event(self, event_elem: ET.Element) -> Optional[TempoChange]:
+        """Parse a tempo automation point."""
+        try:
+            time = float(event_elem.attrib.get("Time", 0))
+            value = float(event_elem.attrib.get("Value", 120))
+            return TempoChange(time=time, tempo=value)
+        except Exception:
+            return None
 
-    def _parse_project_structure(self, root: ET.Element) -> ProjectStructure:
+    def _build_project_structure(
+        self,
+        locator_events: List[Tuple[bool, Optional[Tuple[float, str]]]],
+        scenes: List[Scene],
+        tempo_events: List[Tuple[bool, TempoChange]]
+    ) -> ProjectStructure:
         """
-        Parse all project structure information.
+        Assemble project structure from the streamed elements.
 
         Args:
-            root: XML root element
+            locator_events: (in Locators/Locators, parsed locator) per Locator element
+            scenes: Parsed scenes
+            tempo_events: (inside MasterTrack, tempo change) per automation point
 
         Returns:
             ProjectStructure with locators, scenes, and tempo automation
         """
-        locators = self._parse_locators(root)
-        scenes = self._parse_scenes(root)
-        tempo_automation = self._parse_tempo_automation(root)
+        # Prefer the canonical Locators/Locators list, then any Locators list
+        nested = [loc for is_nested, loc in locator_events if is_nested and loc]
+        parsed = nested or [loc for _, loc in locator_events if loc]
+
+        locators = []
+        for time, name in parsed:
+            if not name:
+                name = f"Marker {len(locators) + 1}"
+            locators.append(Locator(time=time, name=name))
+
+        # Prefer master-track tempo automation
+        master = [change for in_master, change in tempo_events if in_master]
+        tempo_automation = sorted(
+            master or [change for _, change in tempo_events], key=lambda t: t.time
+        )
 
         return ProjectStructure(
-            locators=locators,
+            locators=sorted(locators, key=lambda l: l.time),
             scenes=scenes,
             tempo_automation=tempo_automation,
             has_tempo_changes=len(tempo_automation) > 1
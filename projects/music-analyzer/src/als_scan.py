@@ -0,0 +1,332 @@
+"""
+Incremental, Parallel .als Scanning
+
+`als-doctor scan` used to analyze every .als under a folder one after the
+other and, with --save, re-persist all of them on every run. This module
+keeps a manifest of what was analyzed (table scan_manifest in the project
+database, one row per file):
+
+    als_path | file_size | file_mtime_ns | content_hash | version_id | analyzed_at
+
+Each found file is compared against its manifest row:
+- No row, or its version is gone from the database: new, analyzed
+- Same size and mtime: unchanged, skipped
+- Size or mtime differ: the file is hashed. The same SHA-256 means it was
+  only touched (skipped, the row is refreshed), otherwise it is modified
+  and analyzed again
+
+The files to analyze run on a process pool (scan --jobs N). Outcomes are
+yielded as they finish, so they can be saved one at a time and an
+interrupted scan keeps its progress.
+
+Usage:
+    manifest = ScanManifest()
+    plan = manifest.plan(als_files)
+    for outcome in scan_files(plan.to_analyze, jobs=8):
+        success, message, version_id = persist_scan_result(outcome.result)
+        manifest.record(outcome, version_id)
+"""
+
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+try:
+    from database import Database, ScanResult, ScanResultIssue, _calculate_grade
+    from project_snapshots import file_content_hash
+except ImportError:
+    from .database import Database, ScanResult, ScanResultIssue, _calculate_grade
+    from .project_snapshots import file_content_hash
+
+
+# File states in a ScanPlan
+NEW = 'new'
+MODIFIED = 'modified'
+UNCHANGED = 'unchanged'
+TOUCHED = 'touched'         # mtime changed, content identical
+
+
+@dataclass
+class ManifestEntry:
+    """State of a file when it was last analyzed and saved."""
+    als_path: str
+    file_size: int
+    file_mtime_ns: int
+    content_hash: str
+    version_id: Optional[int]
+    analyzed_at: Optional[str] = None
+
+
+@dataclass
+class PlannedFile:
+    """A found .als file and what the scan will do with it."""
+    path: Path
+    status: str                         # NEW, MODIFIED, UNCHANGED or TOUCHED
+    file_size: int
+    file_mtime_ns: int
+    content_hash: Optional[str] = None  # Set when the file had to be hashed
+    version_id: Optional[int] = None    # Stored version of an unchanged file
+
+
+@dataclass
+class ScanPlan:
+    """Found files split by what changed since the last saved scan."""
+    files: List[PlannedFile] = field(default_factory=list)
+
+    def _with(self, *statuses: str) -> List[PlannedFile]:
+        return [f for f in self.files if f.status in statuses]
+
+    @property
+    def new(self) -> List[PlannedFile]:
+        return self._with(NEW)
+
+    @property
+    def modified(self) -> List[PlannedFile]:
+        return self._with(MODIFIED)
+
+    @property
+    def skipped(self) -> List[PlannedFile]:
+        """Unchanged and touched files."""
+        return self._with(UNCHANGED, TOUCHED)
+
+    @property
+    def touched(self) -> List[PlannedFile]:
+        return self._with(TOUCHED)
+
+    @property
+    def to_analyze(self) -> List[Path]:
+        """New and modified files, in discovery order."""
+        return [f.path for f in self._with(NEW, MODIFIED)]
+
+
+@dataclass
+class ScanOutcome:
+    """Result of analyzing one file."""
+    als_path: str
+    result: Optional[ScanResult]
+    error: Optional[str] = None
+    file_size: int = 0
+    file_mtime_ns: int = 0
+    content_hash: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+
+def _key(path) -> str:
+    """Manifest key of a file (the absolute path, as versions.als_path)."""
+    return str(Path(path).absolute())
+
+
+# ==================== MANIFEST ====================
+
+
+class ScanManifest:
+    """The scan_manifest table of a project database."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize the manifest.
+
+        Args:
+            db_path: Optional custom path for the database (must be initialized)
+        """
+        self.db = Database(db_path)
+        with self.db.connection() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='scan_manifest'"
+            ).fetchone()
+        if not exists:
+            self.db.init()      # Databases created before the manifest existed
+
+    def entries(self) -> Dict[str, ManifestEntry]:
+        """All manifest rows by path; version_id is None if the version was deleted."""
+        with self.db.connection() as conn:
+            rows = conn.execute(
+                """SELECT m.als_path, m.file_size, m.file_mtime_ns, m.content_hash,
+                          v.id AS version_id, m.analyzed_at
+                   FROM scan_manifest m LEFT JOIN versions v ON v.id = m.version_id"""
+            ).fetchall()
+        return {
+            row['als_path']: ManifestEntry(
+                als_path=row['als_path'],
+                file_size=row['file_size'],
+                file_mtime_ns=row['file_mtime_ns'],
+                content_hash=row['content_hash'],
+                version_id=row['version_id'],
+                analyzed_at=str(row['analyzed_at']) if row['analyzed_at'] else None
+            )
+            for row in rows
+        }
+
+    def plan(self, als_files: Iterable[Path], full: bool = False) -> ScanPlan:
+        """
+        Decide which files need analysis.
+
+        Args:
+            als_files: Found .als files
+            full: Analyze every file (unchanged ones are reported as MODIFIED)
+
+        Returns:
+            ScanPlan in the order of als_files
+        """
+        entries = self.entries()
+        plan = ScanPlan()
+
+        for path in als_files:
+            stat = os.stat(path)
+            planned = PlannedFile(Path(path), NEW, stat.st_size, stat.st_mtime_ns)
+            entry = entries.get(_key(path))
+
+            if entry is None or entry.version_id is None:
+                pass
+            elif full:
+                planned.status = MODIFIED
+            elif (entry.file_size, entry.file_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                planned.status = UNCHANGED
+                planned.version_id = entry.version_id
+            else:
+                planned.content_hash = file_content_hash(str(path))
+                if planned.content_hash == entry.content_hash:
+                    planned.status = TOUCHED
+                    planned.version_id = entry.version_id
+                else:
+                    planned.status = MODIFIED
+
+            plan.files.append(planned)
+
+        return plan
+
+    def record(self, outcome: ScanOutcome, version_id: int):
+        """Store the state of a file whose analysis was saved as version_id."""
+        with self.db.connection() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO scan_manifest
+                   (als_path, file_size, file_mtime_ns, content_hash, version_id, analyzed_at)
+                   VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
+                (_key(outcome.als_path), outcome.file_size, outcome.file_mtime_ns,
+                 outcome.content_hash, version_id)
+            )
+
+    def refresh(self, files: Iterable[PlannedFile]) -> int:
+        """Update size and mtime of touched files so they are not hashed again."""
+        updates = [(f.file_size, f.file_mtime_ns, _key(f.path)) for f in files]
+        with self.db.connection() as conn:
+            conn.executemany(
+                "UPDATE scan_manifest SET file_size = ?, file_mtime_ns = ? WHERE als_path = ?",
+                updates
+            )
+        return len(updates)
+
+    def forget(self, als_path: str) -> bool:
+        """Drop a file's row so the next scan analyzes it again."""
+        with self.db.connection() as conn:
+            cursor = conn.execute("DELETE FROM scan_manifest WHERE als_path = ?", (_key(als_path),))
+        return cursor.rowcount > 0
+
+
+def plan_without_manifest(als_files: Iterable[Path]) -> ScanPlan:
+    """ScanPlan that analyzes every file (no database to compare against)."""
+    plan = ScanPlan()
+    for path in als_files:
+        stat = os.stat(path)
+        plan.files.append(PlannedFile(Path(path), NEW, stat.st_size, stat.st_mtime_ns))
+    return plan
+
+
+# ==================== ANALYSIS ====================
+
+
+def build_scan_result(als_path: Path) -> ScanResult:
+    """
+    Analyze a .als file's device chains into a ScanResult.
+
+    Raises:
+        Exception: Whatever parsing or diagnosis raised
+    """
+    try:
+        from device_chain_analyzer import analyze_als_devices
+        from effect_chain_doctor import EffectChainDoctor
+    except ImportError:
+        from .device_chain_analyzer import analyze_als_devices
+        from .effect_chain_doctor import EffectChainDoctor
+
+    # Analyze the project
+    analysis = analyze_als_devices(str(als_path))
+    doctor = EffectChainDoctor()
+    diagnosis = doctor.diagnose(analysis)
+
+    # Convert issues to ScanResultIssue format: global issues, then track issues
+    issues = []
+    track_issues = [issue for track_diag in diagnosis.track_diagnoses for issue in track_diag.issues]
+    for issue in list(diagnosis.global_issues) + track_issues:
+        issues.append(ScanResultIssue(
+            track_name=issue.track_name,
+            severity=issue.severity.value,
+            category=issue.category.value,
+            description=issue.description,
+            fix_suggestion=issue.recommendation
+        ))
+
+    return ScanResult(
+        als_path=str(als_path),
+        health_score=diagnosis.overall_health,
+        grade=_calculate_grade(diagnosis.overall_health),
+        total_issues=diagnosis.total_issues,
+        critical_issues=diagnosis.critical_issues,
+        warning_issues=diagnosis.warning_issues,
+        total_devices=diagnosis.total_devices,
+        disabled_devices=diagnosis.total_disabled,
+        clutter_percentage=diagnosis.clutter_percentage,
+        issues=issues,
+        device_analysis=analysis
+    )
+
+
+def analyze_for_scan(als_path: str) -> ScanOutcome:
+    """Hash and analyze one file (runs in a worker process for jobs > 1)."""
+    start = time.perf_counter()
+    outcome = ScanOutcome(als_path=str(als_path), result=None)
+    try:
+        # Stat and hash first: an edit during analysis shows up on the next scan
+        stat = os.stat(als_path)
+        outcome.file_size, outcome.file_mtime_ns = stat.st_size, stat.st_mtime_ns
+        outcome.content_hash = file_content_hash(str(als_path))
+        outcome.result = build_scan_result(Path(als_path))
+    except Exception as e:
+        outcome.error = str(e)
+    outcome.elapsed_seconds = time.perf_counter() - start
+    return outcome
+
+
+def scan_files(als_files: List[Path], jobs: int = 1,
+               executor: Optional[Executor] = None) -> Iterator[ScanOutcome]:
+    """
+    Analyze files, yielding each outcome as it finishes.
+
+    Args:
+        als_files: Files to analyze
+        jobs: Worker processes; 1 analyzes in this process, in order
+        executor: Long-lived pool to run on instead of starting one (jobs is ignored)
+
+    Yields:
+        ScanOutcome per file (completion order when running on a pool)
+    """
+    if executor is None and (jobs <= 1 or len(als_files) <= 1):
+        for path in als_files:
+            yield analyze_for_scan(str(path))
+        return
+
+    if executor is not None:
+        yield from _scan_on(executor, als_files)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(als_files))) as pool:
+        yield from _scan_on(pool, als_files)
+
+
+def _scan_on(executor: Executor, als_files: List[Path]) -> Iterator[ScanOutcome]:
+    futures = [executor.submit(analyze_for_scan, str(path)) for path in als_files]
+    for future in as_completed(futures):
+        yield future.result()
@@ -0,0 +1,216 @@
+"""
+Streaming ALS Reader.
+
+Reads an Ableton Live Set in one pass with ET.iterparse over the gzip
+stream instead of building the whole XML tree. Large arrangement projects
+decompress to 100+ MB of XML; the reader keeps only the element currently
+being handed to the caller, so peak memory stays flat and parse time is
+linear in file size.
+
+The reader emits events for the parts a caller asks for:
+- 'tracks'    MidiTrack / AudioTrack / ReturnTrack / GroupTrack / MasterTrack
+              elements, with their clips removed (clips are separate events)
+- 'devices'   Keep device chains inside track elements
+- 'clips'     MidiClip / AudioClip elements, tagged with their track
+- 'notes'     Keep the Notes subtree inside MIDI clips
+- 'locators'  Arrangement Locator elements
+- 'scenes'    Session Scene elements
+- 'tempo'     Tempo automation FloatEvent elements
+- 'plugins'   PluginDesc / VstPluginInfo / AuPluginInfo elements
+
+Everything not requested is discarded as soon as its closing tag is read.
+Project settings (tempo, time signature, sample rate) and version info are
+always collected into reader.settings.
+
+Usage:
+    reader = ALSStreamReader("song.als", include=DEVICE_PARTS)
+    for event in reader:
+        if event.kind == 'track':
+            print(event.track_tag, event.element.find(".//EffectiveName").get("Value"))
+    print(reader.settings.get('tempo'))
+
+Event elements are only valid until the next event is requested; extract
+what you need before advancing the iterator.
+"""
+
+import gzip
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+
+
+ALL_PARTS = frozenset({'tracks', 'devices', 'clips', 'notes', 'locators', 'scenes', 'tempo', 'plugins'})
+DEVICE_PARTS = frozenset({'tracks', 'devices'})
+
+TRACK_TAGS = frozenset({'MidiTrack', 'AudioTrack', 'ReturnTrack', 'GroupTrack', 'MasterTrack'})
+CLIP_TAGS = frozenset({'MidiClip', 'AudioClip'})
+
+# First element (in document order) matching each tag-path suffix
+SETTING_PATHS = {
+    'tempo': ('Tempo', 'Manual'),
+    'time_signature_numerator': ('TimeSignature', 'Numerator', 'Manual'),
+    'time_signature_denominator': ('TimeSignature', 'Denominator', 'Manual'),
+    'sample_rate': ('SampleRate', 'Manual'),
+}
+_SETTING_PARENTS = frozenset(suffix[-2] for suffix in SETTING_PATHS.values())
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+@dataclass
+class ALSEvent:
+    """One element emitted by the reader."""
+    kind: str                       # 'track', 'clip', 'locator', 'scene', 'tempo', 'plugin'
+    element: ET.Element             # Valid until the next event is requested
+    path: Tuple[str, ...]           # Ancestor tags, outermost first
+    track_tag: Optional[str] = None     # Enclosing track tag ('MidiTrack', ...)
+    track_ordinal: int = -1         # Index among tracks with the same tag
+
+
+def open_als(als_path: str) -> BinaryIO:
+    """Open an .als file as a binary XML stream (gzipped or plain)."""
+    with open(als_path, 'rb') as f:
+        magic = f.read(2)
+    if magic == _GZIP_MAGIC:
+        return gzip.open(als_path, 'rb')
+    # Some older versions might not be gzipped
+    return open(als_path, 'rb')
+
+
+class ALSStreamReader:
+    """One-pass, bounded-memory reader for .als files."""
+
+    def __init__(self, als_path: str, include: Iterable[str] = ALL_PARTS):
+        """
+        Initialize the reader.
+
+        Args:
+            als_path: Path to the .als file
+            include: Parts to emit (see module docstring); 'notes' implies
+                     'clips' and 'devices' implies 'tracks'
+        """
+        include = set(include)
+        unknown = include - ALL_PARTS
+        if unknown:
+            raise ValueError(f"Unknown ALS parts: {', '.join(sorted(unknown))}")
+        if 'notes' in include:
+            include.add('clips')
+        if 'devices' in include:
+            include.add('tracks')
+
+        self.als_path = str(als_path)
+        self.include = frozenset(include)
+
+        # Filled while iterating
+        self.settings: Dict[str, str] = {}
+        self.creator: Optional[str] = None
+        self.ableton_version: Optional[Tuple[str, str]] = None
+        self.element_count = 0
+
+    def __iter__(self) -> Iterator[ALSEvent]:
+        tags = []           # Open element tags, root first
+        stack = []          # (element, event kind, retains_children, kept) per open element
+        track_tag = None
+        track_ordinal = -1
+        track_counts: Dict[str, int] = {}
+
+        with open_als(self.als_path) as source:
+            for action, elem in ET.iterparse(source, events=('start', 'end')):
+                if action == 'start':
+                    self.element_count += 1
+                    tag = elem.tag
+                    parent_tag = tags[-1] if tags else None
+                    parent_retains = stack[-1][2] if stack else False
+
+                    if self.creator is None and 'Creator' in elem.attrib:
+                        self.creator = elem.attrib['Creator']
+                    if tag == 'Ableton' and stack and self.ableton_version is None:
+                        self.ableton_version = (elem.get('MajorVersion', ''), elem.get('MinorVersion', ''))
+
+                    if tag in TRACK_TAGS and track_tag is None:
+                        track_tag = tag
+                        track_ordinal = track_counts.get(tag, 0)
+                        track_counts[tag] = track_ordinal + 1
+
+                    kind = self._emit_kind(tag, parent_tag, tags, track_tag)
+                    kept = parent_retains and not self._pruned(tag, parent_tag, track_tag)
+                    stack.append((elem, kind, kind is not None or kept, kept))
+                    tags.append(tag)
+                    continue
+
+                # 'end'
+                tags.pop()
+                _, kind, _, kept = stack.pop()
+                tag = elem.tag
+
+                if tag == 'Manual' and tags and tags[-1] in _SETTING_PARENTS and 'Value' in elem.attrib:
+                    self._collect_setting(tags, elem)
+
+                if kind is not None:
+                    yield ALSEvent(kind, elem, tuple(tags), track_tag, track_ordinal)
+
+                if tag == track_tag and not any(t in TRACK_TAGS for t in tags):
+                    track_tag = None
+                    track_ordinal = -1
+
+                if not kept and stack:
+                    # Detach from the parent: elem is always its last child here
+                    parent = stack[-1][0]
+                    if len(parent) and parent[-1] is elem:
+                        del parent[-1]
+                    elem.clear()
+
+    def _emit_kind(self, tag: str, parent_tag: Optional[str], ancestors,
+                   track_tag: Optional[str]) -> Optional[str]:
+        """Event kind for an element, or None if it is not emitted."""
+        include = self.include
+        if tag in TRACK_TAGS:
+            if 'tracks' in include and track_tag == tag and not any(t in TRACK_TAGS for t in ancestors):
+                return 'track'
+            return None
+        if tag in CLIP_TAGS:
+            return 'clip' if 'clips' in include and track_tag is not None else None
+        if tag == 'Locator':
+            return 'locator' if 'locators' in include and parent_tag == 'Locators' else None
+        if tag == 'Scene':
+            return 'scene' if 'scenes' in include and parent_tag == 'Scenes' else None
+        if tag == 'FloatEvent':
+            if 'tempo' in include and parent_tag == 'Events' and _has_subsequence(
+                    ancestors, ('Tempo', 'Automation', 'Events')):
+                return 'tempo'
+            return None
+        if 'plugins' in include and ('PluginDesc' in tag or 'VstPluginInfo' in tag or 'AuPluginInfo' in tag):
+            return 'plugin'
+        return None
+
+    def _pruned(self, tag: str, parent_tag: Optional[str], track_tag: Optional[str]) -> bool:
+        """Whether an element is dropped from the emitted element that contains it."""
+        if tag in CLIP_TAGS:
+            return track_tag is not None        # Clips are emitted separately
+        if parent_tag == 'Devices' and 'devices' not in self.include:
+            return True
+        if tag == 'Notes' and parent_tag == 'MidiClip' and 'notes' not in self.include:
+            return True
+        return False
+
+    def _collect_setting(self, tags, elem: ET.Element) -> None:
+        path = tuple(tags) + ('Manual',)
+        for name, suffix in SETTING_PATHS.items():
+            if name not in self.settings and path[-len(suffix):] == suffix:
+                self.settings[name] = elem.attrib['Value']
+
+
+def _has_subsequence(tags, sequence: Tuple[str, ...]) -> bool:
+    """Whether `sequence` occurs in order (not necessarily adjacent) in `tags`."""
+    position = 0
+    for tag in tags:
+        if tag == sequence[position]:
+            position += 1
+            if position == len(sequence):
+                return True
+    return False
+
+
+def iter_als(als_path: str, include: Iterable[str] = ALL_PARTS) -> Iterator[ALSEvent]:
+    """Iterate over the events of an .als file (see ALSStreamReader)."""
+    return iter(ALSStreamReader(als_path, include))
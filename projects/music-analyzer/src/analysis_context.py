@@ -0,0 +1,239 @@
+"""
+Analysis Context Module
+
+Decode-once container for a single audio file. Holds the raw float buffer
+and lazily memoizes the derived views that several analyzers need:
+- Mono mix
+- Magnitude STFT (per n_fft / hop_length)
+- Onset strength envelope
+- RMS frames
+- Spectral centroid / rolloff
+- Chromagram
+
+Every view is computed at most once per file, so the core AudioAnalyzer
+passes and the extended analyzers (harmonic, clarity, spatial) share the
+same spectrogram instead of each running their own STFT.
+"""
+
+import numpy as np
+import librosa
+from scipy import signal
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+try:
+    from .pcm_cache import load_audio
+except ImportError:
+    from pcm_cache import load_audio
+
+
+class AnalysisContext:
+    """
+    Shared, lazily-populated analysis state for one audio buffer.
+
+    `y` uses the librosa layout: 1-D for mono, (channels, samples) for
+    multi-channel audio. `audio_data` exposes the soundfile layout
+    (samples, channels) as a view of the same buffer.
+    """
+
+    def __init__(self, y: np.ndarray, sr: int, file_path: Optional[str] = None):
+        """
+        Create a context from an already decoded buffer.
+
+        Args:
+            y: Audio samples (1-D mono or (channels, samples))
+            sr: Sample rate
+            file_path: Optional source path (informational)
+        """
+        if y.ndim == 2 and y.shape[0] == 1:
+            y = y[0]
+        self.y = y
+        self.sr = int(sr)
+        self.file_path = file_path
+
+        self._mono: Optional[np.ndarray] = None
+        self._magnitudes: Dict[Tuple[int, int], np.ndarray] = {}
+        self._onset_envs: Dict[int, np.ndarray] = {}
+        self._rms: Dict[Tuple[int, int], np.ndarray] = {}
+        self._centroids: Dict[Tuple[int, int], np.ndarray] = {}
+        self._rolloffs: Dict[Tuple[int, int], np.ndarray] = {}
+        self._chroma: Optional[np.ndarray] = None
+        self._tempo: Optional[float] = None
+        self._tempo_computed = False
+
+    @classmethod
+    def from_file(cls, audio_path: str) -> 'AnalysisContext':
+        """
+        Decode an audio file once at its native sample rate.
+
+        Goes through the PCM cache (float32, no resampling), so re-analyzing
+        an unchanged file memory-maps the previous decode.
+        """
+        path = Path(audio_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        y, sr = load_audio(str(path), sr=None, mono=False)
+        return cls(y, sr, file_path=str(path))
+
+    @classmethod
+    def ensure(
+        cls,
+        y: Union[np.ndarray, 'AnalysisContext'],
+        sr: Optional[int] = None
+    ) -> 'AnalysisContext':
+        """Wrap a raw buffer in a context, or return an existing context unchanged."""
+        if isinstance(y, AnalysisContext):
+            return y
+        if sr is None:
+            raise ValueError("Sample rate is required when passing a raw audio buffer")
+        return cls(np.asarray(y), sr)
+
+    # ==================== BUFFER VIEWS ====================
+
+    @property
+    def channels(self) -> int:
+        """Number of channels in the decoded buffer."""
+        return 1 if self.y.ndim == 1 else self.y.shape[0]
+
+    @property
+    def is_stereo(self) -> bool:
+        """True if the buffer has exactly two channels."""
+        return self.y.ndim == 2 and self.y.shape[0] == 2
+
+    @property
+    def audio_data(self) -> np.ndarray:
+        """Samples in soundfile layout: (samples,) or (samples, channels)."""
+        return self.y if self.y.ndim == 1 else self.y.T
+
+    @property
+    def mono(self) -> np.ndarray:
+        """Mono mix (mean of channels)."""
+        if self._mono is None:
+            self._mono = self.y if self.y.ndim == 1 else librosa.to_mono(self.y)
+        return self._mono
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return self.mono.shape[-1] / self.sr
+
+    def channel(self, index: int) -> np.ndarray:
+        """Single channel (mono buffers return the mono signal for any index)."""
+        if self.y.ndim == 1:
+            return self.y
+        return self.y[min(index, self.y.shape[0] - 1)]
+
+    # ==================== DERIVED FEATURES ====================
+
+    def magnitude(self, n_fft: int = 2048, hop_length: int = 512) -> np.ndarray:
+        """Magnitude STFT of the mono mix."""
+        key = (n_fft, hop_length)
+        if key not in self._magnitudes:
+            self._magnitudes[key] = np.abs(
+                librosa.stft(self.mono, n_fft=n_fft, hop_length=hop_length)
+            )
+        return self._magnitudes[key]
+
+    def fft_frequencies(self, n_fft: int = 2048) -> np.ndarray:
+        """Bin center frequencies for a given n_fft."""
+        return librosa.fft_frequencies(sr=self.sr, n_fft=n_fft)
+
+    def onset_envelope(self, hop_length: int = 512) -> np.ndarray:
+        """Onset strength envelope (same as librosa.onset.onset_strength defaults)."""
+        if hop_length not in self._onset_envs:
+            power = self.magnitude(2048, hop_length) ** 2
+            mel = librosa.feature.melspectrogram(S=power, sr=self.sr)
+            self._onset_envs[hop_length] = librosa.onset.onset_strength(
+                S=librosa.power_to_db(mel), sr=self.sr, hop_length=hop_length
+            )
+        return self._onset_envs[hop_length]
+
+    def rms(self, frame_length: int = 2048, hop_length: int = 512) -> np.ndarray:
+        """Frame-wise RMS of the mono mix."""
+        key = (frame_length, hop_length)
+        if key not in self._rms:
+            self._rms[key] = librosa.feature.rms(
+                y=self.mono, frame_length=frame_length, hop_length=hop_length
+            )[0]
+        return self._rms[key]
+
+    def spectral_centroid(self, n_fft: int = 2048, hop_length: int = 512) -> np.ndarray:
+        """Frame-wise spectral centroid in Hz."""
+        key = (n_fft, hop_length)
+        if key not in self._centroids:
+            self._centroids[key] = librosa.feature.spectral_centroid(
+                S=self.magnitude(n_fft, hop_length), sr=self.sr, n_fft=n_fft
+            )[0]
+        return self._centroids[key]
+
+    def spectral_rolloff(self, n_fft: int = 2048, hop_length: int = 512) -> np.ndarray:
+        """Frame-wise spectral rolloff (85%) in Hz."""
+        key = (n_fft, hop_length)
+        if key not in self._rolloffs:
+            self._rolloffs[key] = librosa.feature.spectral_rolloff(
+                S=self.magnitude(n_fft, hop_length), sr=self.sr, n_fft=n_fft
+            )[0]
+        return self._rolloffs[key]
+
+    def chroma(self) -> np.ndarray:
+        """Constant-Q chromagram, falling back to STFT chroma if CQT fails."""
+        if self._chroma is None:
+            try:
+                self._chroma = librosa.feature.chroma_cqt(y=self.mono, sr=self.sr)
+            except Exception:
+                self._chroma = librosa.feature.chroma_stft(S=self.magnitude() ** 2, sr=self.sr)
+        return self._chroma
+
+    def tempo(self) -> Optional[float]:
+        """Global tempo estimate from the shared onset envelope."""
+        if not self._tempo_computed:
+            self._tempo_computed = True
+            self._tempo = estimate_tempo(self.onset_envelope(), self.sr)
+        return self._tempo
+
+
+def mean_tempogram(
+    onset_env: np.ndarray,
+    sr: int,
+    hop_length: int = 512,
+    ac_size: float = 8.0,
+    chunk_frames: int = 4096
+) -> np.ndarray:
+    """
+    Time-averaged autocorrelation tempogram, computed in chunks of frames.
+
+    Equal to librosa.feature.tempogram(...).mean(axis=1, keepdims=True), but
+    never materializes the full (window x frames) tempogram, which takes
+    gigabytes for a long mix.
+    """
+    win_length = int(librosa.time_to_frames(ac_size, sr=sr, hop_length=hop_length))
+    n = len(onset_env)
+    padded = np.pad(onset_env, win_length // 2, mode='linear_ramp', end_values=[0, 0])
+    window = signal.get_window('hann', win_length, fftbins=True)[:, np.newaxis]
+
+    total = np.zeros(win_length)
+    for start in range(0, n, chunk_frames):
+        stop = min(n, start + chunk_frames)
+        frames = librosa.util.frame(
+            padded[start:stop + win_length - 1], frame_length=win_length, hop_length=1
+        )
+        ac = librosa.autocorrelate(frames * window, axis=0)
+        total += librosa.util.normalize(ac, norm=np.inf, axis=0).sum(axis=1)
+    return (total / max(n, 1))[:, np.newaxis]
+
+
+def estimate_tempo(onset_env: np.ndarray, sr: int, hop_length: int = 512) -> Optional[float]:
+    """
+    Global tempo of an onset envelope (None on failure).
+
+    Same estimate as librosa.beat.beat_track's tempo, with bounded memory.
+    """
+    try:
+        if len(onset_env) == 0:
+            return None
+        tg = mean_tempogram(onset_env, sr, hop_length)
+        tempo = librosa.feature.tempo(tg=tg, sr=sr, hop_length=hop_length)
+        return float(np.atleast_1d(tempo)[0])
+    except Exception:
+        return None
@@ -16,6 +16,8 @@ import librosa
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from analysis_context import AnalysisContext
+
 
 @dataclass
 class ClarityInfo:
@@ -57,27 +59,25 @@ class ClarityAnalyzer:
             self.harsh_centroid_threshold = 4000
             self.good_contrast_range = [20, 60]
 
-    def analyze(self, y: np.ndarray, sr: int) -> ClarityInfo:
+    def analyze(self, y, sr: Optional[int] = None) -> ClarityInfo:
         """
         Perform clarity analysis on audio.
 
         Args:
-            y: Audio time series (mono or stereo)
-            sr: Sample rate
+            y: Audio time series (mono or stereo) or a shared AnalysisContext
+            sr: Sample rate (not needed when passing a context)
 
         Returns:
             ClarityInfo with clarity metrics and analysis
         """
-        # Ensure mono for analysis
-        if len(y.shape) > 1:
-            y = librosa.to_mono(y)
+        ctx = AnalysisContext.ensure(y, sr)
 
         analysis = []
 
         # Calculate spectral features with robust error handling
-        spectral_contrast = self._calculate_spectral_contrast(y, sr)
-        spectral_flatness = self._calculate_spectral_flatness(y, sr)
-        spectral_centroid = self._calculate_spectral_centroid(y, sr)
+        spectral_contrast = self._calculate_spectral_contrast(ctx)
+        spectral_flatness = self._calculate_spectral_flatness(ctx)
+        spectral_centroid = self._calculate_spectral_centroid(ctx)
 
         # Interpret brightness
         brightness_category = self._categorize_brightness(spectral_centroid)
@@ -137,7 +137,7 @@ class ClarityAnalyzer:
             analysis=analysis
         )
 
-    def _calculate_spectral_contrast(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_spectral_contrast(self, ctx: AnalysisContext) -> float:
         """
         Calculate average spectral contrast.
 
@@ -150,7 +150,7 @@ class ClarityAnalyzer:
         try:
             # Try primary method with 4 bands
             contrast = librosa.feature.spectral_contrast(
-                y=y, sr=sr,
+                S=ctx.magnitude(n_fft=2048, hop_length=512), sr=ctx.sr,
                 n_fft=2048,
                 hop_length=512,
                 n_bands=4
@@ -163,7 +163,7 @@ class ClarityAnalyzer:
             # Fallback method 1: Different parameters
             try:
                 contrast = librosa.feature.spectral_contrast(
-                    y=y, sr=sr,
+                    S=ctx.magnitude(n_fft=4096, hop_length=1024), sr=ctx.sr,
                     n_fft=4096,
                     hop_length=1024,
                     n_bands=6
@@ -174,14 +174,14 @@ class ClarityAnalyzer:
 
             # Fallback method 2: Manual calculation
             try:
-                D = np.abs(librosa.stft(y, n_fft=2048))
+                D = ctx.magnitude(n_fft=2048)
                 # Calculate std dev across frequency as rough contrast measure
                 contrast_approx = np.std(librosa.amplitude_to_db(D, ref=np.max))
                 return float(contrast_approx)
             except Exception:
                 return 30.0  # Default mid-range value
 
-    def _calculate_spectral_flatness(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_spectral_flatness(self, ctx: AnalysisContext) -> float:
         """
         Calculate average spectral flatness.
 
@@ -192,13 +192,13 @@ class ClarityAnalyzer:
             Average spectral flatness (0-1)
         """
         try:
-            flatness = librosa.feature.spectral_flatness(y=y)
+            flatness = librosa.feature.spectral_flatness(S=ctx.magnitude())
             avg_flatness = np.mean(flatness)
             return float(avg_flatness)
         except Exception:
             return 0.3  # Default mid-range value
 
-    def _calculate_spectral_centroid(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_spectral_centroid(self, ctx: AnalysisContext) -> float:
         """
         Calculate average spectral centroid.
 
@@ -209,7 +209,7 @@ class ClarityAnalyzer:
             Average spectral centroid in Hz
         """
         try:
-            centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
+            centroid = ctx.spectral_centroid()
             avg_centroid = np.mean(centroid)
             return float(avg_centroid)
         except Exception:
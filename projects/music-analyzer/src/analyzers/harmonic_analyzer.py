@@ -25,6 +25,7 @@ from music_theory import (
     get_key_relationship_info,
     get_camelot_notation,
 )
+from analysis_context import AnalysisContext
 
 
 @dataclass
@@ -69,33 +70,28 @@ class HarmonicAnalyzer:
             self.segment_overlap = 0.5
             self.min_key_confidence = 0.6
 
-    def analyze(self, y: np.ndarray, sr: int) -> HarmonicInfo:
+    def analyze(self, y, sr: Optional[int] = None) -> HarmonicInfo:
         """
         Perform harmonic content analysis on audio.
 
         Args:
-            y: Audio time series (mono)
-            sr: Sample rate
+            y: Audio time series (mono) or a shared AnalysisContext
+            sr: Sample rate (not needed when passing a context)
 
         Returns:
             HarmonicInfo with key detection and harmonic analysis results
         """
-        # Ensure mono
-        if len(y.shape) > 1:
-            y = librosa.to_mono(y)
+        ctx = AnalysisContext.ensure(y, sr)
+        y, sr = ctx.mono, ctx.sr
 
         analysis = []
 
-        # Compute chromagram using Constant-Q Transform
+        # Compute chromagram (CQT, with STFT fallback inside the context)
         try:
-            chroma = librosa.feature.chroma_cqt(y=y, sr=sr)
-        except Exception:
-            # Fallback to STFT-based chroma if CQT fails
-            try:
-                chroma = librosa.feature.chroma_stft(y=y, sr=sr)
-            except Exception as e:
-                # Return default values if both fail
-                return self._create_default_result(f"Chromagram analysis failed: {str(e)}")
+            chroma = ctx.chroma()
+        except Exception as e:
+            # Return default values if both fail
+            return self._create_default_result(f"Chromagram analysis failed: {str(e)}")
 
         # Detect key
         key, key_confidence, is_minor, top_candidates = self._detect_key(chroma)
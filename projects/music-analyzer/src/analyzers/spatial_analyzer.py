@@ -10,10 +10,11 @@ Based on ai-music-mix-analyzer implementation, adapted for AbletonAIAnalysis.
 """
 
 import numpy as np
-import librosa
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from analysis_context import AnalysisContext
+
 
 @dataclass
 class SpatialInfo:
@@ -100,17 +101,19 @@ class SpatialAnalyzer:
         self.crossfeed_factor = 0.4
         self.bass_threshold = 100
 
-    def analyze_3d(self, y: np.ndarray, sr: int) -> SpatialInfo:
+    def analyze_3d(self, y, sr: Optional[int] = None) -> SpatialInfo:
         """
         Analyze 3D spatial perception characteristics.
 
         Args:
-            y: Audio time series (mono or stereo)
-            sr: Sample rate
+            y: Audio time series (mono or stereo) or a shared AnalysisContext
+            sr: Sample rate (not needed when passing a context)
 
         Returns:
             SpatialInfo with height, depth, and width consistency scores
         """
+        ctx = AnalysisContext.ensure(y, sr)
+        y, sr = ctx.y, ctx.sr
         analysis = []
 
         # Ensure stereo for spatial analysis
@@ -122,10 +125,10 @@ class SpatialAnalyzer:
         right = y[1] if len(y.shape) > 1 and y.shape[0] > 1 else y
 
         # Calculate height score (based on high frequency energy)
-        height_score = self._calculate_height_score(left, right, sr)
+        height_score = self._calculate_height_score(ctx)
 
         # Calculate depth score (based on dynamics and reverb characteristics)
-        depth_score = self._calculate_depth_score(left, right, sr)
+        depth_score = self._calculate_depth_score(left, right, ctx)
 
         # Calculate width consistency (stereo correlation stability over time)
         width_consistency = self._calculate_width_consistency(left, right, sr)
@@ -157,17 +160,19 @@ class SpatialAnalyzer:
             analysis=analysis
         )
 
-    def analyze_surround(self, y: np.ndarray, sr: int) -> SurroundInfo:
+    def analyze_surround(self, y, sr: Optional[int] = None) -> SurroundInfo:
         """
         Analyze surround and mono compatibility.
 
         Args:
-            y: Audio time series (mono or stereo)
-            sr: Sample rate
+            y: Audio time series (mono or stereo) or a shared AnalysisContext
+            sr: Sample rate (not needed when passing a context)
 
         Returns:
             SurroundInfo with mono compatibility and phase scores
         """
+        ctx = AnalysisContext.ensure(y, sr)
+        y, sr = ctx.y, ctx.sr
         analysis = []
 
         # Handle mono input
@@ -218,17 +223,19 @@ class SpatialAnalyzer:
             analysis=analysis
         )
 
-    def analyze_playback(self, y: np.ndarray, sr: int) -> PlaybackInfo:
+    def analyze_playback(self, y, sr: Optional[int] = None) -> PlaybackInfo:
         """
         Analyze playback optimization for headphones and speakers.
 
         Args:
-            y: Audio time series (mono or stereo)
-            sr: Sample rate
+            y: Audio time series (mono or stereo) or a shared AnalysisContext
+            sr: Sample rate (not needed when passing a context)
 
         Returns:
             PlaybackInfo with headphone/speaker scores and recommendations
         """
+        ctx = AnalysisContext.ensure(y, sr)
+        y, sr = ctx.y, ctx.sr
         analysis = []
 
         # Handle mono input
@@ -242,7 +249,7 @@ class SpatialAnalyzer:
         headphone_score, crossfeed_safe = self._calculate_headphone_score(left, right)
 
         # Calculate speaker score (bass management)
-        speaker_score, bass_translation = self._calculate_speaker_score(y, sr)
+        speaker_score, bass_translation = self._calculate_speaker_score(ctx)
 
         # Generate analysis
         if headphone_score < 50:
@@ -277,23 +284,20 @@ class SpatialAnalyzer:
             analysis=analysis
         )
 
-    def _calculate_height_score(self, left: np.ndarray, right: np.ndarray, sr: int) -> float:
+    def _calculate_height_score(self, ctx: AnalysisContext) -> float:
         """
         Calculate height perception score based on high frequency content.
 
         Higher frequencies are psychoacoustically perceived as "higher" in space.
         """
         try:
-            # Combine to mono for frequency analysis
-            mono = (left + right) / 2
-
-            # Calculate spectral centroid
-            centroid = librosa.feature.spectral_centroid(y=mono, sr=sr)
+            # Spectral centroid of the shared mono mix
+            centroid = ctx.spectral_centroid()
             avg_centroid = np.mean(centroid)
 
             # Also check high frequency energy
-            D = np.abs(librosa.stft(mono))
-            freqs = librosa.fft_frequencies(sr=sr)
+            D = ctx.magnitude()
+            freqs = ctx.fft_frequencies()
 
             # High frequency range (>8kHz)
             high_mask = freqs > 8000
@@ -318,7 +322,7 @@ class SpatialAnalyzer:
         except Exception:
             return 50.0
 
-    def _calculate_depth_score(self, left: np.ndarray, right: np.ndarray, sr: int) -> float:
+    def _calculate_depth_score(self, left: np.ndarray, right: np.ndarray, ctx: AnalysisContext) -> float:
         """
         Calculate depth perception score based on dynamics and reverb characteristics.
 
@@ -329,8 +333,7 @@ class SpatialAnalyzer:
             correlation = np.corrcoef(left, right)[0, 1]
 
             # Calculate RMS variation (dynamic range proxy)
-            mono = (left + right) / 2
-            rms = librosa.feature.rms(y=mono)[0]
+            rms = ctx.rms()
             rms_std = np.std(rms) / (np.mean(rms) + 1e-10)
 
             # Lower correlation = more depth potential
@@ -468,7 +471,7 @@ class SpatialAnalyzer:
         except Exception:
             return (75.0, True)
 
-    def _calculate_speaker_score(self, y: np.ndarray, sr: int) -> tuple:
+    def _calculate_speaker_score(self, ctx: AnalysisContext) -> tuple:
         """
         Calculate speaker translation score.
 
@@ -478,15 +481,9 @@ class SpatialAnalyzer:
             Tuple of (score, bass_translation)
         """
         try:
-            # Get mono for frequency analysis
-            if len(y.shape) > 1:
-                mono = librosa.to_mono(y)
-            else:
-                mono = y
-
-            # Calculate bass energy
-            D = np.abs(librosa.stft(mono))
-            freqs = librosa.fft_frequencies(sr=sr)
+            # Calculate bass energy from the shared mono spectrogram
+            D = ctx.magnitude()
+            freqs = ctx.fft_frequencies()
 
             # Sub-bass (<60Hz) - won't translate to small speakers
             sub_mask = freqs < 60
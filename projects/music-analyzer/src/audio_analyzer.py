@@ -19,10 +19,15 @@ from typing import Optional, List, Tuple, Dict, Any
 from pathlib import Path
 
 try:
-    import pyloudnorm as pyln
-    PYLOUDNORM_AVAILABLE = True
+    from .analysis_context import AnalysisContext
+    from .loudness_meter import LoudnessMeasurement, measure_loudness
+    from .streaming_analysis import StreamingFeatures
+    from .result_cache import ResultCache
 except ImportError:
-    PYLOUDNORM_AVAILABLE = False
+    from analysis_context import AnalysisContext
+    from loudness_meter import LoudnessMeasurement, measure_loudness
+    from streaming_analysis import StreamingFeatures
+    from result_cache import ResultCache
 
 
 @dataclass
@@ -172,6 +177,9 @@ class AnalysisResult:
 class AudioAnalyzer:
     """Main audio analysis class."""
 
+    # Bump when analysis output changes; part of the result cache key
+    VERSION = "1.0.0"
+
     # Default frequency band definitions (Hz) - can be overridden by config
     DEFAULT_FREQ_BANDS = {
         'sub_bass': (20, 60),
@@ -213,9 +221,19 @@ class AudioAnalyzer:
         'out_of_phase': -1.0     # < 0 = out of phase (CRITICAL)
     }
 
-    def __init__(self, verbose: bool = False, config=None):
+    # Default block length (seconds) for bounded-memory streaming analysis
+    DEFAULT_STREAM_BLOCK_SECONDS = 5.0
+
+    # Per-frame band sums behind section classification and band ratios
+    # (same names as the StreamingFeatures frame tables)
+    SECTION_BAND_TABLES = (
+        'mag_low', 'mag_total', 'power_sub', 'power_mud', 'power_harsh', 'power_total'
+    )
+
+    def __init__(self, verbose: bool = False, config=None, cache: Optional[ResultCache] = None):
         self.verbose = verbose
         self.config = config
+        self.cache = cache
 
         # Load values from config or use defaults
         if config:
@@ -281,11 +299,16 @@ class AudioAnalyzer:
             self.over_compression_threshold = 6.0
             self.mono_compatibility_threshold = 0.3
 
+        # Samples held in memory per block in streaming mode
+        self.stream_block_seconds = self.DEFAULT_STREAM_BLOCK_SECONDS
+
     def analyze(
         self,
         audio_path: str,
         reference_tempo: Optional[float] = None,
-        genre_preset: Optional[str] = None
+        genre_preset: Optional[str] = None,
+        context: Optional[AnalysisContext] = None,
+        streaming: bool = False
     ) -> AnalysisResult:
         """
         Perform complete analysis on an audio file.
@@ -294,41 +317,115 @@ class AudioAnalyzer:
             audio_path: Path to the audio file (WAV, FLAC, etc.)
             reference_tempo: Expected tempo (from project file) for verification
             genre_preset: Genre preset name for target comparison (trance, house, techno, dnb, progressive)
+            context: Pre-decoded AnalysisContext for this file (decoded here if omitted)
+            streaming: Analyze block by block with bounded memory (for long mixes).
+                       Core metrics match the in-memory path within the tolerances
+                       documented in streaming_analysis; the extended analyzers
+                       (harmonic, clarity, spatial) need the full buffer and are skipped.
 
         Returns:
-            AnalysisResult with all analysis data
+            AnalysisResult with all analysis data (served from the result
+            cache when one is configured and the file is unchanged)
         """
         path = Path(audio_path)
         if not path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        # Load audio
-        y, sr = librosa.load(audio_path, sr=None, mono=False)
+        result = self._cached(
+            'analyze', audio_path,
+            lambda: self._analyze(audio_path, reference_tempo, genre_preset, context, streaming),
+            reference_tempo=reference_tempo,
+            genre_preset=genre_preset,
+            streaming=streaming,
+            stream_block_seconds=self.stream_block_seconds if streaming else None
+        )
+        # Cache entries are keyed by content, so the same bounce may have been
+        # analyzed under another name
+        result.file_path = str(path.absolute())
+        return result
 
-        # Get original audio for peak detection (soundfile preserves scale)
-        audio_data, sr_orig = sf.read(audio_path)
+    def _cached(self, analysis: str, audio_path: str, compute, **params):
+        """
+        Return compute(), served from / stored in the result cache if configured.
 
-        # Determine if stereo
-        is_stereo = len(y.shape) > 1 and y.shape[0] == 2
+        Args:
+            analysis: Name of the public method, part of the cache key
+            audio_path: Audio file the result describes
+            compute: Zero-argument callable producing the result
+            **params: Call parameters that affect the result
+        """
+        if self.cache is None:
+            return compute()
 
-        # Create mono mix for analysis
-        if is_stereo:
-            y_mono = librosa.to_mono(y)
-        else:
-            y_mono = y if len(y.shape) == 1 else y[0]
+        key = self.cache.make_key(
+            audio_path, f'AudioAnalyzer.{analysis}', self.VERSION, self.config, **params
+        )
+        result = self.cache.get(key)
+        if result is not None:
+            if self.verbose:
+                print(f"  Using cached {analysis} result for {Path(audio_path).name}")
+            return result
 
-        duration = librosa.get_duration(y=y_mono, sr=sr)
+        result = compute()
+        self.cache.put(key, result, source=str(Path(audio_path).absolute()))
+        return result
 
-        # Perform all analyses
-        clipping = self._analyze_clipping(audio_data, sr)
-        dynamics = self._analyze_dynamics(y_mono, sr)
-        frequency = self._analyze_frequency(y_mono, sr)
-        stereo = self._analyze_stereo(y, sr) if is_stereo else self._create_mono_stereo_info()
-        loudness = self._analyze_loudness(y_mono, sr, audio_data)
-        transients = self._analyze_transients(y_mono, sr, duration)
+    def _analyze(
+        self,
+        audio_path: str,
+        reference_tempo: Optional[float],
+        genre_preset: Optional[str],
+        context: Optional[AnalysisContext],
+        streaming: bool
+    ) -> AnalysisResult:
+        """Uncached body of analyze()."""
+        path = Path(audio_path)
+        ctx = None
+        if streaming:
+            features = StreamingFeatures.from_file(
+                audio_path,
+                block_seconds=self.stream_block_seconds,
+                clip_threshold=self.clipping_threshold,
+                clip_group_window=self.clipping_group_window
+            )
+            sr = features.sr
+            is_stereo = features.is_stereo
+            duration = features.duration
 
-        # Detect tempo
-        detected_tempo = self._detect_tempo(y_mono, sr)
+            clipping = self._clipping_from_events(
+                features.clip_count, features.clip_times, features.max_peak
+            )
+            dynamics = self._dynamics_from_levels(features.mono_peak, features.mono_rms)
+            frequency = self._frequency_from_spectrum(
+                float(np.mean(features.spectral_centroid)),
+                float(np.mean(features.spectral_rolloff)),
+                features.bin_power,
+                features.band_frequencies
+            )
+            stereo = (self._stereo_from_correlation(features.correlation)
+                      if is_stereo else self._create_mono_stereo_info())
+            loudness = self._loudness_from_measurement(features.loudness)
+            transients = self._transients_from_onsets(features.onset_envelope, sr, duration)
+            detected_tempo = features.tempo()
+        else:
+            # Decode once; every analysis below shares this context
+            ctx = context if context is not None else AnalysisContext.from_file(audio_path)
+            y, sr = ctx.y, ctx.sr
+            audio_data = ctx.audio_data
+            y_mono = ctx.mono
+            is_stereo = ctx.is_stereo
+            duration = ctx.duration
+
+            # Perform all analyses
+            clipping = self._analyze_clipping(audio_data, sr)
+            dynamics = self._analyze_dynamics(y_mono, sr)
+            frequency = self._analyze_frequency(ctx)
+            stereo = self._analyze_stereo(y, sr) if is_stereo else self._create_mono_stereo_info()
+            loudness = self._analyze_loudness(audio_data, sr)
+            transients = self._analyze_transients(ctx)
+
+            # Detect tempo
+            detected_tempo = self._detect_tempo(ctx)
 
         # Extended analysis (merged from ai-music-mix-analyzer)
         harmonic = None
@@ -338,13 +435,13 @@ class AudioAnalyzer:
         playback = None
         overall_score_result = None
 
-        # Check if extended analyzers should run
-        if self.config:
+        # Check if extended analyzers should run (they need the decoded buffer)
+        if self.config and ctx is not None:
             # Harmonic analysis (key detection)
             if self.config.stage_enabled('harmonic_analysis'):
                 try:
                     from analyzers import HarmonicAnalyzer
-                    harmonic = HarmonicAnalyzer(self.config).analyze(y_mono, sr)
+                    harmonic = HarmonicAnalyzer(self.config).analyze(ctx)
                 except Exception as e:
                     if self.verbose:
                         print(f"Harmonic analysis failed: {e}")
@@ -353,7 +450,7 @@ class AudioAnalyzer:
             if self.config.stage_enabled('clarity_analysis'):
                 try:
                     from analyzers import ClarityAnalyzer
-                    clarity = ClarityAnalyzer(self.config).analyze(y_mono, sr)
+                    clarity = ClarityAnalyzer(self.config).analyze(ctx)
                 except Exception as e:
                     if self.verbose:
                         print(f"Clarity analysis failed: {e}")
@@ -362,7 +459,7 @@ class AudioAnalyzer:
             if self.config.stage_enabled('spatial_analysis'):
                 try:
                     from analyzers import SpatialAnalyzer
-                    spatial = SpatialAnalyzer(self.config).analyze_3d(y, sr)
+                    spatial = SpatialAnalyzer(self.config).analyze_3d(ctx)
                 except Exception as e:
                     if self.verbose:
                         print(f"Spatial analysis failed: {e}")
@@ -371,7 +468,7 @@ class AudioAnalyzer:
             if self.config.stage_enabled('surround_analysis'):
                 try:
                     from analyzers import SpatialAnalyzer
-                    surround = SpatialAnalyzer(self.config).analyze_surround(y, sr)
+                    surround = SpatialAnalyzer(self.config).analyze_surround(ctx)
                 except Exception as e:
                     if self.verbose:
                         print(f"Surround analysis failed: {e}")
@@ -380,7 +477,7 @@ class AudioAnalyzer:
             if self.config.stage_enabled('playback_analysis'):
                 try:
                     from analyzers import SpatialAnalyzer
-                    playback = SpatialAnalyzer(self.config).analyze_playback(y, sr)
+                    playback = SpatialAnalyzer(self.config).analyze_playback(ctx)
                 except Exception as e:
                     if self.verbose:
                         print(f"Playback analysis failed: {e}")
@@ -477,25 +574,34 @@ class AudioAnalyzer:
         max_peak = float(np.abs(audio_data).max())
 
         # Convert sample positions to time
-        clip_positions = []
+        grouped_times = []
         if clip_count > 0:
             # Group nearby clips and report unique positions
             clip_times = clipped_samples / sr
             # Group clips within configurable window
             group_window = self.clipping_group_window
-            grouped_times = []
             current_group_start = clip_times[0]
             for t in clip_times:
                 if t - current_group_start > group_window:
                     grouped_times.append(current_group_start)
                     current_group_start = t
             grouped_times.append(current_group_start)
-            # Limit positions to config max (0 = unlimited)
-            max_positions = self.clipping_max_positions
-            if max_positions > 0:
-                clip_positions = grouped_times[:max_positions]
-            else:
-                clip_positions = grouped_times
+
+        return self._clipping_from_events(clip_count, grouped_times, max_peak)
+
+    def _clipping_from_events(
+        self,
+        clip_count: int,
+        grouped_times: List[float],
+        max_peak: float
+    ) -> ClippingInfo:
+        """Build ClippingInfo from a clipped-sample count and grouped clip times."""
+        # Limit positions to config max (0 = unlimited)
+        max_positions = self.clipping_max_positions
+        if max_positions > 0:
+            clip_positions = list(grouped_times[:max_positions])
+        else:
+            clip_positions = list(grouped_times)
 
         # Determine severity using config thresholds
         minor_threshold = 100
@@ -523,12 +629,14 @@ class AudioAnalyzer:
 
     def _analyze_dynamics(self, y: np.ndarray, sr: int) -> DynamicsInfo:
         """Analyze dynamic range and compression with enhanced crest factor interpretation."""
+        return self._dynamics_from_levels(np.max(np.abs(y)), np.sqrt(np.mean(y ** 2)))
+
+    def _dynamics_from_levels(self, peak: float, rms: float) -> DynamicsInfo:
+        """Interpret linear peak and RMS levels of the mono mix."""
         # Calculate peak (dBFS)
-        peak = np.max(np.abs(y))
         peak_db = 20 * np.log10(peak + 1e-10)
 
         # Calculate RMS (dBFS)
-        rms = np.sqrt(np.mean(y ** 2))
         rms_db = 20 * np.log10(rms + 1e-10)
 
         # Dynamic range (difference between peak and RMS)
@@ -576,11 +684,13 @@ class AudioAnalyzer:
             recommended_action=recommended_action
         )
 
-    def _analyze_frequency(self, y: np.ndarray, sr: int) -> FrequencyInfo:
+    def _analyze_frequency(self, y, sr: Optional[int] = None) -> FrequencyInfo:
         """Analyze frequency balance and identify problem areas."""
-        # Compute spectral features
-        spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-        spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)[0]
+        ctx = AnalysisContext.ensure(y, sr)
+
+        # Compute spectral features (shared 2048-point STFT)
+        spectral_centroid = ctx.spectral_centroid()
+        spectral_rolloff = ctx.spectral_rolloff()
 
         # Average spectral features
         avg_centroid = float(np.mean(spectral_centroid))
@@ -588,15 +698,35 @@ class AudioAnalyzer:
 
         # Compute STFT for band analysis
         n_fft = 4096
-        D = np.abs(librosa.stft(y, n_fft=n_fft))
-        freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
+        D = ctx.magnitude(n_fft=n_fft)
+        bin_power = np.mean(D ** 2, axis=1)
+
+        return self._frequency_from_spectrum(
+            avg_centroid, avg_rolloff, bin_power, ctx.fft_frequencies(n_fft=n_fft)
+        )
+
+    def _frequency_from_spectrum(
+        self,
+        avg_centroid: float,
+        avg_rolloff: float,
+        bin_power: np.ndarray,
+        freqs: np.ndarray
+    ) -> FrequencyInfo:
+        """
+        Interpret the long-term spectrum.
 
+        Args:
+            avg_centroid: Mean spectral centroid (Hz)
+            avg_rolloff: Mean spectral rolloff (Hz)
+            bin_power: Mean power per STFT bin over all frames
+            freqs: Bin center frequencies for bin_power
+        """
         # Calculate energy in each frequency band
         def get_band_energy(low: float, high: float) -> float:
             mask = (freqs >= low) & (freqs < high)
             if not np.any(mask):
                 return 0.0
-            return float(np.mean(D[mask, :] ** 2))
+            return float(np.mean(bin_power[mask]))
 
         # Get energy for each band
         sub_bass = get_band_energy(20, 60)
@@ -670,8 +800,10 @@ class AudioAnalyzer:
         right = y[1]
 
         # Calculate correlation coefficient
-        correlation = float(np.corrcoef(left, right)[0, 1])
+        return self._stereo_from_correlation(float(np.corrcoef(left, right)[0, 1]))
 
+    def _stereo_from_correlation(self, correlation: float) -> StereoInfo:
+        """Interpret the L/R correlation coefficient of a stereo file."""
         # Estimate stereo width (0-100%)
         # Correlation of 1 = mono (0% width)
         # Correlation of 0 = full stereo (100% width)
@@ -735,61 +867,19 @@ class AudioAnalyzer:
             recommended_width="File is mono - stereo analysis skipped"
         )
 
-    def _analyze_loudness(self, y: np.ndarray, sr: int, audio_data: np.ndarray = None) -> LoudnessInfo:
+    def _analyze_loudness(self, audio_data: np.ndarray, sr: int) -> LoudnessInfo:
         """
-        Analyze loudness using industry-standard LUFS measurement.
-        Uses pyloudnorm for accurate ITU-R BS.1770-4 compliant measurement.
-        Falls back to approximation if pyloudnorm is not available.
+        Analyze loudness using ITU-R BS.1770-4 / EBU R128 measurement.
+
+        Args:
+            audio_data: Samples as (samples,) or (samples, channels)
+            sr: Sample rate
         """
-        if PYLOUDNORM_AVAILABLE:
-            try:
-                # Create meter with sample rate
-                meter = pyln.Meter(sr)
-
-                # For stereo audio, use the original multi-channel data
-                if audio_data is not None and len(audio_data.shape) > 1 and audio_data.shape[1] == 2:
-                    # Stereo - use full audio data for accurate LUFS
-                    integrated_lufs = float(meter.integrated_loudness(audio_data))
-                else:
-                    # Mono or use y
-                    if len(y.shape) == 1:
-                        integrated_lufs = float(meter.integrated_loudness(y))
-                    else:
-                        integrated_lufs = float(meter.integrated_loudness(y.T))
-
-                # True peak measurement (inter-sample peaks)
-                if audio_data is not None:
-                    true_peak_linear = np.max(np.abs(audio_data))
-                else:
-                    true_peak_linear = np.max(np.abs(y))
-                true_peak_db = float(20 * np.log10(true_peak_linear + 1e-10))
-
-                # For short-term and momentary, we need windowed analysis
-                hop_length = int(sr * 0.1)  # 100ms hop
-                frame_length = int(sr * 0.4)  # 400ms window (momentary)
-                rms = librosa.feature.rms(y=y if len(y.shape) == 1 else y[0], frame_length=frame_length, hop_length=hop_length)[0]
-                rms_db = 20 * np.log10(rms + 1e-10)
-
-                # Approximate short-term max (3s windows)
-                short_term_window = int(3.0 / 0.1)
-                if len(rms_db) >= short_term_window:
-                    short_term_values = np.convolve(rms_db, np.ones(short_term_window)/short_term_window, mode='valid')
-                    short_term_max_lufs = float(np.max(short_term_values)) - 0.5  # Adjustment for LUFS
-                else:
-                    short_term_max_lufs = integrated_lufs + 3.0
-
-                # Momentary max
-                momentary_max_lufs = float(np.max(rms_db)) - 0.5
-
-                # Loudness range
-                loudness_range_lu = float(np.percentile(rms_db, 95) - np.percentile(rms_db, 10))
+        return self._loudness_from_measurement(measure_loudness(audio_data, sr))
 
-            except Exception as e:
-                # Fallback to approximation if pyloudnorm fails
-                return self._analyze_loudness_fallback(y, sr)
-        else:
-            # Fallback to approximation
-            return self._analyze_loudness_fallback(y, sr)
+    def _loudness_from_measurement(self, measurement: LoudnessMeasurement) -> LoudnessInfo:
+        """Build LoudnessInfo (with streaming platform comparisons) from a meter result."""
+        integrated_lufs = measurement.integrated_lufs
 
         # Calculate streaming platform differences
         spotify_diff = integrated_lufs - self.STREAMING_TARGETS['spotify']
@@ -806,73 +896,48 @@ class AudioAnalyzer:
 
         return LoudnessInfo(
             integrated_lufs=integrated_lufs,
-            short_term_max_lufs=short_term_max_lufs,
-            momentary_max_lufs=momentary_max_lufs,
-            loudness_range_lu=loudness_range_lu,
-            true_peak_db=true_peak_db,
+            short_term_max_lufs=measurement.short_term_max_lufs,
+            momentary_max_lufs=measurement.momentary_max_lufs,
+            loudness_range_lu=measurement.loudness_range_lu,
+            true_peak_db=measurement.true_peak_db,
             spotify_diff_db=spotify_diff,
             apple_music_diff_db=apple_diff,
             youtube_diff_db=youtube_diff,
             target_platform=target_platform
         )
 
-    def _analyze_loudness_fallback(self, y: np.ndarray, sr: int) -> LoudnessInfo:
-        """Fallback LUFS approximation when pyloudnorm is not available."""
-        # Calculate RMS in 400ms windows (momentary)
-        hop_length = int(sr * 0.1)  # 100ms hop
-        frame_length = int(sr * 0.4)  # 400ms window
-
-        y_mono = y if len(y.shape) == 1 else y[0]
-        rms = librosa.feature.rms(y=y_mono, frame_length=frame_length, hop_length=hop_length)[0]
-        rms_db = 20 * np.log10(rms + 1e-10)
-
-        # Integrated loudness (average over entire track) with K-weighting approximation
-        integrated_lufs = float(np.mean(rms_db)) - 0.691
-
-        # Short-term max (3s windows)
-        short_term_window = int(3.0 / 0.1)
-        if len(rms_db) >= short_term_window:
-            short_term_values = np.convolve(rms_db, np.ones(short_term_window)/short_term_window, mode='valid')
-            short_term_max_lufs = float(np.max(short_term_values))
-        else:
-            short_term_max_lufs = integrated_lufs
-
-        # Momentary max
-        momentary_max_lufs = float(np.max(rms_db))
-
-        # Loudness range (simplified)
-        loudness_range_lu = float(np.percentile(rms_db, 95) - np.percentile(rms_db, 10))
-
-        # True peak
-        true_peak_db = float(20 * np.log10(np.max(np.abs(y_mono)) + 1e-10))
-
-        # Calculate streaming platform differences
-        spotify_diff = integrated_lufs - self.STREAMING_TARGETS['spotify']
-        apple_diff = integrated_lufs - self.STREAMING_TARGETS['apple_music']
-        youtube_diff = integrated_lufs - self.STREAMING_TARGETS['youtube']
-
-        return LoudnessInfo(
-            integrated_lufs=integrated_lufs,
-            short_term_max_lufs=short_term_max_lufs,
-            momentary_max_lufs=momentary_max_lufs,
-            loudness_range_lu=loudness_range_lu,
-            true_peak_db=true_peak_db,
-            spotify_diff_db=spotify_diff,
-            apple_music_diff_db=apple_diff,
-            youtube_diff_db=youtube_diff,
-            target_platform="spotify"
-        )
-
-    def _analyze_transients(self, y: np.ndarray, sr: int, duration: float) -> TransientInfo:
+    def _analyze_transients(
+        self,
+        y,
+        sr: Optional[int] = None,
+        duration: Optional[float] = None
+    ) -> TransientInfo:
         """
         Analyze transients (attacks) in the audio using librosa onset detection.
         Useful for understanding punch/attack quality of the mix.
         """
         try:
-            # Detect onsets (transients)
-            onset_env = librosa.onset.onset_strength(y=y, sr=sr)
+            ctx = AnalysisContext.ensure(y, sr)
+            sr = ctx.sr
+            if duration is None:
+                duration = ctx.duration
+
+            return self._transients_from_onsets(ctx.onset_envelope(), sr, duration)
+
+        except Exception as e:
+            return self._failed_transient_info(e)
+
+    def _transients_from_onsets(
+        self,
+        onset_env: np.ndarray,
+        sr: int,
+        duration: float
+    ) -> TransientInfo:
+        """Detect and grade transients from an onset strength envelope."""
+        try:
+            # Detect onsets (transients) from the shared onset envelope
             onset_frames = librosa.onset.onset_detect(
-                y=y, sr=sr, onset_envelope=onset_env, backtrack=False
+                sr=sr, onset_envelope=onset_env, backtrack=False
             )
             onset_times = librosa.frames_to_time(onset_frames, sr=sr)
 
@@ -919,25 +984,24 @@ class AudioAnalyzer:
             )
 
         except Exception as e:
-            # Return default values if analysis fails
-            return TransientInfo(
-                transient_count=0,
-                transients_per_second=0.0,
-                avg_transient_strength=0.0,
-                peak_transient_strength=0.0,
-                transient_positions=[],
-                attack_quality='unknown',
-                interpretation=f"Transient analysis failed: {str(e)}"
-            )
+            return self._failed_transient_info(e)
+
+    def _failed_transient_info(self, error: Exception) -> TransientInfo:
+        """Default values when transient analysis fails."""
+        return TransientInfo(
+            transient_count=0,
+            transients_per_second=0.0,
+            avg_transient_strength=0.0,
+            peak_transient_strength=0.0,
+            transient_positions=[],
+            attack_quality='unknown',
+            interpretation=f"Transient analysis failed: {str(error)}"
+        )
 
-    def _detect_tempo(self, y: np.ndarray, sr: int) -> Optional[float]:
+    def _detect_tempo(self, y, sr: Optional[int] = None) -> Optional[float]:
         """Detect tempo from audio."""
         try:
-            tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
-            # Handle both old and new librosa return types
-            if isinstance(tempo, np.ndarray):
-                return float(tempo[0]) if len(tempo) > 0 else None
-            return float(tempo)
+            return AnalysisContext.ensure(y, sr).tempo()
         except Exception:
             return None
 
@@ -945,7 +1009,9 @@ class AudioAnalyzer:
         self,
         audio_path: str,
         min_section_length: float = 15.0,
-        detect_musical_sections: bool = True
+        detect_musical_sections: bool = True,
+        streaming: bool = False,
+        context: Optional[AnalysisContext] = None
     ) -> SectionAnalysisResult:
         """
         Analyze audio in time-based sections with timestamp-specific issue detection.
@@ -955,6 +1021,9 @@ class AudioAnalyzer:
             min_section_length: Minimum section length in seconds (default 15s)
             detect_musical_sections: If True, detect intro/buildup/drop/breakdown;
                                     if False, use fixed-length segments
+            streaming: Compute section features from rolling frame tables in one
+                       bounded-memory pass instead of loading the whole file
+            context: Pre-decoded AnalysisContext for this file (decoded here if omitted)
 
         Returns:
             SectionAnalysisResult with sections, timestamped issues, and timeline data
@@ -963,21 +1032,51 @@ class AudioAnalyzer:
         if not path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        # Load audio
-        y, sr = librosa.load(audio_path, sr=None, mono=False)
-        audio_data, sr_orig = sf.read(audio_path)
+        return self._cached(
+            'analyze_sections', audio_path,
+            lambda: self._analyze_sections(
+                audio_path, min_section_length, detect_musical_sections, streaming, context
+            ),
+            min_section_length=min_section_length,
+            detect_musical_sections=detect_musical_sections,
+            streaming=streaming,
+            stream_block_seconds=self.stream_block_seconds if streaming else None
+        )
 
-        # Create mono mix
-        if len(y.shape) > 1 and y.shape[0] == 2:
-            y_mono = librosa.to_mono(y)
-        else:
-            y_mono = y if len(y.shape) == 1 else y[0]
+    def _analyze_sections(
+        self,
+        audio_path: str,
+        min_section_length: float,
+        detect_musical_sections: bool,
+        streaming: bool,
+        context: Optional[AnalysisContext]
+    ) -> SectionAnalysisResult:
+        """Uncached body of analyze_sections()."""
+        if streaming:
+            return self._analyze_sections_streaming(
+                audio_path, min_section_length, detect_musical_sections
+            )
 
-        duration = librosa.get_duration(y=y_mono, sr=sr)
+        # Full-track frame features, computed once and sliced per section
+        ctx = context if context is not None else AnalysisContext.from_file(audio_path)
+        sr = ctx.sr
+        hop_length = 512
+        y_mono = ctx.mono
+        audio_data = ctx.audio_data
+        duration = ctx.duration
+
+        onset_env = ctx.onset_envelope(hop_length)
+        centroid = ctx.spectral_centroid(hop_length=hop_length)
+        tables = self._section_band_tables(
+            ctx.magnitude(hop_length=hop_length), ctx.fft_frequencies()
+        )
 
         # Detect section boundaries
         if detect_musical_sections:
-            boundaries = self._detect_section_boundaries(y_mono, sr, min_section_length)
+            boundaries = self._boundaries_from_features(
+                ctx.rms(hop_length=hop_length), onset_env, centroid,
+                sr, hop_length, duration, min_section_length
+            )
         else:
             # Fixed-length segments (default 30 seconds)
             boundaries = list(np.arange(0, duration, 30.0))
@@ -992,31 +1091,174 @@ class AudioAnalyzer:
             start_time = boundaries[i]
             end_time = boundaries[i + 1]
 
-            # Extract section audio
+            # Level and clipping from the section's samples
             start_sample = int(start_time * sr)
             end_sample = int(end_time * sr)
             section_audio = y_mono[start_sample:end_sample]
+            avg_rms_db = float(20 * np.log10(np.sqrt(np.mean(section_audio ** 2)) + 1e-10))
+            peak_db = float(20 * np.log10(np.max(np.abs(section_audio)) + 1e-10))
+            clip_count, clip_times = self._section_clips(
+                audio_data[start_sample:end_sample], sr, start_time
+            )
+
+            # Spectral and onset metrics from the full-track frames
+            transient_density, spectral_centroid_hz, low_energy_ratio, band_ratios = (
+                self._section_frame_metrics(
+                    start_time, end_time, onset_env, centroid, tables, sr, hop_length
+                )
+            )
+
+            section_type = self._classify_from_metrics(
+                avg_rms_db, transient_density, low_energy_ratio,
+                start_time, end_time, duration
+            )
+            section_info, section_issues, section_clips = self._build_section(
+                section_type, start_time, end_time, avg_rms_db, peak_db,
+                transient_density, spectral_centroid_hz, clip_count, clip_times,
+                band_ratios['mud'], band_ratios['sub'], band_ratios['harsh']
+            )
+
+            sections.append(section_info)
+            all_issues.extend(section_issues)
+            clipping_timestamps.extend(section_clips)
+
+        return self._compile_sections(sections, all_issues, clipping_timestamps, duration)
+
+    def _analyze_sections_streaming(
+        self,
+        audio_path: str,
+        min_section_length: float,
+        detect_musical_sections: bool
+    ) -> SectionAnalysisResult:
+        """
+        Section analysis from one streaming pass (see StreamingFeatures).
+
+        Per-section metrics are aggregated from the global frame and hop tables
+        over the section's time range, so memory stays bounded for long mixes.
+        """
+        features = StreamingFeatures.from_file(
+            audio_path, block_seconds=self.stream_block_seconds,
+            clip_threshold=0.99, clip_group_window=0.1
+        )
+        sr = features.sr
+        hop_length = features.hop_length
+        duration = features.duration
+
+        if detect_musical_sections:
+            boundaries = self._boundaries_from_features(
+                features.rms, features.onset_envelope, features.spectral_centroid,
+                sr, hop_length, duration, min_section_length
+            )
+        else:
+            boundaries = list(np.arange(0, duration, 30.0))
+            boundaries.append(duration)
 
-            # Extract section from original audio for clipping detection
-            start_sample_orig = int(start_time * sr_orig)
-            end_sample_orig = int(end_time * sr_orig)
-            section_orig = audio_data[start_sample_orig:end_sample_orig]
+        tables = {name: features.table(name) for name in self.SECTION_BAND_TABLES}
+        n_hops = len(features.table('hop_sumsq'))
+        sections = []
+        all_issues = []
+        clipping_timestamps = []
+
+        for i in range(len(boundaries) - 1):
+            start_time = boundaries[i]
+            end_time = boundaries[i + 1]
+
+            # Hop (sample-aligned) range for this section
+            h0 = min(int(start_time * sr) // hop_length, n_hops - 1)
+            h1 = max(h0 + 1, min(-(-int(end_time * sr) // hop_length), n_hops))
+
+            n_samples = min(h1 * hop_length, features.n_samples) - h0 * hop_length
+            rms = np.sqrt(features.table('hop_sumsq')[h0:h1].sum() / max(n_samples, 1))
+            avg_rms_db = float(20 * np.log10(rms + 1e-10))
+            peak_db = float(20 * np.log10(features.table('hop_peak')[h0:h1].max() + 1e-10))
+
+            transient_density, spectral_centroid_hz, low_energy_ratio, band_ratios = (
+                self._section_frame_metrics(
+                    start_time, end_time, features.onset_envelope,
+                    features.spectral_centroid, tables, sr, hop_length
+                )
+            )
 
-            # Classify section type
-            section_type = self._classify_section(
-                section_audio, sr, start_time, end_time, duration,
-                i, len(boundaries) - 1
+            section_type = self._classify_from_metrics(
+                avg_rms_db, transient_density, low_energy_ratio,
+                start_time, end_time, duration
             )
+            clip_count = int(features.table('hop_clips')[h0:h1].sum())
+            clip_times = [t for t in features.clip_times if start_time <= t < end_time]
 
-            # Analyze section
-            section_info, section_issues, section_clips = self._analyze_section(
-                section_audio, section_orig, sr, sr_orig, start_time, end_time, section_type
+            section_info, section_issues, section_clips = self._build_section(
+                section_type, start_time, end_time, avg_rms_db, peak_db,
+                transient_density, spectral_centroid_hz, clip_count, clip_times,
+                band_ratios['mud'], band_ratios['sub'], band_ratios['harsh']
             )
 
             sections.append(section_info)
             all_issues.extend(section_issues)
             clipping_timestamps.extend(section_clips)
 
+        return self._compile_sections(sections, all_issues, clipping_timestamps, duration)
+
+    @staticmethod
+    def _section_band_tables(S: np.ndarray, freqs: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-frame band sums of a magnitude spectrogram (see SECTION_BAND_TABLES)."""
+        power = S ** 2
+        return {
+            'mag_low': np.sum(S[freqs < 200], axis=0),
+            'mag_total': np.sum(S, axis=0),
+            'power_sub': np.sum(power[freqs < 60], axis=0),
+            'power_mud': np.sum(power[(freqs >= 200) & (freqs < 500)], axis=0),
+            'power_harsh': np.sum(power[(freqs >= 3000) & (freqs < 8000)], axis=0),
+            'power_total': np.sum(power, axis=0),
+        }
+
+    def _section_frame_metrics(
+        self,
+        start_time: float,
+        end_time: float,
+        onset_envelope: np.ndarray,
+        spectral_centroid: np.ndarray,
+        tables: Dict[str, np.ndarray],
+        sr: int,
+        hop_length: int
+    ) -> Tuple[float, float, float, Dict[str, float]]:
+        """
+        Aggregate full-track frame features over one section.
+
+        Frames are librosa-centered, so the section covers the frames whose
+        centers fall in [start_time, end_time).
+
+        Returns:
+            (transient_density, spectral_centroid_hz, low_energy_ratio,
+             {'mud', 'sub', 'harsh'} power ratios)
+        """
+        n_frames = len(spectral_centroid)
+        f0 = min(int(np.ceil(start_time * sr / hop_length)), n_frames - 1)
+        f1 = max(f0 + 1, min(int(np.ceil(end_time * sr / hop_length)), n_frames))
+        frames = slice(f0, f1)
+
+        section_duration = end_time - start_time
+        onset_frames = librosa.onset.onset_detect(
+            onset_envelope=onset_envelope[frames], sr=sr, hop_length=hop_length
+        )
+        transient_density = float(len(onset_frames) / section_duration) if section_duration > 0 else 0.0
+        spectral_centroid_hz = float(np.mean(spectral_centroid[frames]))
+
+        low_energy_ratio = float(tables['mag_low'][frames].sum() / (tables['mag_total'][frames].sum() + 1e-10))
+        total_energy = tables['power_total'][frames].sum() + 1e-10
+        band_ratios = {
+            band: float(tables[f'power_{band}'][frames].sum() / total_energy)
+            for band in ('mud', 'sub', 'harsh')
+        }
+        return transient_density, spectral_centroid_hz, low_energy_ratio, band_ratios
+
+    def _compile_sections(
+        self,
+        sections: List[SectionInfo],
+        all_issues: List[TimestampedIssue],
+        clipping_timestamps: List[float],
+        duration: float
+    ) -> SectionAnalysisResult:
+        """Summarize analyzed sections into a SectionAnalysisResult."""
         # Compile section summary
         section_summary = {}
         for section in sections:
@@ -1044,32 +1286,19 @@ class AudioAnalyzer:
             timeline_data=timeline_data
         )
 
-    def _detect_section_boundaries(
+    def _boundaries_from_features(
         self,
-        y: np.ndarray,
+        rms: np.ndarray,
+        onset_env: np.ndarray,
+        spectral_centroid: np.ndarray,
         sr: int,
+        hop_length: int,
+        duration: float,
         min_section_length: float
     ) -> List[float]:
-        """
-        Detect musical section boundaries using energy, transients, and spectral changes.
-        Optimized for trance music structure (intro->buildup->drop->breakdown pattern).
-        """
-        duration = librosa.get_duration(y=y, sr=sr)
-
-        # Calculate features over time
-        hop_length = 512
-        frame_length = 2048
-
-        # RMS energy over time
-        rms = librosa.feature.rms(y=y, frame_length=frame_length, hop_length=hop_length)[0]
+        """Pick section boundaries from frame-wise RMS, onset strength and centroid."""
         rms_times = librosa.frames_to_time(np.arange(len(rms)), sr=sr, hop_length=hop_length)
 
-        # Onset strength (transient density)
-        onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length)
-
-        # Spectral centroid (brightness)
-        spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr, hop_length=hop_length)[0]
-
         # Compute novelty curve (changes in all features combined)
         # Normalize features
         rms_norm = (rms - rms.min()) / (rms.max() - rms.min() + 1e-10)
@@ -1124,39 +1353,16 @@ class AudioAnalyzer:
 
         return merged
 
-    def _classify_section(
+    def _classify_from_metrics(
         self,
-        section_audio: np.ndarray,
-        sr: int,
+        rms_db: float,
+        transient_density: float,
+        low_energy_ratio: float,
         start_time: float,
         end_time: float,
-        total_duration: float,
-        section_index: int,
-        total_sections: int
+        total_duration: float
     ) -> str:
-        """
-        Classify a section type based on its audio characteristics and position.
-        Optimized for trance: intro->buildup->drop->breakdown->buildup->drop->outro
-        """
-        # Calculate section features
-        rms = np.sqrt(np.mean(section_audio ** 2))
-        rms_db = 20 * np.log10(rms + 1e-10)
-
-        # Onset density (transients per second)
-        onset_frames = librosa.onset.onset_detect(y=section_audio, sr=sr)
-        onset_times = librosa.frames_to_time(onset_frames, sr=sr)
-        section_duration = end_time - start_time
-        transient_density = len(onset_times) / section_duration if section_duration > 0 else 0
-
-        # Spectral centroid (brightness)
-        centroid = np.mean(librosa.feature.spectral_centroid(y=section_audio, sr=sr))
-
-        # Low frequency energy ratio
-        D = np.abs(librosa.stft(section_audio))
-        freqs = librosa.fft_frequencies(sr=sr)
-        low_mask = freqs < 200
-        low_energy_ratio = np.sum(D[low_mask, :]) / (np.sum(D) + 1e-10)
-
+        """Classify a section from its level, transient density and bass ratio."""
         # Position in track
         relative_position = (start_time + end_time) / 2 / total_duration
 
@@ -1191,79 +1397,79 @@ class AudioAnalyzer:
 
         return 'unknown'
 
-    def _analyze_section(
+    def _section_clips(
         self,
-        section_audio: np.ndarray,
         section_orig: np.ndarray,
         sr: int,
-        sr_orig: int,
-        start_time: float,
-        end_time: float,
-        section_type: str
-    ) -> Tuple[SectionInfo, List[TimestampedIssue], List[float]]:
-        """Analyze a single section for issues and metrics."""
-        issues = []
-        clipping_times = []
-
-        # Basic metrics
-        rms = np.sqrt(np.mean(section_audio ** 2))
-        avg_rms_db = float(20 * np.log10(rms + 1e-10))
-        peak = np.max(np.abs(section_audio))
-        peak_db = float(20 * np.log10(peak + 1e-10))
-
-        # Transient density
-        onset_frames = librosa.onset.onset_detect(y=section_audio, sr=sr)
-        onset_times = librosa.frames_to_time(onset_frames, sr=sr)
-        section_duration = end_time - start_time
-        transient_density = float(len(onset_times) / section_duration) if section_duration > 0 else 0.0
-
-        # Spectral centroid
-        spectral_centroid_hz = float(np.mean(librosa.feature.spectral_centroid(y=section_audio, sr=sr)))
-
-        # --- Issue Detection ---
+        start_time: float
+    ) -> Tuple[int, List[float]]:
+        """
+        Clipped samples in a section, grouped into events 0.1s apart.
 
-        # 1. Clipping detection with timestamps
+        Returns:
+            (clipped sample count, absolute start times of the clip events)
+        """
         clip_threshold = 0.99
         if len(section_orig.shape) > 1:
             clipped_samples = np.where(np.abs(section_orig).max(axis=1) >= clip_threshold)[0]
         else:
             clipped_samples = np.where(np.abs(section_orig) >= clip_threshold)[0]
 
+        grouped_times = []
         if len(clipped_samples) > 0:
-            clip_times_in_section = clipped_samples / sr_orig
-            # Group nearby clips
-            grouped_times = []
+            clip_times_in_section = clipped_samples / sr
             current_group_start = clip_times_in_section[0]
             for t in clip_times_in_section:
                 if t - current_group_start > 0.1:
-                    abs_time = start_time + current_group_start
-                    grouped_times.append(abs_time)
-                    clipping_times.append(abs_time)
+                    grouped_times.append(start_time + current_group_start)
                     current_group_start = t
-            abs_time = start_time + current_group_start
-            grouped_times.append(abs_time)
-            clipping_times.append(abs_time)
+            grouped_times.append(start_time + current_group_start)
+
+        return len(clipped_samples), grouped_times
+
+    def _build_section(
+        self,
+        section_type: str,
+        start_time: float,
+        end_time: float,
+        avg_rms_db: float,
+        peak_db: float,
+        transient_density: float,
+        spectral_centroid_hz: float,
+        clip_count: int,
+        clip_times: List[float],
+        mud_ratio: float,
+        sub_ratio: float,
+        harsh_ratio: float
+    ) -> Tuple[SectionInfo, List[TimestampedIssue], List[float]]:
+        """
+        Detect issues in a section from its aggregated metrics.
 
-            severity = 'severe' if len(clipped_samples) > 500 else ('moderate' if len(clipped_samples) > 100 else 'minor')
+        Args:
+            clip_count: Number of clipped samples in the section
+            clip_times: Absolute start times of grouped clip events
+            mud_ratio: Share of power in 200-500Hz
+            sub_ratio: Share of power below 60Hz
+            harsh_ratio: Share of power in 3-8kHz
+        """
+        issues = []
+        clipping_times = list(clip_times) if clip_count > 0 else []
+
+        # --- Issue Detection ---
+
+        # 1. Clipping detection with timestamps
+        if clip_count > 0:
+            severity = 'severe' if clip_count > 500 else ('moderate' if clip_count > 100 else 'minor')
             issues.append(TimestampedIssue(
                 issue_type='clipping',
                 start_time=start_time,
                 end_time=end_time,
                 severity=severity,
-                message=f"Clipping detected at {', '.join([self._format_time(t) for t in grouped_times[:5]])}",
-                details={'clip_count': len(clipped_samples), 'timestamps': grouped_times[:10]}
+                message=f"Clipping detected at {', '.join([self._format_time(t) for t in clip_times[:5]])}",
+                details={'clip_count': clip_count, 'timestamps': clip_times[:10]}
             ))
 
-        # 2. Low-end buildup detection
-        D = np.abs(librosa.stft(section_audio))
-        freqs = librosa.fft_frequencies(sr=sr)
-
-        # Check 200-500Hz buildup (muddy frequencies)
-        mud_mask = (freqs >= 200) & (freqs < 500)
-        total_energy = np.sum(D ** 2)
-        mud_energy = np.sum(D[mud_mask, :] ** 2)
-        mud_ratio = mud_energy / (total_energy + 1e-10)
-
+        # 2. Low-end buildup detection (200-500Hz, muddy frequencies)
         if mud_ratio > 0.25:
             severity = 'severe' if mud_ratio > 0.4 else ('moderate' if mud_ratio > 0.3 else 'minor')
             issues.append(TimestampedIssue(
@@ -1276,10 +1482,6 @@ class AudioAnalyzer:
             ))
 
         # 3. Sub-bass energy check (especially important for drops)
-        sub_mask = freqs < 60
-        sub_energy = np.sum(D[sub_mask, :] ** 2)
-        sub_ratio = sub_energy / (total_energy + 1e-10)
-
         if section_type == 'drop' and sub_ratio < 0.05:
             issues.append(TimestampedIssue(
                 issue_type='weak_sub',
@@ -1291,10 +1493,6 @@ class AudioAnalyzer:
             ))
 
         # 4. Harsh highs detection
-        harsh_mask = (freqs >= 3000) & (freqs < 8000)
-        harsh_energy = np.sum(D[harsh_mask, :] ** 2)
-        harsh_ratio = harsh_energy / (total_energy + 1e-10)
-
         if harsh_ratio > 0.35:
             severity = 'severe' if harsh_ratio > 0.5 else ('moderate' if harsh_ratio > 0.4 else 'minor')
             issues.append(TimestampedIssue(
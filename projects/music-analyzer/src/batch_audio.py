@@ -0,0 +1,523 @@
+"""
+Process-Pool Batch Audio Analysis.
+
+Runs AudioAnalyzer.analyze over a directory of bounces, plus the optional
+section, trance-score and arrangement-score stages, on a pool of
+long-lived worker processes:
+- Each worker builds its analyzers once in the pool initializer and warms
+  them up on a short synthetic clip, so imports, config parsing and
+  librosa's JIT compilation are paid once per worker, not once per file
+- At most one file per worker is in flight. Workers report their process
+  id when they start and when they pick up a file. A file that runs past
+  the per-file timeout is recorded as timed out. A running task cannot be
+  cancelled through ProcessPoolExecutor, so the parent shuts the pool down,
+  terminates the workers by the ids they reported and starts a fresh pool.
+  The other in-flight files are resubmitted
+- Results are condensed to one BatchItem per file and written as a
+  consolidated JSON and HTML summary
+
+Usage:
+    files = find_audio_files("./bounces")
+    result = run_batch(files, BatchOptions(trance_score=True), workers=8, timeout=600)
+    json_path, html_path = write_batch_summary(result, "./reports")
+"""
+
+import html
+import json
+import multiprocessing
+import os
+import queue as queue_module
+import signal
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+AUDIO_EXTENSIONS = ('.wav', '.flac', '.aif', '.aiff', '.mp3', '.ogg')
+
+# How often to check for start reports while a worker is still initializing
+_START_POLL_SECONDS = 0.2
+
+
+@dataclass
+class BatchOptions:
+    """Per-worker analysis settings (must be picklable)."""
+    config_path: Optional[str] = None
+    stage_overrides: Dict[str, bool] = field(default_factory=dict)  # Applied on top of config stages
+    genre_preset: Optional[str] = None
+    streaming: bool = False
+    sections: bool = True               # Also gated by the section_analysis stage
+    trance_score: bool = False
+    arrangement_score: bool = False
+    cache_dir: Optional[str] = None     # None = no result cache
+    cache_max_size_mb: float = 2048.0
+
+
+@dataclass
+class BatchItem:
+    """Condensed analysis of one file."""
+    file_path: str
+    status: str                         # 'ok', 'error', 'timeout'
+    elapsed_seconds: float = 0.0
+    error: Optional[str] = None
+
+    duration_seconds: Optional[float] = None
+    integrated_lufs: Optional[float] = None
+    true_peak_db: Optional[float] = None
+    crest_factor_db: Optional[float] = None
+    stereo_correlation: Optional[float] = None
+    detected_tempo: Optional[float] = None
+    critical_issues: int = 0
+    warning_issues: int = 0
+    overall_score: Optional[float] = None
+    overall_grade: Optional[str] = None
+
+    section_count: Optional[int] = None
+    worst_section: Optional[str] = None
+    trance_score: Optional[float] = None
+    arrangement_score: Optional[float] = None
+    arrangement_grade: Optional[str] = None
+
+
+@dataclass
+class BatchAudioResult:
+    """Outcome of a batch run."""
+    items: List[BatchItem]
+    workers: int
+    timeout_seconds: Optional[float]
+    elapsed_seconds: float
+    started_at: str
+
+    @property
+    def ok_count(self) -> int:
+        return sum(1 for item in self.items if item.status == 'ok')
+
+    @property
+    def error_count(self) -> int:
+        return sum(1 for item in self.items if item.status == 'error')
+
+    @property
+    def timeout_count(self) -> int:
+        return sum(1 for item in self.items if item.status == 'timeout')
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'started_at': self.started_at,
+            'workers': self.workers,
+            'timeout_seconds': self.timeout_seconds,
+            'elapsed_seconds': round(self.elapsed_seconds, 2),
+            'file_count': len(self.items),
+            'ok': self.ok_count,
+            'errors': self.error_count,
+            'timeouts': self.timeout_count,
+            'items': [asdict(item) for item in self.items],
+        }
+
+
+def find_audio_files(directory: str, recursive: bool = False) -> List[str]:
+    """
+    List audio files in a directory, sorted by path.
+
+    Args:
+        directory: Directory to scan
+        recursive: Include subdirectories
+
+    Returns:
+        Paths of files with an AUDIO_EXTENSIONS suffix
+    """
+    root = Path(directory)
+    candidates = root.rglob('*') if recursive else root.iterdir()
+    return sorted(
+        str(p) for p in candidates
+        if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS
+    )
+
+
+# ==================== WORKER SIDE ====================
+
+# Analyzers built once per worker process by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(options: BatchOptions, started_queue=None) -> None:
+    """
+    Pool initializer: import the analysis stack and build analyzers once.
+
+    Args:
+        options: Shared analysis settings
+        started_queue: Queue receiving (path, time.time(), pid) as each file
+                       starts, so the parent can time files from the actual
+                       start; (None, time.time(), pid) is sent once at startup
+    """
+    try:
+        from .audio_analyzer import AudioAnalyzer
+        from .config import load_config
+        from .result_cache import ResultCache
+        from .pcm_cache import configure_pcm_cache_from_config
+    except ImportError:
+        from audio_analyzer import AudioAnalyzer
+        from config import load_config
+        from result_cache import ResultCache
+        from pcm_cache import configure_pcm_cache_from_config
+
+    if started_queue is not None:
+        started_queue.put((None, time.time(), os.getpid()))
+
+    cfg = load_config(options.config_path)
+    cfg.override_stages(options.stage_overrides)
+    configure_pcm_cache_from_config(cfg)
+
+    cache = None
+    if options.cache_dir:
+        cache = ResultCache(options.cache_dir, max_size_mb=options.cache_max_size_mb)
+
+    _worker.clear()
+    _worker['options'] = options
+    _worker['started_queue'] = started_queue
+    _worker['config'] = cfg
+    _worker['analyzer'] = AudioAnalyzer(config=cfg)
+    _warm_up(_worker['analyzer'], options)
+    _worker['analyzer'].cache = cache
+
+    if options.trance_score:
+        try:
+            from .feature_extraction import extract_all_trance_features
+        except ImportError:
+            from feature_extraction import extract_all_trance_features
+        _worker['extract_trance'] = extract_all_trance_features
+
+    if options.arrangement_score:
+        try:
+            from .structure_detector import StructureDetector
+            from .arrangement_scorer import ArrangementScorer
+        except ImportError:
+            from structure_detector import StructureDetector
+            from arrangement_scorer import ArrangementScorer
+        _worker['structure_detector'] = StructureDetector()
+        _worker['arrangement_scorer'] = ArrangementScorer(config=cfg)
+
+
+def _warm_up(analyzer, options: BatchOptions) -> None:
+    """
+    Analyze a short synthetic clip so librosa's lazy imports and JIT
+    compilation happen at worker start, not inside the first file's timeout.
+    """
+    import numpy as np
+    import soundfile as sf
+
+    sr = 22050
+    t = np.arange(sr * 2) / sr
+    clip = 0.5 * np.sin(2 * np.pi * 110 * t) * np.exp(-(t % 0.5) * 10)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "warm_up.wav")
+        sf.write(path, np.stack([clip, clip]).T, sr)
+        try:
+            analyzer.analyze(path, streaming=options.streaming)
+        except Exception:
+            pass        # Real files will surface any genuine failure
+
+
+def _analyze_file(audio_path: str) -> BatchItem:
+    """Analyze one file in a worker; failures are reported, not raised."""
+    if _worker.get('started_queue') is not None:
+        _worker['started_queue'].put((audio_path, time.time(), os.getpid()))
+    start = time.perf_counter()
+    item = BatchItem(file_path=audio_path, status='ok')
+    try:
+        _fill_item(item, audio_path)
+    except Exception as e:
+        item.status = 'error'
+        item.error = f"{type(e).__name__}: {e}"
+    item.elapsed_seconds = time.perf_counter() - start
+
+    # numpy scalars -> builtins, so the summary serializes as plain JSON numbers
+    for name, value in vars(item).items():
+        if hasattr(value, 'item'):
+            setattr(item, name, value.item())
+    return item
+
+
+def _fill_item(item: BatchItem, audio_path: str) -> None:
+    options: BatchOptions = _worker['options']
+    cfg = _worker['config']
+    analyzer = _worker['analyzer']
+
+    result = analyzer.analyze(
+        audio_path, genre_preset=options.genre_preset, streaming=options.streaming
+    )
+    item.duration_seconds = result.duration_seconds
+    item.integrated_lufs = result.loudness.integrated_lufs
+    item.true_peak_db = result.loudness.true_peak_db
+    item.crest_factor_db = result.dynamics.crest_factor_db
+    item.stereo_correlation = result.stereo.correlation
+    item.detected_tempo = result.detected_tempo
+    severities = [issue.get('severity') for issue in result.overall_issues]
+    item.critical_issues = severities.count('critical')
+    item.warning_issues = severities.count('warning')
+    if result.overall_score is not None:
+        item.overall_score = result.overall_score.overall_score
+        item.overall_grade = result.overall_score.grade
+
+    if options.sections and cfg.stage_enabled('section_analysis'):
+        sections = analyzer.analyze_sections(audio_path, streaming=options.streaming)
+        item.section_count = len(sections.sections)
+        item.worst_section = sections.worst_section
+
+    if options.trance_score:
+        item.trance_score = _worker['extract_trance'](
+            audio_path,
+            pitch_method=cfg.get('reference', 'pitch_method', default='fast')
+        ).trance_score
+
+    if options.arrangement_score:
+        structure = _worker['structure_detector'].detect(audio_path)
+        if not structure.success:
+            raise RuntimeError(f"Structure detection failed: {structure.error_message}")
+        score = _worker['arrangement_scorer'].score(structure)
+        item.arrangement_score = score.overall_score
+        item.arrangement_grade = score.grade
+
+
+# ==================== POOL SIDE ====================
+
+def _drain(started_queue, started: Dict[str, float], pids: Set[int]) -> None:
+    """Collect (path, start time, pid) reports from the workers."""
+    while True:
+        try:
+            path, at, pid = started_queue.get_nowait()
+        except queue_module.Empty:
+            return
+        pids.add(pid)
+        if path is not None:
+            started[path] = at
+
+
+def _terminate(executor: ProcessPoolExecutor, started_queue, pids: Set[int]) -> None:
+    """
+    Shut a pool down without waiting for stuck tasks.
+
+    Queued tasks are cancelled. Running ones cannot be interrupted through
+    the executor, so the workers are terminated by the process ids they
+    reported. Workers still in their initializer have not reported yet;
+    they run no task and exit on their own after the shutdown.
+    """
+    _drain(started_queue, {}, pids)
+    executor.shutdown(wait=False, cancel_futures=True)
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass        # Already gone
+
+
+def run_batch(
+    audio_paths: List[str],
+    options: Optional[BatchOptions] = None,
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    progress_callback: Optional[Callable[[BatchItem, int, int], None]] = None
+) -> BatchAudioResult:
+    """
+    Analyze files on a pool of long-lived worker processes.
+
+    Args:
+        audio_paths: Files to analyze
+        options: Analysis settings shared by all workers
+        workers: Worker processes (default: CPU count, capped at the file count)
+        timeout: Per-file wall-clock limit in seconds, measured from the moment
+                 a worker starts the file (None = unlimited)
+        progress_callback: Called as (item, completed, total) after each file
+
+    Returns:
+        BatchAudioResult with one item per input, in input order
+    """
+    options = options or BatchOptions()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(audio_paths) or 1))
+    started_at = datetime.now().isoformat()
+    start = time.perf_counter()
+    mp_context = multiprocessing.get_context()
+
+    def make_pool() -> Tuple[ProcessPoolExecutor, Any, Set[int]]:
+        started_queue = mp_context.Queue()
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=mp_context,
+            initializer=_init_worker, initargs=(options, started_queue)
+        )
+        return executor, started_queue, set()
+
+    results: Dict[str, BatchItem] = {}
+    queue = deque(audio_paths)
+    running: Dict[Any, str] = {}            # future -> path
+    started: Dict[str, float] = {}          # path -> time.time() the worker picked it up
+
+    def record(item: BatchItem) -> None:
+        results[item.file_path] = item
+        if progress_callback:
+            progress_callback(item, len(results), len(audio_paths))
+
+    executor, started_queue, pids = make_pool()
+    finished = False
+    try:
+        while queue or running:
+            while queue and len(running) < workers:
+                path = queue.popleft()
+                running[executor.submit(_analyze_file, path)] = path
+
+            wait_for = None
+            if timeout is not None:
+                _drain(started_queue, started, pids)
+                in_flight = [started.get(path) for path in running.values()]
+                if None in in_flight:
+                    # A worker is still starting up; poll for its start report
+                    wait_for = _START_POLL_SECONDS
+                else:
+                    wait_for = max(0.0, min(in_flight) + timeout - time.time())
+            done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            broken = False
+            for future in done:
+                path = running.pop(future)
+                elapsed = time.time() - started.get(path, time.time())
+                try:
+                    item = future.result()
+                    if timeout is not None and item.elapsed_seconds > timeout:
+                        # Finished between start-report polls, but over the limit
+                        item = BatchItem(path, 'timeout', item.elapsed_seconds,
+                                         error=f"Exceeded {timeout:g}s timeout")
+                    record(item)
+                except BrokenProcessPool as e:
+                    broken = True
+                    record(BatchItem(path, 'error', elapsed, error=f"Worker process died: {e}"))
+                except Exception as e:
+                    record(BatchItem(path, 'error', elapsed, error=f"{type(e).__name__}: {e}"))
+
+            expired = []
+            if timeout is not None:
+                _drain(started_queue, started, pids)
+                now = time.time()
+                expired = [f for f, path in running.items()
+                           if path in started and now - started[path] >= timeout]
+            for future in expired:
+                path = running.pop(future)
+                record(BatchItem(path, 'timeout', time.time() - started[path],
+                                 error=f"Exceeded {timeout:g}s timeout"))
+
+            if broken or expired:
+                # Other in-flight files start over on the fresh pool
+                queue.extendleft(reversed(list(running.values())))
+                for path in running.values():
+                    started.pop(path, None)
+                running.clear()
+                _terminate(executor, started_queue, pids)
+                executor, started_queue, pids = make_pool()
+        finished = True
+    finally:
+        if finished:
+            executor.shutdown(wait=True)
+        else:
+            _terminate(executor, started_queue, pids)
+
+    return BatchAudioResult(
+        items=[results[path] for path in audio_paths],
+        workers=workers,
+        timeout_seconds=timeout,
+        elapsed_seconds=time.perf_counter() - start,
+        started_at=started_at,
+    )
+
+
+# ==================== SUMMARY OUTPUT ====================
+
+def write_batch_summary(result: BatchAudioResult, output_dir: str) -> Tuple[Path, Path]:
+    """
+    Write the consolidated JSON and HTML summary of a batch run.
+
+    Args:
+        result: Batch result from run_batch()
+        output_dir: Directory for batch_summary_<timestamp>.json/.html
+
+    Returns:
+        (json_path, html_path)
+    """
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    json_path = out / f"batch_summary_{stamp}.json"
+    html_path = out / f"batch_summary_{stamp}.html"
+
+    with open(json_path, 'w') as f:
+        json.dump(result.to_dict(), f, indent=2, default=str)
+    html_path.write_text(_summary_html(result), encoding='utf-8')
+    return json_path, html_path
+
+
+def _fmt(value: Any, spec: str = '.1f') -> str:
+    if value is None:
+        return '-'
+    if isinstance(value, float):
+        return format(value, spec)
+    return html.escape(str(value))
+
+
+def _summary_html(result: BatchAudioResult) -> str:
+    columns = [
+        ('File', lambda i: html.escape(Path(i.file_path).name)),
+        ('Status', lambda i: f'<span class="{i.status}">{i.status}</span>'),
+        ('Duration', lambda i: _fmt(i.duration_seconds)),
+        ('LUFS', lambda i: _fmt(i.integrated_lufs)),
+        ('True Peak', lambda i: _fmt(i.true_peak_db)),
+        ('Crest dB', lambda i: _fmt(i.crest_factor_db)),
+        ('Correlation', lambda i: _fmt(i.stereo_correlation, '.2f')),
+        ('Tempo', lambda i: _fmt(i.detected_tempo)),
+        ('Critical', lambda i: _fmt(i.critical_issues)),
+        ('Warnings', lambda i: _fmt(i.warning_issues)),
+        ('Score', lambda i: _fmt(i.overall_score, '.0f')),
+        ('Sections', lambda i: _fmt(i.section_count)),
+        ('Trance', lambda i: _fmt(i.trance_score, '.2f')),
+        ('Arrangement', lambda i: _fmt(i.arrangement_score, '.0f')),
+        ('Time (s)', lambda i: _fmt(i.elapsed_seconds)),
+        ('Error', lambda i: _fmt(i.error)),
+    ]
+    header = ''.join(f'<th>{name}</th>' for name, _ in columns)
+    rows = '\n'.join(
+        '<tr>' + ''.join(f'<td>{cell(item)}</td>' for _, cell in columns) + '</tr>'
+        for item in result.items
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>Batch Analysis Summary</title>
+<style>
+    body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+           background: #1a1a2e; color: #eee; padding: 20px; }}
+    table {{ border-collapse: collapse; width: 100%; font-size: 13px; }}
+    th, td {{ padding: 6px 10px; border-bottom: 1px solid #333; text-align: left; }}
+    th {{ background: #16213e; position: sticky; top: 0; }}
+    .ok {{ color: #4ade80; }}
+    .error {{ color: #f87171; }}
+    .timeout {{ color: #fbbf24; }}
+</style>
+</head>
+<body>
+<h1>Batch Analysis Summary</h1>
+<p>Started {html.escape(result.started_at)} &middot; {len(result.items)} files &middot;
+{result.workers} workers &middot; {result.elapsed_seconds:.1f}s &middot;
+<span class="ok">{result.ok_count} ok</span>,
+<span class="error">{result.error_count} errors</span>,
+<span class="timeout">{result.timeout_count} timeouts</span></p>
+<table>
+<thead><tr>{header}</tr></thead>
+<tbody>
+{rows}
+</tbody>
+</table>
+</body>
+</html>
+"""
@@ -5,13 +5,25 @@ Scans multiple Ableton Live Set (.als) files and ranks them by "workability".
 Helps you decide which songs to focus on based on project health.
 
 Answers: "Which of my songs should I keep working on?"
+
+Parsing and diagnosing a Live Set is pure Python and holds the GIL, so
+threads barely help. Scans can run on one of three executors:
+- 'process': a pool of worker processes, each building its
+  DeviceChainAnalyzer and EffectChainDoctor once (default for directories)
+- 'thread': a thread pool sharing the scanner's analyzers
+- 'serial': one file after the other in the calling thread
+
+Files are submitted in chunks to keep scheduling overhead low, and each
+SongSummary is streamed back as its chunk finishes (iter_scan, or the
+on_result callback of scan_directory/scan_files).
 """
 
+import math
 import os
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from device_chain_analyzer import (
     ProjectDeviceAnalysis, DeviceChainAnalyzer, analyze_als_devices
 )
@@ -75,13 +87,22 @@ class BatchScanner:
         "F": (0, 19),    # Major problems, consider starting fresh
     }
 
+    EXECUTORS = ("process", "thread", "serial")
+
+    # Chunks per worker when no chunksize is given: large enough to amortize
+    # task overhead, small enough to balance uneven file sizes
+    CHUNKS_PER_WORKER = 4
+
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         self.analyzer = DeviceChainAnalyzer(verbose=verbose)
         self.doctor = EffectChainDoctor(verbose=verbose)
 
     def scan_directory(self, directory: str, recursive: bool = True,
-                      max_workers: int = 4) -> BatchScanResult:
+                      max_workers: int = 4, executor: str = "process",
+                      chunksize: Optional[int] = None,
+                      on_result: Optional[Callable[[SongSummary, int, int], None]] = None
+                      ) -> BatchScanResult:
         """
         Scan all .als files in a directory.
 
@@ -89,6 +110,9 @@ class BatchScanner:
             directory: Path to scan
             recursive: Whether to scan subdirectories
             max_workers: Parallel workers for scanning
+            executor: 'process', 'thread' or 'serial'
+            chunksize: Files per submitted task (default: balanced per worker)
+            on_result: Called with (summary, done, total) as each file finishes
 
         Returns:
             BatchScanResult with all song summaries
@@ -106,87 +130,117 @@ class BatchScanner:
         if self.verbose:
             print(f"Found {len(als_files)} .als files to scan...")
 
-        result = BatchScanResult(
-            scan_path=str(path.absolute()),
-            total_scanned=len(als_files),
-            successful=0,
-            failed=0
+        return self._collect(
+            [str(f) for f in als_files], str(path.absolute()),
+            executor, max_workers, chunksize, on_result
         )
 
-        # Scan files (parallel for speed)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self._scan_file, str(f)): f
-                for f in als_files
-            }
-
-            for future in as_completed(futures):
-                als_file = futures[future]
-                try:
-                    summary = future.result()
-                    result.songs.append(summary)
-                    if summary.error:
-                        result.failed += 1
-                    else:
-                        result.successful += 1
-                except Exception as e:
-                    result.failed += 1
-                    result.songs.append(SongSummary(
-                        file_path=str(als_file),
-                        file_name=als_file.name,
-                        health_score=0,
-                        total_issues=0,
-                        critical_issues=0,
-                        warning_issues=0,
-                        total_devices=0,
-                        disabled_devices=0,
-                        clutter_percentage=0,
-                        tempo=0,
-                        track_count=0,
-                        workability_grade="?",
-                        recommendation="Could not scan",
-                        error=str(e)
-                    ))
-
-        # Sort by health score (best first)
-        result.songs.sort(key=lambda s: s.health_score, reverse=True)
-
-        # Categorize songs
-        self._categorize_songs(result)
-
-        return result
-
-    def scan_files(self, file_paths: List[str]) -> BatchScanResult:
+    def scan_files(self, file_paths: List[str], executor: str = "serial",
+                   max_workers: int = 4, chunksize: Optional[int] = None,
+                   on_result: Optional[Callable[[SongSummary, int, int], None]] = None
+                   ) -> BatchScanResult:
         """
         Scan specific .als files.
 
         Args:
             file_paths: List of paths to .als files
+            executor: 'process', 'thread' or 'serial'
+            max_workers: Parallel workers for scanning
+            chunksize: Files per submitted task (default: balanced per worker)
+            on_result: Called with (summary, done, total) as each file finishes
 
         Returns:
             BatchScanResult with all song summaries
         """
+        return self._collect(
+            [str(f) for f in file_paths], "Multiple files",
+            executor, max_workers, chunksize, on_result
+        )
+
+    def iter_scan(self, file_paths: List[str], executor: str = "process",
+                  max_workers: int = 4, chunksize: Optional[int] = None
+                  ) -> Iterator[SongSummary]:
+        """
+        Scan files, yielding each SongSummary as it finishes.
+
+        Args:
+            file_paths: List of paths to .als files
+            executor: 'process', 'thread' or 'serial'
+            max_workers: Parallel workers for scanning
+            chunksize: Files per submitted task (default: balanced per worker)
+
+        Yields:
+            SongSummary per file; completion order unless executor is 'serial'
+        """
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor} (expected one of {', '.join(self.EXECUTORS)})")
+
+        file_paths = [str(f) for f in file_paths]
+        workers = max(1, min(max_workers, len(file_paths)))
+        if executor == "serial" or (executor == "thread" and workers == 1):
+            for file_path in file_paths:
+                yield self._scan_file(file_path)
+            return
+
+        if chunksize is None:
+            chunksize = math.ceil(len(file_paths) / (workers * self.CHUNKS_PER_WORKER))
+        chunks = [file_paths[i:i + max(1, chunksize)]
+                  for i in range(0, len(file_paths), max(1, chunksize))]
+
+        if executor == "process":
+            pool = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker,
+                initargs=(type(self), self.verbose)
+            )
+            scan_chunk = _scan_chunk
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+            scan_chunk = self._scan_chunk
+
+        with pool:
+            futures = {pool.submit(scan_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    summaries = future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. killed); the whole chunk is lost
+                    summaries = [self._failed_summary(f, str(e), "Could not scan")
+                                 for f in futures[future]]
+                yield from summaries
+
+    def _collect(self, file_paths: List[str], scan_path: str, executor: str,
+                 max_workers: int, chunksize: Optional[int],
+                 on_result: Optional[Callable[[SongSummary, int, int], None]]
+                 ) -> BatchScanResult:
+        """Run iter_scan into a sorted, categorized BatchScanResult."""
         result = BatchScanResult(
-            scan_path="Multiple files",
+            scan_path=scan_path,
             total_scanned=len(file_paths),
             successful=0,
             failed=0
         )
 
-        for file_path in file_paths:
-            summary = self._scan_file(file_path)
+        for summary in self.iter_scan(file_paths, executor, max_workers, chunksize):
             result.songs.append(summary)
             if summary.error:
                 result.failed += 1
             else:
                 result.successful += 1
+            if on_result:
+                on_result(summary, len(result.songs), len(file_paths))
 
-        # Sort by health score
+        # Sort by health score (best first)
         result.songs.sort(key=lambda s: s.health_score, reverse=True)
+
+        # Categorize songs
         self._categorize_songs(result)
 
         return result
 
+    def _scan_chunk(self, file_paths: List[str]) -> List[SongSummary]:
+        """Scan a chunk of files with this scanner's analyzers."""
+        return [self._scan_file(file_path) for file_path in file_paths]
+
     def _scan_file(self, file_path: str) -> SongSummary:
         """Scan a single .als file."""
         try:
@@ -220,22 +274,27 @@ class BatchScanner:
                 recommendation=recommendation
             )
         except Exception as e:
-            return SongSummary(
-                file_path=file_path,
-                file_name=Path(file_path).name,
-                health_score=0,
-                total_issues=0,
-                critical_issues=0,
-                warning_issues=0,
-                total_devices=0,
-                disabled_devices=0,
-                clutter_percentage=0,
-                tempo=0,
-                track_count=0,
-                workability_grade="?",
-                recommendation="Could not analyze",
-                error=str(e)
-            )
+            return self._failed_summary(file_path, str(e), "Could not analyze")
+
+    @staticmethod
+    def _failed_summary(file_path: str, error: str, recommendation: str) -> SongSummary:
+        """SongSummary of a file that could not be scanned."""
+        return SongSummary(
+            file_path=file_path,
+            file_name=Path(file_path).name,
+            health_score=0,
+            total_issues=0,
+            critical_issues=0,
+            warning_issues=0,
+            total_devices=0,
+            disabled_devices=0,
+            clutter_percentage=0,
+            tempo=0,
+            track_count=0,
+            workability_grade="?",
+            recommendation=recommendation,
+            error=error
+        )
 
     def _calculate_grade(self, health_score: int) -> str:
         """Convert health score to letter grade."""
@@ -271,6 +330,14 @@ class BatchScanner:
             elif song.workability_grade in ["D", "F"]:
                 result.consider_abandoning.append(song.file_name)
 
+    def progress_line(self, song: SongSummary, done: int, total: int) -> str:
+        """One line per finished file, for rendering a scan as it runs."""
+        prefix = f"[{done}/{total}]"
+        if song.error:
+            return f"{prefix} ERR {song.file_name} ({song.error[:60]})"
+        return (f"{prefix} [{song.workability_grade}] {song.file_name} - "
+                f"{song.health_score}/100, {song.total_issues} issues")
+
     def generate_report(self, result: BatchScanResult) -> str:
         """Generate a human-readable scan report."""
         lines = []
@@ -359,18 +426,39 @@ class BatchScanner:
         return "\n".join(lines)
 
 
+# ==================== PROCESS WORKERS ====================
+
+# Scanner built once per worker process by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(scanner_cls: type, verbose: bool) -> None:
+    """Pool initializer: build the scanner (and its analyzer and doctor) once."""
+    _worker['scanner'] = scanner_cls(verbose=verbose)
+
+
+def _scan_chunk(file_paths: List[str]) -> List[SongSummary]:
+    """Scan a chunk of files in a worker process."""
+    return _worker['scanner']._scan_chunk(file_paths)
+
+
 def scan_directory(directory: str, recursive: bool = True,
-                  verbose: bool = False) -> BatchScanResult:
+                  verbose: bool = False, executor: str = "process",
+                  max_workers: int = 4) -> BatchScanResult:
     """Quick function to scan a directory."""
     scanner = BatchScanner(verbose=verbose)
-    return scanner.scan_directory(directory, recursive=recursive)
+    return scanner.scan_directory(directory, recursive=recursive,
+                                  max_workers=max_workers, executor=executor)
 
 
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1:
-        result = scan_directory(sys.argv[1], verbose=True)
-        scanner = BatchScanner()
+        scanner = BatchScanner(verbose=True)
+        result = scanner.scan_directory(
+            sys.argv[1], max_workers=os.cpu_count() or 4,
+            on_result=lambda song, done, total: print(scanner.progress_line(song, done, total))
+        )
         print(scanner.generate_report(result))
     else:
         print("Usage: python batch_scanner.py <directory>")
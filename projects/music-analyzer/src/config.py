@@ -176,6 +176,9 @@ DEFAULT_CONFIG = {
         'balance_score_loudness_penalty': 2,
         'balance_score_freq_penalty': 10,
         'balance_score_width_penalty': 5,
+        'pitch_method': 'fast',
+        'pitch_rms_threshold_db': -50.0,
+        'melody_sample_seconds': None,
     },
     'midi': {
         'quantization_detection_threshold': 0.01,
@@ -199,6 +202,16 @@ DEFAULT_CONFIG = {
         'tempo_bpm': 140,
         'project_duration_beats': 16,
     },
+    'cache': {
+        'enabled': True,
+        'directory': None,
+        'max_size_mb': 2048,
+        'decoded_audio': True,
+        'decoded_audio_directory': None,
+        'decoded_audio_max_size_mb': 4096,
+        'als_documents': True,
+        'als_documents_max_entries': 32,
+    },
 }
 
 
@@ -252,6 +265,11 @@ class AnalyzerConfig:
         """Check if a specific stage is enabled."""
         return self.stages.get(stage_name, True)
 
+    def override_stages(self, overrides: Dict[str, bool]) -> None:
+        """Enable or disable stages for this run (e.g. from CLI flags)."""
+        # A new dict: the loaded one may be shared with DEFAULT_CONFIG
+        self._config['stages'] = {**self.stages, **overrides}
+
     # Shorthand accessors for common sections
     @property
     def clipping(self) -> Dict:
@@ -305,6 +323,10 @@ class AnalyzerConfig:
     def report(self) -> Dict:
         return self._config.get('report', {})
 
+    @property
+    def cache(self) -> Dict:
+        return self._config.get('cache', {})
+
     def to_dict(self) -> Dict:
         """Return the full config as a dictionary."""
         return self._config.copy()
@@ -6398,6 +6398,46 @@ def get_database_info() -> Dict[str, Any]:
         }
 
 
+def _snapshot_change_rows(version_a_row, version_b_row) -> List[Dict[str, Any]]:
+    """Device/track changes between two versions computed from their snapshots (no .als parsing)."""
+    try:
+        from project_differ import ProjectDiffer
+        from project_snapshots import get_snapshot_store
+
+        store = get_snapshot_store()
+        before = store.load(version_a_row['id'], als_path=version_a_row['als_path'])
+        after = store.load(version_b_row['id'], als_path=version_b_row['als_path'])
+        if before is None or after is None:
+            return []
+        diff = ProjectDiffer().compare_analyses(
+            before, after, version_a_row['als_path'], version_b_row['als_path']
+        )
+    except Exception:
+        return []
+
+    rows = [
+        {
+            'change_type': f"device_{c.change_type}",
+            'track_name': c.track_name,
+            'device_name': c.device_name,
+            'device_type': c.device_type,
+            'details': c.details,
+        }
+        for c in diff.device_changes
+    ]
+    rows.extend(
+        {
+            'change_type': f"track_{c.change_type}",
+            'track_name': c.track_name,
+            'device_name': None,
+            'device_type': None,
+            'details': c.details,
+        }
+        for c in diff.track_changes
+    )
+    return sorted(rows, key=lambda r: (r['track_name'] or '', r['change_type']))
+
+
 def get_comparison_data(project_id: int, version_a_id: int, version_b_id: int) -> Optional[ComparisonResult]:
     """Fetch comparison data for two versions."""
     try:
@@ -6542,9 +6582,14 @@ def get_comparison_data(project_id: int, version_a_id: int, version_b_id: int) -
                 ORDER BY track_name, change_type
             """, (project_id, version_a_id, version_b_id))
 
+            rows = cursor.fetchall()
+            if not rows:
+                # Nothing recorded for this pair: diff the stored snapshots instead
+                rows = _snapshot_change_rows(version_a_row, version_b_row)
+
             # Group changes by track
             track_changes: Dict[str, List[DeviceChange]] = {}
-            for row in cursor.fetchall():
+            for row in rows:
                 track = row['track_name'] or 'Unknown'
                 change = DeviceChange(
                     track_name=track,
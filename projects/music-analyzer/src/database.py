@@ -227,6 +227,17 @@ CREATE TABLE IF NOT EXISTS arrangement_scores (
     FOREIGN KEY (version_id) REFERENCES versions(id) ON DELETE CASCADE
 );
 
+-- Scan manifest: file state at the last saved scan, so unchanged files are skipped
+CREATE TABLE IF NOT EXISTS scan_manifest (
+    als_path TEXT PRIMARY KEY,
+    file_size INTEGER NOT NULL,
+    file_mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,  -- SHA-256 of the file contents
+    version_id INTEGER,  -- Version the analysis was saved as
+    analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (version_id) REFERENCES versions(id) ON DELETE SET NULL
+);
+
 -- Indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_versions_project_id ON versions(project_id);
 CREATE INDEX IF NOT EXISTS idx_versions_als_path ON versions(als_path);
@@ -483,6 +494,8 @@ class ScanResult:
     disabled_devices: int
     clutter_percentage: float
     issues: List[ScanResultIssue] = field(default_factory=list)
+    # ProjectDeviceAnalysis the result came from; stored as the version's snapshot
+    device_analysis: Optional[Any] = None
 
 
 def _calculate_grade(health_score: int) -> str:
@@ -626,6 +639,14 @@ def persist_scan_result(
                     )
                 )
 
+        # Keep the device data so history and diffs need not re-parse the file
+        if scan_result.device_analysis is not None:
+            try:
+                from project_snapshots import save_version_snapshot
+            except ImportError:
+                from .project_snapshots import save_version_snapshot
+            save_version_snapshot(version_id, str(als_path), scan_result.device_analysis, db_path)
+
         return (
             True,
             f"Version {action}: {als_filename} (score: {scan_result.health_score}, grade: {scan_result.grade})",
@@ -1368,17 +1389,22 @@ class ProjectChangesResult:
 def track_changes(
     before_path: str,
     after_path: str,
-    db_path: Optional[Path] = None
+    db_path: Optional[Path] = None,
+    differ: Optional[Any] = None
 ) -> Tuple[bool, str, Optional[int]]:
     """
     Compare two .als files and store the changes in the database.
 
     Uses project_differ to detect device and track changes between versions.
+    Device data comes from the versions' snapshots when they are current, so
+    only new or changed files are parsed.
 
     Args:
         before_path: Path to the earlier version .als file
         after_path: Path to the later version .als file
         db_path: Optional custom path for the database
+        differ: Optional ProjectDiffer to reuse across calls (its diagnoses
+                are cached by content hash)
 
     Returns:
         Tuple of (success: bool, message: str, changes_count: int or None)
@@ -1390,7 +1416,8 @@ def track_changes(
 
     # Import project_differ here to avoid circular imports
     try:
-        from project_differ import compare_projects
+        from project_differ import ProjectDiffer
+        from project_snapshots import load_version_analysis
     except ImportError:
         return (False, "project_differ module not found", None)
 
@@ -1413,7 +1440,14 @@ def track_changes(
 
     # Compare the projects
     try:
-        diff = compare_projects(before_path, after_path)
+        before_analysis = load_version_analysis(before_version.id, before_path, db_path)
+        after_analysis = load_version_analysis(after_version.id, after_path, db_path)
+        if before_analysis is None or after_analysis is None:
+            missing = before_path if before_analysis is None else after_path
+            return (False, f"No .als file or snapshot for: {missing}", None)
+        diff = (differ or ProjectDiffer()).compare_analyses(
+            before_analysis, after_analysis, before_path, after_path
+        )
     except Exception as e:
         return (False, f"Failed to compare projects: {e}", None)
 
@@ -1649,6 +1683,8 @@ def compute_and_store_all_changes(
     Compute and store changes between all consecutive versions of a project.
 
     This is useful for populating the changes table for existing scanned data.
+    One ProjectDiffer is shared by all pairs: each version is diagnosed once,
+    and unchanged tracks (or whole unchanged versions) are skipped by hash.
 
     Args:
         search_term: Song name or partial match
@@ -1687,23 +1723,33 @@ def compute_and_store_all_changes(
     total_changes = 0
     comparisons_made = 0
 
+    try:
+        from project_differ import ProjectDiffer
+        from project_snapshots import get_snapshot_store
+    except ImportError:
+        from .project_differ import ProjectDiffer
+        from .project_snapshots import get_snapshot_store
+    store = get_snapshot_store(db_path)
+    differ = ProjectDiffer()
+
     for i in range(len(versions) - 1):
         before = versions[i]
         after = versions[i + 1]
 
-        # Check if .als files exist
+        # Need each .als file or its snapshot
         before_path = Path(before['als_path'])
         after_path = Path(after['als_path'])
 
-        if not before_path.exists():
+        if not before_path.exists() and store.info(before['id']) is None:
             continue
-        if not after_path.exists():
+        if not after_path.exists() and store.info(after['id']) is None:
             continue
 
         success, message, changes = track_changes(
             str(before_path),
             str(after_path),
-            db_path
+            db_path,
+            differ=differ
         )
 
         if success and changes is not None:
@@ -11,7 +11,7 @@ Extracts detailed device chain information from .als files including:
 Designed for Ableton Live 11 Suite (compatible with 10+)
 """
 
-import gzip
+import hashlib
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -19,6 +19,13 @@ from typing import List, Dict, Optional, Tuple, Any
 from enum import Enum
 import json
 
+try:
+    from .als_cache import cached_als
+    from .als_stream import ALSStreamReader, DEVICE_PARTS
+except ImportError:
+    from als_cache import cached_als
+    from als_stream import ALSStreamReader, DEVICE_PARTS
+
 
 class DeviceCategory(Enum):
     """Categories of audio devices."""
@@ -112,6 +119,14 @@ DEVICE_CATEGORY_MAP = {
     "MxDeviceInstrument": DeviceCategory.MAX4LIVE,
 }
 
+# Track element tags analyzed, and their track_type
+TRACK_TYPES = {
+    "MidiTrack": "midi",
+    "AudioTrack": "audio",
+    "ReturnTrack": "return",
+    "MasterTrack": "master",
+}
+
 
 @dataclass
 class DeviceParameter:
@@ -140,6 +155,10 @@ class Device:
     # Analysis flags
     issues: List[str] = field(default_factory=list)
 
+    # Subtree hashes (see device_hash); empty until computed
+    parameters_hash: str = field(default="", repr=False, compare=False)
+    content_hash: str = field(default="", repr=False, compare=False)
+
 
 @dataclass
 class TrackDeviceChain:
@@ -158,6 +177,9 @@ class TrackDeviceChain:
     disabled_device_count: int = 0
     total_device_count: int = 0
 
+    # Hash of the track settings and its ordered device hashes (see track_hash)
+    content_hash: str = field(default="", repr=False, compare=False)
+
     @property
     def enabled_devices(self) -> List[Device]:
         return [d for d in self.devices if d.is_enabled]
@@ -184,6 +206,71 @@ class ProjectDeviceAnalysis:
     # Per-category counts
     device_category_counts: Dict[str, int] = field(default_factory=dict)
 
+    # Root of the subtree hashes (see project_hash)
+    content_hash: str = field(default="", repr=False, compare=False)
+
+
+# ==================== SUBTREE HASHES ====================
+#
+# Every parsed device, track and project carries a Merkle-style hash of its
+# content: a device hashes its settings and parameter block, a track hashes
+# its mixer settings and the ordered hashes of its devices, and the project
+# hashes its ordered track hashes. Equal hashes mean equal subtrees, so
+# ProjectDiffer skips identical tracks and devices and compares two
+# identical versions without looking at them at all.
+#
+# Positions (device index, track index) and the file path are not hashed
+# themselves; order still counts through the ordered child hashes.
+
+
+def _digest(*parts: Any) -> str:
+    data = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def parameters_hash(parameters: Dict[str, DeviceParameter]) -> str:
+    """Hash of a device's parameter block, independent of parameter order."""
+    return _digest([
+        [name, p.value, p.display_value, p.min_value, p.max_value]
+        for name, p in sorted(parameters.items())
+    ])
+
+
+def device_hash(device: Device) -> str:
+    """Hash of a device's settings and parameters (computed on first use)."""
+    if not device.content_hash:
+        if not device.parameters_hash:
+            device.parameters_hash = parameters_hash(device.parameters)
+        device.content_hash = _digest(
+            device.device_type, device.category.value, device.name, device.is_enabled,
+            device.plugin_name, device.plugin_vendor, device.parameters_hash
+        )
+    return device.content_hash
+
+
+def track_hash(track: TrackDeviceChain) -> str:
+    """Hash of a track's name, mixer settings and device chain (computed on first use)."""
+    if not track.content_hash:
+        track.content_hash = _digest(
+            track.track_name, track.track_type, track.volume_db, track.pan,
+            track.is_muted, track.is_solo, [device_hash(d) for d in track.devices]
+        )
+    return track.content_hash
+
+
+def project_hash(analysis: ProjectDeviceAnalysis) -> str:
+    """
+    Root hash of a device analysis.
+
+    Analyses stored before hashes existed (old snapshots) get them filled in
+    here on first use.
+    """
+    if not analysis.content_hash:
+        analysis.content_hash = _digest(
+            analysis.ableton_version, analysis.tempo, [track_hash(t) for t in analysis.tracks]
+        )
+    return analysis.content_hash
+
 
 class DeviceChainAnalyzer:
     """
@@ -247,6 +334,11 @@ class DeviceChainAnalyzer:
         """
         Analyze an Ableton Live Set file for device chain information.
 
+        Only tracks and their device chains are read from the file; clips,
+        notes and automation are skipped while streaming. The analysis is
+        shared through the process-wide parsed ALS cache (see als_cache)
+        until the file changes; treat it as read-only.
+
         Args:
             als_path: Path to the .als file
 
@@ -257,19 +349,29 @@ class DeviceChainAnalyzer:
         if not path.exists():
             raise FileNotFoundError(f"ALS file not found: {als_path}")
 
-        # Read and decompress
-        try:
-            with gzip.open(als_path, 'rb') as f:
-                xml_content = f.read()
-        except gzip.BadGzipFile:
-            with open(als_path, 'rb') as f:
-                xml_content = f.read()
+        return cached_als(als_path, 'devices', lambda: self._analyze(als_path))
 
-        root = ET.fromstring(xml_content)
+    def _analyze(self, als_path: str) -> ProjectDeviceAnalysis:
+        """Stream tracks with their device chains into a ProjectDeviceAnalysis."""
+        path = Path(als_path)
+        reader = ALSStreamReader(als_path, include=DEVICE_PARTS)
+        chains: Dict[str, List[Tuple[Optional[TrackDeviceChain], bool]]] = {
+            tag: [] for tag in TRACK_TYPES
+        }
+        for event in reader:
+            if event.kind == 'track' and event.track_tag in TRACK_TYPES:
+                elem = event.element
+                index = {'ReturnTrack': 100 + event.track_ordinal, 'MasterTrack': 999}.get(
+                    event.track_tag, event.track_ordinal
+                )
+                chains[event.track_tag].append((
+                    self._analyze_track(elem, index, TRACK_TYPES[event.track_tag]),
+                    self._get_track_name(elem, None) is None
+                ))
 
         # Extract basic project info
-        version = self._get_version(root)
-        tempo = self._get_tempo(root)
+        version = self._get_version(reader)
+        tempo = self._get_tempo(reader)
 
         # Analyze all tracks
         tracks = []
@@ -278,12 +380,16 @@ class DeviceChainAnalyzer:
         total_disabled = 0
         category_counts: Dict[str, int] = {}
 
-        # Process each track type
+        # MIDI and audio tracks share one index sequence
         track_index = 0
 
-        for track_elem in root.findall(".//MidiTrack"):
-            chain = self._analyze_track(track_elem, track_index, "midi")
+        for chain, unnamed in chains['MidiTrack'] + chains['AudioTrack']:
             if chain:
+                chain.track_index = track_index
+                if unnamed:
+                    chain.track_name = f"{chain.track_type.title()} {track_index + 1}"
+                    chain.content_hash = ""
+                track_hash(chain)
                 tracks.append(chain)
                 track_index += 1
                 total_devices += chain.total_device_count
@@ -294,30 +400,8 @@ class DeviceChainAnalyzer:
                     cat_name = device.category.value
                     category_counts[cat_name] = category_counts.get(cat_name, 0) + 1
 
-        for track_elem in root.findall(".//AudioTrack"):
-            chain = self._analyze_track(track_elem, track_index, "audio")
-            if chain:
-                tracks.append(chain)
-                track_index += 1
-                total_devices += chain.total_device_count
-                total_disabled += chain.disabled_device_count
-                for device in chain.devices:
-                    if device.plugin_name:
-                        all_plugins.add(device.plugin_name)
-                    cat_name = device.category.value
-                    category_counts[cat_name] = category_counts.get(cat_name, 0) + 1
-
-        for i, track_elem in enumerate(root.findall(".//ReturnTrack")):
-            chain = self._analyze_track(track_elem, 100 + i, "return")
-            if chain:
-                tracks.append(chain)
-                total_devices += chain.total_device_count
-                total_disabled += chain.disabled_device_count
-
-        # Master track
-        master_elem = root.find(".//MasterTrack")
-        if master_elem is not None:
-            chain = self._analyze_track(master_elem, 999, "master")
+        # Return tracks, then the master track
+        for chain, _ in chains['ReturnTrack'] + chains['MasterTrack'][:1]:
             if chain:
                 tracks.append(chain)
                 total_devices += chain.total_device_count
@@ -327,7 +411,7 @@ class DeviceChainAnalyzer:
         total_issues = sum(len(t.issues) for t in tracks)
         total_issues += sum(len(d.issues) for t in tracks for d in t.devices)
 
-        return ProjectDeviceAnalysis(
+        analysis = ProjectDeviceAnalysis(
             file_path=str(path.absolute()),
             ableton_version=version,
             tempo=tempo,
@@ -338,6 +422,8 @@ class DeviceChainAnalyzer:
             all_plugins=sorted(list(all_plugins)),
             device_category_counts=category_counts
         )
+        project_hash(analysis)
+        return analysis
 
     def _analyze_track(self, track_elem: ET.Element, index: int,
                        track_type: str) -> Optional[TrackDeviceChain]:
@@ -367,6 +453,7 @@ class DeviceChainAnalyzer:
                 total_device_count=len(devices),
                 disabled_device_count=len([d for d in devices if not d.is_enabled])
             )
+            track_hash(chain)
 
             return chain
 
@@ -448,7 +535,7 @@ class DeviceChainAnalyzer:
         # Extract parameters
         parameters = self._extract_parameters(device_elem, tag)
 
-        return Device(
+        device = Device(
             index=index,
             device_type=tag,
             category=category,
@@ -458,6 +545,8 @@ class DeviceChainAnalyzer:
             plugin_name=plugin_name,
             plugin_vendor=plugin_vendor
         )
+        device_hash(device)
+        return device
 
     def _extract_parameters(self, device_elem: ET.Element,
                            device_type: str) -> Dict[str, DeviceParameter]:
@@ -598,29 +687,22 @@ class DeviceChainAnalyzer:
 
         return (is_muted, is_solo)
 
-    def _get_version(self, root: ET.Element) -> str:
+    def _get_version(self, reader: ALSStreamReader) -> str:
         """Extract Ableton version."""
-        ableton_elem = root.find(".//Ableton")
-        if ableton_elem is not None:
-            major = ableton_elem.get("MajorVersion", "")
-            minor = ableton_elem.get("MinorVersion", "")
+        if reader.ableton_version is not None:
+            major, minor = reader.ableton_version
             if major or minor:
                 return f"{major}.{minor}"
         return "Unknown"
 
-    def _get_tempo(self, root: ET.Element) -> float:
+    def _get_tempo(self, reader: ALSStreamReader) -> float:
         """Extract project tempo."""
-        tempo_paths = [
-            ".//Tempo/Manual",
-            ".//MasterTrack/DeviceChain/Mixer/Tempo/Manual",
-        ]
-        for path in tempo_paths:
-            elem = root.find(path)
-            if elem is not None and "Value" in elem.attrib:
-                try:
-                    return float(elem.attrib["Value"])
-                except ValueError:
-                    continue
+        value = reader.settings.get('tempo')
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                pass
         return 120.0
 
     def to_summary(self, analysis: ProjectDeviceAnalysis) -> str:
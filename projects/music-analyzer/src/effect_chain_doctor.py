@@ -12,14 +12,21 @@ Rules engine that detects:
 - Unusual parameter values
 - Gain staging issues
 - And more...
+
+Track diagnoses depend only on the track itself, so they are cached by the
+track's subtree hash (see TrackDiagnosisCache). Re-diagnosing a saved
+project only runs the rules on tracks that changed; project-wide issues and
+totals are recomputed from the cached per-track results.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Set
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, List, Dict, Optional, Tuple, Set
 from enum import Enum
 from device_chain_analyzer import (
     ProjectDeviceAnalysis, TrackDeviceChain, Device, DeviceCategory,
-    DeviceChainAnalyzer, analyze_als_devices
+    DeviceChainAnalyzer, analyze_als_devices, track_hash
 )
 
 
@@ -97,6 +104,9 @@ class ProjectDiagnosis:
     total_disabled: int = 0
     clutter_percentage: float = 0.0
 
+    # Track diagnoses taken from the TrackDiagnosisCache instead of re-run
+    reused_tracks: int = 0
+
     def get_priority_issues(self, limit: int = 10) -> List[Issue]:
         """Get the highest priority issues to fix first."""
         all_issues = self.global_issues.copy()
@@ -114,6 +124,101 @@ class ProjectDiagnosis:
         return all_issues[:limit]
 
 
+# ==================== TRACK DIAGNOSIS CACHE ====================
+
+DEFAULT_TRACK_CACHE_ENTRIES = 4096
+
+
+class TrackDiagnosisCache:
+    """
+    Thread-safe LRU of TrackDiagnosis keyed by track content.
+
+    The key is the track's subtree hash (name, type, mixer settings and
+    ordered device hashes) plus its device positions, which are all the
+    inputs of EffectChainDoctor._diagnose_track.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_TRACK_CACHE_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Number of track diagnoses kept before the least
+                         recently used one is evicted
+        """
+        self.max_entries = max(1, int(max_entries))
+        self._entries: 'OrderedDict[Tuple, TrackDiagnosis]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(track: TrackDeviceChain) -> Tuple[str, Tuple[int, ...]]:
+        return track_hash(track), tuple(d.index for d in track.devices)
+
+    def get(self, track: TrackDeviceChain) -> Optional[TrackDiagnosis]:
+        """Copy of the cached diagnosis of a track, or None."""
+        key = self.key(track)
+        with self._lock:
+            diag = self._entries.get(key)
+            if diag is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return replace(diag, issues=list(diag.issues))
+
+    def put(self, track: TrackDeviceChain, diag: TrackDiagnosis) -> None:
+        """Store a track's diagnosis."""
+        key = self.key(track)
+        with self._lock:
+            self._entries[key] = replace(diag, issues=list(diag.issues))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        """Remove all entries and return how many there were."""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_track_cache_settings: Dict[str, Any] = {'enabled': True, 'max_entries': DEFAULT_TRACK_CACHE_ENTRIES}
+_default_track_cache: Optional[TrackDiagnosisCache] = None
+_track_cache_lock = threading.Lock()
+
+
+def configure_track_cache(max_entries: Optional[int] = None, enabled: bool = True) -> None:
+    """
+    Configure the process-wide cache used by EffectChainDoctor by default.
+
+    Args:
+        max_entries: LRU size (None = DEFAULT_TRACK_CACHE_ENTRIES)
+        enabled: False re-runs every track's rules on every diagnose()
+    """
+    global _default_track_cache
+    with _track_cache_lock:
+        _track_cache_settings.update(
+            enabled=enabled,
+            max_entries=DEFAULT_TRACK_CACHE_ENTRIES if max_entries is None else max_entries
+        )
+        _default_track_cache = None
+
+
+def get_track_cache() -> Optional[TrackDiagnosisCache]:
+    """The process-wide TrackDiagnosisCache, or None if caching is disabled."""
+    global _default_track_cache
+    with _track_cache_lock:
+        if _default_track_cache is None and _track_cache_settings['enabled']:
+            _default_track_cache = TrackDiagnosisCache(_track_cache_settings['max_entries'])
+        return _default_track_cache
+
+
 class EffectChainDoctor:
     """
     Analyzes device chains and diagnoses mixing problems.
@@ -156,8 +261,20 @@ class EffectChainDoctor:
         "typical": 0.1,     # Normal range starts here
     }
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False,
+                 track_cache: Optional[TrackDiagnosisCache] = None,
+                 use_track_cache: bool = True):
+        """
+        Initialize the doctor.
+
+        Args:
+            verbose: Print progress details
+            track_cache: Cache of per-track diagnoses (default: the process-wide one)
+            use_track_cache: False diagnoses every track from scratch
+        """
         self.verbose = verbose
+        self.track_cache = track_cache
+        self.use_track_cache = use_track_cache
 
     def diagnose(self, analysis: ProjectDeviceAnalysis) -> ProjectDiagnosis:
         """
@@ -182,9 +299,18 @@ class EffectChainDoctor:
                 analysis.total_disabled_devices / analysis.total_devices * 100
             )
 
-        # Diagnose each track
+        # Diagnose each track, reusing diagnoses of unchanged tracks
+        cache = None
+        if self.use_track_cache:
+            cache = self.track_cache if self.track_cache is not None else get_track_cache()
         for track in analysis.tracks:
-            track_diag = self._diagnose_track(track)
+            track_diag = cache.get(track) if cache is not None else None
+            if track_diag is None:
+                track_diag = self._diagnose_track(track)
+                if cache is not None:
+                    cache.put(track, track_diag)
+            else:
+                diagnosis.reused_tracks += 1
             diagnosis.track_diagnoses.append(track_diag)
 
         # Global analysis
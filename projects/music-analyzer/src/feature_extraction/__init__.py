@@ -9,6 +9,10 @@ This module provides specialized feature extractors for analyzing trance music:
 - Tempo and rhythm analysis
 - Composite trance scoring
 
+All extractors accept a path, an array, or a shared FeatureGraph; the
+graph computes each primitive (RMS, centroid, onset envelope, beat grid,
+STFT, band-filtered signals) at most once per track.
+
 Usage:
     from feature_extraction import extract_all_trance_features, TranceScoreCalculator
 
@@ -17,6 +21,7 @@ Usage:
     score, breakdown = scorer.compute_total_score(features)
 """
 
+from .feature_graph import FeatureGraph
 from .pumping_detector import extract_pumping_features
 from .acid_detector import compute_303_score, extract_acid_features
 from .supersaw_analyzer import analyze_supersaw_characteristics
@@ -30,6 +35,9 @@ from .trance_scorer import TranceScoreCalculator
 from .trance_features import extract_all_trance_features
 
 __all__ = [
+    # Shared per-track primitives
+    'FeatureGraph',
+
     # Pumping detection
     'extract_pumping_features',
 
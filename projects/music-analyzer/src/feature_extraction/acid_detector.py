@@ -4,7 +4,7 @@ TB-303 Acid Bassline Detection Module.
 Detects characteristics of 303-style acid basslines:
 - Filter sweep detection via spectral centroid movement
 - Resonance measurement via bandwidth/centroid ratio
-- Pitch glide detection using pYIN F0 tracking
+- Pitch glide detection using F0 tracking (vectorized YIN, or pYIN)
 - Accent pattern detection via RMS/brightness correlation
 
 Classic acid tracks (Hardfloor, Emmanuel Top) should score > 0.7.
@@ -14,7 +14,13 @@ Non-acid trance should score < 0.3.
 import numpy as np
 from dataclasses import dataclass
 from typing import Optional, Tuple
-import librosa
+
+from .feature_graph import FeatureGraph
+
+try:
+    from ..pitch_tracker import get_pitch_tracker
+except ImportError:
+    from pitch_tracker import get_pitch_tracker
 
 
 @dataclass
@@ -40,49 +46,45 @@ def extract_acid_features(
     frame_length: int = 2048,
     hop_length: int = 512,
     bass_freq_range: Tuple[float, float] = (40.0, 500.0),
+    pitch_method: str = 'fast',
 ) -> AcidFeatures:
     """
     Extract TB-303 acid bassline characteristics.
 
     Args:
-        audio_path_or_data: Path to audio file or numpy array
+        audio_path_or_data: Path to audio file, numpy array, or FeatureGraph
         sr: Sample rate (required if array provided)
         frame_length: FFT window size
         hop_length: Hop length for analysis
         bass_freq_range: Frequency range to focus on (Hz)
+        pitch_method: Glide pitch tracker, 'fast' (vectorized YIN) or 'accurate' (pyin)
 
     Returns:
         AcidFeatures with filter sweep, resonance, glide, and accent scores
     """
-    # Load audio if path provided
-    if isinstance(audio_path_or_data, str):
-        y, sr = librosa.load(audio_path_or_data, sr=None, mono=True)
-    else:
-        y = audio_path_or_data
-        if sr is None:
-            raise ValueError("sr must be provided when passing audio array")
-        if len(y.shape) > 1:
-            y = np.mean(y, axis=0)
-
-    # Apply bandpass filter to focus on bass frequencies
-    y_bass = _bandpass_filter(y, sr, bass_freq_range[0], bass_freq_range[1])
+    graph = FeatureGraph.ensure(audio_path_or_data, sr=sr, hop_length=hop_length)
+
+    # Bandpass-filtered signal focusing on bass frequencies
+    bass = f"bandpass:{bass_freq_range[0]:g}-{bass_freq_range[1]:g}"
 
     # 1. Filter Sweep Detection - Spectral centroid movement
     filter_sweep_score, avg_centroid_movement, centroid_range = _analyze_filter_sweeps(
-        y_bass, sr, frame_length, hop_length
+        graph, bass, frame_length, hop_length
     )
 
     # 2. Resonance Measurement - Bandwidth/centroid ratio
     resonance_score, avg_bandwidth = _analyze_resonance(
-        y_bass, sr, frame_length, hop_length
+        graph, bass, frame_length, hop_length
     )
 
     # 3. Pitch Glide Detection - F0 tracking
-    glide_score, glide_count = _analyze_pitch_glides(y_bass, sr, hop_length)
+    glide_score, glide_count = _analyze_pitch_glides(
+        graph.signal(bass), graph.sr, hop_length, pitch_method
+    )
 
     # 4. Accent Pattern Detection - RMS/brightness correlation
     accent_score, accent_correlation = _analyze_accents(
-        y_bass, sr, frame_length, hop_length
+        graph, bass, frame_length, hop_length
     )
 
     # Compute overall 303 score with weighted combination
@@ -124,7 +126,7 @@ def _bandpass_filter(y: np.ndarray, sr: int, low_freq: float, high_freq: float)
 
 
 def _analyze_filter_sweeps(
-    y: np.ndarray, sr: int, frame_length: int, hop_length: int
+    graph: FeatureGraph, signal: str, frame_length: int, hop_length: int
 ) -> Tuple[float, float, float]:
     """
     Analyze filter sweep characteristics via spectral centroid movement.
@@ -132,10 +134,8 @@ def _analyze_filter_sweeps(
     Returns:
         (score, avg_movement_hz, range_hz)
     """
-    # Compute spectral centroid
-    centroid = librosa.feature.spectral_centroid(
-        y=y, sr=sr, n_fft=frame_length, hop_length=hop_length
-    )[0]
+    # Spectral centroid (shared with resonance and accent analysis)
+    centroid = graph.spectral_centroid(signal, n_fft=frame_length, hop_length=hop_length)
 
     if len(centroid) < 2:
         return 0.0, 0.0, 0.0
@@ -160,7 +160,7 @@ def _analyze_filter_sweeps(
 
 
 def _analyze_resonance(
-    y: np.ndarray, sr: int, frame_length: int, hop_length: int
+    graph: FeatureGraph, signal: str, frame_length: int, hop_length: int
 ) -> Tuple[float, float]:
     """
     Analyze resonant character via spectral bandwidth/centroid ratio.
@@ -168,14 +168,9 @@ def _analyze_resonance(
     Returns:
         (score, avg_bandwidth_hz)
     """
-    # Compute spectral centroid and bandwidth
-    centroid = librosa.feature.spectral_centroid(
-        y=y, sr=sr, n_fft=frame_length, hop_length=hop_length
-    )[0]
-
-    bandwidth = librosa.feature.spectral_bandwidth(
-        y=y, sr=sr, n_fft=frame_length, hop_length=hop_length
-    )[0]
+    # Spectral centroid and bandwidth from the same STFT
+    centroid = graph.spectral_centroid(signal, n_fft=frame_length, hop_length=hop_length)
+    bandwidth = graph.spectral_bandwidth(signal, n_fft=frame_length, hop_length=hop_length)
 
     if len(centroid) == 0 or len(bandwidth) == 0:
         return 0.0, 0.0
@@ -202,19 +197,19 @@ def _analyze_resonance(
 
 
 def _analyze_pitch_glides(
-    y: np.ndarray, sr: int, hop_length: int
+    y: np.ndarray, sr: int, hop_length: int, pitch_method: str = 'fast'
 ) -> Tuple[float, int]:
     """
-    Analyze pitch gliding using pYIN F0 tracking.
+    Analyze pitch gliding from the bass F0 track.
 
     Returns:
         (score, glide_count)
     """
     try:
-        # Use pYIN for pitch tracking
-        f0, voiced_flag, voiced_probs = librosa.pyin(
-            y, fmin=30, fmax=500, sr=sr, hop_length=hop_length
-        )
+        track = get_pitch_tracker(
+            pitch_method, fmin=30, fmax=500, hop_length=hop_length
+        ).track(y, sr)
+        f0, voiced_flag = track.f0, track.voiced_flag
 
         if f0 is None or len(f0) < 2:
             return 0.0, 0
@@ -254,7 +249,7 @@ def _analyze_pitch_glides(
 
 
 def _analyze_accents(
-    y: np.ndarray, sr: int, frame_length: int, hop_length: int
+    graph: FeatureGraph, signal: str, frame_length: int, hop_length: int
 ) -> Tuple[float, float]:
     """
     Analyze accent patterns via RMS/brightness correlation.
@@ -265,12 +260,10 @@ def _analyze_accents(
         (score, correlation)
     """
     # Compute RMS
-    rms = librosa.feature.rms(y=y, frame_length=frame_length, hop_length=hop_length)[0]
+    rms = graph.rms(signal, frame_length=frame_length, hop_length=hop_length)
 
-    # Compute spectral centroid (brightness)
-    centroid = librosa.feature.spectral_centroid(
-        y=y, sr=sr, n_fft=frame_length, hop_length=hop_length
-    )[0]
+    # Spectral centroid (brightness)
+    centroid = graph.spectral_centroid(signal, n_fft=frame_length, hop_length=hop_length)
 
     if len(rms) < 2 or len(centroid) < 2:
         return 0.0, 0.0
@@ -15,6 +15,9 @@ from dataclasses import dataclass
 from typing import Optional, Tuple, List
 import librosa
 
+from .feature_graph import FeatureGraph
+from .kernels import runs
+
 
 @dataclass
 class EnergyCurves:
@@ -53,7 +56,7 @@ def extract_energy_curves(
     Extract energy progression features for structure analysis.
 
     Args:
-        audio_path_or_data: Path to audio file or numpy array
+        audio_path_or_data: Path to audio file, numpy array, or FeatureGraph
         sr: Sample rate (required if array provided)
         hop_length: Hop length for feature extraction
         smooth_seconds: Smoothing window in seconds
@@ -62,15 +65,8 @@ def extract_energy_curves(
     Returns:
         EnergyCurves with multi-feature energy tracking
     """
-    # Load audio if path provided
-    if isinstance(audio_path_or_data, str):
-        y, sr = librosa.load(audio_path_or_data, sr=None, mono=True)
-    else:
-        y = audio_path_or_data
-        if sr is None:
-            raise ValueError("sr must be provided when passing audio array")
-        if len(y.shape) > 1:
-            y = np.mean(y, axis=0)
+    graph = FeatureGraph.ensure(audio_path_or_data, sr=sr, hop_length=hop_length)
+    sr = graph.sr
 
     # Calculate smoothing window in frames
     smooth_frames = int(smooth_seconds * sr / hop_length)
@@ -78,19 +74,19 @@ def extract_energy_curves(
         smooth_frames = 1
 
     # 1. RMS Envelope
-    rms = librosa.feature.rms(y=y, hop_length=hop_length)[0]
+    rms = graph.rms('mono', hop_length=hop_length)
     rms_smooth = _smooth_signal(rms, smooth_frames)
 
     # 2. Spectral Centroid (brightness)
-    centroid = librosa.feature.spectral_centroid(y=y, sr=sr, hop_length=hop_length)[0]
+    centroid = graph.spectral_centroid('mono', hop_length=hop_length)
     centroid_smooth = _smooth_signal(centroid, smooth_frames)
 
     # 3. Onset Strength (rhythmic density)
-    onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length)
+    onset_env = graph.onset_envelope('mono', hop_length=hop_length)
     onset_smooth = _smooth_signal(onset_env, smooth_frames)
 
     # 4. Bass Ratio
-    bass_ratio = _compute_bass_ratio(y, sr, hop_length, bass_cutoff)
+    bass_ratio = _compute_bass_ratio(graph, hop_length, bass_cutoff)
     bass_smooth = _smooth_signal(bass_ratio, smooth_frames)
 
     # Ensure all arrays are same length
@@ -137,8 +133,7 @@ def _smooth_signal(signal: np.ndarray, window_size: int) -> np.ndarray:
 
 
 def _compute_bass_ratio(
-    y: np.ndarray,
-    sr: int,
+    graph: FeatureGraph,
     hop_length: int,
     bass_cutoff: float
 ) -> np.ndarray:
@@ -148,9 +143,9 @@ def _compute_bass_ratio(
     Returns:
         Array of bass ratios per frame (0-1)
     """
-    # Compute STFT
-    D = np.abs(librosa.stft(y, hop_length=hop_length))
-    freqs = librosa.fft_frequencies(sr=sr)
+    # Shared mono STFT (also behind the centroid and onset envelope)
+    D = graph.magnitude('mono', hop_length=hop_length)
+    freqs = graph.fft_frequencies()
 
     # Find bass frequency bins
     bass_bins = freqs < bass_cutoff
@@ -231,44 +226,46 @@ def detect_drops(
     if len(energy) < 10:
         return []
 
-    # Find quiet sections (energy below threshold)
-    is_quiet = energy < quiet_threshold
-
-    # Find transitions from quiet to loud
-    drops = []
-    in_quiet = False
-    quiet_start = 0
-
-    for i in range(1, len(energy)):
-        if is_quiet[i] and not in_quiet:
-            # Entering quiet section
-            in_quiet = True
-            quiet_start = i
-        elif not is_quiet[i] and in_quiet:
-            # Exiting quiet section - potential drop
-            in_quiet = False
-            quiet_duration = times[i] - times[quiet_start]
-
-            if quiet_duration >= min_quiet_duration:
-                # Calculate energy before and after
-                energy_before = np.mean(energy[max(0, quiet_start-10):quiet_start])
-                energy_after = np.mean(energy[i:min(len(energy), i+10)])
-
-                if energy_before > 0:
-                    ratio = energy_after / max(energy_before, 0.01)
-                else:
-                    ratio = energy_after * 10  # High ratio if coming from silence
-
-                if ratio >= threshold_ratio:
-                    drops.append(DropInfo(
-                        time=float(times[i]),
-                        energy_before=float(energy_before),
-                        energy_after=float(energy_after),
-                        ratio=float(ratio),
-                        pre_drop_duration=float(quiet_duration)
-                    ))
-
-    return drops
+    # Find quiet sections (energy below threshold), from frame 1 on
+    is_quiet = energy[1:] < quiet_threshold
+    starts, ends = runs(is_quiet)
+    starts += 1
+    ends += 1
+
+    # Transitions from quiet to loud (a quiet run reaching the end is no drop)
+    exits = ends < len(energy)
+    starts, ends = starts[exits], ends[exits]
+    quiet_durations = times[ends] - times[starts]
+    long_enough = quiet_durations >= min_quiet_duration
+    starts, ends = starts[long_enough], ends[long_enough]
+    quiet_durations = quiet_durations[long_enough]
+
+    # Mean energy over the 10 frames before the quiet section and after the drop
+    cumulative = np.concatenate([[0.0], np.cumsum(energy)])
+    before_from = np.maximum(0, starts - 10)
+    after_to = np.minimum(len(energy), ends + 10)
+    energy_before = (cumulative[starts] - cumulative[before_from]) / (starts - before_from)
+    energy_after = (cumulative[after_to] - cumulative[ends]) / (after_to - ends)
+
+    ratios = np.where(
+        energy_before > 0,
+        energy_after / np.maximum(energy_before, 0.01),
+        energy_after * 10  # High ratio if coming from silence
+    )
+
+    return [
+        DropInfo(
+            time=float(times[end]),
+            energy_before=float(before),
+            energy_after=float(after),
+            ratio=float(ratio),
+            pre_drop_duration=float(duration)
+        )
+        for end, before, after, ratio, duration in zip(
+            ends, energy_before, energy_after, ratios, quiet_durations
+        )
+        if ratio >= threshold_ratio
+    ]
 
 
 def compute_energy_progression_score(energy_curves: EnergyCurves) -> float:
@@ -343,27 +340,13 @@ def detect_buildup_sections(
     smooth_frames = max(1, int(2.0 / np.mean(dt)))  # 2 second smoothing
     slope_smooth = _smooth_signal(slope, smooth_frames)
 
-    # Find sections with positive slope
-    is_building = slope_smooth > slope_threshold
-
-    buildups = []
-    in_buildup = False
-    buildup_start = 0
-
-    for i in range(len(is_building)):
-        if is_building[i] and not in_buildup:
-            in_buildup = True
-            buildup_start = i
-        elif not is_building[i] and in_buildup:
-            in_buildup = False
-            duration = times[i] - times[buildup_start]
-            if duration >= min_duration:
-                buildups.append((float(times[buildup_start]), float(times[i])))
-
-    # Handle buildup that continues to end
-    if in_buildup:
-        duration = times[-1] - times[buildup_start]
-        if duration >= min_duration:
-            buildups.append((float(times[buildup_start]), float(times[-1])))
-
-    return buildups
+    # Find sections with positive slope; slope i spans times[i]..times[i + 1],
+    # so a run ending at slope index `end` ends at times[end]
+    starts, ends = runs(slope_smooth > slope_threshold)
+    durations = times[ends] - times[starts]
+    keep = durations >= min_duration
+
+    return [
+        (float(times[start]), float(times[end]))
+        for start, end in zip(starts[keep], ends[keep])
+    ]
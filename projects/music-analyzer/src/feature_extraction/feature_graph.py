@@ -0,0 +1,283 @@
+"""
+Shared Feature Graph for Trance Feature Extraction.
+
+Holds one decoded track and lazily computes the primitives the individual
+extractors need, each at most once per track:
+- Derived signals (mono, mid, side, band-filtered signals)
+- Magnitude STFT per (signal, n_fft, hop)
+- RMS, spectral centroid and bandwidth per signal
+- Onset strength envelopes per signal
+- Beat grids per tempo prior
+
+Every primitive is timed, so callers can see where extraction time goes.
+
+Signals are addressed by name:
+    'mono'              Mean of all channels
+    'mid' / 'side'      (L+R)/2 and (L-R)/2 for stereo input
+    'bandpass:40-500'   4th-order Butterworth band-pass of the mono mix
+    'lowpass:150'       4th-order Butterworth low-pass of the mono mix
+    'highpass:5000'     4th-order Butterworth high-pass of the mono mix
+
+Usage:
+    graph = FeatureGraph.from_file("track.wav")
+    pumping = extract_pumping_features(graph)
+    energy = extract_energy_curves(graph)   # reuses the RMS computed above
+    print(graph.timings)
+"""
+
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import librosa
+
+try:
+    from ..pcm_cache import load_audio
+except ImportError:
+    from pcm_cache import load_audio
+
+
+class FeatureGraph:
+    """Memoized per-track feature primitives shared across extractors."""
+
+    # The mid channel (L+R)/2 is exactly the 2-channel mean, so it shares
+    # every primitive computed on the mono mix.
+    SIGNAL_ALIASES = {'mid': 'mono'}
+
+    def __init__(self, y: np.ndarray, sr: int, hop_length: int = 512):
+        """
+        Create a graph from an already decoded buffer.
+
+        Args:
+            y: Audio samples, 1-D mono or (channels, samples)
+            sr: Sample rate
+            hop_length: Default hop length for frame-based primitives
+        """
+        y = np.asarray(y)
+        if y.ndim == 2:
+            # Accept (samples, channels) layout as well
+            if y.shape[0] > y.shape[1]:
+                y = y.T
+            if y.shape[0] == 1:
+                y = y[0]
+        self.y = y
+        self.sr = int(sr)
+        self.hop_length = hop_length
+        self.timings: Dict[str, float] = {}
+        self._cache: Dict[Tuple, Any] = {}
+        self._nested_time = 0.0
+
+    @classmethod
+    def from_file(cls, audio_path: str, hop_length: int = 512) -> 'FeatureGraph':
+        """Decode an audio file once (native rate, channels preserved)."""
+        start = time.perf_counter()
+        y, sr = load_audio(str(audio_path), sr=None, mono=False)
+        graph = cls(y, sr, hop_length=hop_length)
+        graph.timings['decode'] = time.perf_counter() - start
+        return graph
+
+    @classmethod
+    def ensure(
+        cls,
+        audio_path_or_data,
+        sr: Optional[int] = None,
+        hop_length: int = 512
+    ) -> 'FeatureGraph':
+        """
+        Return a FeatureGraph for a path, an array, or an existing graph.
+
+        Extractors call this on their first argument so they can be used
+        standalone or fed a shared graph.
+        """
+        if isinstance(audio_path_or_data, FeatureGraph):
+            return audio_path_or_data
+        if isinstance(audio_path_or_data, (str, Path)):
+            return cls.from_file(str(audio_path_or_data), hop_length=hop_length)
+        if sr is None:
+            raise ValueError("sr must be provided when passing audio array")
+        return cls(audio_path_or_data, sr, hop_length=hop_length)
+
+    # ==================== CACHE / TIMING ====================
+
+    def _memo(self, key: Tuple, label: str, compute: Callable[[], Any]) -> Any:
+        """
+        Compute `key` once, recording its wall time under `label`.
+
+        Time spent computing nested primitives (e.g. the STFT behind a
+        centroid) is attributed to those primitives, not double counted.
+        """
+        if key not in self._cache:
+            outer_nested = self._nested_time
+            self._nested_time = 0.0
+            start = time.perf_counter()
+            self._cache[key] = compute()
+            elapsed = time.perf_counter() - start
+            self.timings[label] = self.timings.get(label, 0.0) + elapsed - self._nested_time
+            self._nested_time = outer_nested + elapsed
+        return self._cache[key]
+
+    @contextmanager
+    def timed(self, label: str):
+        """Record the wall time of an extraction stage under `label`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[label] = self.timings.get(label, 0.0) + time.perf_counter() - start
+
+    def _hop(self, hop_length: Optional[int]) -> int:
+        return self.hop_length if hop_length is None else hop_length
+
+    # ==================== SIGNALS ====================
+
+    @property
+    def is_stereo(self) -> bool:
+        """True if the buffer has exactly two channels."""
+        return self.y.ndim == 2 and self.y.shape[0] == 2
+
+    @property
+    def mono(self) -> np.ndarray:
+        """Mono mix (mean of channels)."""
+        return self.signal('mono')
+
+    def signal(self, name: str) -> np.ndarray:
+        """Return a named derived signal (see module docstring)."""
+        name = self._resolve(name)
+        return self._memo(('signal', name), f'signal:{name}', lambda: self._build_signal(name))
+
+    def _resolve(self, name: str) -> str:
+        return self.SIGNAL_ALIASES.get(name, name)
+
+    def _build_signal(self, name: str) -> np.ndarray:
+        if name == 'mono':
+            return self.y if self.y.ndim == 1 else np.mean(self.y, axis=0)
+
+        if name == 'side':
+            if not self.is_stereo:
+                return np.zeros_like(self.mono)
+            return (self.y[0] - self.y[1]) / 2
+
+        kind, _, spec = name.partition(':')
+        if kind == 'bandpass':
+            from .acid_detector import _bandpass_filter
+            low, high = (float(v) for v in spec.split('-'))
+            return _bandpass_filter(self.mono, self.sr, low, high)
+        if kind == 'lowpass':
+            from .rhythm_analyzer import _lowpass_filter
+            return _lowpass_filter(self.mono, self.sr, float(spec))
+        if kind == 'highpass':
+            from .rhythm_analyzer import _highpass_filter
+            return _highpass_filter(self.mono, self.sr, float(spec))
+
+        raise ValueError(f"Unknown signal: {name}")
+
+    # ==================== SPECTRAL PRIMITIVES ====================
+
+    def magnitude(
+        self,
+        signal: str = 'mono',
+        n_fft: int = 2048,
+        hop_length: Optional[int] = None
+    ) -> np.ndarray:
+        """Magnitude STFT of a named signal."""
+        hop = self._hop(hop_length)
+        signal = self._resolve(signal)
+        return self._memo(
+            ('stft', signal, n_fft, hop), f'stft:{signal}',
+            lambda: np.abs(librosa.stft(self.signal(signal), n_fft=n_fft, hop_length=hop))
+        )
+
+    def fft_frequencies(self, n_fft: int = 2048) -> np.ndarray:
+        """Bin center frequencies for a given n_fft."""
+        return librosa.fft_frequencies(sr=self.sr, n_fft=n_fft)
+
+    def rms(
+        self,
+        signal: str = 'mono',
+        frame_length: int = 2048,
+        hop_length: Optional[int] = None
+    ) -> np.ndarray:
+        """Frame-wise RMS of a named signal."""
+        hop = self._hop(hop_length)
+        signal = self._resolve(signal)
+        return self._memo(
+            ('rms', signal, frame_length, hop), f'rms:{signal}',
+            lambda: librosa.feature.rms(
+                y=self.signal(signal), frame_length=frame_length, hop_length=hop
+            )[0]
+        )
+
+    def spectral_centroid(
+        self,
+        signal: str = 'mono',
+        n_fft: int = 2048,
+        hop_length: Optional[int] = None
+    ) -> np.ndarray:
+        """Frame-wise spectral centroid (Hz) of a named signal."""
+        hop = self._hop(hop_length)
+        signal = self._resolve(signal)
+        return self._memo(
+            ('centroid', signal, n_fft, hop), f'centroid:{signal}',
+            lambda: librosa.feature.spectral_centroid(
+                S=self.magnitude(signal, n_fft, hop), sr=self.sr, n_fft=n_fft
+            )[0]
+        )
+
+    def spectral_bandwidth(
+        self,
+        signal: str = 'mono',
+        n_fft: int = 2048,
+        hop_length: Optional[int] = None
+    ) -> np.ndarray:
+        """Frame-wise spectral bandwidth (Hz) of a named signal."""
+        hop = self._hop(hop_length)
+        signal = self._resolve(signal)
+        return self._memo(
+            ('bandwidth', signal, n_fft, hop), f'bandwidth:{signal}',
+            lambda: librosa.feature.spectral_bandwidth(
+                S=self.magnitude(signal, n_fft, hop), sr=self.sr, n_fft=n_fft,
+                centroid=self.spectral_centroid(signal, n_fft, hop)[np.newaxis, :]
+            )[0]
+        )
+
+    def onset_envelope(self, signal: str = 'mono', hop_length: Optional[int] = None) -> np.ndarray:
+        """Onset strength envelope (librosa defaults) of a named signal."""
+        hop = self._hop(hop_length)
+        signal = self._resolve(signal)
+
+        def compute():
+            power = self.magnitude(signal, 2048, hop) ** 2
+            mel = librosa.feature.melspectrogram(S=power, sr=self.sr)
+            return librosa.onset.onset_strength(
+                S=librosa.power_to_db(mel), sr=self.sr, hop_length=hop
+            )
+
+        return self._memo(('onset', signal, hop), f'onset:{signal}', compute)
+
+    # ==================== RHYTHM PRIMITIVES ====================
+
+    def beat_track(
+        self,
+        bpm: Optional[float] = None,
+        hop_length: Optional[int] = None
+    ) -> Tuple[Any, np.ndarray]:
+        """
+        Beat-track the mono onset envelope, optionally with a tempo prior.
+
+        Returns:
+            (tempo, beat_frames) as returned by librosa.beat.beat_track
+        """
+        hop = self._hop(hop_length)
+
+        def compute():
+            kwargs = {} if bpm is None else {'bpm': bpm}
+            return librosa.beat.beat_track(
+                onset_envelope=self.onset_envelope('mono', hop),
+                sr=self.sr,
+                hop_length=hop,
+                **kwargs
+            )
+
+        return self._memo(('beats', bpm, hop), 'beat_track', compute)
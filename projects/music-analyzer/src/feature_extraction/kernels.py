@@ -0,0 +1,111 @@
+"""
+Vectorized Frame Kernels for Trance Feature Extraction.
+
+Small numpy building blocks that replace per-frame / per-sample Python
+loops in the extractors:
+- frame: strided (n_frames, frame_length) view of a signal, no copy
+- framewise_pearson: L/R correlation of every frame in one pass
+- local_maxima: strict local maxima of a 1-D array
+- find_peaks: local maxima at least `min_distance` apart
+- runs: start/end indices of every run of True in a boolean mask
+
+Framing follows the non-centered convention of the loops it replaces:
+frame i covers samples [i * hop_length, i * hop_length + frame_length).
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import signal
+
+
+def frame(x: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+    """
+    Read-only strided view of a 1-D signal as overlapping frames.
+
+    Args:
+        x: 1-D signal
+        frame_length: Samples per frame
+        hop_length: Samples between frame starts
+
+    Returns:
+        (n_frames, frame_length) view; n_frames = 1 + (len(x) - frame_length) // hop_length,
+        or zero rows if the signal is shorter than one frame
+    """
+    x = np.asarray(x)
+    if len(x) < frame_length:
+        return np.zeros((0, frame_length), dtype=x.dtype)
+    return sliding_window_view(x, frame_length)[::hop_length]
+
+
+def framewise_pearson(
+    a: np.ndarray,
+    b: np.ndarray,
+    frame_length: int,
+    hop_length: int
+) -> np.ndarray:
+    """
+    Pearson correlation between matching frames of two signals.
+
+    Equivalent to np.corrcoef(a_frame, b_frame)[0, 1] per frame, computed
+    from per-frame sums without copying the frames.
+
+    Returns:
+        Correlation per frame; NaN where either frame has zero variance
+    """
+    frames_a = frame(np.asarray(a, dtype=np.float64), frame_length, hop_length)
+    frames_b = frame(np.asarray(b, dtype=np.float64), frame_length, hop_length)
+
+    sum_a = frames_a.sum(axis=1)
+    sum_b = frames_b.sum(axis=1)
+    cov = np.einsum('ij,ij->i', frames_a, frames_b) - sum_a * sum_b / frame_length
+    var_a = np.einsum('ij,ij->i', frames_a, frames_a) - sum_a ** 2 / frame_length
+    var_b = np.einsum('ij,ij->i', frames_b, frames_b) - sum_b ** 2 / frame_length
+
+    denom = np.sqrt(np.maximum(var_a, 0.0) * np.maximum(var_b, 0.0))
+    corr = np.full(len(cov), np.nan)
+    valid = denom > 0
+    corr[valid] = np.clip(cov[valid] / denom[valid], -1.0, 1.0)
+    return corr
+
+
+def local_maxima(x: np.ndarray) -> np.ndarray:
+    """Indices i with x[i-1] < x[i] > x[i+1] (endpoints and plateaus excluded)."""
+    x = np.asarray(x)
+    if len(x) < 3:
+        return np.zeros(0, dtype=int)
+    middle = x[1:-1]
+    return np.flatnonzero((middle > x[:-2]) & (middle > x[2:])) + 1
+
+
+def find_peaks(x: np.ndarray, min_distance: int = 1) -> np.ndarray:
+    """
+    Local maxima separated by at least `min_distance` samples.
+
+    When peaks are closer than min_distance the highest one is kept, and a
+    flat-topped peak counts once at its middle sample (scipy.signal.find_peaks
+    semantics). With min_distance <= 1 this is local_maxima.
+
+    Returns:
+        Sorted array of peak indices
+    """
+    x = np.asarray(x)
+    if min_distance <= 1:
+        return local_maxima(x)
+    if len(x) < 3:
+        return np.zeros(0, dtype=int)
+    peaks, _ = signal.find_peaks(x, distance=min_distance)
+    return peaks
+
+
+def runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Locate runs of consecutive True values.
+
+    Returns:
+        (starts, ends) index arrays; each run covers mask[start:end]
+    """
+    mask = np.asarray(mask, dtype=bool)
+    edges = np.diff(np.concatenate([[False], mask, [False]]).astype(np.int8))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
@@ -14,6 +14,9 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 import librosa
 
+from .feature_graph import FeatureGraph
+from .kernels import find_peaks
+
 
 @dataclass
 class PumpingFeatures:
@@ -38,7 +41,7 @@ def extract_pumping_features(
     Detect sidechain compression via RMS envelope analysis.
 
     Args:
-        audio_path_or_data: Path to audio file or numpy array of audio data
+        audio_path_or_data: Path to audio file, numpy array of audio data, or FeatureGraph
         sr: Sample rate (required if audio_path_or_data is numpy array)
         expected_bpm: Expected tempo for peak distance calculation
         frame_length: FFT window size (~46ms at 44.1kHz)
@@ -48,19 +51,11 @@ def extract_pumping_features(
     Returns:
         PumpingFeatures with modulation depth, regularity, and cycle count
     """
-    # Load audio if path provided
-    if isinstance(audio_path_or_data, str):
-        y, sr = librosa.load(audio_path_or_data, sr=None, mono=True)
-    else:
-        y = audio_path_or_data
-        if sr is None:
-            raise ValueError("sr must be provided when passing audio array")
-        # Ensure mono
-        if len(y.shape) > 1:
-            y = np.mean(y, axis=0)
+    graph = FeatureGraph.ensure(audio_path_or_data, sr=sr, hop_length=hop_length)
+    sr = graph.sr
 
-    # Compute RMS envelope
-    rms = librosa.feature.rms(y=y, frame_length=frame_length, hop_length=hop_length)[0]
+    # Compute RMS envelope (shared with energy curve extraction)
+    rms = graph.rms('mono', frame_length=frame_length, hop_length=hop_length)
 
     # Calculate expected distance between peaks based on BPM
     # For sidechain pumping, peaks typically occur on each beat
@@ -72,10 +67,10 @@ def extract_pumping_features(
     min_distance = max(1, frames_per_beat // 2)
 
     # Find local maxima (peaks)
-    peaks = _find_peaks(rms, min_distance=min_distance)
+    peaks = find_peaks(rms, min_distance=min_distance)
 
     # Find local minima (troughs)
-    troughs = _find_peaks(-rms, min_distance=min_distance)
+    troughs = find_peaks(-rms, min_distance=min_distance)
 
     if len(peaks) < 2 or len(troughs) < 2:
         # No significant pumping detected
@@ -89,20 +84,12 @@ def extract_pumping_features(
         )
 
     # Calculate modulation depth from peak-to-trough differences
-    peak_values = rms[peaks]
-    trough_values = rms[troughs]
-
-    # Match peaks to nearest troughs for accurate depth calculation
-    depths = []
-    for peak_idx, peak_val in zip(peaks, peak_values):
-        # Find closest trough before this peak
-        troughs_before = troughs[troughs < peak_idx]
-        if len(troughs_before) > 0:
-            closest_trough_idx = troughs_before[-1]
-            trough_val = rms[closest_trough_idx]
-            if trough_val > 0:
-                depth = (peak_val - trough_val) / peak_val
-                depths.append(depth)
+    # Match each peak to the closest trough before it for accurate depth calculation
+    preceding = np.searchsorted(troughs, peaks) - 1
+    peak_values = rms[peaks[preceding >= 0]]
+    trough_values = rms[troughs[preceding[preceding >= 0]]]
+    valid = trough_values > 0
+    depths = (peak_values[valid] - trough_values[valid]) / peak_values[valid]
 
     if len(depths) == 0:
         return PumpingFeatures(
@@ -157,36 +144,6 @@ def extract_pumping_features(
     )
 
 
-def _find_peaks(data: np.ndarray, min_distance: int = 1) -> np.ndarray:
-    """
-    Find local maxima in data with minimum distance constraint.
-
-    Args:
-        data: 1D array to find peaks in
-        min_distance: Minimum number of samples between peaks
-
-    Returns:
-        Array of peak indices
-    """
-    peaks = []
-    n = len(data)
-
-    if n < 3:
-        return np.array(peaks)
-
-    # Find all local maxima
-    for i in range(1, n - 1):
-        if data[i] > data[i - 1] and data[i] > data[i + 1]:
-            # Check if this peak is far enough from the last one
-            if len(peaks) == 0 or i - peaks[-1] >= min_distance:
-                peaks.append(i)
-            elif data[i] > data[peaks[-1]]:
-                # Replace last peak if this one is higher
-                peaks[-1] = i
-
-    return np.array(peaks)
-
-
 def compute_pumping_score(features: PumpingFeatures) -> float:
     """
     Compute a normalized pumping score (0-1) from pumping features.
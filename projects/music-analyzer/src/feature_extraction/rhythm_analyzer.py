@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 import librosa
 
+from .feature_graph import FeatureGraph
+
 
 @dataclass
 class TempoFeatures:
@@ -66,7 +68,7 @@ def detect_trance_tempo(
     Tempo detection with trance-specific prior (138-140 BPM).
 
     Args:
-        audio_path_or_data: Path to audio file or numpy array
+        audio_path_or_data: Path to audio file, numpy array, or FeatureGraph
         sr: Sample rate (required if array provided)
         trance_prior: Expected tempo range for prior (BPM)
         hop_length: Hop length for beat tracking
@@ -74,23 +76,14 @@ def detect_trance_tempo(
     Returns:
         TempoFeatures with tempo, beat times, and stability metrics
     """
-    # Load audio if path provided
-    if isinstance(audio_path_or_data, str):
-        y, sr = librosa.load(audio_path_or_data, sr=None, mono=True)
-    else:
-        y = audio_path_or_data
-        if sr is None:
-            raise ValueError("sr must be provided when passing audio array")
-        if len(y.shape) > 1:
-            y = np.mean(y, axis=0)
+    graph = FeatureGraph.ensure(audio_path_or_data, sr=sr, hop_length=hop_length)
+    sr = graph.sr
 
     # Compute onset strength envelope
-    onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length)
+    onset_env = graph.onset_envelope('mono', hop_length=hop_length)
 
     # Initial tempo estimation using librosa's built-in
-    tempo_estimate, _ = librosa.beat.beat_track(
-        onset_envelope=onset_env, sr=sr, hop_length=hop_length
-    )
+    tempo_estimate, _ = graph.beat_track(hop_length=hop_length)
 
     # Handle both scalar and array returns from librosa
     if isinstance(tempo_estimate, np.ndarray):
@@ -101,13 +94,8 @@ def detect_trance_tempo(
     # Check if initial estimate is in trance range, if not, try to find a multiple/divisor
     tempo = _adjust_tempo_for_trance(tempo_estimate, trance_prior)
 
-    # Get beat times with adjusted tempo as prior
-    _, beat_frames = librosa.beat.beat_track(
-        onset_envelope=onset_env,
-        sr=sr,
-        hop_length=hop_length,
-        bpm=tempo
-    )
+    # Get beat times with adjusted tempo as prior (shared with hihat detection)
+    _, beat_frames = graph.beat_track(bpm=tempo, hop_length=hop_length)
 
     beat_times = librosa.frames_to_time(beat_frames, sr=sr, hop_length=hop_length)
 
@@ -177,7 +165,7 @@ def detect_four_on_floor(
     Verify 4-on-the-floor kick pattern.
 
     Args:
-        audio_path_or_data: Path to audio file or numpy array
+        audio_path_or_data: Path to audio file, numpy array, or FeatureGraph
         sr: Sample rate (required if array provided)
         tempo: Expected tempo (will be detected if not provided)
         hop_length: Hop length for analysis
@@ -185,26 +173,16 @@ def detect_four_on_floor(
     Returns:
         KickPatternFeatures with pattern strength and consistency
     """
-    # Load audio if path provided
-    if isinstance(audio_path_or_data, str):
-        y, sr = librosa.load(audio_path_or_data, sr=None, mono=True)
-    else:
-        y = audio_path_or_data
-        if sr is None:
-            raise ValueError("sr must be provided when passing audio array")
-        if len(y.shape) > 1:
-            y = np.mean(y, axis=0)
+    graph = FeatureGraph.ensure(audio_path_or_data, sr=sr, hop_length=hop_length)
+    sr = graph.sr
 
     # Detect tempo if not provided
     if tempo is None:
-        tempo_features = detect_trance_tempo(y, sr=sr, hop_length=hop_length)
+        tempo_features = detect_trance_tempo(graph, hop_length=hop_length)
         tempo = tempo_features.tempo
 
-    # Focus on kick frequency range (20-150 Hz)
-    y_kick = _lowpass_filter(y, sr, 150)
-
-    # Compute onset strength for kick region
-    onset_env = librosa.onset.onset_strength(y=y_kick, sr=sr, hop_length=hop_length)
+    # Onset strength for the kick frequency range (20-150 Hz)
+    onset_env = graph.onset_envelope('lowpass:150', hop_length=hop_length)
 
     # Calculate expected beat period in frames
     beat_period_seconds = 60.0 / tempo
@@ -218,15 +196,14 @@ def detect_four_on_floor(
             avg_kick_level=0.0
         )
 
-    # Compute autocorrelation at beat period
-    autocorr = np.correlate(onset_env, onset_env, mode='full')
-    autocorr = autocorr[len(autocorr)//2:]  # Take positive lags only
+    # Compute autocorrelation (FFT) up to just past the beat period
+    tolerance = max(1, beat_period_frames // 8)
+    autocorr = librosa.autocorrelate(onset_env, max_size=beat_period_frames + tolerance + 1)
 
     # Normalize
     autocorr = autocorr / (autocorr[0] + 1e-10)
 
     # Get strength at beat period (and nearby for tolerance)
-    tolerance = max(1, beat_period_frames // 8)
     start_idx = max(0, beat_period_frames - tolerance)
     end_idx = min(len(autocorr), beat_period_frames + tolerance + 1)
 
@@ -247,20 +224,14 @@ def detect_four_on_floor(
     # Divide into 8-bar sections and check pattern in each
     frames_per_8bars = beat_period_frames * 32  # 8 bars * 4 beats
     n_sections = max(1, len(onset_env) // frames_per_8bars)
+    section_len = min(frames_per_8bars, len(onset_env))
 
     section_strengths = []
-    for i in range(n_sections):
-        start = i * frames_per_8bars
-        end = min((i + 1) * frames_per_8bars, len(onset_env))
-        section = onset_env[start:end]
-
-        if len(section) > beat_period_frames * 2:
-            section_autocorr = np.correlate(section, section, mode='full')
-            section_autocorr = section_autocorr[len(section_autocorr)//2:]
-            section_autocorr = section_autocorr / (section_autocorr[0] + 1e-10)
-
-            if beat_period_frames < len(section_autocorr):
-                section_strengths.append(section_autocorr[beat_period_frames])
+    if section_len > beat_period_frames * 2:
+        # Normalized autocorrelation at the beat lag, all sections at once
+        sections = onset_env[:n_sections * section_len].reshape(n_sections, section_len)
+        lagged = np.sum(sections[:, beat_period_frames:] * sections[:, :-beat_period_frames], axis=1)
+        section_strengths = lagged / (np.sum(sections ** 2, axis=1) + 1e-10)
 
     if len(section_strengths) > 0:
         kick_consistency = 1.0 - np.std(section_strengths)
@@ -326,7 +297,7 @@ def detect_offbeat_hihats(
     Detect off-beat hi-hat patterns typical in trance.
 
     Args:
-        audio_path_or_data: Path to audio file or numpy array
+        audio_path_or_data: Path to audio file, numpy array, or FeatureGraph
         sr: Sample rate (required if array provided)
         tempo: Expected tempo (will be detected if not provided)
         hop_length: Hop length for analysis
@@ -334,26 +305,17 @@ def detect_offbeat_hihats(
     Returns:
         HihatFeatures with offbeat strength and consistency
     """
-    # Load audio if path provided
-    if isinstance(audio_path_or_data, str):
-        y, sr = librosa.load(audio_path_or_data, sr=None, mono=True)
-    else:
-        y = audio_path_or_data
-        if sr is None:
-            raise ValueError("sr must be provided when passing audio array")
-        if len(y.shape) > 1:
-            y = np.mean(y, axis=0)
+    graph = FeatureGraph.ensure(audio_path_or_data, sr=sr, hop_length=hop_length)
+    sr = graph.sr
 
     # Detect tempo if not provided
     if tempo is None:
-        tempo_features = detect_trance_tempo(y, sr=sr, hop_length=hop_length)
+        tempo_features = detect_trance_tempo(graph, hop_length=hop_length)
         tempo = tempo_features.tempo
 
-    # Focus on hi-hat frequency range (5000-15000 Hz)
-    y_hihat = _highpass_filter(y, sr, 5000)
-
-    # Compute onset strength for hihat region
-    onset_env = librosa.onset.onset_strength(y=y_hihat, sr=sr, hop_length=hop_length)
+    # Onset strength for the hi-hat frequency range (5000-15000 Hz)
+    hihat = 'highpass:5000'
+    onset_env = graph.onset_envelope(hihat, hop_length=hop_length)
 
     # Calculate beat period in frames
     beat_period_seconds = 60.0 / tempo
@@ -367,13 +329,8 @@ def detect_offbeat_hihats(
             hihat_brightness=0.0
         )
 
-    # Get beat tracking
-    _, beat_frames = librosa.beat.beat_track(
-        onset_envelope=librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length),
-        sr=sr,
-        hop_length=hop_length,
-        bpm=tempo
-    )
+    # Get beat tracking (same grid as detect_trance_tempo)
+    _, beat_frames = graph.beat_track(bpm=tempo, hop_length=hop_length)
 
     if len(beat_frames) < 4:
         return HihatFeatures(
@@ -383,18 +340,14 @@ def detect_offbeat_hihats(
         )
 
     # Sample onset strength at on-beats and off-beats
-    on_beat_strengths = []
-    off_beat_strengths = []
+    beats = beat_frames[:-1]
+    on_beat_strengths = onset_env[beats[beats < len(onset_env)]]
 
-    for i, beat in enumerate(beat_frames[:-1]):
-        # On-beat
-        if beat < len(onset_env):
-            on_beat_strengths.append(onset_env[beat])
-
-        # Off-beat (between this beat and next)
-        offbeat = beat + half_beat_frames
-        if offbeat < len(onset_env) and offbeat < beat_frames[i + 1]:
-            off_beat_strengths.append(onset_env[offbeat])
+    # Off-beat (between this beat and next)
+    offbeats = beats + half_beat_frames
+    off_beat_strengths = onset_env[
+        offbeats[(offbeats < len(onset_env)) & (offbeats < beat_frames[1:])]
+    ]
 
     if len(off_beat_strengths) == 0:
         return HihatFeatures(
@@ -423,7 +376,7 @@ def detect_offbeat_hihats(
         hihat_consistency = 0.0
 
     # Brightness of hihat region
-    centroid = librosa.feature.spectral_centroid(y=y_hihat, sr=sr, hop_length=hop_length)
+    centroid = graph.spectral_centroid(hihat, hop_length=hop_length)
     hihat_brightness = np.mean(centroid) / 10000  # Normalize roughly to 0-1
 
     return HihatFeatures(
@@ -442,28 +395,27 @@ def analyze_rhythm(
     Comprehensive rhythm analysis for trance music.
 
     Args:
-        audio_path_or_data: Path to audio file or numpy array
+        audio_path_or_data: Path to audio file, numpy array, or FeatureGraph
         sr: Sample rate (required if array provided)
         hop_length: Hop length for analysis
 
     Returns:
         RhythmFeatures with tempo, kick, and hihat analysis
     """
+    # Decode once and share onset envelopes / beat grid across detectors
+    graph = FeatureGraph.ensure(audio_path_or_data, sr=sr, hop_length=hop_length)
+
     # Detect tempo first
-    tempo_features = detect_trance_tempo(audio_path_or_data, sr=sr, hop_length=hop_length)
+    tempo_features = detect_trance_tempo(graph, hop_length=hop_length)
 
     # Use detected tempo for other analyses
     tempo = tempo_features.tempo
 
     # Detect 4-on-the-floor
-    kick_features = detect_four_on_floor(
-        audio_path_or_data, sr=sr, tempo=tempo, hop_length=hop_length
-    )
+    kick_features = detect_four_on_floor(graph, tempo=tempo, hop_length=hop_length)
 
     # Detect off-beat hihats
-    hihat_features = detect_offbeat_hihats(
-        audio_path_or_data, sr=sr, tempo=tempo, hop_length=hop_length
-    )
+    hihat_features = detect_offbeat_hihats(graph, tempo=tempo, hop_length=hop_length)
 
     # Calculate summary scores
     four_on_floor_score = kick_features.strength * kick_features.kick_consistency
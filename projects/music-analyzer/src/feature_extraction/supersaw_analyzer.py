@@ -15,6 +15,9 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 import librosa
 
+from .feature_graph import FeatureGraph
+from .kernels import framewise_pearson, local_maxima
+
 
 @dataclass
 class SupersawFeatures:
@@ -42,7 +45,7 @@ def analyze_supersaw_characteristics(
     Analyze supersaw-style stereo spread characteristics.
 
     Args:
-        audio_path_or_data: Path to stereo audio file or (2, N) array
+        audio_path_or_data: Path to stereo audio file, (2, N) array, or FeatureGraph
         sr: Sample rate (required if array provided)
         frame_length: FFT window size
         hop_length: Hop length for analysis
@@ -51,19 +54,13 @@ def analyze_supersaw_characteristics(
     Returns:
         SupersawFeatures with stereo width, correlation, and detuning info
     """
-    # Load audio if path provided
-    if isinstance(audio_path_or_data, str):
-        y, sr = librosa.load(audio_path_or_data, sr=None, mono=False)
-    else:
-        y = audio_path_or_data
-        if sr is None:
-            raise ValueError("sr must be provided when passing audio array")
+    graph = FeatureGraph.ensure(audio_path_or_data, sr=sr, hop_length=hop_length)
+    sr = graph.sr
+    y = graph.y
 
     # Handle mono input
-    if len(y.shape) == 1 or (len(y.shape) == 2 and y.shape[0] == 1):
+    if len(y.shape) == 1:
         # Mono signal - no stereo information
-        if len(y.shape) == 2:
-            y = y[0]
         return SupersawFeatures(
             stereo_width=0.0,
             phase_correlation=1.0,
@@ -76,17 +73,15 @@ def analyze_supersaw_characteristics(
         )
 
     # Ensure stereo format (2, N)
-    if y.shape[0] > 2:
-        y = y.T
     if y.shape[0] != 2:
         raise ValueError("Audio must be stereo (2 channels)")
 
     left = y[0]
     right = y[1]
 
-    # Compute Mid-Side
-    mid = (left + right) / 2
-    side = (left - right) / 2
+    # Compute Mid-Side (mid is the shared mono mix)
+    mid = graph.signal('mid')
+    side = graph.signal('side')
 
     # Calculate basic energy levels
     mid_energy = np.sqrt(np.mean(mid**2))
@@ -94,7 +89,7 @@ def analyze_supersaw_characteristics(
 
     # 1. Stereo Width Ratio
     stereo_width, width_over_time = _compute_stereo_width(
-        mid, side, frame_length, hop_length, return_time_series
+        graph, frame_length, hop_length, return_time_series
     )
 
     # 2. Phase Correlation
@@ -102,7 +97,7 @@ def analyze_supersaw_characteristics(
 
     # 3. Detuning Detection
     detuning_detected, estimated_voices, spread_cents = _detect_detuning(
-        mid, sr, frame_length, hop_length
+        graph, frame_length, hop_length
     )
 
     return SupersawFeatures(
@@ -118,8 +113,7 @@ def analyze_supersaw_characteristics(
 
 
 def _compute_stereo_width(
-    mid: np.ndarray,
-    side: np.ndarray,
+    graph: FeatureGraph,
     frame_length: int,
     hop_length: int,
     return_time_series: bool
@@ -131,8 +125,8 @@ def _compute_stereo_width(
         (average_width, width_over_time)
     """
     # Compute frame-by-frame RMS
-    mid_rms = librosa.feature.rms(y=mid, frame_length=frame_length, hop_length=hop_length)[0]
-    side_rms = librosa.feature.rms(y=side, frame_length=frame_length, hop_length=hop_length)[0]
+    mid_rms = graph.rms('mid', frame_length=frame_length, hop_length=hop_length)
+    side_rms = graph.rms('side', frame_length=frame_length, hop_length=hop_length)
 
     # Calculate width ratio per frame (avoid division by zero)
     mid_safe = np.where(mid_rms > 1e-10, mid_rms, 1e-10)
@@ -163,24 +157,12 @@ def _compute_phase_correlation(
         correlation: -1 (out of phase) to +1 (mono/in-phase)
         Typical supersaw: 0.3-0.7
     """
-    # Frame the signals
-    n_frames = 1 + (len(left) - frame_length) // hop_length
-
-    if n_frames < 1:
+    if len(left) < frame_length:
         return float(np.corrcoef(left, right)[0, 1])
 
-    correlations = []
-    for i in range(n_frames):
-        start = i * hop_length
-        end = start + frame_length
-
-        l_frame = left[start:end]
-        r_frame = right[start:end]
-
-        # Pearson correlation
-        corr = np.corrcoef(l_frame, r_frame)[0, 1]
-        if not np.isnan(corr):
-            correlations.append(corr)
+    # Pearson correlation per frame (NaN for silent frames)
+    correlations = framewise_pearson(left, right, frame_length, hop_length)
+    correlations = correlations[~np.isnan(correlations)]
 
     if len(correlations) == 0:
         return 1.0
@@ -189,8 +171,7 @@ def _compute_phase_correlation(
 
 
 def _detect_detuning(
-    y: np.ndarray,
-    sr: int,
+    graph: FeatureGraph,
     frame_length: int,
     hop_length: int
 ) -> Tuple[bool, int, float]:
@@ -205,14 +186,14 @@ def _detect_detuning(
     Returns:
         (detuning_detected, estimated_voices, spread_cents)
     """
-    # Compute spectrogram
-    D = np.abs(librosa.stft(y, n_fft=frame_length, hop_length=hop_length))
+    # Spectrogram of the mid channel (shared mono STFT)
+    D = graph.magnitude('mid', n_fft=frame_length, hop_length=hop_length)
 
     # Average across time to get overall spectrum
     avg_spectrum = np.mean(D, axis=1)
 
     # Find spectral peaks
-    freqs = librosa.fft_frequencies(sr=sr, n_fft=frame_length)
+    freqs = graph.fft_frequencies(n_fft=frame_length)
     peaks = _find_spectral_peaks(avg_spectrum, freqs, min_db=-40)
 
     if len(peaks) < 3:
@@ -220,8 +201,7 @@ def _detect_detuning(
 
     # Look for clustered peaks (indicates detuning)
     # Sort peaks by frequency
-    peak_freqs = np.array([p[0] for p in peaks])
-    peak_freqs = np.sort(peak_freqs)
+    peak_freqs = np.sort(peaks[:, 0])
 
     # Find fundamental (lowest significant peak)
     fundamental = peak_freqs[0]
@@ -273,12 +253,12 @@ def _find_spectral_peaks(
     spectrum: np.ndarray,
     freqs: np.ndarray,
     min_db: float = -40
-) -> list:
+) -> np.ndarray:
     """
     Find prominent peaks in spectrum.
 
     Returns:
-        List of (frequency, magnitude_db) tuples
+        (n_peaks, 2) array of (frequency, magnitude_db) rows
     """
     # Convert to dB
     spectrum_db = 20 * np.log10(spectrum + 1e-10)
@@ -287,15 +267,11 @@ def _find_spectral_peaks(
     # Normalize relative to max
     spectrum_db_norm = spectrum_db - max_db
 
-    peaks = []
-    for i in range(1, len(spectrum_db) - 1):
-        # Local maximum above threshold
-        if (spectrum_db_norm[i] > spectrum_db_norm[i-1] and
-            spectrum_db_norm[i] > spectrum_db_norm[i+1] and
-            spectrum_db_norm[i] > min_db):
-            peaks.append((freqs[i], spectrum_db_norm[i]))
+    # Local maxima above threshold
+    peaks = local_maxima(spectrum_db_norm)
+    peaks = peaks[spectrum_db_norm[peaks] > min_db]
 
-    return peaks
+    return np.column_stack([freqs[peaks], spectrum_db_norm[peaks]])
 
 
 def compute_supersaw_score(features: SupersawFeatures) -> float:
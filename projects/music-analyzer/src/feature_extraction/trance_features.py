@@ -14,10 +14,10 @@ Usage:
 """
 
 import numpy as np
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import Optional, Dict, Any
-import librosa
 
+from .feature_graph import FeatureGraph
 from .pumping_detector import extract_pumping_features, compute_pumping_score
 from .acid_detector import extract_acid_features
 from .supersaw_analyzer import analyze_supersaw_characteristics, compute_supersaw_score
@@ -73,6 +73,9 @@ class TranceFeatures:
     trance_score: float
     trance_score_breakdown: Dict[str, float]
 
+    # Wall time (seconds) per extraction stage and shared primitive
+    extraction_timings: Dict[str, float] = field(default_factory=dict)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         result = asdict(self)
@@ -84,81 +87,89 @@ def extract_all_trance_features(
     sr: Optional[int] = None,
     hop_length: int = 512,
     include_time_series: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    pitch_method: str = 'fast'
 ) -> TranceFeatures:
     """
     Extract all trance-specific features from an audio file.
 
     This is the main entry point for trance feature extraction.
-    It runs all extractors and computes the composite trance score.
+    It runs all extractors over one shared FeatureGraph, so each primitive
+    (RMS, centroid, onset envelope, beat grid, STFT, band-filtered signals)
+    is computed at most once, and computes the composite trance score.
 
     Args:
-        audio_path_or_data: Path to audio file or numpy array
+        audio_path_or_data: Path to audio file, numpy array, or FeatureGraph
         sr: Sample rate (required if array provided)
         hop_length: Hop length for analysis
         include_time_series: If True, include time-varying features
         verbose: If True, print progress
+        pitch_method: Acid glide pitch tracker, 'fast' (vectorized YIN) or 'accurate' (pyin)
 
     Returns:
         TranceFeatures dataclass with all extracted features
     """
-    # Load audio once for reuse
-    if isinstance(audio_path_or_data, str):
+    # Decode once; every extractor below shares this graph
+    if isinstance(audio_path_or_data, FeatureGraph):
+        graph = audio_path_or_data
+    elif isinstance(audio_path_or_data, str):
         if verbose:
             print(f"Loading audio: {audio_path_or_data}")
-        # Load mono for most analysis
-        y_mono, sr = librosa.load(audio_path_or_data, sr=None, mono=True)
-        # Load stereo for supersaw analysis
-        y_stereo, _ = librosa.load(audio_path_or_data, sr=sr, mono=False)
+        graph = FeatureGraph.from_file(audio_path_or_data, hop_length=hop_length)
     else:
         if sr is None:
             raise ValueError("sr must be provided when passing audio array")
-        if len(audio_path_or_data.shape) == 1:
-            y_mono = audio_path_or_data
-            y_stereo = np.vstack([audio_path_or_data, audio_path_or_data])
-        else:
-            y_mono = np.mean(audio_path_or_data, axis=0)
-            y_stereo = audio_path_or_data
+        y = audio_path_or_data
+        if len(y.shape) == 1:
+            # Duplicate mono arrays so supersaw analysis sees a (silent-side) stereo pair
+            y = np.vstack([y, y])
+        graph = FeatureGraph(y, sr, hop_length=hop_length)
 
     # 1. Extract pumping features
     if verbose:
         print("Analyzing sidechain pumping...")
-    pumping = extract_pumping_features(y_mono, sr=sr, hop_length=hop_length)
-    pumping_score = compute_pumping_score(pumping)
+    with graph.timed('stage:pumping'):
+        pumping = extract_pumping_features(graph, hop_length=hop_length)
+        pumping_score = compute_pumping_score(pumping)
 
     # 2. Extract acid features
     if verbose:
         print("Analyzing acid/303 characteristics...")
-    acid = extract_acid_features(y_mono, sr=sr, hop_length=hop_length)
+    with graph.timed('stage:acid'):
+        acid = extract_acid_features(graph, hop_length=hop_length, pitch_method=pitch_method)
 
     # 3. Extract supersaw features
     if verbose:
         print("Analyzing stereo spread...")
-    supersaw = analyze_supersaw_characteristics(
-        y_stereo, sr=sr, hop_length=hop_length,
-        return_time_series=include_time_series
-    )
-    supersaw_score = compute_supersaw_score(supersaw)
+    with graph.timed('stage:supersaw'):
+        supersaw = analyze_supersaw_characteristics(
+            graph, hop_length=hop_length,
+            return_time_series=include_time_series
+        )
+        supersaw_score = compute_supersaw_score(supersaw)
 
     # 4. Extract energy features
     if verbose:
         print("Analyzing energy progression...")
-    energy = extract_energy_curves(y_mono, sr=sr, hop_length=hop_length)
-    drops = detect_drops(energy)
-    energy_progression_score = compute_energy_progression_score(energy)
+    with graph.timed('stage:energy'):
+        energy = extract_energy_curves(graph, hop_length=hop_length)
+        drops = detect_drops(energy)
+        energy_progression_score = compute_energy_progression_score(energy)
 
     # 5. Extract rhythm features
     if verbose:
         print("Analyzing rhythm and tempo...")
-    rhythm = analyze_rhythm(y_mono, sr=sr, hop_length=hop_length)
+    with graph.timed('stage:rhythm'):
+        rhythm = analyze_rhythm(graph, hop_length=hop_length)
 
     # 6. Compute spectral brightness
     if verbose:
         print("Analyzing spectral characteristics...")
-    centroid = librosa.feature.spectral_centroid(y=y_mono, sr=sr, hop_length=hop_length)
-    avg_centroid = float(np.mean(centroid))
-    # Normalize to 0-1 score (2000-5000 Hz is bright for trance)
-    brightness_score = np.clip((avg_centroid - 1000) / 4000, 0.0, 1.0)
+    with graph.timed('stage:spectral'):
+        centroid = graph.spectral_centroid('mono', hop_length=hop_length)
+        avg_centroid = float(np.mean(centroid))
+        # Normalize to 0-1 score (2000-5000 Hz is bright for trance)
+        brightness_score = np.clip((avg_centroid - 1000) / 4000, 0.0, 1.0)
 
     # 7. Compute overall trance score
     if verbose:
@@ -179,6 +190,10 @@ def extract_all_trance_features(
 
     trance_score, breakdown = scorer.compute_total_score(score_features)
 
+    if verbose:
+        slowest = sorted(graph.timings.items(), key=lambda kv: kv[1], reverse=True)[:8]
+        print("Extraction timings: " + ", ".join(f"{k} {v:.2f}s" for k, v in slowest))
+
     return TranceFeatures(
         # Pumping
         pumping_modulation_depth_db=pumping.modulation_depth_db,
@@ -222,7 +237,9 @@ def extract_all_trance_features(
 
         # Overall
         trance_score=trance_score,
-        trance_score_breakdown=breakdown.to_dict()
+        trance_score_breakdown=breakdown.to_dict(),
+
+        extraction_timings=dict(graph.timings)
     )
 
 
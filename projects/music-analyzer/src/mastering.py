@@ -13,6 +13,11 @@ from typing import Optional, Tuple
 import numpy as np
 import soundfile as sf
 
+try:
+    from .loudness_meter import measure_loudness
+except ImportError:
+    from loudness_meter import measure_loudness
+
 
 @dataclass
 class MasteringResult:
@@ -187,21 +192,11 @@ class MasteringEngine:
 
     def _estimate_lufs(self, audio_path: str) -> float:
         """
-        Estimate integrated LUFS of an audio file.
-        This is a simplified approximation.
+        Measure integrated LUFS (ITU-R BS.1770-4) of an audio file.
         """
         try:
-            audio, sr = sf.read(audio_path)
-
-            # Convert to mono if stereo
-            if len(audio.shape) > 1:
-                audio = np.mean(audio, axis=1)
-
-            # Simple RMS-based LUFS approximation
-            rms = np.sqrt(np.mean(audio ** 2))
-            lufs_estimate = 20 * np.log10(rms + 1e-10) - 0.691
-
-            return float(lufs_estimate)
+            audio, sr = sf.read(audio_path, dtype='float32')
+            return measure_loudness(audio, sr).integrated_lufs
 
         except Exception:
             return -24.0  # Default if estimation fails
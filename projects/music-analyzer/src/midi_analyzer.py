@@ -13,7 +13,8 @@ Integrates with als_parser.py to provide detailed MIDI analysis.
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple, Set
-from hashlib import md5
+
+import numpy as np
 
 # Import from als_parser (we'll use the types it defines)
 try:
@@ -21,11 +22,13 @@ try:
         ALSProject, Track, MIDIClip, MIDINote, Locator,
         MIDIAnalysis, ALSParser
     )
+    from midi_notes import clip_note_array, note_hash
 except ImportError:
     from .als_parser import (
         ALSProject, Track, MIDIClip, MIDINote, Locator,
         MIDIAnalysis, ALSParser
     )
+    from .midi_notes import clip_note_array, note_hash
 
 
 # ==================== DATA CLASSES ====================
@@ -316,31 +319,27 @@ class MIDIAnalyzer:
 
     def _analyze_clip(self, clip: MIDIClip, track_name: str) -> MIDIClipStats:
         """Analyze a single MIDI clip and return stats."""
-        notes = [n for n in clip.notes if not n.mute]
+        notes = clip_note_array(clip)
+        notes = notes[~notes['mute']]
         note_count = len(notes)
         duration = clip.end_time - clip.start_time
 
         # Calculate stats
         if note_count > 0:
-            velocities = [n.velocity for n in notes]
-            pitches = set(n.pitch for n in notes)
-            vel_min = min(velocities)
-            vel_max = max(velocities)
-            avg_vel = sum(velocities) / len(velocities)
-
-            # Create hash for duplicate detection
-            # Hash based on sorted (pitch, relative_time, duration, velocity)
-            note_data = sorted([
-                (n.pitch, round(n.start_time, 3), round(n.duration, 3), n.velocity)
-                for n in notes
-            ])
-            note_hash = md5(str(note_data).encode()).hexdigest()
+            velocities = notes['velocity']
+            vel_min = int(velocities.min())
+            vel_max = int(velocities.max())
+            avg_vel = int(velocities.sum(dtype=np.int64)) / note_count
+            unique_pitches = len(np.unique(notes['pitch']))
+
+            # Hash of sorted (pitch, relative_time, duration, velocity) for duplicate detection
+            content_hash = note_hash(notes)
         else:
-            pitches = set()
+            unique_pitches = 0
             vel_min = 0
             vel_max = 0
             avg_vel = 0.0
-            note_hash = "empty"
+            content_hash = "empty"
 
         return MIDIClipStats(
             clip_name=clip.name,
@@ -349,10 +348,10 @@ class MIDIAnalyzer:
             duration_beats=duration,
             is_empty=note_count == 0,
             is_very_short=duration < self.SHORT_CLIP_THRESHOLD,
-            unique_pitches=len(pitches),
+            unique_pitches=unique_pitches,
             velocity_range=(vel_min, vel_max),
             average_velocity=avg_vel,
-            note_hash=note_hash
+            note_hash=content_hash
         )
 
     def _analyze_arrangement(self, project: ALSProject) -> ArrangementAnalysis:
@@ -0,0 +1,204 @@
+"""
+Columnar MIDI Notes.
+
+Dense arrangements (16th-note arps over a whole track) carry hundreds of
+thousands of notes. Walking them as MIDINote objects makes MIDI analysis
+slower than parsing the file, so the parser also stores every clip's notes
+as a NumPy structured array with one row per note:
+
+    pitch     int16    MIDI pitch (0-127)
+    velocity  int16    MIDI velocity (0-127)
+    start     float64  Start in beats, relative to the clip
+    duration  float64  Length in beats
+    mute      bool     Note is disabled in Live
+    clip      int32    Index of the clip within its track
+
+The helpers below are the vectorized building blocks of the quantization,
+chord, swing and velocity statistics in ALSParser.analyze_midi_track and
+MIDIAnalyzer. Objects that only provide `.notes` (hand-built clips, test
+doubles) are converted on demand.
+
+A parsed clip's notes are read-only: the stored array is not rebuilt when
+a MIDINote in clip.notes is edited in place. Code that edits notes must
+set clip.note_array = None afterwards.
+
+Usage:
+    notes = track_note_array(track.midi_clips)
+    played = notes[~notes['mute']]
+    index, grid, error = off_grid(played['start'], 0.25)
+"""
+
+import math
+from hashlib import md5
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+
+NOTE_DTYPE = np.dtype([
+    ('pitch', np.int16),
+    ('velocity', np.int16),
+    ('start', np.float64),
+    ('duration', np.float64),
+    ('mute', np.bool_),
+    ('clip', np.int32),
+])
+
+
+# ==================== CONSTRUCTION ====================
+
+def empty_note_array() -> np.ndarray:
+    """A note array with no rows."""
+    return np.zeros(0, dtype=NOTE_DTYPE)
+
+
+def note_array_from_columns(
+    pitch: List[int],
+    velocity: List[int],
+    start: List[float],
+    duration: List[float],
+    mute: List[bool],
+    clip_id: int = 0
+) -> np.ndarray:
+    """Build a note array from parallel per-note lists."""
+    notes = np.zeros(len(pitch), dtype=NOTE_DTYPE)
+    if len(pitch):
+        notes['pitch'] = pitch
+        notes['velocity'] = velocity
+        notes['start'] = start
+        notes['duration'] = duration
+        notes['mute'] = mute
+        notes['clip'] = clip_id
+    return notes
+
+
+def notes_to_array(notes: Iterable, clip_id: int = 0) -> np.ndarray:
+    """Convert objects with pitch/velocity/start_time/duration/mute to a note array."""
+    notes = list(notes)
+    return note_array_from_columns(
+        [n.pitch for n in notes],
+        [n.velocity for n in notes],
+        [n.start_time for n in notes],
+        [n.duration for n in notes],
+        [getattr(n, 'mute', False) for n in notes],
+        clip_id
+    )
+
+
+def clip_note_array(clip) -> np.ndarray:
+    """
+    The clip's note array, built from clip.notes if the parser did not store one.
+
+    The stored array is rebuilt when notes were added or removed, but not
+    when a note was edited in place; clear clip.note_array after such edits.
+    """
+    notes = getattr(clip, 'note_array', None)
+    if notes is None or len(notes) != len(clip.notes):
+        notes = notes_to_array(clip.notes)
+    return notes
+
+
+def track_note_array(clips: Iterable) -> np.ndarray:
+    """All notes of a track's clips in clip order, with 'clip' set to the clip index."""
+    arrays = []
+    for clip_id, clip in enumerate(clips):
+        notes = clip_note_array(clip)
+        if len(notes):
+            notes = notes.copy()
+            notes['clip'] = clip_id
+            arrays.append(notes)
+    return np.concatenate(arrays) if arrays else empty_note_array()
+
+
+# ==================== VECTORIZED STATISTICS ====================
+
+def velocity_stats(velocity: np.ndarray) -> Tuple[float, float, int, int]:
+    """
+    Mean, population standard deviation, min and max of velocities.
+
+    Returns:
+        (mean, std, min, max); velocity must not be empty
+    """
+    values = velocity.astype(np.int64)
+    mean = int(values.sum()) / len(values)
+    variance = float(((values - mean) ** 2).sum()) / len(values)
+    return mean, math.sqrt(variance), int(values.min()), int(values.max())
+
+
+def off_grid(start: np.ndarray, grid_resolution: float,
+             tolerance: float = 0.01) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Notes further than `tolerance` beats from the nearest grid line.
+
+    Returns:
+        (indices into start, nearest grid position, absolute error in beats)
+    """
+    grid = np.round(start / grid_resolution) * grid_resolution
+    error = np.abs(start - grid)
+    index = np.flatnonzero(error > tolerance)
+    return index, grid[index], error[index]
+
+
+def chord_groups(start: np.ndarray, time_threshold: float = 0.05,
+                 min_size: int = 3) -> List[np.ndarray]:
+    """
+    Group notes starting within `time_threshold` of a group's first note.
+
+    Groups are formed greedily in time order: the earliest unassigned note
+    opens a group that takes every later note within the threshold.
+
+    Returns:
+        Index arrays (into start) of the groups with at least min_size notes,
+        each in time order
+    """
+    if len(start) < min_size:
+        return []
+    order = np.argsort(start, kind='stable')
+    times = start[order]
+
+    # A gap wider than the threshold always opens a new group, so groups
+    # never span clusters; only clusters large enough for a chord are walked
+    breaks = np.flatnonzero(np.diff(times) > time_threshold) + 1
+    bounds = np.concatenate(([0], breaks, [len(times)]))
+
+    groups = []
+    for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        if hi - lo < min_size:
+            continue
+        cluster = times[lo:hi]
+        ends = np.searchsorted(cluster, cluster + time_threshold, side='right').tolist()
+        values = cluster.tolist()
+        i = 0
+        while i < len(values):
+            # searchsorted compares t[j] <= t[i] + threshold; settle the
+            # boundary on t[j] - t[i] <= threshold in case rounding differs
+            j = max(ends[i], i + 1)
+            while j < len(values) and values[j] - values[i] <= time_threshold:
+                j += 1
+            while j > i + 1 and values[j - 1] - values[i] > time_threshold:
+                j -= 1
+            if j - i >= min_size:
+                groups.append(order[lo + i:lo + j])
+            i = j
+    return groups
+
+
+def offbeat_positions(start: np.ndarray, low: float = 0.3, high: float = 0.8) -> np.ndarray:
+    """Positions within the beat of notes strictly between low and high."""
+    position = np.mod(start, 1.0)
+    return position[(position > low) & (position < high)]
+
+
+def note_hash(notes: np.ndarray) -> str:
+    """
+    Order-independent hash of (pitch, start, duration, velocity), with times
+    rounded to 1/1000 beat. Identical note content hashes identically.
+    """
+    rows = np.zeros(len(notes), dtype=[('pitch', np.int16), ('start', np.float64),
+                                       ('duration', np.float64), ('velocity', np.int16)])
+    rows['pitch'] = notes['pitch']
+    rows['start'] = np.round(notes['start'], 3)
+    rows['duration'] = np.round(notes['duration'], 3)
+    rows['velocity'] = notes['velocity']
+    rows = np.sort(rows, order=['pitch', 'start', 'duration', 'velocity'])
+    return md5(rows.tobytes()).hexdigest()
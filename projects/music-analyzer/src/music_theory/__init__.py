@@ -16,9 +16,11 @@ from .key_relationships import (
     COMMON_PROGRESSIONS,
     MODULATION_MAP,
     KEY_SIGNATURES,
+    PITCH_CLASS_NAMES,
     get_parallel_key,
     get_neighboring_keys,
     get_key_relationship_info,
+    get_camelot_notation,
 )
 
 __all__ = [
@@ -32,7 +34,9 @@ __all__ = [
     'COMMON_PROGRESSIONS',
     'MODULATION_MAP',
     'KEY_SIGNATURES',
+    'PITCH_CLASS_NAMES',
     'get_parallel_key',
     'get_neighboring_keys',
     'get_key_relationship_info',
+    'get_camelot_notation',
 ]
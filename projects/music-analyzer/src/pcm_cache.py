@@ -0,0 +1,303 @@
+"""
+Decoded-Audio (PCM) Cache.
+
+The same file is decoded, and often resampled, by several analyzers
+(reference analysis at 22050 Hz, stems at their native rate, the YouTube
+spectral analyzer at 44100 Hz). load_audio() is a drop-in replacement for
+librosa.load that keeps every decode on disk:
+- One float32 .npy file per (content hash, sample rate, channel layout)
+- Repeat loads use np.load(mmap_mode='r'). They are zero-copy, read-only
+  arrays, shared between processes through the page cache
+- Resampled and mono variants are derived from the cached native-rate
+  decode, so a file is decoded once however many rates are requested
+- Least recently used files are evicted above a size cap
+
+Misses follow librosa.load exactly: native decode, then mono downmix, then
+resampling with librosa's default resampler. offset/duration are served
+as slices of the full-track variant once the file is cached. For resampled
+audio this can differ from a partial librosa.load by resampler edge
+effects in the first and last few samples of the slice. A request with a
+duration for a file that is not cached yet reads just that part with
+librosa.load and stores nothing, so short probes stay cheap.
+
+Usage:
+    y, sr = load_audio("ref.mp3", sr=22050, mono=True)   # decoded, cached
+    y, sr = load_audio("ref.mp3", sr=22050, mono=True)   # memory-mapped
+
+    configure_pcm_cache(directory="D:/cache/pcm", max_size_mb=8192)
+    configure_pcm_cache(enabled=False)                  # plain librosa.load
+
+The default directory is ~/.cache/music-analyzer/pcm. Override it with the
+MUSIC_ANALYZER_PCM_CACHE environment variable; 'off' disables the cache.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import librosa
+
+
+DEFAULT_MAX_SIZE_MB = 4096.0
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "music-analyzer" / "pcm"
+CACHE_DIR_ENV = "MUSIC_ANALYZER_PCM_CACHE"
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+class PCMCache:
+    """Size-capped on-disk cache of decoded float32 audio."""
+
+    def __init__(self, cache_dir: str = str(DEFAULT_CACHE_DIR), max_size_mb: float = DEFAULT_MAX_SIZE_MB):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the .npy files
+            max_size_mb: Total size above which least recently used files are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+
+    # ==================== KEYS ====================
+
+    def file_hash(self, audio_path: str) -> str:
+        """SHA-256 of a file's contents, memoized per (path, size, mtime) in this process."""
+        path = Path(audio_path).resolve()
+        stat = path.stat()
+        memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+        if memo_key not in self._hashes:
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b''):
+                    digest.update(chunk)
+            self._hashes[memo_key] = digest.hexdigest()
+        return self._hashes[memo_key]
+
+    def _npy_path(self, digest: str, sr: int, mono: bool) -> Path:
+        return self.cache_dir / f"{digest}_{sr}_{'mono' if mono else 'multi'}.npy"
+
+    def _meta_path(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}.json"
+
+    def _native_rate(self, digest: str) -> Optional[int]:
+        try:
+            with open(self._meta_path(digest)) as f:
+                return int(json.load(f)['sr'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    # ==================== LOAD ====================
+
+    def load(
+        self,
+        audio_path: str,
+        sr: Optional[int] = 22050,
+        mono: bool = True,
+        offset: float = 0.0,
+        duration: Optional[float] = None
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Load audio like librosa.load, serving repeat requests from the cache.
+
+        Args:
+            audio_path: Audio file path
+            sr: Target sample rate (None = native)
+            mono: Downmix to mono
+            offset: Start time in seconds
+            duration: Length in seconds (None = to the end)
+
+        Returns:
+            (y, sr): float32 array, 1-D for mono or (channels, samples);
+            read-only unless it is a partial read of an uncached file
+        """
+        digest = self.file_hash(audio_path)
+        native_sr = self._native_rate(digest)
+        target_sr = sr or native_sr
+
+        y = self._open(digest, target_sr, mono) if target_sr else None
+        if y is None:
+            native = self._open(digest, native_sr, False) if native_sr else None
+            if native is None and duration is not None:
+                # A short probe of an uncached file: decode just that part
+                return librosa.load(str(audio_path), sr=sr, mono=mono,
+                                    offset=offset, duration=duration)
+            if native is None:
+                native, native_sr = librosa.load(str(audio_path), sr=None, mono=False)
+                native = self._store(digest, native_sr, False, native)
+                with open(self._meta_path(digest), 'w') as f:
+                    json.dump({'sr': int(native_sr), 'source': str(audio_path)}, f)
+
+            target_sr = sr or native_sr
+            y = native
+            if mono and y.ndim > 1:
+                y = librosa.to_mono(y)
+            if target_sr != native_sr:
+                y = librosa.resample(y, orig_sr=native_sr, target_sr=target_sr)
+            if y is not native:
+                y = self._store(digest, target_sr, mono, y)
+
+        return self._slice(y, target_sr, offset, duration), int(target_sr)
+
+    @staticmethod
+    def _slice(y: np.ndarray, sr: int, offset: float, duration: Optional[float]) -> np.ndarray:
+        if not offset and duration is None:
+            return y
+        start = int(round(offset * sr))
+        end = None if duration is None else start + int(round(duration * sr))
+        return y[..., start:end]
+
+    def _open(self, digest: str, sr: int, mono: bool) -> Optional[np.ndarray]:
+        path = self._npy_path(digest, sr, mono)
+        try:
+            y = np.load(path, mmap_mode='r')
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Zero-length arrays cannot be memory-mapped
+            y = np.load(path)
+        try:
+            os.utime(path)      # LRU order follows mtime
+        except OSError:
+            pass
+        return np.asarray(y)
+
+    def _store(self, digest: str, sr: int, mono: bool, y: np.ndarray) -> np.ndarray:
+        """Write a variant and return it memory-mapped (or as-is if the write fails)."""
+        path = self._npy_path(digest, sr, mono)
+        # Not *.npy, so other processes' size accounting, eviction and clear()
+        # skip this file until it is renamed into place
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(y, dtype=np.float32))
+            os.replace(tmp_path, path)
+        except OSError:
+            # Disk full or file locked by another reader: serve from memory
+            tmp_path.unlink(missing_ok=True)
+            return np.asarray(y, dtype=np.float32)
+        self._evict(keep=path)
+        mapped = self._open(digest, sr, mono)
+        return mapped if mapped is not None else np.asarray(y, dtype=np.float32)
+
+    # ==================== MAINTENANCE ====================
+
+    def size_bytes(self) -> int:
+        """Total size of cached audio."""
+        return sum(p.stat().st_size for p in self.cache_dir.glob('*.npy'))
+
+    def _evict(self, keep: Optional[Path] = None) -> None:
+        """Delete least recently used files until the cache fits max_bytes."""
+        files = []
+        for p in self.cache_dir.glob('*.npy'):
+            try:
+                stat = p.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, p))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, p in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if p == keep:
+                continue
+            try:
+                p.unlink()
+                total -= size
+            except OSError:
+                pass    # Still mapped by a process on a platform that forbids deleting it
+
+    def clear(self) -> int:
+        """
+        Remove all cached audio.
+
+        Returns:
+            Number of .npy files removed
+        """
+        removed = 0
+        for p in self.cache_dir.glob('*.npy'):
+            try:
+                p.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+# ==================== PROCESS-WIDE DEFAULT ====================
+
+_settings = {'enabled': True, 'directory': None, 'max_size_mb': DEFAULT_MAX_SIZE_MB}
+_default_cache: Optional[PCMCache] = None
+
+
+def configure_pcm_cache(
+    directory: Optional[str] = None,
+    max_size_mb: Optional[float] = None,
+    enabled: bool = True
+) -> None:
+    """
+    Configure the cache used by load_audio().
+
+    Args:
+        directory: Cache directory (None = environment variable or default)
+        max_size_mb: Size cap (None = DEFAULT_MAX_SIZE_MB)
+        enabled: False makes load_audio() a plain librosa.load
+    """
+    global _default_cache
+    _settings.update(
+        enabled=enabled,
+        directory=directory,
+        max_size_mb=DEFAULT_MAX_SIZE_MB if max_size_mb is None else max_size_mb
+    )
+    _default_cache = None
+
+
+def configure_pcm_cache_from_config(config) -> None:
+    """Apply the decoded_audio* settings of the config's cache section."""
+    configure_pcm_cache(
+        directory=config.get('cache', 'decoded_audio_directory'),
+        max_size_mb=config.get('cache', 'decoded_audio_max_size_mb'),
+        enabled=config.get('cache', 'decoded_audio', default=True)
+    )
+
+
+def get_pcm_cache() -> Optional[PCMCache]:
+    """The process-wide PCMCache, or None if caching is disabled or unavailable."""
+    global _default_cache
+    if _default_cache is None and _settings['enabled']:
+        directory = _settings['directory'] or os.environ.get(CACHE_DIR_ENV) or str(DEFAULT_CACHE_DIR)
+        if directory.lower() == 'off':
+            _settings['enabled'] = False
+            return None
+        try:
+            _default_cache = PCMCache(directory, max_size_mb=_settings['max_size_mb'])
+        except OSError:
+            _settings['enabled'] = False
+    return _default_cache
+
+
+def load_audio(
+    path: str,
+    sr: Optional[int] = 22050,
+    mono: bool = True,
+    offset: float = 0.0,
+    duration: Optional[float] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    Drop-in replacement for librosa.load backed by the PCM cache.
+
+    Arrays served from the cache are read-only; copy before modifying in place.
+
+    Returns:
+        (y, sr) as returned by librosa.load
+    """
+    cache = get_pcm_cache()
+    if cache is None:
+        return librosa.load(str(path), sr=sr, mono=mono, offset=offset, duration=duration)
+    return cache.load(str(path), sr=sr, mono=mono, offset=offset, duration=duration)
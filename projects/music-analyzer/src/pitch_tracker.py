@@ -0,0 +1,411 @@
+"""
+Pitch Tracking Module.
+
+Pluggable monophonic F0 trackers with a shared interface:
+- 'fast'      Vectorized YIN: every analyzed frame's difference function
+              is computed in one FFT pass, frames quieter than a threshold
+              are skipped entirely
+- 'accurate'  librosa.pyin (probabilistic YIN with HMM smoothing); much
+              slower, but more stable voicing decisions on dense mixes
+
+Both trackers return a PitchTrack on librosa.pyin's frame grid (centered
+frames, 1 + len(y) // hop_length of them, f0 = NaN where unvoiced), so
+callers can switch methods without touching their post-processing.
+
+Either tracker can be restricted to time regions (e.g. a few seconds of
+each arrangement section) with section_regions(); frames outside the
+regions are reported as unvoiced.
+
+Usage:
+    tracker = get_pitch_tracker('fast', fmin=65.4, fmax=2093.0)
+    track = tracker.track(y, sr)
+    notes = track.f0[track.voiced_flag]
+
+    # Compare against pyin
+    agreement = compare_tracks(reference=pyin_track, candidate=track)
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import librosa
+
+
+@dataclass
+class PitchTrack:
+    """Frame-wise F0 estimate."""
+    f0: np.ndarray              # Hz per frame, NaN where unvoiced
+    voiced_flag: np.ndarray     # bool per frame
+    voiced_prob: np.ndarray     # 0-1 per frame
+    times: np.ndarray           # Frame centers in seconds
+    method: str                 # Tracker name, e.g. 'yin' or 'pyin'
+    frames_analyzed: int        # Frames actually analyzed after gating/sampling
+
+
+class PitchTracker(ABC):
+    """Base class for F0 trackers."""
+
+    name = ''
+
+    def __init__(
+        self,
+        fmin: float = 65.4,
+        fmax: float = 2093.0,
+        frame_length: int = 2048,
+        hop_length: int = 512
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            fmin: Lowest detectable F0 in Hz (default C2)
+            fmax: Highest detectable F0 in Hz (default C7)
+            frame_length: Analysis frame length in samples
+            hop_length: Samples between frame centers
+        """
+        self.fmin = fmin
+        self.fmax = fmax
+        self.frame_length = frame_length
+        self.hop_length = hop_length
+
+    @abstractmethod
+    def track(
+        self,
+        y: np.ndarray,
+        sr: int,
+        regions: Optional[Sequence[Tuple[float, float]]] = None
+    ) -> PitchTrack:
+        """
+        Estimate F0 for every frame of a mono signal.
+
+        Args:
+            y: Mono audio
+            sr: Sample rate
+            regions: Optional (start, end) times in seconds to analyze;
+                     frames outside them are reported as unvoiced
+
+        Returns:
+            PitchTrack on pyin's frame grid
+        """
+
+    def _frame_mask(self, n_samples: int, sr: int, regions) -> np.ndarray:
+        """Frames whose centers fall inside the requested regions."""
+        n_frames = 1 + n_samples // self.hop_length
+        if regions is None:
+            return np.ones(n_frames, dtype=bool)
+        mask = np.zeros(n_frames, dtype=bool)
+        for start, end in regions:
+            lo = max(0, int(np.ceil(start * sr / self.hop_length)))
+            hi = min(n_frames, int(np.floor(end * sr / self.hop_length)) + 1)
+            mask[lo:hi] = True
+        return mask
+
+    def _empty_track(self, n_frames: int, sr: int) -> PitchTrack:
+        return PitchTrack(
+            f0=np.full(n_frames, np.nan),
+            voiced_flag=np.zeros(n_frames, dtype=bool),
+            voiced_prob=np.zeros(n_frames),
+            times=librosa.frames_to_time(np.arange(n_frames), sr=sr, hop_length=self.hop_length),
+            method=self.name,
+            frames_analyzed=0
+        )
+
+
+# ==================== FAST (VECTORIZED YIN) ====================
+
+class YinPitchTracker(PitchTracker):
+    """Vectorized YIN with RMS voicing gate."""
+
+    name = 'yin'
+
+    # Frames per FFT batch; bounds peak memory to a few tens of MB
+    _BATCH_FRAMES = 1024
+
+    def __init__(
+        self,
+        fmin: float = 65.4,
+        fmax: float = 2093.0,
+        frame_length: int = 2048,
+        hop_length: int = 512,
+        threshold: float = 0.15,
+        rms_threshold_db: Optional[float] = -50.0
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            fmin: Lowest detectable F0 in Hz
+            fmax: Highest detectable F0 in Hz
+            frame_length: Analysis frame length in samples
+            hop_length: Samples between frame centers
+            threshold: YIN dip threshold on the cumulative mean normalized
+                       difference; frames without a dip below it are unvoiced
+            rms_threshold_db: Skip frames more than this many dB below the
+                              loudest frame (None = analyze every frame)
+        """
+        super().__init__(fmin, fmax, frame_length, hop_length)
+        self.threshold = threshold
+        self.rms_threshold_db = rms_threshold_db
+
+    def track(
+        self,
+        y: np.ndarray,
+        sr: int,
+        regions: Optional[Sequence[Tuple[float, float]]] = None
+    ) -> PitchTrack:
+        y = np.asarray(y, dtype=np.float64)
+        n_frames = 1 + len(y) // self.hop_length
+        result = self._empty_track(n_frames, sr)
+
+        win_length = self.frame_length // 2
+        tau_min = max(1, int(np.floor(sr / self.fmax)))
+        tau_max = min(int(np.ceil(sr / self.fmin)), self.frame_length - win_length - 1)
+        if tau_min >= tau_max:
+            return result
+
+        # Centered, zero-padded frames, as in librosa.pyin
+        pad = self.frame_length // 2
+        y_pad = np.pad(y, pad)
+        starts = np.arange(n_frames) * self.hop_length
+
+        mask = self._frame_mask(len(y), sr, regions)
+        if self.rms_threshold_db is not None:
+            power = np.concatenate(([0.0], np.cumsum(y_pad ** 2)))
+            rms = np.sqrt(np.maximum(power[starts + self.frame_length] - power[starts], 0.0)
+                          / self.frame_length)
+            peak = rms.max() if len(rms) else 0.0
+            if peak <= 0:
+                return result
+            mask &= rms > peak * 10 ** (self.rms_threshold_db / 20)
+
+        selected = np.flatnonzero(mask)
+        offsets = np.arange(self.frame_length)
+        for lo in range(0, len(selected), self._BATCH_FRAMES):
+            idx = selected[lo:lo + self._BATCH_FRAMES]
+            frames = y_pad[starts[idx, None] + offsets]
+            f0, voiced, prob = self._yin(frames, sr, win_length, tau_min, tau_max)
+            result.f0[idx] = np.where(voiced, f0, np.nan)
+            result.voiced_flag[idx] = voiced
+            result.voiced_prob[idx] = prob
+
+        result.frames_analyzed = len(selected)
+        return result
+
+    def _yin(
+        self,
+        frames: np.ndarray,
+        sr: int,
+        win_length: int,
+        tau_min: int,
+        tau_max: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """YIN on a (n_frames, frame_length) batch; returns (f0, voiced, voiced_prob)."""
+        n_fft = self.frame_length
+        lags = tau_max + 2      # one past tau_max for the local-minimum test
+
+        # Autocorrelation of the first win_length samples against every lag
+        spectrum = np.fft.rfft(frames, n_fft, axis=1)
+        head = np.fft.rfft(frames[:, :win_length], n_fft, axis=1)
+        acf = np.fft.irfft(spectrum * np.conj(head), n_fft, axis=1)[:, :lags]
+
+        # Energy of each lagged window from a running sum of squares
+        power = np.concatenate(
+            (np.zeros((len(frames), 1)), np.cumsum(frames ** 2, axis=1)), axis=1
+        )
+        energy = power[:, win_length:win_length + lags] - power[:, :lags]
+
+        diff = np.maximum(energy[:, :1] + energy - 2 * acf, 0.0)
+        diff[:, 0] = 0.0
+
+        # Cumulative mean normalized difference
+        running = np.cumsum(diff[:, 1:], axis=1)
+        cmnd = np.ones_like(diff)
+        np.divide(diff[:, 1:] * np.arange(1, lags), running, out=cmnd[:, 1:], where=running > 0)
+
+        # First local minimum below threshold, else the global minimum
+        search = cmnd[:, tau_min:tau_max + 1]
+        is_min = ((search <= cmnd[:, tau_min - 1:tau_max]) &
+                  (search <= cmnd[:, tau_min + 1:tau_max + 2]))
+        dips = is_min & (search < self.threshold)
+        voiced = dips.any(axis=1)
+        best = np.where(voiced, dips.argmax(axis=1), search.argmin(axis=1)) + tau_min
+
+        # Parabolic interpolation around the chosen lag
+        rows = np.arange(len(frames))
+        prev, here, nxt = cmnd[rows, best - 1], cmnd[rows, best], cmnd[rows, best + 1]
+        curvature = prev - 2 * here + nxt
+        shift = np.zeros(len(frames))
+        np.divide(0.5 * (prev - nxt), curvature, out=shift, where=curvature > 0)
+        period = best + np.clip(shift, -1.0, 1.0)
+
+        f0 = sr / period
+        voiced &= (f0 >= self.fmin) & (f0 <= self.fmax)
+        return f0, voiced, np.clip(1.0 - here, 0.0, 1.0)
+
+
+# ==================== ACCURATE (PYIN) ====================
+
+class PyinPitchTracker(PitchTracker):
+    """librosa.pyin, optionally restricted to regions."""
+
+    name = 'pyin'
+
+    def track(
+        self,
+        y: np.ndarray,
+        sr: int,
+        regions: Optional[Sequence[Tuple[float, float]]] = None
+    ) -> PitchTrack:
+        y = np.asarray(y)
+        n_frames = 1 + len(y) // self.hop_length
+
+        if regions is None:
+            f0, voiced_flag, voiced_prob = librosa.pyin(
+                y, fmin=self.fmin, fmax=self.fmax, sr=sr,
+                frame_length=self.frame_length, hop_length=self.hop_length
+            )
+            return PitchTrack(
+                f0=f0, voiced_flag=voiced_flag, voiced_prob=voiced_prob,
+                times=librosa.times_like(f0, sr=sr, hop_length=self.hop_length),
+                method=self.name, frames_analyzed=len(f0)
+            )
+
+        # Imported here: feature_extraction's acid detector imports this module
+        try:
+            from .feature_extraction.kernels import runs
+        except ImportError:
+            from feature_extraction.kernels import runs
+
+        # Run pyin per region on hop-aligned slices and place the frames back
+        result = self._empty_track(n_frames, sr)
+        mask = self._frame_mask(len(y), sr, regions)
+        first, last = runs(mask)
+        for lo, hi in zip(first, last):
+            segment = y[lo * self.hop_length:(hi - 1) * self.hop_length + 1]
+            f0, voiced_flag, voiced_prob = librosa.pyin(
+                segment, fmin=self.fmin, fmax=self.fmax, sr=sr,
+                frame_length=self.frame_length, hop_length=self.hop_length
+            )
+            count = min(len(f0), hi - lo)
+            result.f0[lo:lo + count] = f0[:count]
+            result.voiced_flag[lo:lo + count] = voiced_flag[:count]
+            result.voiced_prob[lo:lo + count] = voiced_prob[:count]
+            result.frames_analyzed += count
+        return result
+
+
+# ==================== REGISTRY ====================
+
+PITCH_TRACKERS: Dict[str, Type[PitchTracker]] = {
+    'fast': YinPitchTracker,
+    'accurate': PyinPitchTracker,
+    'yin': YinPitchTracker,
+    'pyin': PyinPitchTracker,
+}
+
+
+def get_pitch_tracker(method: str = 'fast', **kwargs) -> PitchTracker:
+    """
+    Create a tracker by name.
+
+    Args:
+        method: 'fast' / 'yin' or 'accurate' / 'pyin'
+        **kwargs: Tracker settings (fmin, fmax, frame_length, hop_length, ...)
+
+    Returns:
+        PitchTracker instance
+    """
+    if method not in PITCH_TRACKERS:
+        raise ValueError(f"Unknown pitch tracking method '{method}'. "
+                         f"Available: {', '.join(PITCH_TRACKERS)}")
+    tracker_cls = PITCH_TRACKERS[method]
+    if tracker_cls is PyinPitchTracker:
+        # pyin has its own voicing model
+        kwargs.pop('threshold', None)
+        kwargs.pop('rms_threshold_db', None)
+    return tracker_cls(**kwargs)
+
+
+def section_regions(
+    sections: Sequence,
+    seconds_per_section: float
+) -> List[Tuple[float, float]]:
+    """
+    Sample a window from the middle of each section.
+
+    Args:
+        sections: Objects with start_time and end_time (seconds)
+        seconds_per_section: Window length; shorter sections are used whole
+
+    Returns:
+        (start, end) regions in seconds
+    """
+    regions = []
+    for section in sections:
+        length = section.end_time - section.start_time
+        if length <= seconds_per_section:
+            regions.append((section.start_time, section.end_time))
+        else:
+            start = section.start_time + (length - seconds_per_section) / 2
+            regions.append((start, start + seconds_per_section))
+    return regions
+
+
+# ==================== COMPARISON ====================
+
+def compare_tracks(
+    reference: PitchTrack,
+    candidate: PitchTrack,
+    tolerance_cents: float = 50.0,
+    min_note_frames: int = 3
+) -> Dict[str, float]:
+    """
+    Agreement of a candidate track with a reference track.
+
+    Notes are runs of reference frames that round to the same MIDI pitch.
+    A note agrees if the candidate's median pitch over it rounds to the same
+    MIDI pitch.
+
+    Args:
+        reference: Reference track (usually pyin)
+        candidate: Track being evaluated
+        tolerance_cents: Frame-level pitch tolerance
+        min_note_frames: Shorter reference runs are not counted as notes
+
+    Returns:
+        Dict with voicing_agreement, pitch_agreement (share of frames voiced
+        in both within tolerance), note_agreement and note_count
+    """
+    n = min(len(reference.f0), len(candidate.f0))
+    ref_f0, cand_f0 = reference.f0[:n], candidate.f0[:n]
+    ref_voiced, cand_voiced = reference.voiced_flag[:n], candidate.voiced_flag[:n]
+
+    both = ref_voiced & cand_voiced & np.isfinite(ref_f0) & np.isfinite(cand_f0)
+    cents = 1200 * np.abs(np.log2(cand_f0[both] / ref_f0[both]))
+
+    ref_midi = np.full(n, -1)
+    ref_midi[ref_voiced & np.isfinite(ref_f0)] = np.round(
+        librosa.hz_to_midi(ref_f0[ref_voiced & np.isfinite(ref_f0)])
+    ).astype(int)
+    boundaries = np.flatnonzero(np.diff(ref_midi)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [n]))
+
+    note_count = 0
+    note_matches = 0
+    for start, end in zip(starts, ends):
+        if ref_midi[start] < 0 or end - start < min_note_frames:
+            continue
+        note_count += 1
+        pitches = cand_f0[start:end][cand_voiced[start:end] & np.isfinite(cand_f0[start:end])]
+        if len(pitches) and int(np.round(librosa.hz_to_midi(np.median(pitches)))) == ref_midi[start]:
+            note_matches += 1
+
+    return {
+        'voicing_agreement': float(np.mean(ref_voiced == cand_voiced)) if n else 0.0,
+        'pitch_agreement': float(np.mean(cents <= tolerance_cents)) if len(cents) else 0.0,
+        'note_agreement': note_matches / note_count if note_count else 0.0,
+        'note_count': note_count,
+    }
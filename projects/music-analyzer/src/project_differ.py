@@ -5,14 +5,20 @@ Compares two Ableton Live Set (.als) files to show what changed.
 Tracks whether changes are improvements or regressions.
 
 Use this to answer: "Did my tweaks make the song better or worse?"
+
+Device analyses carry subtree hashes (see device_chain_analyzer): tracks and
+devices whose hash did not change are skipped, two versions with the same
+root hash are reported as unchanged without comparing anything, and the
+diagnosis of each distinct analysis is computed once per differ.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple, Set
 from pathlib import Path
 from device_chain_analyzer import (
     ProjectDeviceAnalysis, TrackDeviceChain, Device, DeviceCategory,
-    DeviceChainAnalyzer, analyze_als_devices
+    DeviceChainAnalyzer, analyze_als_devices, device_hash, project_hash, track_hash
 )
 from effect_chain_doctor import (
     ProjectDiagnosis, diagnose_project, EffectChainDoctor
@@ -86,10 +92,27 @@ class ProjectDiffer:
     Helps producers track whether their changes are improvements.
     """
 
+    # Diagnoses kept per differ, keyed by the analysis root hash
+    DIAGNOSIS_CACHE_SIZE = 64
+
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         self.analyzer = DeviceChainAnalyzer(verbose=verbose)
         self.doctor = EffectChainDoctor(verbose=verbose)
+        self._diagnoses: 'OrderedDict[str, ProjectDiagnosis]' = OrderedDict()
+
+    def _diagnose(self, analysis: ProjectDeviceAnalysis) -> ProjectDiagnosis:
+        """Diagnose an analysis, reusing the result for identical content."""
+        key = project_hash(analysis)
+        diagnosis = self._diagnoses.get(key)
+        if diagnosis is None:
+            diagnosis = self.doctor.diagnose(analysis)
+            self._diagnoses[key] = diagnosis
+            while len(self._diagnoses) > self.DIAGNOSIS_CACHE_SIZE:
+                self._diagnoses.popitem(last=False)
+        else:
+            self._diagnoses.move_to_end(key)
+        return diagnosis
 
     def compare(self, before_path: str, after_path: str) -> ProjectDiff:
         """
@@ -106,9 +129,34 @@ class ProjectDiffer:
         before_analysis = self.analyzer.analyze(before_path)
         after_analysis = self.analyzer.analyze(after_path)
 
+        return self.compare_analyses(before_analysis, after_analysis, before_path, after_path)
+
+    def compare_analyses(
+        self,
+        before_analysis: ProjectDeviceAnalysis,
+        after_analysis: ProjectDeviceAnalysis,
+        before_path: str,
+        after_path: str
+    ) -> ProjectDiff:
+        """
+        Compare two already analyzed project versions (e.g. stored snapshots).
+
+        A ProjectDiffer can be reused for many comparisons (e.g. all
+        consecutive versions of a song); each distinct analysis is then
+        diagnosed only once.
+
+        Args:
+            before_analysis: Device analysis of the earlier version
+            after_analysis: Device analysis of the later version
+            before_path: Path reported for the earlier version
+            after_path: Path reported for the later version
+
+        Returns:
+            ProjectDiff with all changes and assessment
+        """
         # Diagnose both
-        before_diag = self.doctor.diagnose(before_analysis)
-        after_diag = self.doctor.diagnose(after_analysis)
+        before_diag = self._diagnose(before_analysis)
+        after_diag = self._diagnose(after_analysis)
 
         diff = ProjectDiff(
             before_path=before_path,
@@ -125,8 +173,9 @@ class ProjectDiffer:
             after_disabled=after_analysis.total_disabled_devices
         )
 
-        # Compare device chains
-        self._compare_devices(before_analysis, after_analysis, diff)
+        # Compare device chains, unless the whole tree is identical
+        if project_hash(before_analysis) != project_hash(after_analysis):
+            self._compare_devices(before_analysis, after_analysis, diff)
 
         # Assess overall improvement
         self._assess_improvement(diff)
@@ -158,11 +207,12 @@ class ProjectDiffer:
                 details=f"Removed track that had {before_tracks[name].total_device_count} devices"
             ))
 
-        # Compare shared tracks
+        # Compare shared tracks whose content changed
         for name in before_names & after_names:
             before_track = before_tracks[name]
             after_track = after_tracks[name]
-            self._compare_track_devices(before_track, after_track, diff)
+            if track_hash(before_track) != track_hash(after_track):
+                self._compare_track_devices(before_track, after_track, diff)
 
     def _compare_track_devices(self, before: TrackDeviceChain,
                               after: TrackDeviceChain, diff: ProjectDiff) -> None:
@@ -204,6 +254,8 @@ class ProjectDiffer:
         for key in before_keys & after_keys:
             before_d = before_devices[key]
             after_d = after_devices[key]
+            if device_hash(before_d) == device_hash(after_d):
+                continue
 
             if before_d.is_enabled and not after_d.is_enabled:
                 diff.device_changes.append(DeviceChange(
@@ -0,0 +1,417 @@
+"""
+Parsed-Project Snapshots
+
+Version history, change tracking and the dashboard comparison view need
+device-level data for old versions. Re-running analyze_als_devices on the
+original .als is slow (large files, OneDrive placeholders) and impossible
+once a version was deleted. This module stores a compact binary snapshot of
+each version's ProjectDeviceAnalysis (and optionally its ALSProject) next to
+the SQLite database:
+
+    data/projects.db
+    data/snapshots/v42.devices.snap
+    data/snapshots/v42.project.snap
+
+A snapshot file is a short JSON header (version id, content hash, file size
+and mtime of the .als it was built from, file format and analysis schema)
+followed by the zlib-compressed pickle of the analysis. Loading one takes
+milliseconds. A snapshot whose format or schema differs from the running
+code is ignored like a missing one, and is rebuilt when the .als exists.
+
+Snapshots are keyed by version id and checked against the .als content:
+- The .als still has the recorded size and mtime: the snapshot is used
+- Size or mtime changed: the file is hashed; a different hash means the
+  snapshot is stale and the version is re-analyzed
+- The .als no longer exists: the snapshot is the only copy and is used
+
+Usage:
+    analysis = load_version_analysis(version_id, als_path)   # snapshot or parse
+    result = backfill_snapshots()                            # existing versions
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+
+SNAPSHOT_FORMAT = 1
+# Bump a kind's schema when its pickled class (ProjectDeviceAnalysis,
+# ALSProject) or the analysis that fills it changes, so old snapshots are
+# rebuilt instead of served with missing or outdated fields
+SNAPSHOT_SCHEMAS = {'devices': 1, 'project': 1}
+SNAPSHOT_DIRNAME = "snapshots"
+SNAPSHOT_KINDS = ('devices', 'project')
+
+_MAGIC = b'ALSSNAP'
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+@dataclass
+class SnapshotInfo:
+    """Header of a stored snapshot."""
+    version_id: int
+    kind: str                   # 'devices' (ProjectDeviceAnalysis) or 'project' (ALSProject)
+    content_hash: str           # SHA-256 of the .als the snapshot was built from
+    als_path: str
+    file_size: int
+    file_mtime_ns: int
+    created_at: str
+    path: Path
+    size_bytes: int
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of backfill_snapshots()."""
+    created: int = 0
+    up_to_date: int = 0
+    missing_files: int = 0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def file_content_hash(als_path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(als_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SnapshotStore:
+    """Directory of per-version analysis snapshots."""
+
+    def __init__(self, directory: Path):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Snapshot directory (created on first save)
+        """
+        self.directory = Path(directory)
+
+    def _path(self, version_id: int, kind: str) -> Path:
+        if kind not in SNAPSHOT_KINDS:
+            raise ValueError(f"Unknown snapshot kind: {kind}")
+        return self.directory / f"v{int(version_id)}.{kind}.snap"
+
+    # ==================== WRITE ====================
+
+    def save(
+        self,
+        version_id: int,
+        als_path: str,
+        obj: Any,
+        kind: str = 'devices',
+        content_hash: Optional[str] = None
+    ) -> SnapshotInfo:
+        """
+        Store a snapshot, replacing any previous one of the same version and kind.
+
+        Args:
+            version_id: versions.id of the analyzed file
+            als_path: The .als the object was built from
+            obj: ProjectDeviceAnalysis or ALSProject
+            kind: 'devices' or 'project'
+            content_hash: SHA-256 of the .als (computed if None)
+
+        Returns:
+            SnapshotInfo of the written file
+        """
+        path = self._path(version_id, kind)
+        stat = os.stat(als_path)
+        header = {
+            'format': SNAPSHOT_FORMAT,
+            'schema': SNAPSHOT_SCHEMAS[kind],
+            'version_id': int(version_id),
+            'kind': kind,
+            'content_hash': content_hash or file_content_hash(als_path),
+            'als_path': str(als_path),
+            'file_size': stat.st_size,
+            'file_mtime_ns': stat.st_mtime_ns,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        header_bytes = json.dumps(header).encode('utf-8')
+        payload = zlib.compress(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), 6)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(len(header_bytes).to_bytes(4, 'little'))
+            f.write(header_bytes)
+            f.write(payload)
+        os.replace(tmp_path, path)
+        return self._info(header, path)
+
+    def delete(self, version_id: int) -> int:
+        """Remove all snapshots of a version and return how many there were."""
+        removed = 0
+        for kind in SNAPSHOT_KINDS:
+            try:
+                self._path(version_id, kind).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    # ==================== READ ====================
+
+    @staticmethod
+    def _read_header(f) -> Optional[dict]:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            return None
+        length = int.from_bytes(f.read(4), 'little')
+        try:
+            header = json.loads(f.read(length).decode('utf-8'))
+        except ValueError:
+            return None
+        if header.get('format') != SNAPSHOT_FORMAT:
+            return None
+        if header.get('schema') != SNAPSHOT_SCHEMAS.get(header.get('kind')):
+            return None
+        return header
+
+    @staticmethod
+    def _info(header: dict, path: Path) -> SnapshotInfo:
+        return SnapshotInfo(
+            version_id=header['version_id'],
+            kind=header['kind'],
+            content_hash=header['content_hash'],
+            als_path=header['als_path'],
+            file_size=header['file_size'],
+            file_mtime_ns=header['file_mtime_ns'],
+            created_at=header['created_at'],
+            path=path,
+            size_bytes=path.stat().st_size
+        )
+
+    def info(self, version_id: int, kind: str = 'devices') -> Optional[SnapshotInfo]:
+        """Header of a version's snapshot, or None if there is none."""
+        path = self._path(version_id, kind)
+        try:
+            with open(path, 'rb') as f:
+                header = self._read_header(f)
+        except OSError:
+            return None
+        return self._info(header, path) if header else None
+
+    def is_current(self, info: SnapshotInfo, als_path: Optional[str] = None) -> bool:
+        """
+        Whether a snapshot still describes its .als file.
+
+        Args:
+            info: Snapshot header
+            als_path: Current location of the file (default: the recorded one)
+        """
+        als_path = als_path or info.als_path
+        try:
+            stat = os.stat(als_path)
+        except OSError:
+            return True     # File gone: the snapshot is all that is left
+        if (stat.st_size, stat.st_mtime_ns) == (info.file_size, info.file_mtime_ns):
+            return True
+        try:
+            return file_content_hash(als_path) == info.content_hash
+        except OSError:
+            return True
+
+    def load(
+        self,
+        version_id: int,
+        kind: str = 'devices',
+        als_path: Optional[str] = None,
+        verify: bool = True
+    ) -> Optional[Any]:
+        """
+        Load a version's snapshot.
+
+        Args:
+            version_id: versions.id
+            kind: 'devices' or 'project'
+            als_path: Current location of the .als (default: the recorded one)
+            verify: Return None if the .als changed since the snapshot was taken
+
+        Returns:
+            The stored object, or None if missing, stale or unreadable
+        """
+        path = self._path(version_id, kind)
+        try:
+            with open(path, 'rb') as f:
+                header = self._read_header(f)
+                if header is None:
+                    return None
+                if verify and not self.is_current(self._info(header, path), als_path):
+                    return None
+                return pickle.loads(zlib.decompress(f.read()))
+        except (OSError, zlib.error, pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+            # Missing file, or classes that moved since it was written
+            return None
+
+    def list_snapshots(self) -> List[SnapshotInfo]:
+        """Headers of all stored snapshots."""
+        infos = []
+        for path in sorted(self.directory.glob('v*.snap')):
+            try:
+                with open(path, 'rb') as f:
+                    header = self._read_header(f)
+            except OSError:
+                continue
+            if header:
+                infos.append(self._info(header, path))
+        return infos
+
+
+# ==================== DATABASE INTEGRATION ====================
+
+
+def get_snapshot_store(db_path: Optional[Path] = None) -> SnapshotStore:
+    """The snapshot store next to a database (default: data/snapshots)."""
+    try:
+        from database import DEFAULT_DB_PATH
+    except ImportError:
+        from .database import DEFAULT_DB_PATH
+    return SnapshotStore(Path(db_path or DEFAULT_DB_PATH).parent / SNAPSHOT_DIRNAME)
+
+
+def _analyze_devices(als_path: str):
+    try:
+        from device_chain_analyzer import analyze_als_devices
+    except ImportError:
+        from .device_chain_analyzer import analyze_als_devices
+    return analyze_als_devices(als_path)
+
+
+def _parse_project(als_path: str):
+    try:
+        from als_parser import ALSParser
+    except ImportError:
+        from .als_parser import ALSParser
+    return ALSParser().parse(als_path)
+
+
+def load_version_analysis(
+    version_id: int,
+    als_path: str,
+    db_path: Optional[Path] = None,
+    kind: str = 'devices',
+    parse: bool = True
+) -> Optional[Any]:
+    """
+    Device analysis (or ALSProject) of a stored version.
+
+    Served from the version's snapshot when it is current. Otherwise the .als
+    is parsed and a new snapshot is written.
+
+    Args:
+        version_id: versions.id
+        als_path: Path of the version's .als file
+        db_path: Optional custom path for the database
+        kind: 'devices' (ProjectDeviceAnalysis) or 'project' (ALSProject)
+        parse: Parse the .als if there is no current snapshot
+
+    Returns:
+        The analysis, or None if there is no snapshot and parse is False or
+        the file is gone
+    """
+    store = get_snapshot_store(db_path)
+    obj = store.load(version_id, kind, als_path)
+    if obj is not None or not parse or not Path(als_path).exists():
+        return obj
+
+    obj = _analyze_devices(als_path) if kind == 'devices' else _parse_project(als_path)
+    try:
+        store.save(version_id, als_path, obj, kind)
+    except OSError:
+        pass    # Read-only data folder: still return the fresh analysis
+    return obj
+
+
+def save_version_snapshot(
+    version_id: int,
+    als_path: str,
+    obj: Any,
+    db_path: Optional[Path] = None,
+    kind: str = 'devices'
+) -> bool:
+    """Store a snapshot for a version; returns False if it could not be written."""
+    try:
+        get_snapshot_store(db_path).save(version_id, als_path, obj, kind)
+        return True
+    except OSError:
+        return False
+
+
+def backfill_snapshots(
+    db_path: Optional[Path] = None,
+    include_project: bool = False,
+    force: bool = False,
+    progress: Optional[Callable[[int, int, str], None]] = None
+) -> BackfillResult:
+    """
+    Create snapshots for stored versions that do not have a current one.
+
+    Args:
+        db_path: Optional custom path for the database
+        include_project: Also store the full ALSProject of each version
+        force: Rebuild snapshots even if they are current
+        progress: Called with (index, total, als_filename) before each version
+
+    Returns:
+        BackfillResult with counts per outcome
+    """
+    try:
+        from database import Database
+    except ImportError:
+        from .database import Database
+
+    db = Database(db_path)
+    result = BackfillResult()
+    if not db.is_initialized():
+        result.errors.append("Database not initialized. Run 'als-doctor db init' first.")
+        return result
+
+    with db.connection() as conn:
+        versions = conn.execute(
+            "SELECT id, als_path, als_filename FROM versions ORDER BY id"
+        ).fetchall()
+
+    store = get_snapshot_store(db_path)
+    kinds = SNAPSHOT_KINDS if include_project else ('devices',)
+
+    for index, row in enumerate(versions, 1):
+        if progress:
+            progress(index, len(versions), row['als_filename'])
+
+        als_path = row['als_path']
+        pending = []
+        for kind in kinds:
+            info = store.info(row['id'], kind)
+            if force or info is None or not store.is_current(info, als_path):
+                pending.append(kind)
+
+        if not pending:
+            result.up_to_date += 1
+            continue
+        if not Path(als_path).exists():
+            result.missing_files += 1
+            continue
+
+        try:
+            content_hash = file_content_hash(als_path)
+            for kind in pending:
+                obj = _analyze_devices(als_path) if kind == 'devices' else _parse_project(als_path)
+                store.save(row['id'], als_path, obj, kind, content_hash=content_hash)
+            result.created += 1
+        except Exception as e:
+            result.failed += 1
+            result.errors.append(f"{row['als_filename']}: {e}")
+
+    return result
@@ -26,13 +26,21 @@ try:
         StructureDetector, StructureResult, Section, SectionType
     )
     from .audio_analyzer import AudioAnalyzer
+    from .loudness_meter import measure_loudness
     from .stem_separator import StemSeparator, StemType, DEMUCS_AVAILABLE
+    from .result_cache import ResultCache
+    from .pcm_cache import load_audio
+    from .pitch_tracker import get_pitch_tracker, section_regions
 except ImportError:
     from structure_detector import (
         StructureDetector, StructureResult, Section, SectionType
     )
     from audio_analyzer import AudioAnalyzer
+    from loudness_meter import measure_loudness
     from stem_separator import StemSeparator, StemType, DEMUCS_AVAILABLE
+    from result_cache import ResultCache
+    from pcm_cache import load_audio
+    from pitch_tracker import get_pitch_tracker, section_regions
 
 
 @dataclass
@@ -100,7 +108,7 @@ class MelodyAnalysis:
     notes: List[MelodyNote]
 
     # Analysis metadata
-    extraction_method: str  # 'pyin', 'crepe', etc.
+    extraction_method: str  # 'yin', 'pyin', etc.
     source: str  # 'full_mix', 'other_stem', 'vocals_stem'
 
 
@@ -311,7 +319,9 @@ class ReferenceAnalyzer:
         include_stems: bool = False,
         include_melody: bool = False,
         verbose: bool = False,
-        config=None
+        config=None,
+        cache: Optional[ResultCache] = None,
+        pitch_method: Optional[str] = None
     ):
         """
         Initialize the reference analyzer.
@@ -321,11 +331,21 @@ class ReferenceAnalyzer:
             include_melody: Whether to extract melody/pitch data (adds processing time)
             verbose: Enable verbose output
             config: Optional config object
+            cache: Optional result cache; successful analyses are stored and
+                   reused while the file, VERSION and config are unchanged
+            pitch_method: Melody pitch tracker, 'fast' (vectorized YIN) or
+                          'accurate' (pyin); default from config, else 'fast'
         """
         self.include_stems = include_stems
         self.include_melody = include_melody
         self.verbose = verbose
         self.config = config
+        self.cache = cache
+
+        reference_cfg = config.reference if config is not None else {}
+        self.pitch_method = pitch_method or reference_cfg.get('pitch_method', 'fast')
+        self.pitch_rms_threshold_db = reference_cfg.get('pitch_rms_threshold_db', -50.0)
+        self.melody_sample_seconds = reference_cfg.get('melody_sample_seconds')
 
         self.structure_detector = StructureDetector(verbose=verbose)
         self.audio_analyzer = AudioAnalyzer(verbose=verbose, config=config)
@@ -351,6 +371,38 @@ class ReferenceAnalyzer:
             ReferenceAnalysisResult with complete analysis
         """
         path = Path(audio_path)
+        if self.cache is None or not path.exists():
+            return self._analyze(audio_path, progress_callback)
+
+        key = self.cache.make_key(
+            audio_path, 'ReferenceAnalyzer.analyze', self.VERSION, self.config,
+            include_stems=self.stem_separator is not None,
+            include_melody=self.include_melody,
+            pitch_method=self.pitch_method if self.include_melody else None
+        )
+        result = self.cache.get(key)
+        if result is not None:
+            result.source_file = str(path.absolute())
+            if progress_callback:
+                progress_callback(AnalysisProgress(
+                    stage='complete',
+                    progress_pct=100,
+                    message='Using cached analysis'
+                ))
+            return result
+
+        result = self._analyze(audio_path, progress_callback)
+        if result.success:
+            self.cache.put(key, result, source=str(path.absolute()))
+        return result
+
+    def _analyze(
+        self,
+        audio_path: str,
+        progress_callback: Optional[Callable[[AnalysisProgress], None]]
+    ) -> ReferenceAnalysisResult:
+        """Uncached body of analyze()."""
+        path = Path(audio_path)
 
         if not path.exists():
             return self._error_result(audio_path, f"File not found: {audio_path}")
@@ -380,15 +432,18 @@ class ReferenceAnalyzer:
                     message='Analyzing global metrics...'
                 ))
 
-            y, sr = librosa.load(audio_path, sr=22050, mono=False)
+            y, sr = load_audio(audio_path, sr=22050, mono=False)
 
-            # Handle mono vs stereo
+            # Handle mono vs stereo; loudness is measured on the original
+            # channels (soundfile layout), not the duplicated mono pair
             if len(y.shape) == 1:
                 y_mono = y
                 y_stereo = np.vstack([y, y])
+                y_loudness = y
             else:
                 y_mono = librosa.to_mono(y)
                 y_stereo = y
+                y_loudness = y.T
 
             # Global metrics
             global_rms = np.sqrt(np.mean(y_mono ** 2))
@@ -396,8 +451,8 @@ class ReferenceAnalyzer:
             global_peak_db = 20 * np.log10(np.max(np.abs(y_mono)) + 1e-10)
             global_dynamic_range = global_peak_db - global_rms_db
 
-            # Estimate LUFS (approximate)
-            integrated_lufs = global_rms_db - 0.691
+            # BS.1770-4 integrated loudness
+            integrated_lufs = measure_loudness(y_loudness, sr).integrated_lufs
 
             # Global spectral centroid
             global_centroid = float(np.mean(librosa.feature.spectral_centroid(y=y_mono, sr=sr)))
@@ -422,7 +477,7 @@ class ReferenceAnalyzer:
             section_metrics = []
             for i, section in enumerate(structure.sections):
                 metrics = self._analyze_section(
-                    section, i, y_mono, y_stereo, sr,
+                    section, i, y_mono, y_stereo, y_loudness, sr,
                     global_rms_db, global_centroid
                 )
                 section_metrics.append(metrics)
@@ -525,6 +580,7 @@ class ReferenceAnalyzer:
         index: int,
         y_mono: np.ndarray,
         y_stereo: np.ndarray,
+        y_loudness: np.ndarray,
         sr: int,
         global_rms_db: float,
         global_centroid: float
@@ -549,7 +605,7 @@ class ReferenceAnalyzer:
         rms_db = 20 * np.log10(rms + 1e-10)
         peak_db = 20 * np.log10(np.max(np.abs(section_mono)) + 1e-10)
         dynamic_range = peak_db - rms_db
-        lufs = rms_db - 0.691  # Approximate LUFS
+        lufs = measure_loudness(y_loudness[start_sample:end_sample], sr).integrated_lufs
 
         # Frequency metrics
         centroid = float(np.mean(librosa.feature.spectral_centroid(y=section_mono, sr=sr)))
@@ -719,7 +775,7 @@ class ReferenceAnalyzer:
     ) -> StemActivity:
         """Analyze when a stem is active throughout the track."""
 
-        y, sr = librosa.load(stem_path, sr=22050, mono=True)
+        y, sr = load_audio(stem_path, sr=22050, mono=True)
 
         # Compute RMS over time
         frame_length = int(sr * 0.5)  # 0.5 second frames
@@ -822,7 +878,7 @@ class ReferenceAnalyzer:
         for i, section in enumerate(structure.sections):
             if section.section_type == SectionType.BUILDUP:
                 # Load section audio
-                y, sr = librosa.load(
+                y, sr = load_audio(
                     audio_path, sr=22050, mono=True,
                     offset=section.start_time,
                     duration=section.duration_seconds
@@ -1067,27 +1123,32 @@ class ReferenceAnalyzer:
             if separated_stems and 'other' in separated_stems:
                 try:
                     other_path = separated_stems['other'].file_path
-                    melody_audio, _ = librosa.load(other_path, sr=sr, mono=True)
+                    melody_audio, _ = load_audio(other_path, sr=sr, mono=True)
                     source = 'other_stem'
                     if self.verbose:
                         print("  Using 'other' stem for melody extraction")
                 except Exception:
                     pass
 
-            # Extract pitch contour using pyin
+            # Extract pitch contour
             if self.verbose:
-                print("  Extracting pitch contour...")
+                print(f"  Extracting pitch contour ({self.pitch_method})...")
 
-            f0, voiced_flag, voiced_prob = librosa.pyin(
-                melody_audio,
+            tracker = get_pitch_tracker(
+                self.pitch_method,
                 fmin=librosa.note_to_hz('C2'),
                 fmax=librosa.note_to_hz('C7'),
-                sr=sr,
                 frame_length=2048,
-                hop_length=512
+                hop_length=512,
+                rms_threshold_db=self.pitch_rms_threshold_db
+            )
+            regions = None
+            if self.melody_sample_seconds:
+                regions = section_regions(structure.sections, self.melody_sample_seconds)
+            track = tracker.track(melody_audio, sr, regions=regions)
+            f0, voiced_flag, voiced_prob, times = (
+                track.f0, track.voiced_flag, track.voiced_prob, track.times
             )
-
-            times = librosa.times_like(f0, sr=sr, hop_length=512)
 
             # Segment into notes
             if self.verbose:
@@ -1132,7 +1193,7 @@ class ReferenceAnalyzer:
                 overall=overall_metrics,
                 by_section=by_section,
                 notes=notes,
-                extraction_method='pyin',
+                extraction_method=track.method,
                 source=source
             )
 
@@ -18,11 +18,15 @@ import numpy as np
 import librosa
 
 try:
+    from .loudness_meter import measure_loudness
     from .stem_separator import StemSeparator, StemSeparationResult, StemType
     from .reference_storage import ReferenceStorage, ReferenceAnalytics, StemMetrics, TrackMetadata
+    from .pcm_cache import load_audio
 except ImportError:
+    from loudness_meter import measure_loudness
     from stem_separator import StemSeparator, StemSeparationResult, StemType
     from reference_storage import ReferenceStorage, ReferenceAnalytics, StemMetrics, TrackMetadata
+    from pcm_cache import load_audio
 
 
 @dataclass
@@ -391,7 +395,7 @@ class ReferenceComparator:
         Returns:
             StemMetrics with complete analysis
         """
-        y, sr = librosa.load(stem_path, sr=None, mono=False)
+        y, sr = load_audio(stem_path, sr=None, mono=False)
 
         # Handle stereo vs mono
         is_stereo = len(y.shape) > 1 and y.shape[0] == 2
@@ -412,8 +416,8 @@ class ReferenceComparator:
         rms = np.sqrt(np.mean(y_mono ** 2))
         rms_db = float(20 * np.log10(rms + 1e-10))
 
-        # Approximate LUFS
-        integrated_lufs = rms_db - 0.691
+        # BS.1770-4 integrated loudness over the original channels
+        integrated_lufs = measure_loudness(y.T if y.ndim > 1 else y, sr).integrated_lufs
 
         # Dynamic range
         dynamic_range = peak_db - rms_db
@@ -22,6 +22,11 @@ import numpy as np
 import librosa
 import soundfile as sf
 
+try:
+    from .pcm_cache import load_audio
+except ImportError:
+    from pcm_cache import load_audio
+
 
 @dataclass
 class TrackMetadata:
@@ -166,7 +171,7 @@ class ReferenceStorage:
         track_id = self._generate_track_id(audio_path)
 
         # Load audio for basic analysis
-        y, sr = librosa.load(audio_path, sr=None, mono=True)
+        y, sr = load_audio(audio_path, sr=None, mono=True)
         duration = librosa.get_duration(y=y, sr=sr)
 
         # Detect tempo if not provided
@@ -0,0 +1,335 @@
+"""
+Content-Addressed Analysis Result Cache.
+
+Persists AnalysisResult, SectionAnalysisResult and ReferenceAnalysisResult
+objects on disk so re-analyzing an unchanged file is a lookup:
+- Key: SHA-256 of the audio file contents, the analyzer name and version,
+  the config settings and the call parameters that affect the result
+- Values: one pickled result object per entry
+- Index: SQLite table of entry sizes and last access times, used for
+  size-bounded LRU eviction and persistent hit/miss counters
+
+Content hashes are memoized per (path, size, mtime), so a cache hit on a
+large file does not re-read it. The index is opened per operation, so one
+cache directory can be shared by several processes.
+
+Usage:
+    cache = ResultCache("./reports/cache/analysis", max_size_mb=2048)
+    analyzer = AudioAnalyzer(config=cfg, cache=cache)
+    result = analyzer.analyze("mix.wav")     # computed and stored
+    result = analyzer.analyze("mix.wav")     # served from cache
+    print(cache.stats().summary())
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+
+# Config sections that only affect presentation, never analysis results
+CACHE_IRRELEVANT_SECTIONS = ('report', 'cache')
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    source TEXT,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss statistics for a result cache."""
+    hits: int                   # This ResultCache instance
+    misses: int
+    total_hits: int             # Lifetime of the cache directory
+    total_misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (lifetime)."""
+        lookups = self.total_hits + self.total_misses
+        return self.total_hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        mb = 1024 * 1024
+        return (
+            f"{self.hits} hit(s), {self.misses} miss(es) this run; "
+            f"{self.entries} entries, {self.size_bytes / mb:.1f}/{self.max_bytes / mb:.0f} MB, "
+            f"lifetime hit rate {self.hit_rate:.0%}"
+        )
+
+
+def config_fingerprint(config) -> Dict:
+    """
+    Config settings that can change an analysis result.
+
+    Args:
+        config: AnalyzerConfig, plain dict, or None for built-in defaults
+
+    Returns:
+        JSON-serializable dict of every section except presentation-only ones
+    """
+    if config is None:
+        return {}
+    data = config.to_dict() if hasattr(config, 'to_dict') else dict(config)
+    return {k: v for k, v in data.items() if k not in CACHE_IRRELEVANT_SECTIONS}
+
+
+class ResultCache:
+    """Size-bounded, content-addressed on-disk cache of analysis results."""
+
+    def __init__(self, cache_dir: str = "./cache/analysis", max_size_mb: float = 2048.0):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the index and pickled results
+            max_size_mb: Total payload size above which least recently
+                         used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.index_path = self.cache_dir / "index.db"
+        self.hits = 0
+        self.misses = 0
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.index_path), timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _payload_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    # ==================== KEYS ====================
+
+    def file_hash(self, audio_path: str) -> str:
+        """
+        SHA-256 of a file's contents, memoized per (path, size, mtime).
+
+        Args:
+            audio_path: Path to the file
+
+        Returns:
+            Hex digest
+        """
+        path = Path(audio_path).resolve()
+        stat = path.stat()
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT sha256 FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (str(path), stat.st_size, stat.st_mtime_ns)
+            ).fetchone()
+        if row:
+            return row[0]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b''):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                (str(path), stat.st_size, stat.st_mtime_ns, sha256)
+            )
+        return sha256
+
+    def make_key(
+        self,
+        audio_path: str,
+        analyzer: str,
+        version: str,
+        config=None,
+        **params: Any
+    ) -> str:
+        """
+        Build the cache key for one analysis call.
+
+        Args:
+            audio_path: Audio file being analyzed
+            analyzer: Name of the analysis (e.g. 'AudioAnalyzer.analyze')
+            version: Analyzer version; bump it when results change
+            config: Config the analyzer was built with
+            **params: Call parameters that affect the result
+
+        Returns:
+            Hex digest identifying the result
+        """
+        descriptor = json.dumps({
+            'content': self.file_hash(audio_path),
+            'analyzer': analyzer,
+            'version': version,
+            'config': config_fingerprint(config),
+            'params': params,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(descriptor.encode('utf-8')).hexdigest()
+
+    # ==================== LOOKUP / STORE ====================
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached result for `key`, or None on a miss.
+
+        Unreadable entries are dropped and count as misses.
+        """
+        result = None
+        payload_path = self._payload_path(key)
+
+        with self._connect() as conn:
+            found = conn.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+
+        if found:
+            try:
+                with open(payload_path, 'rb') as f:
+                    result = pickle.load(f)
+            except Exception:
+                self._delete(key)
+
+        with self._connect() as conn:
+            if result is not None:
+                conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._bump(conn, 'hits' if result is not None else 'misses')
+
+        if result is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return result
+
+    def put(self, key: str, result: Any, source: str = "") -> None:
+        """
+        Store a result and evict least recently used entries over the size limit.
+
+        Args:
+            key: Key from make_key()
+            result: Picklable result object
+            source: Audio path, recorded for inspection only
+        """
+        payload_path = self._payload_path(key)
+        payload_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp_path = payload_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, payload_path)
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, source, size_bytes, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, source, payload_path.stat().st_size, now, now)
+            )
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the payload fits max_bytes."""
+        with self._connect() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            rows = conn.execute(
+                "SELECT key, size_bytes FROM entries ORDER BY last_access, rowid"
+            ).fetchall()
+
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append(key)
+            total -= size
+
+        for key in evicted:
+            self._delete(key)
+        with self._connect() as conn:
+            self._bump(conn, 'evictions', len(evicted))
+
+    def _delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        try:
+            self._payload_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount)
+        )
+
+    # ==================== MAINTENANCE ====================
+
+    def stats(self) -> CacheStats:
+        """Current hit/miss counters and cache occupancy."""
+        with self._connect() as conn:
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+            entries, size_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries"
+            ).fetchone()
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            total_hits=counters.get('hits', 0),
+            total_misses=counters.get('misses', 0),
+            evictions=counters.get('evictions', 0),
+            entries=entries,
+            size_bytes=size_bytes,
+            max_bytes=self.max_bytes,
+        )
+
+    def clear(self) -> int:
+        """
+        Remove every cached result (counters are kept).
+
+        Returns:
+            Number of entries removed
+        """
+        with self._connect() as conn:
+            keys = [row[0] for row in conn.execute("SELECT key FROM entries").fetchall()]
+        for key in keys:
+            self._delete(key)
+        return len(keys)
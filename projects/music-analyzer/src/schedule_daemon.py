@@ -0,0 +1,418 @@
+"""
+Resident Scheduler Daemon for ALS Doctor
+
+Cron starts a fresh interpreter for every firing, which re-imports the
+analysis stack before scanning. The daemon stays resident instead:
+
+- Schedules sit in an in-memory priority queue ordered by their next run
+  time (the same slots as their cron entries; overdue ones run at start).
+  schedules.json is re-read when it changes, so `schedule add/remove/
+  enable/disable` take effect without a restart.
+- The analysis modules are imported once and, with jobs > 1, one process
+  pool is kept warm and shared by every run.
+- Runs go through run_schedule, so only files changed since their last
+  saved scan are analyzed (the scan manifest shared with `als-doctor scan`)
+  and every run is written to the run log.
+- At most max_concurrent schedules run at a time, and schedules whose
+  folders overlap (the same folder, or one inside the other) never run
+  together; a blocked schedule runs as soon as the conflicting one ends.
+
+While running, the daemon refreshes a heartbeat file. The cron fallback
+(run_scheduled_scans.py and `schedule run-due`) leaves due schedules to the
+daemon while that heartbeat is fresh.
+
+Usage:
+    daemon = ScheduleDaemon(max_concurrent=2, jobs=4)
+    daemon.run_forever()            # Until stop() or Ctrl+C
+"""
+
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+try:
+    from scheduler import (
+        Schedule, ScheduleRunResult, _load_schedules_index, _get_schedules_path,
+        is_schedule_due, next_run_at, run_schedule
+    )
+except ImportError:
+    from .scheduler import (
+        Schedule, ScheduleRunResult, _load_schedules_index, _get_schedules_path,
+        is_schedule_due, next_run_at, run_schedule
+    )
+
+logger = logging.getLogger(__name__)
+
+# Longest sleep between checks of schedules.json and the queue
+DEFAULT_TICK_SECONDS = 30.0
+
+# A heartbeat older than this means the daemon is gone
+HEARTBEAT_TIMEOUT_SECONDS = 120.0
+
+# Completed runs kept in ScheduleDaemon.history
+HISTORY_SIZE = 100
+
+
+def _get_daemon_state_path() -> Path:
+    """Get the path to the daemon heartbeat file."""
+    return Path(__file__).parent.parent.parent.parent / "data" / "scheduler_daemon.json"
+
+
+def read_daemon_state(state_path: Optional[Path] = None) -> Optional[Dict]:
+    """
+    State of a running daemon.
+
+    Returns:
+        Dict with pid, started_at and heartbeat, or None if no daemon has
+        refreshed its heartbeat within HEARTBEAT_TIMEOUT_SECONDS
+    """
+    path = state_path or _get_daemon_state_path()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        heartbeat = datetime.fromisoformat(state['heartbeat'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if (datetime.now() - heartbeat).total_seconds() > HEARTBEAT_TIMEOUT_SECONDS:
+        return None
+    return state
+
+
+def is_daemon_running(state_path: Optional[Path] = None) -> bool:
+    """True if a scheduler daemon is running (fresh heartbeat)."""
+    return read_daemon_state(state_path) is not None
+
+
+def _folders_overlap(a: str, b: str) -> bool:
+    """True if two folders are the same or one contains the other."""
+    a_path, b_path = Path(a).absolute(), Path(b).absolute()
+    return a_path == b_path or a_path in b_path.parents or b_path in a_path.parents
+
+
+@dataclass
+class DaemonRun:
+    """A schedule run made by the daemon."""
+    schedule_id: str
+    schedule_name: str
+    started_at: datetime
+    result: ScheduleRunResult
+    message: str
+    wait_seconds: float = 0.0  # Time between the slot and the start (blocked by other runs)
+
+
+class ScheduleDaemon:
+    """Long-running scheduler with an in-memory queue of schedules."""
+
+    def __init__(
+        self,
+        schedules_path: Optional[Path] = None,
+        db_path: Optional[Path] = None,
+        log_path: Optional[Path] = None,
+        state_path: Optional[Path] = None,
+        max_concurrent: int = 1,
+        jobs: int = 1,
+        tick_seconds: float = DEFAULT_TICK_SECONDS,
+        quiet: bool = True,
+        on_result: Optional[Callable[[DaemonRun], None]] = None
+    ):
+        """
+        Initialize the daemon.
+
+        Args:
+            schedules_path: Optional custom path for schedules.json
+            db_path: Optional custom path for the database
+            log_path: Optional custom path for the run log
+            state_path: Optional custom path for the heartbeat file
+            max_concurrent: Schedules allowed to run at the same time
+            jobs: Analysis worker processes shared by all runs (1 = in the run's thread)
+            tick_seconds: Longest sleep between checks for changed schedules
+            quiet: Suppress per-file logging of runs
+            on_result: Called with each DaemonRun as it finishes (from a run thread)
+        """
+        self.schedules_path = schedules_path or _get_schedules_path()
+        self.db_path = db_path
+        self.log_path = log_path
+        self.state_path = state_path or _get_daemon_state_path()
+        self.max_concurrent = max(1, max_concurrent)
+        self.jobs = max(1, jobs)
+        self.tick_seconds = tick_seconds
+        self.quiet = quiet
+        self.on_result = on_result
+
+        self.history: Deque[DaemonRun] = deque(maxlen=HISTORY_SIZE)
+        self.started_at: Optional[datetime] = None
+
+        # Queue of (run time, sequence, schedule id); entries whose time no
+        # longer matches _next are stale and dropped when popped
+        self._queue: List[Tuple[datetime, int, str]] = []
+        self._sequence = 0
+        self._next: Dict[str, datetime] = {}
+        self._schedules: Dict[str, Schedule] = {}
+        self._running: Dict[str, Schedule] = {}
+        self._schedules_mtime: Optional[int] = None
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._run_pool: Optional[ThreadPoolExecutor] = None
+        self._analysis_pool: Optional[ProcessPoolExecutor] = None
+
+    # ==================== QUEUE ====================
+
+    def _push(self, schedule_id: str, when: datetime) -> None:
+        self._sequence += 1
+        self._next[schedule_id] = when
+        heapq.heappush(self._queue, (when, self._sequence, schedule_id))
+
+    def _first_run(self, schedule: Schedule, now: datetime) -> datetime:
+        return now if is_schedule_due(schedule, now) else next_run_at(schedule, now)
+
+    def reload(self, now: Optional[datetime] = None, force: bool = False) -> bool:
+        """
+        Re-read schedules.json if it changed.
+
+        New and edited schedules are (re)queued, removed and disabled ones
+        are dropped. Running schedules keep running.
+
+        Returns:
+            True if the file was read
+        """
+        now = now or datetime.now()
+        try:
+            mtime = self.schedules_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if not force and mtime == self._schedules_mtime:
+            return False
+
+        index = _load_schedules_index(self.schedules_path)
+        with self._lock:
+            self._schedules_mtime = mtime
+            current = {s.id: s for s in index.schedules if s.enabled}
+
+            for schedule_id in list(self._schedules):
+                if schedule_id not in current:
+                    del self._schedules[schedule_id]
+                    self._next.pop(schedule_id, None)
+
+            for schedule_id, schedule in current.items():
+                previous = self._schedules.get(schedule_id)
+                self._schedules[schedule_id] = schedule
+                if schedule_id in self._running:
+                    continue
+                if previous is None or _slot(previous) != _slot(schedule) \
+                        or schedule_id not in self._next:
+                    self._push(schedule_id, self._first_run(schedule, now))
+        return True
+
+    def next_due(self) -> Optional[datetime]:
+        """Time of the earliest queued run, or None."""
+        with self._lock:
+            return min(self._next.values(), default=None)
+
+    def next_start(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Time of the earliest queued run that can start, or None.
+
+        Due schedules blocked by a running one are left out; the end of
+        that run wakes the loop instead.
+        """
+        now = now or datetime.now()
+        with self._lock:
+            return min((when for schedule_id, when in self._next.items()
+                        if when > now or not self._blocked(self._schedules[schedule_id])),
+                       default=None)
+
+    def queued(self) -> List[Tuple[datetime, Schedule]]:
+        """Queued schedules with their run time, earliest first."""
+        with self._lock:
+            return sorted(((when, self._schedules[sid]) for sid, when in self._next.items()),
+                          key=lambda item: item[0])
+
+    @property
+    def running(self) -> List[Schedule]:
+        with self._lock:
+            return list(self._running.values())
+
+    # ==================== RUNS ====================
+
+    def _blocked(self, schedule: Schedule) -> bool:
+        return len(self._running) >= self.max_concurrent or any(
+            _folders_overlap(schedule.folder_path, other.folder_path)
+            for other in self._running.values()
+        )
+
+    def start_due(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Start every queued schedule whose time has come.
+
+        Schedules over the concurrency limit or overlapping a running
+        schedule stay queued, in order, until a run finishes.
+
+        Returns:
+            IDs of the schedules started
+        """
+        now = now or datetime.now()
+        started, blocked = [], []
+
+        with self._lock:
+            while self._queue and self._queue[0][0] <= now:
+                when, sequence, schedule_id = heapq.heappop(self._queue)
+                if self._next.get(schedule_id) != when:
+                    continue
+                schedule = self._schedules[schedule_id]
+                if self._blocked(schedule):
+                    blocked.append((when, sequence, schedule_id))
+                    continue
+
+                del self._next[schedule_id]
+                self._running[schedule_id] = schedule
+                self._run_pool.submit(self._run, schedule, when)
+                started.append(schedule_id)
+
+            for entry in blocked:
+                heapq.heappush(self._queue, entry)
+
+        return started
+
+    def _run(self, schedule: Schedule, slot: datetime) -> None:
+        started_at = datetime.now()
+        try:
+            result, message = run_schedule(
+                schedule.id, self.schedules_path, quiet=self.quiet,
+                db_path=self.db_path, log_path=self.log_path,
+                jobs=self.jobs, executor=self._analysis_pool
+            )
+        except Exception as e:  # run_schedule reports its own errors; this is a bug guard
+            logger.exception(f"Schedule {schedule.name} crashed")
+            result = ScheduleRunResult(schedule.id, schedule.name, success=False,
+                                       error_message=str(e))
+            message = str(e)
+
+        run = DaemonRun(
+            schedule_id=schedule.id,
+            schedule_name=schedule.name,
+            started_at=started_at,
+            result=result,
+            message=message,
+            wait_seconds=max(0.0, (started_at - slot).total_seconds())
+        )
+
+        with self._lock:
+            del self._running[schedule.id]
+            self.history.append(run)
+            current = self._schedules.get(schedule.id)
+            if current is not None and schedule.id not in self._next:
+                self._push(schedule.id, next_run_at(current, datetime.now()))
+
+        if self.on_result:
+            try:
+                self.on_result(run)
+            except Exception:
+                logger.exception("on_result callback failed")
+        self._wake.set()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no schedule is running. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.running:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    # ==================== LIFECYCLE ====================
+
+    def warm_up(self) -> None:
+        """Import the analysis stack once and start the shared pools."""
+        try:
+            import als_scan, database, device_chain_analyzer, effect_chain_doctor  # noqa: F401
+        except ImportError:
+            from . import als_scan, database, device_chain_analyzer, effect_chain_doctor  # noqa: F401
+
+        if self._run_pool is None:
+            self._run_pool = ThreadPoolExecutor(max_workers=self.max_concurrent,
+                                                thread_name_prefix="schedule-run")
+        if self._analysis_pool is None and self.jobs > 1:
+            self._analysis_pool = ProcessPoolExecutor(max_workers=self.jobs)
+
+    def heartbeat(self) -> None:
+        """Write the heartbeat file the cron fallback checks."""
+        state = {
+            'pid': os.getpid(),
+            'started_at': (self.started_at or datetime.now()).isoformat(),
+            'heartbeat': datetime.now().isoformat(),
+            'running': [s.id for s in self.running],
+        }
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(state), encoding='utf-8')
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.error(f"Failed to write daemon heartbeat: {e}")
+
+    def start(self) -> None:
+        """Warm up, load the schedules and announce the daemon."""
+        self.started_at = datetime.now()
+        self.warm_up()
+        self.reload(force=True)
+        self.heartbeat()
+
+    def tick(self, now: Optional[datetime] = None) -> List[str]:
+        """Refresh the heartbeat, pick up schedule changes and start due runs."""
+        self.heartbeat()
+        self.reload(now)
+        return self.start_due(now)
+
+    def run_forever(self) -> None:
+        """Run schedules until stop() is called or Ctrl+C (start() if needed)."""
+        if self.started_at is None:
+            self.start()
+        try:
+            while not self._stop.is_set():
+                self.tick()
+                now = datetime.now()
+                next_start = self.next_start(now)
+                timeout = self.tick_seconds
+                if next_start is not None:
+                    timeout = min(timeout, max(0.0, (next_start - now).total_seconds()))
+                self._wake.wait(timeout)
+                self._wake.clear()
+        except KeyboardInterrupt:
+            logger.info("Stopping scheduler daemon (waiting for running schedules)")
+        finally:
+            self.shutdown()
+
+    def stop(self) -> None:
+        """Ask run_forever to return (running schedules finish first)."""
+        self._stop.set()
+        self._wake.set()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pools and remove the heartbeat file."""
+        if self._run_pool is not None:
+            self._run_pool.shutdown(wait=wait)
+            self._run_pool = None
+        if self._analysis_pool is not None:
+            self._analysis_pool.shutdown(wait=wait)
+            self._analysis_pool = None
+        try:
+            self.state_path.unlink()
+        except OSError:
+            pass
+
+
+def _slot(schedule: Schedule) -> Tuple:
+    """Fields that decide when and what a schedule runs."""
+    return (schedule.folder_path, schedule.frequency, schedule.run_at_time, schedule.run_on_day)
@@ -4,6 +4,11 @@ Scheduler Module for ALS Doctor
 Provides scheduled batch scanning functionality for Ableton projects.
 Manages schedule configurations stored in JSON and integrates with
 OS task schedulers (cron on Linux/macOS, Task Scheduler on Windows).
+
+Runs only analyze .als files that changed since they were last saved,
+using the same scan manifest as `als-doctor scan` (see als_scan). The
+resident daemon in schedule_daemon runs schedules without a new process
+per firing; cron entries remain as a fallback for when it is not running.
 """
 
 import os
@@ -13,9 +18,12 @@ import uuid
 import subprocess
 import platform
 import logging
+import threading
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
@@ -27,6 +35,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Serializes schedules.json updates and run log writes between threads of
+# one process; _schedules_lock() adds a file lock for other processes
+_state_lock = threading.Lock()
+
+# Folders skipped when collecting a schedule's .als files
+EXCLUDED_FOLDERS = ('backup', 'backups', 'ableton project info')
+
+# Seconds between runs, by frequency
+FREQUENCY_SECONDS = {
+    'hourly': 3600,
+    'daily': 86400,
+    'weekly': 604800,
+}
+
 
 class ScheduleFrequency(Enum):
     """Frequency options for scheduled scans."""
@@ -97,6 +119,7 @@ class ScheduleRunResult:
     success: bool
     files_scanned: int = 0
     files_failed: int = 0
+    files_skipped: int = 0  # Unchanged since their last saved scan
     duration_seconds: float = 0.0
     error_message: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
@@ -105,7 +128,9 @@ class ScheduleRunResult:
     def summary(self) -> str:
         """Get a summary string for the run result."""
         if self.success:
-            return f"Scanned {self.files_scanned} files ({self.files_failed} failed) in {self.duration_seconds:.1f}s"
+            skipped = f", {self.files_skipped} unchanged" if self.files_skipped else ""
+            return (f"Scanned {self.files_scanned} files ({self.files_failed} failed{skipped}) "
+                    f"in {self.duration_seconds:.1f}s")
         else:
             return f"Failed: {self.error_message}"
 
@@ -144,6 +169,37 @@ def _get_run_log_path() -> Path:
     return Path(__file__).parent.parent.parent.parent / "data" / "scheduled_runs.log"
 
 
+@contextmanager
+def _schedules_lock(schedules_path: Optional[Path] = None) -> Iterator[None]:
+    """
+    Hold the schedules.json lock for a read-modify-write.
+
+    The daemon, cron fallbacks and `schedule add/enable/remove` are separate
+    processes, so besides the in-process lock an OS lock is taken on
+    schedules.json.lock (fcntl on Linux/macOS, msvcrt on Windows).
+    """
+    path = schedules_path or _get_schedules_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = path.with_name(path.name + '.lock')
+
+    with _state_lock, open(lock_path, 'a+b') as f:
+        if platform.system() == 'Windows':
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if platform.system() == 'Windows':
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def _load_schedules_index(schedules_path: Optional[Path] = None) -> ScheduleIndex:
     """
     Load the schedules index from JSON.
@@ -179,8 +235,12 @@ def _save_schedules_index(index: ScheduleIndex, schedules_path: Optional[Path] =
     path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(path, 'w', encoding='utf-8') as f:
+        # Write then rename, so concurrent readers never see a partial file;
+        # the pid keeps writers in different processes off each other's file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(index.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
         return True
     except Exception as e:
         logger.error(f"Failed to save schedules: {e}")
@@ -205,7 +265,7 @@ def _log_run(result: ScheduleRunResult, log_path: Optional[Path] = None) -> None
     line = f"{timestamp} | {status} | {result.schedule_name} | {result.summary}"
 
     try:
-        with open(path, 'a', encoding='utf-8') as f:
+        with _state_lock, open(path, 'a', encoding='utf-8') as f:
             f.write(line + "\n")
     except Exception as e:
         logger.error(f"Failed to write to run log: {e}")
@@ -308,29 +368,30 @@ def add_schedule(
     if not name:
         name = folder.name
 
-    index = _load_schedules_index(schedules_path)
+    with _schedules_lock(schedules_path):
+        index = _load_schedules_index(schedules_path)
+
+        # Check for duplicate name
+        for existing in index.schedules:
+            if existing.name.lower() == name.lower():
+                return (None, f"Schedule with name '{name}' already exists. Use a different name.")
+
+        # Create schedule
+        schedule = Schedule(
+            id=_generate_schedule_id(),
+            name=name,
+            folder_path=str(folder),
+            frequency=frequency.lower(),
+            run_at_time=run_at_time,
+            run_on_day=run_on_day
+        )
 
-    # Check for duplicate name
-    for existing in index.schedules:
-        if existing.name.lower() == name.lower():
-            return (None, f"Schedule with name '{name}' already exists. Use a different name.")
-
-    # Create schedule
-    schedule = Schedule(
-        id=_generate_schedule_id(),
-        name=name,
-        folder_path=str(folder),
-        frequency=frequency.lower(),
-        run_at_time=run_at_time,
-        run_on_day=run_on_day
-    )
-
-    index.schedules.append(schedule)
-
-    if _save_schedules_index(index, schedules_path):
-        return (schedule, f"Created schedule '{schedule.name}' ({schedule.id})")
-    else:
-        return (None, "Failed to save schedule configuration.")
+        index.schedules.append(schedule)
+
+        if _save_schedules_index(index, schedules_path):
+            return (schedule, f"Created schedule '{schedule.name}' ({schedule.id})")
+        else:
+            return (None, "Failed to save schedule configuration.")
 
 
 def remove_schedule(schedule_id: str, schedules_path: Optional[Path] = None) -> Tuple[bool, str]:
@@ -343,24 +404,25 @@ def remove_schedule(schedule_id: str, schedules_path: Optional[Path] = None) ->
     Returns:
         Tuple of (success, message)
     """
-    index = _load_schedules_index(schedules_path)
+    with _schedules_lock(schedules_path):
+        index = _load_schedules_index(schedules_path)
 
-    # Find the schedule
-    schedule_to_remove = None
-    for schedule in index.schedules:
-        if schedule.id == schedule_id or schedule.name.lower() == schedule_id.lower():
-            schedule_to_remove = schedule
-            break
+        # Find the schedule
+        schedule_to_remove = None
+        for schedule in index.schedules:
+            if schedule.id == schedule_id or schedule.name.lower() == schedule_id.lower():
+                schedule_to_remove = schedule
+                break
 
-    if not schedule_to_remove:
-        return (False, f"Schedule not found: {schedule_id}")
+        if not schedule_to_remove:
+            return (False, f"Schedule not found: {schedule_id}")
 
-    index.schedules.remove(schedule_to_remove)
+        index.schedules.remove(schedule_to_remove)
 
-    if _save_schedules_index(index, schedules_path):
-        return (True, f"Removed schedule: {schedule_to_remove.name}")
-    else:
-        return (False, "Failed to save schedule configuration.")
+        if _save_schedules_index(index, schedules_path):
+            return (True, f"Removed schedule: {schedule_to_remove.name}")
+        else:
+            return (False, "Failed to save schedule configuration.")
 
 
 def enable_schedule(schedule_id: str, enabled: bool = True, schedules_path: Optional[Path] = None) -> Tuple[bool, str]:
@@ -374,32 +436,54 @@ def enable_schedule(schedule_id: str, enabled: bool = True, schedules_path: Opti
     Returns:
         Tuple of (success, message)
     """
-    index = _load_schedules_index(schedules_path)
-
-    # Find and update the schedule
-    for schedule in index.schedules:
-        if schedule.id == schedule_id or schedule.name.lower() == schedule_id.lower():
-            schedule.enabled = enabled
-            if _save_schedules_index(index, schedules_path):
-                status = "enabled" if enabled else "disabled"
-                return (True, f"Schedule '{schedule.name}' {status}.")
-            else:
-                return (False, "Failed to save schedule configuration.")
+    with _schedules_lock(schedules_path):
+        index = _load_schedules_index(schedules_path)
+
+        # Find and update the schedule
+        for schedule in index.schedules:
+            if schedule.id == schedule_id or schedule.name.lower() == schedule_id.lower():
+                schedule.enabled = enabled
+                if _save_schedules_index(index, schedules_path):
+                    status = "enabled" if enabled else "disabled"
+                    return (True, f"Schedule '{schedule.name}' {status}.")
+                else:
+                    return (False, "Failed to save schedule configuration.")
 
     return (False, f"Schedule not found: {schedule_id}")
 
 
+def find_schedule_files(folder: Path) -> List[Path]:
+    """All .als files under a schedule's folder, without backup folders."""
+    return [
+        f for f in folder.rglob("*.als")
+        if not any(part.lower() in EXCLUDED_FOLDERS for part in f.parts)
+    ]
+
+
 def run_schedule(
     schedule_id: str,
     schedules_path: Optional[Path] = None,
-    quiet: bool = False
+    quiet: bool = False,
+    db_path: Optional[Path] = None,
+    log_path: Optional[Path] = None,
+    jobs: int = 1,
+    full: bool = False,
+    executor: Optional[Executor] = None
 ) -> Tuple[ScheduleRunResult, str]:
     """
     Run a scheduled scan immediately.
 
+    Files whose size and mtime (or content) match their last saved scan
+    are skipped; the rest are analyzed and saved.
+
     Args:
         schedule_id: Schedule ID or name to run
         quiet: Suppress non-essential output
+        db_path: Optional custom path for the database
+        log_path: Optional custom path for the run log
+        jobs: Worker processes for analysis
+        full: Analyze every file, changed or not
+        executor: Long-lived process pool to analyze on (the daemon's)
 
     Returns:
         Tuple of (ScheduleRunResult, message)
@@ -427,20 +511,21 @@ def run_schedule(
             success=False,
             error_message=f"Folder no longer exists: {schedule.folder_path}"
         )
-        _log_run(result)
+        _log_run(result, log_path)
         return (result, result.error_message)
 
     # Run the scan
     start_time = datetime.now()
 
     try:
-        from database import (
-            get_db, persist_scan_result, ScanResult, ScanResultIssue, _calculate_grade
-        )
-        from device_chain_analyzer import analyze_als_devices
-        from effect_chain_doctor import EffectChainDoctor
+        try:
+            from database import get_db, persist_scan_result
+            from als_scan import ScanManifest, scan_files
+        except ImportError:
+            from .database import get_db, persist_scan_result
+            from .als_scan import ScanManifest, scan_files
 
-        db = get_db()
+        db = get_db(db_path)
         if not db.is_initialized():
             result = ScheduleRunResult(
                 schedule_id=schedule.id,
@@ -448,73 +533,35 @@ def run_schedule(
                 success=False,
                 error_message="Database not initialized"
             )
-            _log_run(result)
+            _log_run(result, log_path)
             return (result, result.error_message)
 
-        # Find all .als files
-        als_files = list(folder.rglob("*.als"))
-
-        # Exclude backup folders
-        als_files = [
-            f for f in als_files
-            if not any(part.lower() in ['backup', 'backups', 'ableton project info']
-                      for part in f.parts)
-        ]
+        # Only new and modified files are analyzed
+        manifest = ScanManifest(db_path)
+        plan = manifest.plan(find_schedule_files(folder), full=full)
+        manifest.refresh(plan.touched)
 
         files_scanned = 0
         files_failed = 0
 
-        for als_path in als_files:
-            try:
-                # Analyze the file
-                analysis = analyze_als_devices(str(als_path))
-                doctor = EffectChainDoctor()
-                diagnosis = doctor.diagnose(analysis)
-
-                # Convert issues
-                issues = []
-                for issue in diagnosis.global_issues:
-                    issues.append(ScanResultIssue(
-                        track_name=issue.track_name,
-                        severity=issue.severity.value,
-                        category=issue.category.value,
-                        description=issue.description,
-                        fix_suggestion=issue.recommendation
-                    ))
-
-                for track_diag in diagnosis.track_diagnoses:
-                    for issue in track_diag.issues:
-                        issues.append(ScanResultIssue(
-                            track_name=issue.track_name,
-                            severity=issue.severity.value,
-                            category=issue.category.value,
-                            description=issue.description,
-                            fix_suggestion=issue.recommendation
-                        ))
-
-                scan_result = ScanResult(
-                    als_path=str(als_path),
-                    health_score=diagnosis.overall_health,
-                    grade=_calculate_grade(diagnosis.overall_health),
-                    total_issues=diagnosis.total_issues,
-                    critical_issues=diagnosis.critical_issues,
-                    warning_issues=diagnosis.warning_issues,
-                    total_devices=diagnosis.total_devices,
-                    disabled_devices=diagnosis.total_disabled,
-                    clutter_percentage=diagnosis.clutter_percentage,
-                    issues=issues
-                )
-
-                persist_scan_result(scan_result)
-                files_scanned += 1
-
-                if not quiet:
-                    logger.info(f"  Scanned: {als_path.name} [{diagnosis.overall_health}]")
+        for outcome in scan_files(plan.to_analyze, jobs=jobs, executor=executor):
+            name = Path(outcome.als_path).name
+            if outcome.error is None:
+                success, message, version_id = persist_scan_result(outcome.result, db_path)
+            else:
+                success, message = False, outcome.error
 
-            except Exception as e:
+            if not success:
                 files_failed += 1
                 if not quiet:
-                    logger.error(f"  Failed: {als_path.name}: {e}")
+                    logger.error(f"  Failed: {name}: {message}")
+                continue
+
+            manifest.record(outcome, version_id)
+            files_scanned += 1
+
+            if not quiet:
+                logger.info(f"  Scanned: {name} [{outcome.result.health_score}]")
 
         duration = (datetime.now() - start_time).total_seconds()
 
@@ -524,6 +571,7 @@ def run_schedule(
             success=True,
             files_scanned=files_scanned,
             files_failed=files_failed,
+            files_skipped=len(plan.skipped),
             duration_seconds=duration
         )
 
@@ -536,7 +584,7 @@ def run_schedule(
             schedules_path=schedules_path
         )
 
-        _log_run(result)
+        _log_run(result, log_path)
         return (result, f"Scanned {files_scanned} files in {duration:.1f}s")
 
     except ImportError as e:
@@ -546,7 +594,7 @@ def run_schedule(
             success=False,
             error_message=f"Import error: {e}"
         )
-        _log_run(result)
+        _log_run(result, log_path)
         return (result, result.error_message)
     except Exception as e:
         result = ScheduleRunResult(
@@ -555,7 +603,7 @@ def run_schedule(
             success=False,
             error_message=str(e)
         )
-        _log_run(result)
+        _log_run(result, log_path)
         return (result, result.error_message)
 
 
@@ -567,16 +615,78 @@ def _update_schedule_run_status(
     schedules_path: Optional[Path] = None
 ) -> None:
     """Update a schedule's last run status."""
-    index = _load_schedules_index(schedules_path)
+    with _schedules_lock(schedules_path):
+        index = _load_schedules_index(schedules_path)
 
-    for schedule in index.schedules:
-        if schedule.id == schedule_id:
-            schedule.last_run_at = datetime.now().isoformat()
-            schedule.last_run_status = 'success' if success else 'failed'
-            schedule.last_run_files_scanned = files_scanned
-            schedule.last_run_files_failed = files_failed
-            _save_schedules_index(index, schedules_path)
-            return
+        for schedule in index.schedules:
+            if schedule.id == schedule_id:
+                schedule.last_run_at = datetime.now().isoformat()
+                schedule.last_run_status = 'success' if success else 'failed'
+                schedule.last_run_files_scanned = files_scanned
+                schedule.last_run_files_failed = files_failed
+                _save_schedules_index(index, schedules_path)
+                return
+
+
+def _run_time(schedule: Schedule) -> Tuple[int, int]:
+    """(hour, minute) a schedule runs at; midnight by default."""
+    if schedule.run_at_time:
+        try:
+            time_parts = schedule.run_at_time.split(':')
+            return (int(time_parts[0]), int(time_parts[1]))
+        except (ValueError, IndexError):
+            pass
+    return (0, 0)
+
+
+def next_run_at(schedule: Schedule, after: datetime) -> datetime:
+    """
+    First time after `after` that matches the schedule's slot.
+
+    Hourly schedules run at the minute of run_at_time, daily ones at
+    run_at_time and weekly ones at run_at_time on run_on_day
+    (0=Monday), the same slots as their cron entries.
+
+    Args:
+        schedule: Schedule to place
+        after: Time to search from (exclusive)
+
+    Returns:
+        Next run time
+    """
+    hour, minute = _run_time(schedule)
+
+    if schedule.frequency == 'hourly':
+        candidate = after.replace(minute=minute, second=0, microsecond=0)
+        step = timedelta(hours=1)
+    else:
+        candidate = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        step = timedelta(days=1)
+        if schedule.frequency == 'weekly':
+            weekday = schedule.run_on_day if schedule.run_on_day is not None else 0
+            candidate += timedelta(days=(weekday - after.weekday()) % 7)
+            step = timedelta(weeks=1)
+
+    if candidate <= after:
+        candidate += step
+    return candidate
+
+
+def is_schedule_due(schedule: Schedule, now: Optional[datetime] = None) -> bool:
+    """True if an enabled schedule never ran or its period has passed since it last ran."""
+    if not schedule.enabled or not Path(schedule.folder_path).exists():
+        return False
+
+    if schedule.last_run_at is None:
+        # Never run, so it's due
+        return True
+
+    try:
+        last_run = datetime.fromisoformat(schedule.last_run_at)
+        elapsed = ((now or datetime.now()) - last_run).total_seconds()
+        return elapsed >= FREQUENCY_SECONDS.get(schedule.frequency, float('inf'))
+    except (ValueError, TypeError):
+        return True
 
 
 def get_cron_expression(schedule: Schedule) -> str:
@@ -589,17 +699,7 @@ def get_cron_expression(schedule: Schedule) -> str:
     Returns:
         Cron expression string (5 fields: minute hour day month weekday)
     """
-    # Default time is midnight
-    minute = 0
-    hour = 0
-
-    if schedule.run_at_time:
-        try:
-            time_parts = schedule.run_at_time.split(':')
-            hour = int(time_parts[0])
-            minute = int(time_parts[1])
-        except (ValueError, IndexError):
-            pass
+    hour, minute = _run_time(schedule)
 
     if schedule.frequency == 'hourly':
         # Run at the specified minute every hour
@@ -633,7 +733,8 @@ def generate_cron_command(schedule: Schedule, python_path: Optional[str] = None)
 
     als_doctor_path = Path(__file__).parent.parent / "als_doctor.py"
 
-    return f'{python_path} "{als_doctor_path}" schedule run "{schedule.id}"'
+    # Cron is the fallback: the run is skipped while the scheduler daemon is up
+    return f'{python_path} "{als_doctor_path}" schedule run "{schedule.id}" --skip-if-daemon'
 
 
 def install_cron_job(schedule: Schedule, schedules_path: Optional[Path] = None) -> Tuple[bool, str]:
@@ -762,51 +863,24 @@ def check_due_schedules(schedules_path: Optional[Path] = None) -> List[Schedule]
     """
     index = _load_schedules_index(schedules_path)
     now = datetime.now()
-    due_schedules = []
-
-    for schedule in index.schedules:
-        if not schedule.enabled:
-            continue
-
-        # Check if folder exists
-        if not Path(schedule.folder_path).exists():
-            continue
-
-        # Determine if due based on frequency
-        is_due = False
-
-        if schedule.last_run_at is None:
-            # Never run, so it's due
-            is_due = True
-        else:
-            try:
-                last_run = datetime.fromisoformat(schedule.last_run_at)
-                elapsed = (now - last_run).total_seconds()
-
-                if schedule.frequency == 'hourly':
-                    is_due = elapsed >= 3600  # 1 hour
-                elif schedule.frequency == 'daily':
-                    is_due = elapsed >= 86400  # 24 hours
-                elif schedule.frequency == 'weekly':
-                    is_due = elapsed >= 604800  # 7 days
-            except (ValueError, TypeError):
-                is_due = True
-
-        if is_due:
-            due_schedules.append(schedule)
-
-    return due_schedules
+    return [schedule for schedule in index.schedules if is_schedule_due(schedule, now)]
 
 
 def run_due_schedules(
     schedules_path: Optional[Path] = None,
-    quiet: bool = False
+    quiet: bool = False,
+    full: bool = False
 ) -> List[ScheduleRunResult]:
     """
     Run all schedules that are due.
 
     This is the main entry point for the wrapper script.
 
+    Args:
+        schedules_path: Optional custom path for schedules.json
+        quiet: Suppress non-essential output
+        full: Analyze every file, changed or not
+
     Returns:
         List of ScheduleRunResult for each schedule that was run
     """
@@ -825,7 +899,7 @@ def run_due_schedules(
         if not quiet:
             logger.info(f"Running schedule: {schedule.name}")
 
-        result, msg = run_schedule(schedule.id, schedules_path, quiet)
+        result, msg = run_schedule(schedule.id, schedules_path, quiet, full=full)
         results.append(result)
 
         if not quiet:
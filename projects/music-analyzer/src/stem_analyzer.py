@@ -15,6 +15,11 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 from collections import defaultdict
 
+try:
+    from .pcm_cache import load_audio
+except ImportError:
+    from pcm_cache import load_audio
+
 
 @dataclass
 class FrequencyClash:
@@ -170,7 +175,7 @@ class StemAnalyzer:
     def _analyze_single_stem(self, path: str, name: str) -> Tuple[StemInfo, np.ndarray]:
         """Analyze a single stem and return its info and spectrogram."""
         # Load audio
-        y, sr = librosa.load(path, sr=None, mono=False)
+        y, sr = load_audio(path, sr=None, mono=False)
 
         # Check if mono or stereo
         is_mono = len(y.shape) == 1 or (len(y.shape) == 2 and y.shape[0] == 1)
@@ -25,6 +25,11 @@ import numpy as np
 import librosa
 import soundfile as sf
 
+try:
+    from .pcm_cache import load_audio
+except ImportError:
+    from pcm_cache import load_audio
+
 # Check for Demucs availability
 DEMUCS_AVAILABLE = False
 try:
@@ -437,7 +442,7 @@ class StemSeparator:
 
     def _analyze_stem(self, stem_path: str, stem_type: StemType) -> SeparatedStem:
         """Analyze a separated stem for basic metrics."""
-        y, sr = librosa.load(stem_path, sr=None, mono=True)
+        y, sr = load_audio(stem_path, sr=None, mono=True)
         duration = librosa.get_duration(y=y, sr=sr)
 
         # Calculate levels
@@ -0,0 +1,374 @@
+"""
+Streaming Analysis Module
+
+Bounded-memory, single-pass feature extraction for long files (DJ mixes,
+multi-hour stem bounces). The file is read with soundfile.blocks and only
+one block of samples is held at a time. Everything retained is either a
+scalar accumulator or a frame-rate table (one row per 512-sample hop), so
+memory grows with duration / hop_length instead of duration * sample rate.
+
+Computed in one pass:
+- Clipping count, grouped clip times and sample peak (all channels)
+- Mono peak and RMS (crest factor)
+- L/R correlation from running moments
+- Mean per-bin power of a 4096-point STFT (band energies)
+- Spectral centroid, rolloff, RMS and onset strength per 2048-point frame
+- BS.1770-4 loudness, LRA and true peak (loudness_meter.LoudnessMeter)
+- Per-hop level, clip and band-energy tables for section analysis
+
+STFT frames are computed on a zero-padded stream so they line up exactly
+with librosa's centered frames; block boundaries never change a frame.
+
+Agreement with the in-memory path (AudioAnalyzer.analyze):
+- Clipping, peaks, RMS, correlation, band energies, centroid and rolloff
+  are identical up to float rounding (< 0.01 dB / 0.01%).
+- Loudness is identical: both paths use loudness_meter.
+- The onset envelope floors each frame at 80 dB below the running (not
+  global) maximum, so a very quiet opening can differ slightly; tempo and
+  transient statistics match in practice.
+- Both paths slice section features from full-track frame tables; section
+  level and peak come from hop sums here and from samples in memory, so
+  they differ by at most a hop at section edges.
+"""
+
+import numpy as np
+import librosa
+import soundfile as sf
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .analysis_context import estimate_tempo
+    from .loudness_meter import LoudnessMeasurement, LoudnessMeter
+except ImportError:
+    from analysis_context import estimate_tempo
+    from loudness_meter import LoudnessMeasurement, LoudnessMeter
+
+
+def _with_last(blocks: Iterable[np.ndarray]) -> Iterator[Tuple[np.ndarray, bool]]:
+    """Yield (block, is_last) pairs from a block iterator."""
+    iterator = iter(blocks)
+    try:
+        current = next(iterator)
+    except StopIteration:
+        return
+    for following in iterator:
+        yield current, False
+        current = following
+    yield current, True
+
+
+class _ClipGrouper:
+    """Groups clip times that fall within `window` seconds of a group start."""
+
+    def __init__(self, window: float):
+        self.window = window
+        self.times: List[float] = []
+        self._start: Optional[float] = None
+
+    def add(self, times: np.ndarray):
+        for t in times:
+            if self._start is None:
+                self._start = float(t)
+            elif t - self._start > self.window:
+                self.times.append(self._start)
+                self._start = float(t)
+
+    def finish(self) -> List[float]:
+        if self._start is not None:
+            self.times.append(self._start)
+            self._start = None
+        return self.times
+
+
+class StreamingFeatures:
+    """
+    Features of one audio file, accumulated block by block.
+
+    Frame tables (`rms`, `spectral_centroid`, `onset_envelope`, ...) use
+    librosa's centered framing with `hop_length`; hop tables (`hop_sumsq`,
+    `hop_peak`, `hop_clips`) cover consecutive non-overlapping hops of the
+    mono mix starting at sample 0.
+    """
+
+    N_FFT = 2048          # Frame features, onset envelope, section bands
+    BAND_N_FFT = 4096     # Band energies (matches AudioAnalyzer._analyze_frequency)
+
+    def __init__(
+        self,
+        sr: int,
+        channels: int,
+        hop_length: int = 512,
+        clip_threshold: float = 0.99,
+        clip_group_window: float = 0.1
+    ):
+        """
+        Create empty accumulators; feed them with `push` and close with `finish`.
+
+        Args:
+            sr: Sample rate
+            channels: Channel count of the incoming blocks
+            hop_length: Hop length for frame and hop tables
+            clip_threshold: Absolute sample value counted as clipping
+            clip_group_window: Clips within this many seconds form one event
+        """
+        self.sr = int(sr)
+        self.channels = channels
+        self.hop_length = hop_length
+        self.clip_threshold = clip_threshold
+        self.n_samples = 0
+
+        # Sample-level accumulators
+        self.max_peak = 0.0
+        self.mono_peak = 0.0
+        self.clip_count = 0
+        self._clips = _ClipGrouper(clip_group_window)
+        self.clip_times: List[float] = []
+        self._mono_sumsq = 0.0
+        self._moments = np.zeros(5)  # sum L, sum R, sum L^2, sum R^2, sum LR
+
+        # BS.1770-4 meter over all channels; result set by finish()
+        self._loudness_meter = LoudnessMeter(self.sr, channels)
+        self.loudness: Optional[LoudnessMeasurement] = None
+
+        # Spectral framing on the zero-padded mono stream
+        self._buffer = np.zeros(self.BAND_N_FFT // 2, dtype=np.float32)
+        self._bin_power = np.zeros(self.BAND_N_FFT // 2 + 1)
+        self._band_frames = 0
+        self._freqs = librosa.fft_frequencies(sr=self.sr, n_fft=self.N_FFT)
+        self._mel_basis = librosa.filters.mel(sr=self.sr, n_fft=self.N_FFT)
+        self._prev_mel_db: Optional[np.ndarray] = None
+        self._mel_db_max = -np.inf
+        self._tables = {name: [] for name in (
+            'rms', 'centroid', 'rolloff', 'onset_diff', 'mag_low', 'mag_total',
+            'power_sub', 'power_mud', 'power_harsh', 'power_total',
+            'hop_sumsq', 'hop_peak', 'hop_clips'
+        )}
+        self._tempo: Optional[float] = None
+        self._tempo_computed = False
+
+    @classmethod
+    def from_file(
+        cls,
+        audio_path: str,
+        block_seconds: float = 5.0,
+        hop_length: int = 512,
+        clip_threshold: float = 0.99,
+        clip_group_window: float = 0.1
+    ) -> 'StreamingFeatures':
+        """
+        Stream an audio file once and return its accumulated features.
+
+        Args:
+            audio_path: Path to any file soundfile can read
+            block_seconds: Samples held in memory per block (rounded to hops)
+            hop_length: Hop length for frame and hop tables
+            clip_threshold: Absolute sample value counted as clipping
+            clip_group_window: Clips within this many seconds form one event
+        """
+        path = Path(audio_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        with sf.SoundFile(str(path)) as f:
+            features = cls(f.samplerate, f.channels, hop_length,
+                           clip_threshold, clip_group_window)
+            blocksize = max(1, int(block_seconds * f.samplerate) // hop_length) * hop_length
+            blocks = f.blocks(blocksize=blocksize, dtype='float32', always_2d=True)
+            for block, is_last in _with_last(blocks):
+                features.push(block, is_last=is_last)
+
+        return features.finish()
+
+    # ==================== ACCUMULATION ====================
+
+    def push(self, block: np.ndarray, is_last: bool = False):
+        """
+        Accumulate one (samples, channels) float block.
+
+        Every block except the last must be a multiple of hop_length long.
+        """
+        mono = block[:, 0] if block.shape[1] == 1 else block.mean(axis=1)
+        abs_max = np.abs(block).max(axis=1)
+
+        # Peaks and clipping (over all channels)
+        self.max_peak = max(self.max_peak, float(abs_max.max(initial=0.0)))
+        self.mono_peak = max(self.mono_peak, float(np.abs(mono).max(initial=0.0)))
+        clipped = np.flatnonzero(abs_max >= self.clip_threshold)
+        self.clip_count += len(clipped)
+        self._clips.add((self.n_samples + clipped) / self.sr)
+
+        # Level and correlation moments
+        mono64 = mono.astype(np.float64)
+        self._mono_sumsq += float(np.dot(mono64, mono64))
+        if self.channels == 2:
+            left = block[:, 0].astype(np.float64)
+            right = block[:, 1].astype(np.float64)
+            self._moments += [left.sum(), right.sum(), np.dot(left, left),
+                              np.dot(right, right), np.dot(left, right)]
+
+        self._push_hops(mono, abs_max >= self.clip_threshold)
+        self._loudness_meter.push(block)
+        self._push_frames(mono, is_last)
+        self.n_samples += len(block)
+
+    def _push_hops(self, mono: np.ndarray, clipped: np.ndarray):
+        """Per-hop mono sum of squares, mono peak and clipped-sample count."""
+        hop = self.hop_length
+        pad = -len(mono) % hop
+        hops = np.pad(mono, (0, pad)).reshape(-1, hop).astype(np.float64)
+        self._tables['hop_sumsq'].append(np.sum(hops ** 2, axis=1))
+        self._tables['hop_peak'].append(np.abs(hops).max(axis=1))
+        self._tables['hop_clips'].append(np.pad(clipped, (0, pad)).reshape(-1, hop).sum(axis=1))
+
+    def _push_frames(self, mono: np.ndarray, is_last: bool):
+        """Compute every complete centered STFT frame available in the buffer."""
+        hop = self.hop_length
+        buffer = np.concatenate([self._buffer, mono])
+        if is_last:
+            buffer = np.concatenate([buffer, np.zeros(self.BAND_N_FFT // 2, dtype=buffer.dtype)])
+        if len(buffer) < self.BAND_N_FFT:
+            self._buffer = buffer
+            return
+
+        n_frames = (len(buffer) - self.BAND_N_FFT) // hop + 1
+        span = (n_frames - 1) * hop
+
+        # 4096-point frames: only the per-bin power sum is kept
+        band_mag = np.abs(librosa.stft(
+            buffer[:span + self.BAND_N_FFT], n_fft=self.BAND_N_FFT,
+            hop_length=hop, center=False
+        ))
+        self._bin_power += np.sum(band_mag.astype(np.float64) ** 2, axis=1)
+        self._band_frames += n_frames
+
+        # 2048-point frames centered on the same sample positions
+        offset = (self.BAND_N_FFT - self.N_FFT) // 2
+        segment = buffer[offset:offset + span + self.N_FFT]
+        S = np.abs(librosa.stft(segment, n_fft=self.N_FFT, hop_length=hop, center=False))
+        power = S ** 2
+        freqs = self._freqs
+        tables = self._tables
+        tables['rms'].append(librosa.feature.rms(
+            y=segment, frame_length=self.N_FFT, hop_length=hop, center=False
+        )[0])
+        tables['centroid'].append(
+            librosa.feature.spectral_centroid(S=S, sr=self.sr, n_fft=self.N_FFT)[0]
+        )
+        tables['rolloff'].append(
+            librosa.feature.spectral_rolloff(S=S, sr=self.sr, n_fft=self.N_FFT)[0]
+        )
+        tables['mag_low'].append(np.sum(S[freqs < 200], axis=0))
+        tables['mag_total'].append(np.sum(S, axis=0))
+        tables['power_sub'].append(np.sum(power[freqs < 60], axis=0))
+        tables['power_mud'].append(np.sum(power[(freqs >= 200) & (freqs < 500)], axis=0))
+        tables['power_harsh'].append(np.sum(power[(freqs >= 3000) & (freqs < 8000)], axis=0))
+        tables['power_total'].append(np.sum(power, axis=0))
+        tables['onset_diff'].append(self._onset_diffs(power))
+
+        self._buffer = buffer[n_frames * hop:]
+
+    def _onset_diffs(self, power: np.ndarray) -> np.ndarray:
+        """Spectral flux of the log-mel spectrogram, continued across blocks."""
+        mel_db = librosa.power_to_db(self._mel_basis @ power, top_db=None)
+        self._mel_db_max = max(self._mel_db_max, float(mel_db.max()))
+        floor = self._mel_db_max - 80.0
+        mel_db = np.maximum(mel_db, floor)
+        if self._prev_mel_db is not None:
+            mel_db_ext = np.hstack([np.maximum(self._prev_mel_db, floor)[:, None], mel_db])
+        else:
+            mel_db_ext = mel_db
+        self._prev_mel_db = mel_db[:, -1]
+        return np.mean(np.maximum(0.0, mel_db_ext[:, 1:] - mel_db_ext[:, :-1]), axis=0)
+
+    def finish(self) -> 'StreamingFeatures':
+        """Close the stream and assemble the final tables."""
+        self.clip_times = self._clips.finish()
+        for name, parts in self._tables.items():
+            self._tables[name] = np.concatenate(parts) if parts else np.zeros(0)
+
+        # Trim hop tables to the samples actually seen
+        n_hops = -(-self.n_samples // self.hop_length)
+        for name in ('hop_sumsq', 'hop_peak', 'hop_clips'):
+            self._tables[name] = self._tables[name][:n_hops]
+
+        # Onset envelope with librosa's lag + centering offset
+        pad_width = 1 + self.N_FFT // (2 * self.hop_length)
+        n_frames = len(self._tables['rms'])
+        self.onset_envelope = np.concatenate(
+            [np.zeros(pad_width), self._tables['onset_diff']]
+        )[:n_frames].astype(np.float32)
+
+        self.loudness = self._loudness_meter.result()
+        return self
+
+    # ==================== SUMMARY VALUES ====================
+
+    @property
+    def is_stereo(self) -> bool:
+        """True if the file has exactly two channels."""
+        return self.channels == 2
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return self.n_samples / self.sr
+
+    @property
+    def mono_rms(self) -> float:
+        """RMS of the mono mix over the whole file."""
+        return float(np.sqrt(self._mono_sumsq / max(self.n_samples, 1)))
+
+    @property
+    def correlation(self) -> float:
+        """Pearson correlation between left and right (1.0 for mono)."""
+        if not self.is_stereo or self.n_samples == 0:
+            return 1.0
+        n = self.n_samples
+        sum_l, sum_r, sum_ll, sum_rr, sum_lr = self._moments
+        cov = sum_lr - sum_l * sum_r / n
+        var_l = sum_ll - sum_l ** 2 / n
+        var_r = sum_rr - sum_r ** 2 / n
+        return float(cov / np.sqrt(var_l * var_r))
+
+    @property
+    def bin_power(self) -> np.ndarray:
+        """Mean power per 4096-point STFT bin over all frames."""
+        return self._bin_power / max(self._band_frames, 1)
+
+    @property
+    def band_frequencies(self) -> np.ndarray:
+        """Bin center frequencies matching `bin_power`."""
+        return librosa.fft_frequencies(sr=self.sr, n_fft=self.BAND_N_FFT)
+
+    def table(self, name: str) -> np.ndarray:
+        """
+        Raw frame or hop table by name.
+
+        Frame tables: rms, centroid, rolloff, mag_low, mag_total, power_sub,
+        power_mud, power_harsh, power_total. Hop tables: hop_sumsq, hop_peak,
+        hop_clips.
+        """
+        return self._tables[name]
+
+    @property
+    def rms(self) -> np.ndarray:
+        """Frame-wise RMS of the mono mix (2048 / hop_length, centered)."""
+        return self._tables['rms']
+
+    @property
+    def spectral_centroid(self) -> np.ndarray:
+        """Frame-wise spectral centroid in Hz."""
+        return self._tables['centroid']
+
+    @property
+    def spectral_rolloff(self) -> np.ndarray:
+        """Frame-wise spectral rolloff (85%) in Hz."""
+        return self._tables['rolloff']
+
+    def tempo(self) -> Optional[float]:
+        """Global tempo estimate from the streamed onset envelope."""
+        if not self._tempo_computed:
+            self._tempo_computed = True
+            self._tempo = estimate_tempo(self.onset_envelope, self.sr, self.hop_length)
+        return self._tempo
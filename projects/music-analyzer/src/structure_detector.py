@@ -17,6 +17,11 @@ from typing import Optional, List, Dict, Callable
 from pathlib import Path
 from enum import Enum
 
+try:
+    from .pcm_cache import load_audio
+except ImportError:
+    from pcm_cache import load_audio
+
 # Add shared module to path
 _shared_path = Path(__file__).parents[3] / "shared"
 if str(_shared_path) not in sys.path:
@@ -251,7 +256,7 @@ class StructureDetector:
                 ))
 
             # Get duration
-            y, sr = librosa.load(audio_path, sr=None, mono=True, duration=10)
+            y, sr = load_audio(audio_path, sr=None, mono=True, duration=10)
             full_duration = librosa.get_duration(path=audio_path)
 
             # Process beats
@@ -351,7 +356,7 @@ class StructureDetector:
 
         try:
             # Load audio
-            y, sr = librosa.load(audio_path, sr=22050, mono=True)
+            y, sr = load_audio(audio_path, sr=22050, mono=True)
             duration = librosa.get_duration(y=y, sr=sr)
 
             if progress_callback:
@@ -596,7 +601,7 @@ class StructureDetector:
 
         # Load audio for energy analysis
         try:
-            y, sr = librosa.load(audio_path, sr=22050, mono=True)
+            y, sr = load_audio(audio_path, sr=22050, mono=True)
         except Exception:
             return sections
 
@@ -19,6 +19,11 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+try:
+    from .pcm_cache import load_audio
+except ImportError:
+    from pcm_cache import load_audio
+
 
 @dataclass
 class WaveformAnalysis:
@@ -216,7 +221,7 @@ class SynthAnalyzer:
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
         # Load audio
-        y, sr = librosa.load(audio_path, sr=None, mono=False)
+        y, sr = load_audio(audio_path, sr=None, mono=False)
 
         # Convert to mono for most analysis
         if len(y.shape) > 1:
@@ -3,20 +3,47 @@ File Watcher Module for ALS Doctor
 
 Monitors folders for changes to .als files and triggers automatic analysis.
 Uses the watchdog library for cross-platform file system monitoring.
+
+A running FolderWatcher is a pipeline of stages connected by queues, so a
+burst of saves (Live autosaves, or several projects saved at once) does not
+serialize behind one loop:
+
+    watchdog thread -> DebouncedQueue -> dispatcher -> bounded work queue
+        -> worker pool (analysis) -> result stage (database, log, notify)
+
+- The DebouncedQueue coalesces events per path and wakes the dispatcher on
+  a condition variable when the next debounce deadline passes
+- The work queue is bounded. When it is full the dispatcher blocks, and
+  further events for the same files keep coalescing in the debouncer
+  instead of piling up
+- A path is never analyzed by two workers at once; a change during its
+  analysis schedules one more run afterwards
+- A single result thread persists, logs and notifies, so SQLite writes and
+  log lines never interleave
 """
 
+import math
 import os
 import sys
 import time
+import queue
 import threading
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Callable, Dict, List, Set
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from collections import deque
 from contextlib import contextmanager
 
+try:
+    from .als_cache import invalidate_als
+except ImportError:
+    from als_cache import invalidate_als
+
+# Results whose latency is kept for the percentiles in WatchStats
+LATENCY_WINDOW = 1000
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +59,7 @@ class WatchEvent:
     file_path: str
     event_type: str  # 'created', 'modified', 'deleted', 'moved'
     timestamp: datetime = field(default_factory=datetime.now)
+    first_seen: Optional[datetime] = None  # Earliest coalesced event (set by DebouncedQueue)
 
     @property
     def als_filename(self) -> str:
@@ -65,6 +93,43 @@ class WatchStats:
     last_event_at: Optional[datetime] = None
     results: List[WatchResult] = field(default_factory=list)
 
+    # Pipeline state, updated while the watcher runs
+    pending_events: int = 0  # Waiting for their debounce period
+    queue_depth: int = 0  # Ready, waiting for a worker
+    max_queue_depth: int = 0
+    in_flight: int = 0  # Being analyzed
+    events_coalesced: int = 0  # Merged into an event that was already waiting
+    backpressure_waits: int = 0  # Times the dispatcher found the work queue full
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Seconds from the first change of a file to its recorded result.
+
+        Args:
+            percentile: 0-100, over the last LATENCY_WINDOW results
+
+        Returns:
+            Nearest-rank percentile, or None before the first result
+        """
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = min(max(1, math.ceil(len(ordered) * percentile / 100)), len(ordered))
+        return ordered[rank - 1]
+
+    @property
+    def latency_p50(self) -> Optional[float]:
+        return self.latency_percentile(50)
+
+    @property
+    def latency_p95(self) -> Optional[float]:
+        return self.latency_percentile(95)
+
+    @property
+    def latency_p99(self) -> Optional[float]:
+        return self.latency_percentile(99)
+
     @property
     def uptime_seconds(self) -> float:
         return (datetime.now() - self.started_at).total_seconds()
@@ -87,37 +152,80 @@ class DebouncedQueue:
     Queue that debounces rapid file events.
 
     Multiple rapid changes to the same file are coalesced into a single event
-    after the debounce period expires.
+    after the debounce period expires. Consumers either poll
+    get_ready_events() or block in wait_ready(), which sleeps on a condition
+    variable until the next event becomes ready.
     """
 
     def __init__(self, debounce_seconds: float = 5.0):
         self.debounce_seconds = debounce_seconds
         self._pending: Dict[str, WatchEvent] = {}
         self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._closed = False
+        self.coalesced_count = 0
 
     def add_event(self, event: WatchEvent) -> None:
         """Add an event to the queue, resetting debounce timer for this file."""
         with self._lock:
-            # Use the latest event for this file
+            # Use the latest event for this file, keeping when it first changed
+            previous = self._pending.get(event.file_path)
+            if previous is not None:
+                self.coalesced_count += 1
+                event.first_seen = previous.first_seen or previous.timestamp
+            elif event.first_seen is None:
+                event.first_seen = event.timestamp
             self._pending[event.file_path] = event
+            self._changed.notify_all()
 
-    def get_ready_events(self) -> List[WatchEvent]:
-        """Get events that have passed the debounce period."""
-        now = datetime.now()
+    def _pop_ready(self, now: datetime) -> Tuple[List[WatchEvent], Optional[float]]:
+        """Remove ready events; also return seconds until the next one (lock held)."""
         ready = []
+        next_in = None
+        for file_path, event in list(self._pending.items()):
+            remaining = self.debounce_seconds - (now - event.timestamp).total_seconds()
+            if remaining <= 0:
+                ready.append(event)
+                del self._pending[file_path]
+            elif next_in is None or remaining < next_in:
+                next_in = remaining
+        return ready, next_in
 
+    def get_ready_events(self) -> List[WatchEvent]:
+        """Get events that have passed the debounce period."""
         with self._lock:
-            expired_keys = []
-            for file_path, event in self._pending.items():
-                elapsed = (now - event.timestamp).total_seconds()
-                if elapsed >= self.debounce_seconds:
-                    ready.append(event)
-                    expired_keys.append(file_path)
+            return self._pop_ready(datetime.now())[0]
 
-            for key in expired_keys:
-                del self._pending[key]
+    def wait_ready(self, timeout: Optional[float] = None) -> List[WatchEvent]:
+        """
+        Block until events have passed the debounce period.
 
-        return ready
+        Args:
+            timeout: Maximum seconds to wait (None = until ready or closed)
+
+        Returns:
+            Ready events; empty on timeout or after close()
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while not self._closed:
+                ready, next_in = self._pop_ready(datetime.now())
+                if ready:
+                    return ready
+                wait = next_in
+                if deadline is not None:
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        return []
+                    wait = left if wait is None else min(wait, left)
+                self._changed.wait(wait)
+        return []
+
+    def close(self) -> None:
+        """Wake up and release all waiters; wait_ready() returns at once afterwards."""
+        with self._lock:
+            self._closed = True
+            self._changed.notify_all()
 
     def clear(self) -> None:
         """Clear all pending events."""
@@ -152,6 +260,22 @@ def is_als_file(path: str) -> bool:
     return path.lower().endswith('.als')
 
 
+def _build_scan_result_in_worker(als_path: Path):
+    """
+    build_scan_result for the 'process' executor.
+
+    Each worker process has its own .als cache, which the watcher's
+    invalidate_als calls do not reach, so the file is invalidated here.
+    """
+    try:
+        from als_scan import build_scan_result
+    except ImportError:
+        from .als_scan import build_scan_result
+
+    invalidate_als(str(als_path))
+    return build_scan_result(als_path)
+
+
 class ALSFileEventHandler:
     """
     Event handler for .als file changes.
@@ -192,6 +316,9 @@ class ALSFileEventHandler:
         if not is_als_file(src_path):
             return
 
+        # Parsed results of the old contents must not be served again
+        invalidate_als(src_path)
+
         # Skip backup folders
         if is_backup_folder(src_path):
             if not self.quiet:
@@ -217,7 +344,10 @@ class ALSFileEventHandler:
         # For moved events, use the destination path
         if event_type == 'moved' and hasattr(event, 'dest_path'):
             src_path = event.dest_path
-            if not is_als_file(src_path) or is_backup_folder(src_path):
+            if not is_als_file(src_path):
+                return
+            invalidate_als(src_path)
+            if is_backup_folder(src_path):
                 return
 
         # Create watch event and add to debounced queue
@@ -266,17 +396,24 @@ class FolderWatcher:
     - Recursive monitoring of all subfolders
     - Excludes Backup folders
     - Debounces rapid changes (configurable, default 5 seconds)
+    - Analyzes changed files on a pool of workers
     - Logs results to data/watch.log
     - Graceful shutdown on Ctrl+C
     """
 
+    EXECUTORS = ('thread', 'process')
+
     def __init__(
         self,
         folder_path: str,
         debounce_seconds: float = 5.0,
         quiet: bool = False,
         save_to_db: bool = True,
-        log_path: Optional[str] = None
+        log_path: Optional[str] = None,
+        workers: int = 2,
+        max_queue: int = 32,
+        executor: str = 'thread',
+        on_result: Optional[Callable[[WatchResult], None]] = None
     ):
         """
         Initialize the folder watcher.
@@ -287,11 +424,24 @@ class FolderWatcher:
             quiet: Suppress non-essential output
             save_to_db: Whether to save results to the database
             log_path: Path to log file (default: data/watch.log)
+            workers: Files analyzed at the same time
+            max_queue: Ready files waiting for a worker before the dispatcher blocks
+            executor: 'thread' analyzes in the worker threads; 'process' hands
+                      each analysis to a pool of worker processes (no GIL contention)
+            on_result: Called from the result stage with every WatchResult
+                       (e.g. desktop notifications)
         """
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor} (expected one of {', '.join(self.EXECUTORS)})")
+
         self.folder_path = str(Path(folder_path).absolute())
         self.debounce_seconds = debounce_seconds
         self.quiet = quiet
         self.save_to_db = save_to_db
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self.executor = executor
+        self.on_result = on_result
 
         # Set up log path
         if log_path:
@@ -308,10 +458,27 @@ class FolderWatcher:
         self._event_handler: Optional[ALSFileEventHandler] = None
         self._stop_event = threading.Event()
 
-    def _analyze_file(self, event: WatchEvent) -> Optional[WatchResult]:
-        """Analyze a single .als file and optionally save to database."""
-        from pathlib import Path
+        # Pipeline state
+        self._work_queue: Optional[queue.Queue] = None
+        self._result_queue: Optional[queue.Queue] = None
+        self._threads: List[threading.Thread] = []
+        self._worker_threads: List[threading.Thread] = []
+        self._process_pool = None
+        self._state_lock = threading.Lock()
+        self._queued_paths: Set[str] = set()
+        self._running_paths: Set[str] = set()
+        self._rerun: Dict[str, WatchEvent] = {}
+        self._dispatch_coalesced = 0
+
+    # ==================== ANALYSIS ====================
+
+    def _analyze(self, event: WatchEvent) -> Tuple[WatchResult, Optional[Any]]:
+        """
+        Analyze a single .als file.
 
+        Returns:
+            Tuple of (WatchResult, ScanResult or None if analysis failed)
+        """
         file_path = Path(event.file_path)
 
         # Verify file still exists
@@ -320,81 +487,60 @@ class FolderWatcher:
                 file_path=event.file_path,
                 success=False,
                 error_message="File no longer exists"
-            )
+            ), None
 
         try:
-            # Import analysis functions
-            from database import (
-                persist_scan_result, ScanResult, ScanResultIssue, _calculate_grade, get_db
-            )
-            from device_chain_analyzer import analyze_als_devices
-            from effect_chain_doctor import EffectChainDoctor
+            try:
+                from als_scan import build_scan_result
+            except ImportError:
+                from .als_scan import build_scan_result
 
-            # Perform analysis
-            analysis = analyze_als_devices(str(file_path))
-            doctor = EffectChainDoctor()
-            diagnosis = doctor.diagnose(analysis)
+            if self._process_pool is not None:
+                scan_result = self._process_pool.submit(_build_scan_result_in_worker, file_path).result()
+            else:
+                scan_result = build_scan_result(file_path)
 
-            # Build result
-            result = WatchResult(
+            return WatchResult(
                 file_path=event.file_path,
                 success=True,
-                health_score=diagnosis.overall_health,
-                grade=_calculate_grade(diagnosis.overall_health),
-                total_issues=diagnosis.total_issues
-            )
-
-            # Save to database if enabled
-            if self.save_to_db:
-                # Convert issues to ScanResultIssue format
-                issues = []
-                for issue in diagnosis.global_issues:
-                    issues.append(ScanResultIssue(
-                        track_name=issue.track_name,
-                        severity=issue.severity.value,
-                        category=issue.category.value,
-                        description=issue.description,
-                        fix_suggestion=issue.recommendation
-                    ))
-
-                for track_diag in diagnosis.track_diagnoses:
-                    for issue in track_diag.issues:
-                        issues.append(ScanResultIssue(
-                            track_name=issue.track_name,
-                            severity=issue.severity.value,
-                            category=issue.category.value,
-                            description=issue.description,
-                            fix_suggestion=issue.recommendation
-                        ))
-
-                scan_result = ScanResult(
-                    als_path=str(file_path),
-                    health_score=diagnosis.overall_health,
-                    grade=_calculate_grade(diagnosis.overall_health),
-                    total_issues=diagnosis.total_issues,
-                    critical_issues=diagnosis.critical_issues,
-                    warning_issues=diagnosis.warning_issues,
-                    total_devices=diagnosis.total_devices,
-                    disabled_devices=diagnosis.total_disabled,
-                    clutter_percentage=diagnosis.clutter_percentage,
-                    issues=issues
-                )
-
-                db = get_db()
-                if db.is_initialized():
-                    persist_scan_result(scan_result)
-                else:
-                    if not self.quiet:
-                        logger.warning("Database not initialized, skipping save")
-
-            return result
+                health_score=scan_result.health_score,
+                grade=scan_result.grade,
+                total_issues=scan_result.total_issues
+            ), scan_result
 
         except Exception as e:
             return WatchResult(
                 file_path=event.file_path,
                 success=False,
                 error_message=str(e)
-            )
+            ), None
+
+    def _persist(self, result: WatchResult, scan_result: Optional[Any]) -> None:
+        """Save a successful analysis to the database if enabled."""
+        if not self.save_to_db or scan_result is None:
+            return
+
+        try:
+            try:
+                from database import get_db, persist_scan_result
+            except ImportError:
+                from .database import get_db, persist_scan_result
+
+            if get_db().is_initialized():
+                persist_scan_result(scan_result)
+            elif not self.quiet:
+                logger.warning("Database not initialized, skipping save")
+        except Exception as e:
+            result.success = False
+            result.error_message = str(e)
+
+    def _analyze_file(self, event: WatchEvent) -> Optional[WatchResult]:
+        """Analyze a single .als file and optionally save to database."""
+        result, scan_result = self._analyze(event)
+        self._persist(result, scan_result)
+        return result
+
+    # ==================== RESULTS ====================
 
     def _log_result(self, result: WatchResult) -> None:
         """Log a watch result to the log file."""
@@ -412,38 +558,192 @@ class FolderWatcher:
         except Exception as e:
             logger.error(f"Failed to write to log: {e}")
 
+    def _record_result(self, result: WatchResult, event: Optional[WatchEvent] = None) -> None:
+        """Update stats, log, print and hand a result to on_result."""
+        # Update stats
+        if self._stats:
+            self._stats.total_events += 1
+            self._stats.last_event_at = datetime.now()
+
+            if result.success:
+                self._stats.files_analyzed += 1
+            else:
+                self._stats.files_failed += 1
+
+            self._stats.results.append(result)
+            # Keep only last 100 results
+            if len(self._stats.results) > 100:
+                self._stats.results = self._stats.results[-100:]
+
+            if event is not None:
+                first_seen = event.first_seen or event.timestamp
+                self._stats.latencies.append((datetime.now() - first_seen).total_seconds())
+
+        # Log the result
+        self._log_result(result)
+
+        # Print result
+        if not self.quiet:
+            filename = Path(result.file_path).name
+            if result.success:
+                print(f"  [{result.grade}] {filename}: {result.health_score}/100, {result.total_issues} issues")
+            else:
+                print(f"  [!] {filename}: {result.error_message}")
+
+        if self.on_result:
+            try:
+                self.on_result(result)
+            except Exception as e:
+                logger.error(f"Result callback failed for {Path(result.file_path).name}: {e}")
+
     def _process_callback(self, event: WatchEvent) -> Optional[WatchResult]:
         """Callback for processing file events."""
         result = self._analyze_file(event)
 
         if result:
-            # Update stats
-            if self._stats:
-                self._stats.total_events += 1
-                self._stats.last_event_at = datetime.now()
+            self._record_result(result, event)
 
-                if result.success:
-                    self._stats.files_analyzed += 1
-                else:
-                    self._stats.files_failed += 1
+        return result
 
-                self._stats.results.append(result)
-                # Keep only last 100 results
-                if len(self._stats.results) > 100:
-                    self._stats.results = self._stats.results[-100:]
+    # ==================== PIPELINE ====================
+
+    def _update_depths(self) -> None:
+        """Copy current queue sizes into the stats."""
+        stats = self._stats
+        if stats is None or self._work_queue is None:
+            return
+        stats.queue_depth = self._work_queue.qsize()
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        stats.in_flight = len(self._running_paths)
+        if self._event_handler:
+            debouncer = self._event_handler.queue
+            stats.pending_events = debouncer.pending_count
+            stats.events_coalesced = debouncer.coalesced_count + self._dispatch_coalesced
+
+    def _dispatch_loop(self) -> None:
+        """Move debounced events into the bounded work queue."""
+        debouncer = self._event_handler.queue
+        while not self._stop_event.is_set():
+            for event in debouncer.wait_ready():
+                with self._state_lock:
+                    if event.file_path in self._running_paths:
+                        # Changed during analysis: run once more when it finishes
+                        self._rerun[event.file_path] = event
+                        continue
+                    if event.file_path in self._queued_paths:
+                        # A queued run will read the latest contents anyway
+                        self._dispatch_coalesced += 1
+                        continue
+                    self._queued_paths.add(event.file_path)
+
+                if self._work_queue.full() and self._stats:
+                    self._stats.backpressure_waits += 1
+                # Blocks while the workers are behind (backpressure)
+                while not self._stop_event.is_set():
+                    try:
+                        self._work_queue.put(event, timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+                self._update_depths()
+
+    def _worker_loop(self) -> None:
+        """Analyze queued events and pass the results on."""
+        while True:
+            event = self._work_queue.get()
+            if event is None:
+                return
 
-            # Log the result
-            self._log_result(result)
+            with self._state_lock:
+                self._queued_paths.discard(event.file_path)
+                self._running_paths.add(event.file_path)
+            self._update_depths()
 
-            # Print result
             if not self.quiet:
-                filename = Path(result.file_path).name
-                if result.success:
-                    print(f"  [{result.grade}] {filename}: {result.health_score}/100, {result.total_issues} issues")
-                else:
-                    print(f"  [!] {filename}: {result.error_message}")
+                logger.info(f"Processing: {event.als_filename}")
+            result, scan_result = self._analyze(event)
+
+            with self._state_lock:
+                self._running_paths.discard(event.file_path)
+                rerun = self._rerun.pop(event.file_path, None)
+            self._result_queue.put((event, result, scan_result))
+            if rerun is not None and not self._stop_event.is_set():
+                self._event_handler.queue.add_event(rerun)
+            self._update_depths()
+
+    def _result_loop(self) -> None:
+        """Persist, log and notify results one at a time."""
+        while True:
+            item = self._result_queue.get()
+            if item is None:
+                return
+            event, result, scan_result = item
+            self._persist(result, scan_result)
+            self._record_result(result, event)
+
+    def _start_pipeline(self) -> None:
+        """Start the dispatcher, worker and result threads."""
+        self._work_queue = queue.Queue(maxsize=self.max_queue)
+        self._result_queue = queue.Queue()
+        self._queued_paths.clear()
+        self._running_paths.clear()
+        self._rerun.clear()
+        self._dispatch_coalesced = 0
+
+        if self.executor == 'process':
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # Spawned, not forked: the watchdog and pipeline threads are already running
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+            )
 
-        return result
+        self._worker_threads = [
+            threading.Thread(target=self._worker_loop, name=f"watch-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        self._threads = [
+            threading.Thread(target=self._dispatch_loop, name="watch-dispatch", daemon=True),
+            threading.Thread(target=self._result_loop, name="watch-results", daemon=True),
+        ] + self._worker_threads
+        for thread in self._threads:
+            thread.start()
+
+    def _stop_pipeline(self, timeout: float = 10.0) -> None:
+        """Stop accepting work, finish in-flight analyses and flush their results."""
+        if self._event_handler:
+            self._event_handler.queue.close()
+
+        if self._work_queue is not None:
+            # Files still waiting for a worker are dropped
+            dropped = 0
+            while True:
+                try:
+                    if self._work_queue.get_nowait() is not None:
+                        dropped += 1
+                except queue.Empty:
+                    break
+            if dropped and not self.quiet:
+                logger.info(f"Dropped {dropped} queued file(s) on shutdown")
+
+            for _ in self._worker_threads:
+                self._work_queue.put(None)
+            for thread in self._worker_threads:
+                thread.join(timeout=timeout)
+            self._result_queue.put(None)
+
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+        self._worker_threads = []
+
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+        self._update_depths()
+
+    # ==================== LIFECYCLE ====================
 
     def start(self, blocking: bool = True) -> None:
         """
@@ -491,16 +791,20 @@ class FolderWatcher:
 
         adapter = WatchdogAdapter(self._event_handler)
 
+        # Start the pipeline before events can arrive
+        self._stop_event.clear()
+        self._start_pipeline()
+
         # Create observer
         self._observer = Observer()
         self._observer.schedule(adapter, self.folder_path, recursive=True)
         self._observer.start()
         self._running = True
-        self._stop_event.clear()
 
         if not self.quiet:
             logger.info(f"Watching: {self.folder_path}")
             logger.info(f"Debounce: {self.debounce_seconds}s")
+            logger.info(f"Workers: {self.workers} ({self.executor}), queue limit: {self.max_queue}")
             logger.info(f"Log file: {self.log_path}")
             logger.info("Press Ctrl+C to stop")
 
@@ -513,14 +817,10 @@ class FolderWatcher:
             self._run_loop()
 
     def _run_loop(self) -> None:
-        """Main loop for processing events."""
+        """Wait in the calling thread until stopped; the pipeline does the work."""
         try:
             while self._running and not self._stop_event.is_set():
-                # Process any ready events
-                if self._event_handler:
-                    self._event_handler.process_ready_events()
-
-                # Sleep briefly to avoid busy waiting
+                # Short waits keep Ctrl+C responsive
                 self._stop_event.wait(timeout=0.5)
 
         except KeyboardInterrupt:
@@ -547,6 +847,8 @@ class FolderWatcher:
             self._observer.join(timeout=5.0)
             self._observer = None
 
+        self._stop_pipeline()
+
         # Log stop
         try:
             with open(self.log_path, 'a', encoding='utf-8') as f:
@@ -565,6 +867,8 @@ class FolderWatcher:
             print(f"  Uptime: {self._stats.uptime_formatted}")
             print(f"  Files analyzed: {self._stats.files_analyzed}")
             print(f"  Files failed: {self._stats.files_failed}")
+            if self._stats.latencies:
+                print(f"  Latency: p50 {self._stats.latency_p50:.1f}s, p95 {self._stats.latency_p95:.1f}s")
             print(f"  Log: {self.log_path}")
 
         return self._stats
@@ -577,6 +881,7 @@ class FolderWatcher:
     @property
     def stats(self) -> Optional[WatchStats]:
         """Get current session statistics."""
+        self._update_depths()
         return self._stats
 
 
@@ -584,7 +889,8 @@ def watch_folder(
     folder_path: str,
     debounce_seconds: float = 5.0,
     quiet: bool = False,
-    save_to_db: bool = True
+    save_to_db: bool = True,
+    workers: int = 2
 ) -> WatchStats:
     """
     Watch a folder for .als file changes and run analysis.
@@ -597,6 +903,7 @@ def watch_folder(
         debounce_seconds: Seconds to wait after last change before processing
         quiet: Suppress non-essential output
         save_to_db: Whether to save results to the database
+        workers: Files analyzed at the same time
 
     Returns:
         WatchStats with session summary
@@ -605,7 +912,8 @@ def watch_folder(
         folder_path=folder_path,
         debounce_seconds=debounce_seconds,
         quiet=quiet,
-        save_to_db=save_to_db
+        save_to_db=save_to_db,
+        workers=workers
     )
 
     watcher.start(blocking=True)
@@ -52,6 +52,14 @@ from feature_extraction.trance_scorer import (
     TranceScoreCalculator,
     TranceScoreBreakdown
 )
+from feature_extraction.feature_graph import FeatureGraph
+from feature_extraction.kernels import (
+    frame,
+    framewise_pearson,
+    local_maxima,
+    find_peaks,
+    runs
+)
 
 
 # Sample rate for test audio
@@ -443,6 +451,86 @@ class TestTranceScorer:
         assert "0.65" in report
 
 
+class TestFeatureGraph:
+    """Tests for the shared per-track feature graph."""
+
+    def test_primitives_memoized(self):
+        """Each primitive is computed once per graph."""
+        graph = FeatureGraph(generate_kick_pattern(138, 5.0), SR)
+
+        assert graph.rms() is graph.rms('mono')
+        assert graph.magnitude('mid') is graph.magnitude('mono')
+        assert graph.onset_envelope() is graph.onset_envelope('mono')
+        assert graph.beat_track(bpm=138.0) is graph.beat_track(bpm=138.0)
+        assert 'rms:mono' in graph.timings
+
+    def test_shared_graph_matches_standalone(self):
+        """Extractors return the same results with or without a shared graph."""
+        audio = generate_pumping_audio(138, 6.0, depth=0.6)
+        graph = FeatureGraph(audio, SR)
+
+        shared_pumping = extract_pumping_features(graph)
+        shared_energy = extract_energy_curves(graph)
+        solo_pumping = extract_pumping_features(audio, sr=SR)
+        solo_energy = extract_energy_curves(audio, sr=SR)
+
+        assert shared_pumping.modulation_depth_db == pytest.approx(solo_pumping.modulation_depth_db)
+        assert np.allclose(shared_energy.energy_curve, solo_energy.energy_curve)
+
+    def test_side_signal(self):
+        """Side channel is (L-R)/2 for stereo and silent for mono."""
+        stereo = generate_stereo_audio(width=0.5, duration=1.0)
+        graph = FeatureGraph(stereo, SR)
+        assert np.allclose(graph.signal('side'), (stereo[0] - stereo[1]) / 2)
+
+        mono_graph = FeatureGraph(generate_sine_wave(440, 1.0), SR)
+        assert not np.any(mono_graph.signal('side'))
+
+    def test_requires_sr_for_arrays(self):
+        """Raw arrays need a sample rate."""
+        with pytest.raises(ValueError):
+            FeatureGraph.ensure(generate_sine_wave(440, 1.0))
+
+
+class TestKernels:
+    """Tests for the vectorized frame kernels."""
+
+    def test_frame_is_view(self):
+        """Frames follow i * hop_length without copying the signal."""
+        x = np.arange(10.0)
+        frames = frame(x, 4, 3)
+        assert frames.shape == (3, 4)
+        assert np.array_equal(frames[2], [6, 7, 8, 9])
+        assert np.shares_memory(frames, x)
+        assert frame(x, 20, 3).shape == (0, 20)
+
+    def test_framewise_pearson_matches_corrcoef(self):
+        """Per-frame correlation equals np.corrcoef; silent frames are NaN."""
+        rng = np.random.default_rng(0)
+        left = rng.normal(size=4096)
+        right = 0.5 * left + rng.normal(size=4096)
+        left[:1024] = 0.0
+
+        corr = framewise_pearson(left, right, 512, 256)
+        for i in (4, 7, 14):
+            start = i * 256
+            expected = np.corrcoef(left[start:start + 512], right[start:start + 512])[0, 1]
+            assert corr[i] == pytest.approx(expected)
+        assert np.all(np.isnan(corr[:3]))
+
+    def test_peaks(self):
+        """Strict local maxima, and the highest peak wins within min_distance."""
+        x = np.array([0, 3, 1, 4, 0, 1, 1, 1, 0, 5, 0, 4, 0])
+        assert np.array_equal(local_maxima(x), [1, 3, 9, 11])
+        assert np.array_equal(find_peaks(x, min_distance=3), [3, 6, 9])
+
+    def test_runs(self):
+        """Runs include ones touching either end of the mask."""
+        starts, ends = runs(np.array([1, 1, 0, 0, 1, 0, 1, 1, 1], dtype=bool))
+        assert np.array_equal(starts, [0, 4, 6])
+        assert np.array_equal(ends, [2, 5, 9])
+
+
 class TestIntegration:
     """Integration tests for the full feature extraction pipeline."""
 
@@ -484,6 +572,35 @@ class TestIntegration:
         assert 'trance_score' in feature_dict
         assert 'tempo' in feature_dict
 
+    def test_extraction_timings_reported(self):
+        """Full extraction reports per-stage and per-primitive timings."""
+        from feature_extraction import extract_all_trance_features
+
+        audio = generate_kick_pattern(138, 5.0)
+        features = extract_all_trance_features(audio, sr=SR)
+
+        assert 'stage:pumping' in features.extraction_timings
+        assert 'stft:mono' in features.extraction_timings
+        assert all(v >= 0 for v in features.extraction_timings.values())
+
+    def test_pitch_method_reaches_acid_detector(self, monkeypatch):
+        """The acid glide analysis uses the requested pitch tracker."""
+        from feature_extraction import acid_detector, extract_all_trance_features
+
+        methods = []
+        real = acid_detector.get_pitch_tracker
+
+        def recording(method, **kwargs):
+            methods.append(method)
+            return real(method, **kwargs)
+
+        monkeypatch.setattr(acid_detector, 'get_pitch_tracker', recording)
+        audio = generate_kick_pattern(138, 3.0)
+        extract_all_trance_features(audio, sr=SR)
+        extract_all_trance_features(audio, sr=SR, pitch_method='accurate')
+
+        assert methods == ['fast', 'accurate']
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
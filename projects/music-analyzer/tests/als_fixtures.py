@@ -0,0 +1,80 @@
+"""
+Synthetic Live Sets shared by the ALS tests and benchmarks.
+"""
+
+import gzip
+from pathlib import Path
+
+
+def _mixer(volume="0.85", pan="0", speaker="true"):
+    return (f'<Mixer><Volume><Manual Value="{volume}"/></Volume><Pan><Manual Value="{pan}"/></Pan>'
+            f'<Speaker><Manual Value="{speaker}"/></Speaker><Solo><Manual Value="false"/></Solo></Mixer>')
+
+
+def _devices(plugin):
+    return ('<DeviceChain><Devices>'
+            '<Eq8><On><Manual Value="true"/></On><UserName Value=""/></Eq8>'
+            f'<PluginDevice><On><Manual Value="false"/></On><PluginDesc><VstPluginInfo>'
+            f'<PlugName Value="{plugin}"/><Manufacturer Value="Acme"/></VstPluginInfo></PluginDesc>'
+            '</PluginDevice></Devices></DeviceChain>')
+
+
+def _midi_clip(start, notes_per_key):
+    key_tracks = ''.join(
+        f'<KeyTrack><Notes>' + ''.join(
+            f'<MidiNoteEvent Time="{start + i * 0.25 + (0.02 if i % 3 else 0)}" Duration="0.25" '
+            f'Velocity="{90 + i % 20}" IsEnabled="true"/>' for i in range(notes_per_key)
+        ) + f'</Notes><MidiKey Value="{pitch}"/></KeyTrack>'
+        for pitch in (60, 64, 67)
+    )
+    return (f'<MidiClip Time="{start}"><CurrentStart Value="{start}"/><CurrentEnd Value="{start + 16}"/>'
+            f'<Loop><LoopStart Value="0"/><LoopEnd Value="16"/></Loop><Name Value="Clip {start:g}"/>'
+            f'<Color Value="3"/><Notes><KeyTracks>{key_tracks}</KeyTracks></Notes></MidiClip>')
+
+
+def build_als(path: Path, clips_per_track: int = 2, notes_per_key: int = 8, gzipped: bool = True) -> Path:
+    """Write a small but structurally realistic Live Set."""
+    tracks = []
+    for t in range(2):
+        clips = ''.join(_midi_clip(c * 16.0, notes_per_key) for c in range(clips_per_track))
+        tracks.append(
+            f'<MidiTrack Id="{t}"><Name><EffectiveName Value="Lead {t}"/><UserName Value=""/></Name>'
+            f'<Color Value="{10 + t}"/><DeviceChain>{_mixer(pan="-0.5")}'
+            f'<MainSequencer><ClipTimeable><ArrangerAutomation><Events>{clips}</Events>'
+            f'</ArrangerAutomation></ClipTimeable></MainSequencer>{_devices(f"Synth {t}")}'
+            f'</DeviceChain></MidiTrack>'
+        )
+    tracks.append(
+        '<AudioTrack Id="5"><Name><UserName Value=""/></Name><Color Value="4"/><DeviceChain>'
+        f'{_mixer(speaker="false")}<MainSequencer><Sample><ArrangerAutomation><Events>'
+        '<AudioClip Time="0"><CurrentStart Value="0"/><CurrentEnd Value="64"/><Name Value="Drums"/>'
+        '<SampleRef><FileRef><Path Value="C:/Samples/drums.wav"/></FileRef></SampleRef>'
+        '<WarpMode Value="0"/></AudioClip></Events></ArrangerAutomation></Sample></MainSequencer>'
+        '<DeviceChain><Devices/></DeviceChain></DeviceChain></AudioTrack>'
+    )
+    tracks.append(
+        f'<ReturnTrack Id="8"><Name><EffectiveName Value="Reverb"/></Name><DeviceChain>{_mixer()}'
+        f'{_devices("Valhalla")}</DeviceChain></ReturnTrack>'
+    )
+    tracks.append('<GroupTrack Id="9"><Name><EffectiveName Value="Drums Bus"/></Name>'
+                  f'<DeviceChain>{_mixer()}</DeviceChain></GroupTrack>')
+
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Ableton MajorVersion="5" MinorVersion="11.0_11300" Creator="Ableton Live 11.3.4">'
+        f'<LiveSet><Tracks>{"".join(tracks)}</Tracks>'
+        '<MasterTrack><Name><EffectiveName Value="Master"/></Name><DeviceChain>'
+        f'<Mixer><Tempo><Manual Value="138"/><ArrangerAutomation><Automation><Events>'
+        '<FloatEvent Time="32" Value="140"/><FloatEvent Time="0" Value="138"/>'
+        '</Events></Automation></ArrangerAutomation></Tempo>'
+        '<TimeSignature><Numerator><Manual Value="3"/></Numerator>'
+        '<Denominator><Manual Value="4"/></Denominator></TimeSignature>'
+        f'<Volume><Manual Value="0.85"/></Volume></Mixer>{_devices("Limiter")}</DeviceChain></MasterTrack>'
+        '<Locators><Locators><Locator><Time Value="64"/><Name Value="Drop"/></Locator>'
+        '<Locator><Time Value="0"/><Name Value=""/></Locator></Locators></Locators>'
+        '<Scenes><Scene><Name Value="Intro"/><Tempo Value="138"/></Scene><Scene><Name Value=""/></Scene></Scenes>'
+        '</LiveSet></Ableton>'
+    )
+    data = xml.encode()
+    path.write_bytes(gzip.compress(data) if gzipped else data)
+    return path
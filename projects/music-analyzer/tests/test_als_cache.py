@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide parsed ALS cache.
+"""
+
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import als_cache
+from als_cache import ALSCache, configure_als_cache, get_als_cache
+from als_parser import ALSParser
+from als_stream import DEVICE_PARTS
+from device_chain_analyzer import DeviceChainAnalyzer
+from project_differ import ProjectDiffer
+from watcher import ALSFileEventHandler
+
+from tests.als_fixtures import build_als
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    configure_als_cache(max_entries=8)
+    yield
+    configure_als_cache()
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    """Count how often each module actually streams a file."""
+    reads = []
+    for module in ('als_parser', 'device_chain_analyzer'):
+        reader_class = sys.modules[module].ALSStreamReader
+
+        def counting(path, include, _cls=reader_class, _module=module):
+            reads.append(_module)
+            return _cls(path, include)
+        monkeypatch.setattr(sys.modules[module], 'ALSStreamReader', counting)
+    return reads
+
+
+def test_parse_once_per_kind(tmp_path, count_reads):
+    """Repeat requests for the same extraction reuse the parsed result."""
+    path = str(build_als(tmp_path / "song.als"))
+
+    first = ALSParser().parse(path)
+    assert ALSParser().parse(path) is first
+    assert ALSParser().parse(path, include=DEVICE_PARTS) is not first
+    analysis = DeviceChainAnalyzer().analyze(path)
+    assert DeviceChainAnalyzer().analyze(path) is analysis
+
+    assert count_reads == ['als_parser', 'als_parser', 'device_chain_analyzer']
+    assert get_als_cache().hits == 2
+
+
+def test_differ_shares_analysis(tmp_path, count_reads):
+    """Comparing against the same version again does not re-read it."""
+    before = str(build_als(tmp_path / "v1.als", clips_per_track=1))
+    after = str(build_als(tmp_path / "v2.als", clips_per_track=2))
+
+    differ = ProjectDiffer()
+    differ.compare(before, after)
+    differ.compare(before, after)
+    DeviceChainAnalyzer().analyze(after)
+
+    assert count_reads == ['device_chain_analyzer'] * 2
+
+
+def test_changed_file_is_reparsed(tmp_path):
+    """A new size or mtime is a new key."""
+    path = build_als(tmp_path / "song.als", clips_per_track=1)
+    first = ALSParser().parse(str(path))
+
+    build_als(path, clips_per_track=3)
+    second = ALSParser().parse(str(path))
+    assert second is not first
+    assert len(second.tracks[0].midi_clips) == 3
+
+
+def test_invalidate_and_lru():
+    """Explicit invalidation drops all kinds of a path; old entries are evicted."""
+    cache = ALSCache(max_entries=2)      # Any existing file works as identity
+    cache.get_or_parse(__file__, 'x', lambda: 1)
+    cache.get_or_parse(__file__, 'y', lambda: 2)
+    assert cache.get_or_parse(__file__, 'x', lambda: 0) == 1
+
+    cache.get_or_parse(__file__, 'z', lambda: 3)     # Evicts 'y'
+    assert len(cache) == 2
+    assert cache.get_or_parse(__file__, 'y', lambda: 4) == 4
+
+    assert cache.invalidate(__file__) == 2
+    assert len(cache) == 0
+
+
+def test_watcher_invalidates(tmp_path):
+    """File events drop cached results even if size and mtime are unchanged."""
+    path = build_als(tmp_path / "song.als")
+    first = ALSParser().parse(str(path))
+
+    stat = path.stat()
+    build_als(path, notes_per_key=9)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    handler = ALSFileEventHandler(callback=lambda event: None, quiet=True)
+    handler.on_any_event(SimpleNamespace(is_directory=False, src_path=str(path), event_type='modified'))
+
+    assert ALSParser().parse(str(path)) is not first
+
+
+def test_disabled(tmp_path, count_reads):
+    configure_als_cache(enabled=False)
+    path = str(build_als(tmp_path / "song.als"))
+
+    assert get_als_cache() is None
+    assert ALSParser().parse(path) is not ALSParser().parse(path)
+    assert als_cache.invalidate_als(path) == 0
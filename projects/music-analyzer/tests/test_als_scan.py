@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental scan manifest and parallel scanning.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(src_path.parent))
+
+from als_scan import MODIFIED, NEW, TOUCHED, UNCHANGED, ScanManifest, scan_files
+from database import db_init, get_db, persist_scan_result
+
+from tests.als_fixtures import build_als
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "data" / "projects.db"
+    db_init(path)
+    return path
+
+
+def save(manifest: ScanManifest, paths, db_path: Path, jobs: int = 1):
+    for outcome in scan_files(paths, jobs=jobs):
+        assert outcome.error is None
+        success, message, version_id = persist_scan_result(outcome.result, db_path)
+        assert success, message
+        manifest.record(outcome, version_id)
+
+
+def statuses(manifest: ScanManifest, paths):
+    return [f.status for f in manifest.plan(paths).files]
+
+
+def test_plan_follows_file_changes(tmp_path, db_path):
+    """New, unchanged, touched and modified files are told apart."""
+    folder = tmp_path / "song"
+    folder.mkdir()
+    paths = [build_als(folder / f"v{i}.als", clips_per_track=1) for i in range(3)]
+    manifest = ScanManifest(db_path)
+
+    assert statuses(manifest, paths) == [NEW, NEW, NEW]
+    save(manifest, paths[:2], db_path)
+    assert statuses(manifest, paths) == [UNCHANGED, UNCHANGED, NEW]
+
+    os.utime(paths[0], ns=(0, 10 ** 9))
+    build_als(paths[1], clips_per_track=4)
+    plan = manifest.plan(paths)
+    assert [f.status for f in plan.files] == [TOUCHED, MODIFIED, NEW]
+    assert plan.to_analyze == paths[1:]
+    assert manifest.plan(paths, full=True).to_analyze == paths
+
+    # Refreshed touched files are unchanged again without hashing
+    manifest.refresh(plan.touched)
+    assert statuses(manifest, paths[:1]) == [UNCHANGED]
+
+    # A deleted version means the file has to be scanned again
+    with get_db(db_path).connection() as conn:
+        conn.execute("DELETE FROM versions WHERE als_path = ?", (str(paths[0].absolute()),))
+    assert statuses(manifest, paths[:1]) == [NEW]
+
+
+def test_parallel_scan_matches_serial(tmp_path, db_path):
+    """A process pool returns the same results as a serial scan."""
+    paths = [build_als(tmp_path / f"v{i}.als", clips_per_track=i + 1) for i in range(3)]
+    paths.append(tmp_path / "broken.als")
+    paths[-1].write_bytes(b"not a live set")
+
+    serial = {o.als_path: o for o in scan_files(paths)}
+    parallel = {o.als_path: o for o in scan_files(paths, jobs=2)}
+
+    assert serial.keys() == parallel.keys()
+    assert serial[str(paths[-1])].error and parallel[str(paths[-1])].result is None
+    for path in paths[:-1]:
+        a, b = serial[str(path)], parallel[str(path)]
+        assert a.content_hash == b.content_hash
+        assert (a.result.health_score, a.result.total_issues, a.result.total_devices) == \
+            (b.result.health_score, b.result.total_issues, b.result.total_devices)
+
+    manifest = ScanManifest(db_path)
+    save(manifest, paths[:-1], db_path, jobs=2)
+    assert manifest.plan(paths).to_analyze == paths[-1:]
+
+
+def test_scan_without_save_reports_unchanged_files(tmp_path, db_path, monkeypatch):
+    """Only --save skips unchanged files; a plain scan grades every file."""
+    import database
+    from als_doctor import cli
+
+    monkeypatch.setattr(database, "DEFAULT_DB_PATH", db_path)
+    folder = tmp_path / "song"
+    folder.mkdir()
+    for i in range(2):
+        build_als(folder / f"v{i}.als", clips_per_track=1)
+
+    runner = CliRunner()
+    saved = runner.invoke(cli, ["--no-color", "scan", str(folder), "--save"])
+    assert saved.exit_code == 0, saved.output
+    assert "Saved 2 scan result(s)" in saved.output
+
+    again = runner.invoke(cli, ["--no-color", "scan", str(folder), "--save"])
+    assert "Skipping 2 unchanged file(s)" in again.output
+
+    report = runner.invoke(cli, ["--no-color", "scan", str(folder)])
+    assert report.exit_code == 0, report.output
+    assert "Skipping" not in report.output
+    assert "Scanned: 2 successful, 0 failed" in report.output
+    assert report.output.count("/100") == 2
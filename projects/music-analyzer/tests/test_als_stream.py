@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming ALS reader and the parsers built on it.
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from als_stream import ALSStreamReader, DEVICE_PARTS
+from als_parser import ALSParser
+from device_chain_analyzer import DeviceChainAnalyzer
+
+from tests.als_fixtures import build_als
+
+
+@pytest.fixture
+def als_file(tmp_path):
+    return build_als(tmp_path / "song.als")
+
+
+def test_parse_full_project(als_file):
+    """Streaming parse extracts tracks, clips, notes, structure and settings."""
+    project = ALSParser().parse(str(als_file))
+
+    assert project.ableton_version == "Ableton Live 11.3.4"
+    assert (project.tempo, project.time_signature_numerator, project.time_signature_denominator) == (138.0, 3, 4)
+    assert [(t.id, t.name, t.track_type) for t in project.tracks] == [
+        (0, "Lead 0", "midi"), (1, "Lead 1", "midi"), (2, "Audio 3", "audio"),
+        (100, "Reverb", "return"), (200, "Drums Bus", "group"),
+    ]
+
+    lead = project.tracks[0]
+    assert lead.color == 10 and lead.pan == -0.5
+    assert lead.devices == ["Eq8", "PluginDevice"]
+    assert [c.name for c in lead.midi_clips] == ["Clip 0", "Clip 16"]
+    assert project.midi_note_count == 2 * 2 * 3 * 8
+    assert project.tracks[2].is_muted
+    assert project.tracks[2].audio_clips[0].file_path == "C:/Samples/drums.wav"
+    assert project.total_duration_beats == 64.0
+
+    assert project.plugin_list == ["Limiter", "Synth 0", "Synth 1", "Valhalla"]
+    structure = project.project_structure
+    assert [(l.time, l.name) for l in structure.locators] == [(0.0, "Marker 2"), (64.0, "Drop")]
+    assert [(s.name, s.tempo) for s in structure.scenes] == [("Intro", 138.0), ("Scene 2", None)]
+    assert [(c.time, c.tempo) for c in structure.tempo_automation] == [(0.0, 138.0), (32.0, 140.0)]
+    assert "Lead 0" in project.midi_analysis
+
+
+def test_parse_subset(als_file):
+    """Unrequested parts are skipped entirely."""
+    project = ALSParser().parse(str(als_file), include=DEVICE_PARTS)
+
+    assert len(project.tracks) == 5
+    assert project.tracks[0].devices == ["Eq8", "PluginDevice"]
+    assert project.midi_note_count == 0
+    assert not project.tracks[0].midi_clips
+    assert project.plugin_list == []
+    assert not project.project_structure.locators
+    assert project.tempo == 138.0
+
+
+def test_uncompressed_file(tmp_path):
+    """Plain XML Live Sets are read as well."""
+    path = build_als(tmp_path / "plain.als", gzipped=False)
+    assert len(ALSParser().parse(str(path)).tracks) == 5
+
+
+def test_device_chain_analyzer(als_file):
+    """als-doctor's device analysis reads tracks and devices only."""
+    analysis = DeviceChainAnalyzer().analyze(str(als_file))
+
+    assert analysis.tempo == 138.0
+    assert [(t.track_name, t.track_type, t.track_index) for t in analysis.tracks] == [
+        ("Lead 0", "midi", 0), ("Lead 1", "midi", 1), ("Audio 3", "audio", 2),
+        ("Reverb", "return", 100), ("Master", "master", 999),
+    ]
+    assert analysis.total_devices == 8
+    assert analysis.total_disabled_devices == 4
+    assert "Synth 0" in analysis.all_plugins
+
+
+def test_reader_memory_is_flat(tmp_path):
+    """Peak memory does not grow with the number of clips and notes."""
+    def peak(path):
+        tracemalloc.start()
+        for _ in ALSStreamReader(str(path)):
+            pass
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_bytes
+
+    small = peak(build_als(tmp_path / "small.als", clips_per_track=4))
+    large = peak(build_als(tmp_path / "large.als", clips_per_track=64))
+    assert large < small * 1.5
+
+
+def test_unknown_part(als_file):
+    with pytest.raises(ValueError):
+        ALSStreamReader(str(als_file), include={'tracks', 'waveforms'})
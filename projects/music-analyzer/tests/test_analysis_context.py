@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the decode-once AnalysisContext.
+
+Covers buffer layout, memoization of derived views, and agreement with the
+equivalent direct librosa calls.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import librosa
+import soundfile as sf
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from analysis_context import AnalysisContext
+
+
+SR = 22050
+
+
+def _stereo_tone(duration: float = 3.0) -> np.ndarray:
+    t = np.arange(int(SR * duration)) / SR
+    left = 0.5 * np.sin(2 * np.pi * 220 * t)
+    right = 0.4 * np.sin(2 * np.pi * 330 * t)
+    return np.stack([left, right]).astype(np.float32)
+
+
+def test_from_file_layout(tmp_path):
+    """Stereo files decode to (channels, samples) with a soundfile-layout view."""
+    y = _stereo_tone()
+    path = tmp_path / "tone.wav"
+    sf.write(str(path), y.T, SR, subtype='FLOAT')
+
+    ctx = AnalysisContext.from_file(str(path))
+
+    assert ctx.sr == SR
+    assert ctx.is_stereo
+    assert ctx.channels == 2
+    assert ctx.y.shape == y.shape
+    assert ctx.audio_data.shape == (y.shape[1], 2)
+    assert np.allclose(ctx.mono, y.mean(axis=0))
+    assert abs(ctx.duration - 3.0) < 1e-6
+
+
+def test_from_file_missing():
+    """Missing files raise FileNotFoundError."""
+    try:
+        AnalysisContext.from_file("/nonexistent/file.wav")
+        assert False, "expected FileNotFoundError"
+    except FileNotFoundError:
+        pass
+
+
+def test_mono_single_channel_is_flattened():
+    """A (1, n) buffer is treated as mono."""
+    ctx = AnalysisContext(_stereo_tone()[:1], SR)
+    assert ctx.y.ndim == 1
+    assert not ctx.is_stereo
+    assert ctx.mono is ctx.y
+
+
+def test_views_are_memoized():
+    """Derived views are computed once and reused."""
+    ctx = AnalysisContext(_stereo_tone(), SR)
+
+    assert ctx.magnitude() is ctx.magnitude()
+    assert ctx.magnitude(4096) is ctx.magnitude(n_fft=4096)
+    assert ctx.magnitude(4096) is not ctx.magnitude()
+    assert ctx.onset_envelope() is ctx.onset_envelope()
+    assert ctx.rms() is ctx.rms()
+    assert ctx.spectral_centroid() is ctx.spectral_centroid()
+
+
+def test_views_match_librosa():
+    """Shared views agree with the direct librosa computations they replace."""
+    ctx = AnalysisContext(_stereo_tone(), SR)
+    mono = librosa.to_mono(ctx.y)
+
+    assert np.allclose(ctx.magnitude(), np.abs(librosa.stft(mono)), atol=1e-4)
+    assert np.allclose(
+        ctx.spectral_centroid(),
+        librosa.feature.spectral_centroid(y=mono, sr=SR)[0],
+        rtol=1e-4
+    )
+    assert np.allclose(
+        ctx.onset_envelope(),
+        librosa.onset.onset_strength(y=mono, sr=SR),
+        atol=1e-3
+    )
+
+
+def test_ensure_passthrough():
+    """ensure() wraps raw buffers and passes contexts through untouched."""
+    ctx = AnalysisContext(_stereo_tone(), SR)
+    assert AnalysisContext.ensure(ctx) is ctx
+
+    wrapped = AnalysisContext.ensure(ctx.mono, SR)
+    assert wrapped.sr == SR
+    assert wrapped.y.ndim == 1
+
+    try:
+        AnalysisContext.ensure(ctx.mono)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
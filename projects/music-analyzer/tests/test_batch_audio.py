@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for process-pool batch audio analysis.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from batch_audio import BatchOptions, find_audio_files, run_batch, write_batch_summary
+
+
+SR = 22050
+
+
+@pytest.fixture(scope="module")
+def bounce_dir(tmp_path_factory):
+    """Two short stereo bounces, one corrupt file and a non-audio file."""
+    root = tmp_path_factory.mktemp("bounces")
+    t = np.arange(SR * 3) / SR
+    for i, freq in enumerate([110, 220]):
+        tone = 0.4 * np.sin(2 * np.pi * freq * t) * np.exp(-(t % 0.5) * 10)
+        sf.write(str(root / f"bounce{i}.wav"), np.stack([tone, tone]).T, SR)
+    (root / "corrupt.wav").write_bytes(b"RIFFjunk")
+    (root / "notes.txt").write_text("not audio")
+    return root
+
+
+def test_find_audio_files(bounce_dir):
+    """Only audio extensions are listed, sorted."""
+    names = [Path(p).name for p in find_audio_files(str(bounce_dir))]
+    assert names == ["bounce0.wav", "bounce1.wav", "corrupt.wav"]
+
+
+def test_run_batch_and_summary(bounce_dir, tmp_path):
+    """Files are analyzed in parallel; failures are reported per file."""
+    files = find_audio_files(str(bounce_dir))
+    progress = []
+    result = run_batch(
+        files, BatchOptions(sections=False), workers=2, timeout=120,
+        progress_callback=lambda item, done, total: progress.append((done, total))
+    )
+
+    assert [item.file_path for item in result.items] == files
+    assert [item.status for item in result.items] == ["ok", "ok", "error"]
+    assert result.items[0].integrated_lufs < 0
+    assert result.items[1].duration_seconds == pytest.approx(3.0, abs=0.01)
+    assert result.items[2].error
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+    json_path, html_path = write_batch_summary(result, str(tmp_path))
+    summary = json.loads(json_path.read_text())
+    assert (summary["ok"], summary["errors"], summary["timeouts"]) == (2, 1, 0)
+    assert "bounce1.wav" in html_path.read_text()
+
+
+def test_run_batch_timeout(bounce_dir):
+    """Files exceeding the per-file timeout are reported and the run completes."""
+    files = find_audio_files(str(bounce_dir))[:2]
+    result = run_batch(files, BatchOptions(), workers=1, timeout=0.001)
+
+    assert [item.status for item in result.items] == ["timeout", "timeout"]
+    assert result.timeout_count == 2
+
+
+def test_run_batch_timeout_applies_between_start_polls(bounce_dir, monkeypatch):
+    """A file that finishes before its start report is seen still times out."""
+    import multiprocessing
+    import batch_audio
+
+    if multiprocessing.get_context().get_start_method() != "fork":
+        pytest.skip("patching the worker needs the fork start method")
+
+    def slow(item, audio_path):
+        time.sleep(0.5)
+
+    monkeypatch.setattr(batch_audio, "_fill_item", slow)
+    # The parent waits on the future, not on the start report, for this long
+    monkeypatch.setattr(batch_audio, "_START_POLL_SECONDS", 30.0)
+    files = find_audio_files(str(bounce_dir))[:1]
+    result = run_batch(files, BatchOptions(), workers=1, timeout=0.2)
+
+    assert [item.status for item in result.items] == ["timeout"]
+    assert result.items[0].elapsed_seconds >= 0.5
+
+
+def test_run_batch_timeout_terminates_stuck_worker(bounce_dir, tmp_path, monkeypatch):
+    """A worker stuck past the timeout is killed, not left running."""
+    import multiprocessing
+    import os
+    import batch_audio
+
+    if multiprocessing.get_context().get_start_method() != "fork":
+        pytest.skip("patching the worker needs the fork start method")
+
+    pid_file = tmp_path / "worker.pid"
+
+    def stuck(item, audio_path):
+        pid_file.write_text(str(os.getpid()))
+        time.sleep(60)
+
+    monkeypatch.setattr(batch_audio, "_fill_item", stuck)
+    files = find_audio_files(str(bounce_dir))[:1]
+    start = time.time()
+    result = run_batch(files, BatchOptions(), workers=1, timeout=1)
+
+    assert [item.status for item in result.items] == ["timeout"]
+    assert time.time() - start < 30
+    pid = int(pid_file.read_text())
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        try:
+            os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            pass
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("stuck worker is still running")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for BatchScanner executors.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from batch_scanner import BatchScanner
+
+from tests.als_fixtures import build_als
+
+
+@pytest.fixture(scope="module")
+def project_dir(tmp_path_factory):
+    """Five Live Sets in two project folders and one broken file."""
+    root = tmp_path_factory.mktemp("projects")
+    for i in range(5):
+        folder = root / f"{i % 2} Project"
+        folder.mkdir(exist_ok=True)
+        build_als(folder / f"song_{i}.als", clips_per_track=i + 1)
+    (root / "broken.als").write_bytes(b"not a live set")
+    return root
+
+
+def summary_key(song):
+    return (song.file_path, song.health_score, song.total_issues, song.total_devices,
+            song.track_count, song.workability_grade, song.error is None)
+
+
+@pytest.mark.parametrize("executor,chunksize", [("thread", None), ("process", None), ("process", 4)])
+def test_executors_match_serial(project_dir, executor, chunksize):
+    """Every executor returns the same summaries and streams each file once."""
+    scanner = BatchScanner()
+    serial = scanner.scan_directory(str(project_dir), executor="serial")
+
+    streamed = []
+    result = scanner.scan_directory(
+        str(project_dir), executor=executor, max_workers=2, chunksize=chunksize,
+        on_result=lambda song, done, total: streamed.append((song.file_path, done, total))
+    )
+
+    assert (result.successful, result.failed) == (serial.successful, serial.failed) == (5, 1)
+    assert sorted(map(summary_key, result.songs)) == sorted(map(summary_key, serial.songs))
+    assert result.best_songs and sorted(result.best_songs) == sorted(serial.best_songs)
+    assert [done for _, done, _ in streamed] == list(range(1, 7))
+    assert {path for path, _, _ in streamed} == {s.file_path for s in serial.songs}
+
+
+def test_unknown_executor(project_dir):
+    with pytest.raises(ValueError):
+        list(BatchScanner().iter_scan([str(project_dir / "broken.als")], executor="gpu"))
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Tests for the analyzer configuration container.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from config import DEFAULT_CONFIG, AnalyzerConfig
+
+
+def test_override_stages():
+    """Stage overrides apply to one config without touching the defaults."""
+    cfg = AnalyzerConfig()
+    cfg.override_stages({'section_analysis': False})
+
+    assert not cfg.stage_enabled('section_analysis')
+    assert cfg.stage_enabled('audio_analysis')
+    assert DEFAULT_CONFIG['stages'].get('section_analysis', True)
+    assert AnalyzerConfig().stage_enabled('section_analysis')
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-track diagnosis cache of EffectChainDoctor.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from device_chain_analyzer import Device, DeviceCategory, ProjectDeviceAnalysis, TrackDeviceChain
+from effect_chain_doctor import (
+    EffectChainDoctor, TrackDiagnosisCache, configure_track_cache, get_track_cache
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_track_cache():
+    configure_track_cache()
+    yield
+    configure_track_cache()
+
+
+def make_track(index: int, enabled: bool = True) -> TrackDeviceChain:
+    devices = [
+        Device(index=0, device_type="Eq8", category=DeviceCategory.EQ, name="EQ Eight", is_enabled=True),
+        Device(index=1, device_type="Compressor2", category=DeviceCategory.COMPRESSOR,
+               name="Compressor", is_enabled=enabled),
+        Device(index=2, device_type="Eq8", category=DeviceCategory.EQ, name="EQ Eight", is_enabled=True),
+    ]
+    return TrackDeviceChain(track_name=f"Track {index}", track_type="audio", track_index=index,
+                            volume_db=0.0, pan=0.0, is_muted=False, is_solo=False, devices=devices)
+
+
+def make_analysis(disabled_tracks=()) -> ProjectDeviceAnalysis:
+    return ProjectDeviceAnalysis(
+        file_path="song.als", ableton_version="11.0", tempo=120.0,
+        tracks=[make_track(i, enabled=i not in disabled_tracks) for i in range(6)]
+    )
+
+
+def summary(diagnosis):
+    return (diagnosis.overall_health, diagnosis.total_issues, diagnosis.critical_issues,
+            diagnosis.warning_issues, diagnosis.clutter_percentage,
+            [(t.track_name, t.health_score, [(i.category, i.track_name, i.device_name, i.device_index)
+                                             for i in t.issues])
+             for t in diagnosis.track_diagnoses],
+            [(i.category, i.title) for i in diagnosis.global_issues])
+
+
+def test_cached_diagnosis_matches_fresh():
+    """Reused track diagnoses give the same project diagnosis as a fresh run."""
+    fresh = EffectChainDoctor(use_track_cache=False).diagnose(make_analysis(disabled_tracks={2}))
+    first = EffectChainDoctor().diagnose(make_analysis(disabled_tracks={2}))
+    second = EffectChainDoctor().diagnose(make_analysis(disabled_tracks={2}))
+
+    assert (first.reused_tracks, second.reused_tracks) == (0, 6)
+    assert summary(fresh) == summary(first) == summary(second)
+    assert fresh.total_issues > 0
+
+
+def test_only_changed_tracks_rediagnosed():
+    cache = TrackDiagnosisCache()
+    doctor = EffectChainDoctor(track_cache=cache)
+    doctor.diagnose(make_analysis())
+
+    changed = doctor.diagnose(make_analysis(disabled_tracks={4}))
+    assert changed.reused_tracks == 5 and (cache.hits, cache.misses) == (5, 7)
+    assert summary(changed) == summary(EffectChainDoctor(use_track_cache=False)
+                                       .diagnose(make_analysis(disabled_tracks={4})))
+
+    # Issues handed out are copies, so callers cannot change cached results
+    changed.track_diagnoses[4].issues.clear()
+    assert doctor.diagnose(make_analysis(disabled_tracks={4})).track_diagnoses[4].issues
+
+
+def test_cache_bounded_and_configurable():
+    cache = TrackDiagnosisCache(max_entries=2)
+    EffectChainDoctor(track_cache=cache).diagnose(make_analysis())
+    assert len(cache) == 2
+
+    configure_track_cache(enabled=False)
+    assert get_track_cache() is None
+    assert EffectChainDoctor().diagnose(make_analysis()).reused_tracks == 0
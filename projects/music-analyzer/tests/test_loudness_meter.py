@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized BS.1770-4 loudness meter.
+
+Integrated loudness is checked against pyloudnorm (when installed) and
+against values pyloudnorm 0.2.0 reported for the same signals, true peak
+against an inter-sample peak whose value is known analytically.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from loudness_meter import ABSOLUTE_GATE_LUFS, LoudnessMeter, measure_loudness
+
+
+SR = 48000
+
+
+def _program(duration: float = 20.0) -> np.ndarray:
+    """Stereo noise bed with a quiet intro, a loud drop and a breakdown."""
+    rng = np.random.default_rng(1)
+    n = int(SR * duration)
+    t = np.arange(n) / SR
+    envelope = np.where(t < 5, 0.05, np.where(t < 12, 0.3, 0.1))
+    noise = rng.normal(0, 1, (n, 2)) * envelope[:, None]
+    tone = 0.2 * np.sin(2 * np.pi * 110 * t)[:, None]
+    return (noise + tone).clip(-1, 1).astype(np.float32)
+
+
+def _mono_program(sr: int = 44100, duration: float = 12.0) -> np.ndarray:
+    """Mono noise bed with a quiet intro, a loud middle and a quiet outro."""
+    rng = np.random.default_rng(2)
+    n = int(sr * duration)
+    t = np.arange(n) / sr
+    envelope = np.where(t < 4, 0.02, np.where(t < 8, 0.4, 0.1))
+    tone = 0.1 * np.sin(2 * np.pi * 440 * t)
+    return (rng.normal(0, 1, n) * envelope + tone).clip(-1, 1).astype(np.float32)
+
+
+# pyloudnorm 0.2.0 integrated loudness of the signals above
+@pytest.mark.parametrize("make_audio, sr, expected", [
+    (_program, SR, -7.5541),
+    (_mono_program, 44100, -7.6343),
+])
+def test_integrated_matches_reference_values(make_audio, sr, expected):
+    """Gated integrated loudness matches stored pyloudnorm results."""
+    assert measure_loudness(make_audio(), sr).integrated_lufs == pytest.approx(expected, abs=0.01)
+
+
+def test_integrated_matches_pyloudnorm():
+    """Gated integrated loudness agrees with pyloudnorm."""
+    pyln = pytest.importorskip("pyloudnorm")
+    audio = _program()
+
+    expected = pyln.Meter(SR).integrated_loudness(audio.astype(np.float64))
+    assert measure_loudness(audio, SR).integrated_lufs == pytest.approx(expected, abs=0.01)
+
+
+def test_block_size_invariance():
+    """Pushing blocks of any size gives the whole-buffer result."""
+    audio = _program(8.0)
+    whole = measure_loudness(audio, SR)
+
+    meter = LoudnessMeter(SR, channels=2)
+    for start in range(0, len(audio), 3001):
+        meter.push(audio[start:start + 3001])
+    streamed = meter.result()
+
+    for name in ('integrated_lufs', 'momentary_max_lufs', 'short_term_max_lufs',
+                 'loudness_range_lu', 'true_peak_db', 'sample_peak_db'):
+        assert getattr(streamed, name) == pytest.approx(getattr(whole, name), abs=1e-6)
+
+
+def test_loudness_range_of_step():
+    """A 10 dB step between two long plateaus reads about 10 LU of range."""
+    t = np.arange(SR * 30) / SR
+    level = np.where(t < 15, 0.05, 0.05 * 10 ** (10 / 20))
+    audio = (level * np.sin(2 * np.pi * 1000 * t)).astype(np.float32)
+
+    result = measure_loudness(audio, SR)
+    assert result.loudness_range_lu == pytest.approx(10.0, abs=0.5)
+    assert result.short_term_max_lufs > result.integrated_lufs
+
+
+def test_true_peak_catches_inter_sample_peak():
+    """A fs/4 sine sampled at 45 degrees peaks 3 dB above its samples."""
+    t = np.arange(SR) / SR
+    audio = np.sin(2 * np.pi * (SR / 4) * t + np.pi / 4).astype(np.float32)
+
+    result = measure_loudness(audio, SR)
+    assert result.sample_peak_db == pytest.approx(-3.01, abs=0.01)
+    assert result.true_peak_db > -0.5
+
+
+def test_silence_reports_absolute_gate():
+    """Digital silence stays finite at the -70 LUFS gate."""
+    result = measure_loudness(np.zeros((SR * 2, 2), dtype=np.float32), SR)
+    assert result.integrated_lufs == ABSOLUTE_GATE_LUFS
+    assert result.momentary_max_lufs == ABSOLUTE_GATE_LUFS
+    assert result.loudness_range_lu == 0.0
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar MIDI note representation and the vectorized MIDI analysis.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from als_parser import ALSParser, MIDIClip, MIDINote, Track
+from midi_notes import (
+    NOTE_DTYPE, chord_groups, clip_note_array, note_hash, off_grid, track_note_array
+)
+
+from tests.als_fixtures import build_als
+
+
+def make_track(clips):
+    return Track(id=0, name="Keys", track_type='midi', color=None, is_muted=False,
+                 is_solo=False, volume_db=0.0, pan=0.0, midi_clips=clips)
+
+
+def test_parser_builds_note_arrays(tmp_path):
+    """Every parsed MIDI clip carries a note array matching its notes."""
+    project = ALSParser().parse(str(build_als(tmp_path / "song.als", clips_per_track=2, notes_per_key=5)))
+
+    clip = project.tracks[0].midi_clips[1]
+    assert clip.note_array.dtype == NOTE_DTYPE
+    assert clip.note_array['pitch'].tolist() == [n.pitch for n in clip.notes]
+    assert clip.note_array['start'].tolist() == [n.start_time for n in clip.notes]
+
+    notes = track_note_array(project.tracks[0].midi_clips)
+    assert len(notes) == 2 * 3 * 5
+    assert notes['clip'].tolist() == [0] * 15 + [1] * 15
+
+
+def test_in_place_edits_need_a_cleared_array(tmp_path):
+    """Edited notes are picked up once the stored array is cleared."""
+    project = ALSParser().parse(str(build_als(tmp_path / "song.als", clips_per_track=1, notes_per_key=2)))
+    clip = project.tracks[0].midi_clips[0]
+
+    clip.notes[0].pitch = 72
+    assert clip_note_array(clip)['pitch'][0] != 72     # Documented: not tracked
+
+    clip.note_array = None
+    assert clip_note_array(clip)['pitch'][0] == 72
+
+
+def test_hand_built_clips_are_converted():
+    """Clips without a stored array (or with stale ones) are converted from .notes."""
+    clip = MIDIClip(name="A", start_time=0, end_time=4, loop_start=0, loop_end=4,
+                    notes=[MIDINote(60, 100, 0.0, 1.0), MIDINote(64, 90, 1.0, 1.0, mute=True)])
+    notes = clip_note_array(clip)
+    assert notes['velocity'].tolist() == [100, 90]
+    assert notes['mute'].tolist() == [False, True]
+
+
+def test_greedy_chord_groups():
+    """Groups are anchored on their first note, like the per-note scan they replace."""
+    start = np.array([0.0, 0.04, 0.02, 0.08, 0.09, 0.1, 1.0, 1.0, 2.0])
+    groups = [g.tolist() for g in chord_groups(start, 0.05, min_size=2)]
+    # 0.08 is > 0.05 after the 0.0 anchor, so it opens the next group
+    assert groups == [[0, 2, 1], [3, 4, 5], [6, 7]]
+    assert [g.tolist() for g in chord_groups(start, 0.05)] == [[0, 2, 1], [3, 4, 5]]
+
+
+def test_analyze_midi_track():
+    """Quantization, chords, swing and velocity statistics on a note array."""
+    notes = [MIDINote(p, 100, 0.0, 2.0) for p in (57, 60, 64)]                      # Am at beat 0
+    notes += [MIDINote(48, 80 + 10 * (i % 2), i + 0.5 + 0.08 * (i % 2), 0.25) for i in range(8)]
+    notes.append(MIDINote(72, 127, 3.52, 0.25, mute=True))
+    analysis = ALSParser().analyze_midi_track(make_track([
+        MIDIClip(name="A", start_time=0, end_time=8, loop_start=0, loop_end=8, notes=notes)
+    ]))
+
+    assert analysis.note_count == 12
+    assert analysis.velocity_range == (80, 100)
+    assert [(c.time, c.pitches, c.chord_name) for c in analysis.chords] == [(0.0, [57, 60, 64], 'Am')]
+    assert [(e.time, e.nearest_grid, e.severity) for e in analysis.quantization_errors] == [
+        (1.58, 1.5, 'notable'), (3.58, 3.5, 'notable'), (5.58, 5.5, 'notable'), (7.58, 7.5, 'notable'),
+    ]
+    assert analysis.swing_ratio == 0.54
+
+
+def test_off_grid_and_hash():
+    index, grid, error = off_grid(np.array([0.0, 0.255, 0.48, 1.1]), 0.25)
+    assert index.tolist() == [2, 3]
+    assert grid.tolist() == [0.5, 1.0]
+
+    a = np.zeros(3, dtype=NOTE_DTYPE)
+    a['pitch'] = [60, 64, 67]
+    a['start'] = [0.0, 0.5, 1.0]
+    before = note_hash(a)
+    assert note_hash(a[::-1]) == before
+    a['velocity'][0] = 1
+    assert note_hash(a) != before
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped decoded-audio cache.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import librosa
+import soundfile as sf
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pcm_cache
+from pcm_cache import PCMCache, configure_pcm_cache, load_audio
+
+
+SR = 44100
+
+
+@pytest.fixture
+def stereo_path(tmp_path):
+    """3s stereo file at 44.1 kHz with different content per channel."""
+    t = np.arange(SR * 3) / SR
+    y = np.stack([0.5 * np.sin(2 * np.pi * 220 * t), 0.3 * np.sin(2 * np.pi * 330 * t)])
+    path = tmp_path / "stereo.flac"
+    sf.write(str(path), y.T, SR)
+    return path
+
+
+@pytest.mark.parametrize("sr,mono", [(22050, True), (22050, False), (None, False), (None, True)])
+def test_matches_librosa_load(tmp_path, stereo_path, sr, mono):
+    """Misses and hits return exactly what librosa.load returns."""
+    cache = PCMCache(str(tmp_path / "pcm"))
+    expected, expected_sr = librosa.load(str(stereo_path), sr=sr, mono=mono)
+
+    for _ in range(2):
+        y, out_sr = cache.load(str(stereo_path), sr=sr, mono=mono)
+        assert out_sr == expected_sr
+        assert y.dtype == np.float32
+        np.testing.assert_array_equal(y, expected)
+
+
+def test_hits_are_memory_mapped(tmp_path, stereo_path):
+    """Repeat loads map the stored .npy read-only; the native decode is shared."""
+    cache = PCMCache(str(tmp_path / "pcm"))
+    cache.load(str(stereo_path), sr=22050, mono=True)
+    y, _ = cache.load(str(stereo_path), sr=22050, mono=True)
+
+    assert not y.flags.writeable
+    assert isinstance(y.base, np.memmap)
+    names = sorted(p.name.split('_', 1)[1] for p in (tmp_path / "pcm").glob('*.npy'))
+    assert names == ["22050_mono.npy", "44100_multi.npy"]
+
+
+def test_offset_duration_slice(tmp_path, stereo_path):
+    """offset/duration slice the cached native-rate decode sample-accurately."""
+    cache = PCMCache(str(tmp_path / "pcm"))
+    cache.load(str(stereo_path), sr=None, mono=True)
+    expected, _ = librosa.load(str(stereo_path), sr=None, mono=True, offset=1.0, duration=0.5)
+    y, sr = cache.load(str(stereo_path), sr=None, mono=True, offset=1.0, duration=0.5)
+
+    assert sr == SR
+    assert not y.flags.writeable
+    np.testing.assert_array_equal(y, expected)
+
+
+def test_partial_miss_reads_only_the_window(tmp_path, stereo_path, monkeypatch):
+    """A duration request for an uncached file is a partial librosa.load, not cached."""
+    cache = PCMCache(str(tmp_path / "pcm"))
+    calls = []
+    load = librosa.load
+    monkeypatch.setattr(pcm_cache.librosa, "load",
+                        lambda *args, **kwargs: calls.append(kwargs) or load(*args, **kwargs))
+
+    expected, _ = load(str(stereo_path), sr=22050, mono=True, offset=0.5, duration=1.0)
+    y, sr = cache.load(str(stereo_path), sr=22050, mono=True, offset=0.5, duration=1.0)
+
+    assert sr == 22050
+    np.testing.assert_array_equal(y, expected)
+    assert [c["duration"] for c in calls] == [1.0]
+    assert not list((tmp_path / "pcm").glob('*.npy'))
+
+
+def test_content_change_misses(tmp_path, stereo_path):
+    """Rewriting the file with new audio is not served stale data."""
+    cache = PCMCache(str(tmp_path / "pcm"))
+    first, _ = cache.load(str(stereo_path), sr=None, mono=True)
+    first = np.array(first)
+
+    sf.write(str(stereo_path), np.zeros((SR, 2)), SR)
+    second, _ = cache.load(str(stereo_path), sr=None, mono=True)
+    assert len(second) == SR
+    assert not np.array_equal(second[:100], first[:100])
+
+
+def test_eviction_keeps_size_bounded(tmp_path):
+    """Least recently used decodes are evicted above the size cap."""
+    cache = PCMCache(str(tmp_path / "pcm"), max_size_mb=1.0)   # ~1.06 MB per 6s mono file
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"tone{i}.wav"
+        sf.write(str(path), np.full(SR * 6, 0.1 * (i + 1)), SR)
+        paths.append(path)
+        cache.load(str(path), sr=None, mono=True)
+
+    files = list((tmp_path / "pcm").glob('*.npy'))
+    assert len(files) == 1
+    assert cache.file_hash(str(paths[-1])) in files[0].name
+
+
+def test_other_processes_writes_are_left_alone(tmp_path, stereo_path):
+    """In-flight writes of other processes are not counted, evicted or cleared."""
+    cache = PCMCache(str(tmp_path / "pcm"), max_size_mb=0.5)
+    cache.cache_dir.mkdir(parents=True, exist_ok=True)
+    in_flight = cache.cache_dir / "0123abcd_44100_mono.npy.99999.tmp"
+    in_flight.write_bytes(b"\0" * (1 << 20))
+
+    cache.load(str(stereo_path), sr=None, mono=True)
+    assert in_flight.exists()
+    assert not list(cache.cache_dir.glob(f"*.npy.{os.getpid()}.tmp"))
+    assert cache.size_bytes() == sum(p.stat().st_size for p in cache.cache_dir.glob("*.npy"))
+
+    assert cache.clear() == 1
+    assert in_flight.exists()
+
+
+def test_load_audio_disabled_falls_back(tmp_path, stereo_path):
+    """With the cache disabled load_audio is plain librosa.load."""
+    try:
+        configure_pcm_cache(enabled=False)
+        y, sr = load_audio(str(stereo_path), sr=22050)
+        assert y.flags.writeable
+        assert pcm_cache.get_pcm_cache() is None
+
+        configure_pcm_cache(directory=str(tmp_path / "pcm"))
+        y, sr = load_audio(str(stereo_path), sr=22050)
+        assert not y.flags.writeable
+        assert sr == 22050
+    finally:
+        configure_pcm_cache()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the pluggable pitch trackers.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import librosa
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from pitch_tracker import (
+    PitchTracker, PyinPitchTracker, YinPitchTracker, compare_tracks, get_pitch_tracker, section_regions
+)
+
+
+SR = 22050
+NOTES = [48, 55, 60, 64, 67, 72, 79, 84]    # C3 .. C6
+NOTE_SECONDS = 0.4
+GAP_SECONDS = 0.2
+
+
+@pytest.fixture(scope="module")
+def melody():
+    """Harmonic tones separated by digital silence."""
+    t = np.arange(int(NOTE_SECONDS * SR)) / SR
+    envelope = np.minimum(1.0, t * 200) * np.exp(-t * 2)
+    pieces = []
+    for midi in NOTES:
+        f0 = librosa.midi_to_hz(midi)
+        tone = sum(np.sin(2 * np.pi * k * f0 * t) / k for k in range(1, 4))
+        pieces.extend([0.3 * envelope * tone, np.zeros(int(GAP_SECONDS * SR))])
+    return np.concatenate(pieces)
+
+
+def note_medians(track):
+    """Median MIDI pitch of the voiced frames inside each note."""
+    medians = []
+    for i in range(len(NOTES)):
+        start = i * (NOTE_SECONDS + GAP_SECONDS) + 0.05
+        inside = (track.times >= start) & (track.times < start + NOTE_SECONDS - 0.1)
+        pitches = track.f0[inside & track.voiced_flag]
+        medians.append(int(np.round(librosa.hz_to_midi(np.median(pitches)))) if len(pitches) else None)
+    return medians
+
+
+def test_fast_tracker_finds_notes(melody):
+    """Vectorized YIN recovers every note on pyin's frame grid."""
+    track = get_pitch_tracker('fast').track(melody, SR)
+
+    assert track.method == 'yin'
+    assert len(track.f0) == 1 + len(melody) // 512
+    assert note_medians(track) == NOTES
+    assert np.all(np.isnan(track.f0[~track.voiced_flag]))
+
+
+def test_rms_gate_skips_silence(melody):
+    """Silent frames are never analyzed and come back unvoiced."""
+    gated = YinPitchTracker().track(melody, SR)
+    ungated = YinPitchTracker(rms_threshold_db=None).track(melody, SR)
+
+    assert ungated.frames_analyzed == len(ungated.f0)
+    assert gated.frames_analyzed <= ungated.frames_analyzed - 2 * len(NOTES)   # >= 2 per gap
+    gap = (gated.times > NOTE_SECONDS + 0.07) & (gated.times < NOTE_SECONDS + GAP_SECONDS - 0.07)
+    assert not gated.voiced_flag[gap].any()
+
+
+def test_regions_limit_analysis(melody):
+    """Only frames inside the requested regions are analyzed."""
+    sections = [SimpleNamespace(start_time=0.0, end_time=1.2),
+                SimpleNamespace(start_time=2.4, end_time=3.6)]
+    regions = section_regions(sections, 0.5)
+    assert regions == [pytest.approx((0.35, 0.85)), pytest.approx((2.75, 3.25))]
+
+    track = YinPitchTracker(rms_threshold_db=None).track(melody, SR, regions=regions)
+    assert track.frames_analyzed == np.count_nonzero(
+        ((track.times >= 0.35) & (track.times <= 0.85)) |
+        ((track.times >= 2.75) & (track.times <= 3.25))
+    )
+    assert not track.voiced_flag[track.times > 3.3].any()
+
+
+def test_agrees_with_pyin(melody):
+    """Note-level agreement with the accurate (pyin) tracker."""
+    reference = get_pitch_tracker('accurate').track(melody, SR)
+    candidate = get_pitch_tracker('fast').track(melody, SR)
+
+    assert isinstance(get_pitch_tracker('pyin'), PyinPitchTracker)
+    assert len(reference.f0) == len(candidate.f0)
+    agreement = compare_tracks(reference, candidate)
+    assert agreement['note_count'] >= len(NOTES)
+    assert agreement['note_agreement'] >= 0.9
+    assert agreement['pitch_agreement'] >= 0.9
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        get_pitch_tracker('crepe')
+
+
+def test_base_tracker_is_abstract():
+    with pytest.raises(TypeError):
+        PitchTracker()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for subtree hashes and the hash-aware ProjectDiffer.
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from device_chain_analyzer import (
+    DeviceParameter, analyze_als_devices, device_hash, project_hash, track_hash
+)
+from project_differ import ProjectDiffer
+
+from tests.als_fixtures import build_als
+
+
+def test_hashes_follow_device_content(tmp_path):
+    """Clips do not affect device hashes; a parameter change only touches its path."""
+    before = analyze_als_devices(str(build_als(tmp_path / "v1.als", clips_per_track=1)))
+    same = analyze_als_devices(str(build_als(tmp_path / "v2.als", clips_per_track=3)))
+    assert before.content_hash and project_hash(before) == project_hash(same)
+
+    after = copy.deepcopy(before)
+    eq = after.tracks[0].devices[0]
+    eq.parameters['GlobalGain'] = DeviceParameter(name='GlobalGain', value=1.5)
+    eq.parameters_hash = eq.content_hash = after.tracks[0].content_hash = after.content_hash = ""
+
+    assert device_hash(eq) != device_hash(before.tracks[0].devices[0])
+    assert device_hash(after.tracks[0].devices[1]) == device_hash(before.tracks[0].devices[1])
+    assert track_hash(after.tracks[0]) != track_hash(before.tracks[0])
+    assert track_hash(after.tracks[1]) == track_hash(before.tracks[1])
+    assert project_hash(after) != project_hash(before)
+
+
+def test_identical_subtrees_are_skipped(tmp_path, monkeypatch):
+    """Only changed tracks are compared, and each analysis is diagnosed once."""
+    before = analyze_als_devices(str(build_als(tmp_path / "v1.als")))
+    after = copy.deepcopy(before)
+    device = after.tracks[1].devices[1]
+    device.is_enabled = True
+    device.content_hash = after.tracks[1].content_hash = after.content_hash = ""
+
+    differ = ProjectDiffer()
+    compared, diagnosed = [], []
+    original_compare = differ._compare_track_devices
+    original_diagnose = differ.doctor.diagnose
+    monkeypatch.setattr(differ, '_compare_track_devices',
+                        lambda b, a, d: compared.append(b.track_name) or original_compare(b, a, d))
+    monkeypatch.setattr(differ.doctor, 'diagnose',
+                        lambda analysis: diagnosed.append(analysis) or original_diagnose(analysis))
+
+    diff = differ.compare_analyses(before, after, "v1.als", "v2.als")
+    assert compared == ["Lead 1"]
+    assert [(c.change_type, c.track_name, c.device_name) for c in diff.device_changes] == [
+        ("enabled", "Lead 1", "Synth 1")
+    ]
+
+    unchanged = differ.compare_analyses(after, copy.deepcopy(after), "v2.als", "v3.als")
+    assert compared == ["Lead 1"]
+    assert unchanged.device_changes == [] and unchanged.track_changes == []
+    assert len(diagnosed) == 2
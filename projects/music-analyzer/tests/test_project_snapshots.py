@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for stored per-version project snapshots.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import device_chain_analyzer
+from database import ScanResult, db_init, persist_scan_result, track_changes
+from device_chain_analyzer import analyze_als_devices
+from project_snapshots import (
+    SnapshotStore, backfill_snapshots, get_snapshot_store, load_version_analysis
+)
+
+from tests.als_fixtures import build_als
+
+
+def scan(als_path: Path, db_path: Path, with_analysis: bool = True) -> int:
+    analysis = analyze_als_devices(str(als_path))
+    success, message, version_id = persist_scan_result(ScanResult(
+        als_path=str(als_path), health_score=80, grade='A', total_issues=0,
+        critical_issues=0, warning_issues=0, total_devices=analysis.total_devices,
+        disabled_devices=analysis.total_disabled_devices, clutter_percentage=0.0,
+        device_analysis=analysis if with_analysis else None
+    ), db_path)
+    assert success, message
+    return version_id
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "data" / "projects.db"
+    db_init(path)
+    return path
+
+
+def test_round_trip_and_staleness(tmp_path):
+    """Snapshots load while the .als is unchanged, and after it is gone."""
+    als = build_als(tmp_path / "v1.als")
+    store = SnapshotStore(tmp_path / "snapshots")
+    analysis = analyze_als_devices(str(als))
+
+    info = store.save(7, str(als), analysis)
+    assert info.path.name == "v7.devices.snap"
+    assert store.load(7).tracks[0].track_name == "Lead 0"
+
+    # Touched but identical content: still current
+    os.utime(als, ns=(0, 10 ** 9))
+    assert store.load(7) is not None
+
+    # Different content: stale
+    build_als(als, clips_per_track=5)
+    assert store.load(7) is None
+    assert store.load(7, verify=False) is not None
+
+    # Deleted file: the snapshot is all that is left
+    als.unlink()
+    assert store.load(7) is not None
+
+
+def test_schema_mismatch_is_ignored(tmp_path, monkeypatch):
+    """Snapshots written by another analysis schema are treated as missing."""
+    import project_snapshots
+
+    als = build_als(tmp_path / "v1.als")
+    store = SnapshotStore(tmp_path / "snapshots")
+    store.save(7, str(als), analyze_als_devices(str(als)))
+    assert store.info(7) is not None
+
+    monkeypatch.setitem(project_snapshots.SNAPSHOT_SCHEMAS, 'devices', 2)
+    assert store.info(7) is None
+    assert store.load(7, verify=False) is None
+    assert store.list_snapshots() == []
+
+    # A rebuilt snapshot carries the new schema
+    store.save(7, str(als), analyze_als_devices(str(als)))
+    assert store.load(7) is not None
+
+
+def test_scan_stores_snapshot_and_diffs_use_it(tmp_path, db_path, monkeypatch):
+    """Saved scans write snapshots; change tracking then works without the files."""
+    folder = tmp_path / "song"
+    folder.mkdir()
+    before = build_als(folder / "v1.als", clips_per_track=1)
+    after = build_als(folder / "v2.als", clips_per_track=2)
+    before_id, after_id = scan(before, db_path), scan(after, db_path)
+
+    store = get_snapshot_store(db_path)
+    assert store.info(before_id) is not None and store.info(after_id) is not None
+
+    before.unlink()
+    after.unlink()
+
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("snapshot should have been used")
+    monkeypatch.setattr(device_chain_analyzer.DeviceChainAnalyzer, 'analyze', no_parsing)
+
+    success, message, count = track_changes(str(before.absolute()), str(after.absolute()), db_path)
+    assert success, message
+    assert count == 0
+    assert load_version_analysis(after_id, str(after), db_path).total_devices == 8
+
+
+def test_backfill(tmp_path, db_path):
+    """Versions scanned without snapshots are filled in once."""
+    folder = tmp_path / "song"
+    folder.mkdir()
+    ids = [scan(build_als(folder / f"v{i}.als"), db_path, with_analysis=False) for i in range(3)]
+    (folder / "v2.als").unlink()
+
+    result = backfill_snapshots(db_path, include_project=True)
+    assert (result.created, result.up_to_date, result.missing_files, result.failed) == (2, 0, 1, 0)
+
+    store = get_snapshot_store(db_path)
+    assert store.load(ids[0], 'project').tracks[0].name == "Lead 0"
+    assert backfill_snapshots(db_path).up_to_date == 2
+    assert len(store.list_snapshots()) == 4
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed analysis result cache.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from audio_analyzer import AudioAnalyzer
+from result_cache import ResultCache
+
+
+SR = 22050
+
+
+@pytest.fixture
+def mix_path(tmp_path):
+    """4s stereo tone with a kick pulse."""
+    t = np.arange(SR * 4) / SR
+    kick = 0.6 * np.sin(2 * np.pi * 55 * t) * np.exp(-(t % 0.5) * 20)
+    y = np.stack([kick + 0.1 * np.sin(2 * np.pi * 440 * t),
+                  kick + 0.1 * np.sin(2 * np.pi * 660 * t)]).astype(np.float32)
+    path = tmp_path / "mix.wav"
+    sf.write(str(path), y.T, SR)
+    return path
+
+
+def test_analyze_hit_after_miss(tmp_path, mix_path):
+    """The second analysis of an unchanged file is served from the cache."""
+    cache = ResultCache(str(tmp_path / "cache"))
+    analyzer = AudioAnalyzer(cache=cache)
+
+    first = analyzer.analyze(str(mix_path))
+    second = analyzer.analyze(str(mix_path))
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second.loudness.integrated_lufs == first.loudness.integrated_lufs
+    assert second.clipping.clip_count == first.clipping.clip_count
+
+    # Counters persist across instances sharing the directory
+    stats = ResultCache(str(tmp_path / "cache")).stats()
+    assert (stats.total_hits, stats.total_misses, stats.entries) == (1, 1, 1)
+
+
+def test_key_is_content_addressed(tmp_path, mix_path):
+    """A copy of the file hits; changed content, params or config miss."""
+    cache = ResultCache(str(tmp_path / "cache"))
+    key = cache.make_key(str(mix_path), 'AudioAnalyzer.analyze', '1.0.0')
+
+    copy = tmp_path / "renamed.wav"
+    copy.write_bytes(mix_path.read_bytes())
+    assert cache.make_key(str(copy), 'AudioAnalyzer.analyze', '1.0.0') == key
+
+    assert cache.make_key(str(mix_path), 'AudioAnalyzer.analyze', '1.0.1') != key
+    assert cache.make_key(str(mix_path), 'AudioAnalyzer.analyze', '1.0.0', streaming=True) != key
+
+    cfg = {'clipping': {'threshold': 0.99}, 'report': {'format': 'html'}}
+    cfg_key = cache.make_key(str(mix_path), 'AudioAnalyzer.analyze', '1.0.0', cfg)
+    cfg['report']['format'] = 'text'
+    assert cache.make_key(str(mix_path), 'AudioAnalyzer.analyze', '1.0.0', cfg) == cfg_key
+    cfg['clipping']['threshold'] = 0.5
+    assert cache.make_key(str(mix_path), 'AudioAnalyzer.analyze', '1.0.0', cfg) != cfg_key
+
+    data = bytearray(mix_path.read_bytes())
+    data[-1] ^= 0xFF
+    mix_path.write_bytes(bytes(data))
+    os.utime(mix_path, ns=(0, 0))
+    assert cache.make_key(str(mix_path), 'AudioAnalyzer.analyze', '1.0.0') != key
+
+
+def test_cached_result_reports_requested_path(tmp_path, mix_path):
+    """A hit through a copied file reports the copy's path."""
+    analyzer = AudioAnalyzer(cache=ResultCache(str(tmp_path / "cache")))
+    analyzer.analyze(str(mix_path))
+
+    copy = tmp_path / "copy.wav"
+    copy.write_bytes(mix_path.read_bytes())
+    result = analyzer.analyze(str(copy))
+
+    assert analyzer.cache.hits == 1
+    assert result.file_path == str(copy.absolute())
+
+
+def test_sections_cached(tmp_path, mix_path):
+    """Section results are cached separately per parameter set."""
+    cache = ResultCache(str(tmp_path / "cache"))
+    analyzer = AudioAnalyzer(cache=cache)
+
+    first = analyzer.analyze_sections(str(mix_path), min_section_length=2.0)
+    second = analyzer.analyze_sections(str(mix_path), min_section_length=2.0)
+    analyzer.analyze_sections(str(mix_path), min_section_length=1.0)
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert [s.section_type for s in second.sections] == [s.section_type for s in first.sections]
+
+
+def test_lru_eviction(tmp_path, mix_path):
+    """Entries beyond the size bound are evicted least recently used first."""
+    cache = ResultCache(str(tmp_path / "cache"), max_size_mb=2.5 / 1024)
+    payload = np.zeros(128, dtype=np.float64)     # ~1 KB pickled
+
+    cache.put('a' * 64, payload)
+    cache.put('b' * 64, payload)
+    assert cache.get('a' * 64) is not None        # 'a' is now most recent
+    cache.put('c' * 64, payload)
+
+    assert cache.get('b' * 64) is None
+    assert cache.get('a' * 64) is not None
+    assert cache.get('c' * 64) is not None
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    assert stats.size_bytes <= stats.max_bytes
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    """An unreadable payload is dropped instead of raising."""
+    cache = ResultCache(str(tmp_path / "cache"))
+    key = 'd' * 64
+    cache.put(key, {'x': 1})
+    cache._payload_path(key).write_bytes(b'not a pickle')
+
+    assert cache.get(key) is None
+    assert cache.stats().entries == 0
+
+
+def test_missing_file_raises(tmp_path):
+    """Missing files still raise FileNotFoundError with a cache configured."""
+    analyzer = AudioAnalyzer(cache=ResultCache(str(tmp_path / "cache")))
+    with pytest.raises(FileNotFoundError):
+        analyzer.analyze(str(tmp_path / "missing.wav"))
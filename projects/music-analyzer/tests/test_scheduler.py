@@ -747,6 +747,251 @@ def test_schedule_folder_missing_on_check():
     print("  ✓ Schedule folder missing on check")
 
 
+def test_next_run_at():
+    """Test next run slots match the cron slots."""
+    from scheduler import Schedule, next_run_at
+
+    # Wednesday 2025-01-15 10:30
+    now = datetime(2025, 1, 15, 10, 30)
+
+    def slot(frequency, run_at_time=None, run_on_day=None):
+        schedule = Schedule(id="s", name="S", folder_path=".", frequency=frequency,
+                            run_at_time=run_at_time, run_on_day=run_on_day)
+        return next_run_at(schedule, now)
+
+    assert slot("hourly") == datetime(2025, 1, 15, 11, 0)
+    assert slot("hourly", "03:45") == datetime(2025, 1, 15, 10, 45)
+    assert slot("daily", "03:00") == datetime(2025, 1, 16, 3, 0)
+    assert slot("daily", "22:15") == datetime(2025, 1, 15, 22, 15)
+    assert slot("weekly", "09:00", 0) == datetime(2025, 1, 20, 9, 0)
+    assert slot("weekly", "12:00", 2) == datetime(2025, 1, 15, 12, 0)
+    assert slot("weekly", "09:00", 2) == datetime(2025, 1, 22, 9, 0)
+
+    print("  ✓ Next run slots")
+
+
+def _scan_fixture(tmpdir):
+    """Database, two song folders and a schedules file in tmpdir."""
+    from database import db_init
+    from tests.als_fixtures import build_als
+
+    root = Path(tmpdir)
+    db_path = root / "data" / "projects.db"
+    db_init(db_path)
+    for name in ("Album", "Album/Singles"):
+        (root / name).mkdir(parents=True)
+        build_als(root / name / "song.als", clips_per_track=1)
+    (root / "Album" / "Backup").mkdir()
+    build_als(root / "Album" / "Backup" / "song [2024].als", clips_per_track=1)
+    return root, db_path, root / "schedules.json", root / "runs.log"
+
+
+def _add_schedules(folder, schedules_path, prefix, count):
+    """Add `count` schedules from a separate process."""
+    from scheduler import add_schedule
+
+    for i in range(count):
+        schedule, msg = add_schedule(folder, "daily", name=f"{prefix}-{i}",
+                                     schedules_path=Path(schedules_path))
+        assert schedule is not None, msg
+
+
+def test_concurrent_processes_keep_all_schedules():
+    """Test add_schedule calls from several processes do not lose updates."""
+    import multiprocessing
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        from scheduler import list_schedules
+
+        schedules_path = Path(tmpdir) / "schedules.json"
+        processes = [
+            multiprocessing.Process(target=_add_schedules,
+                                    args=(tmpdir, str(schedules_path), f"p{n}", 10))
+            for n in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        schedules, _ = list_schedules(schedules_path)
+        assert len(schedules) == 40
+        assert not list(Path(tmpdir).glob("*.tmp"))
+
+    print("  ✓ Concurrent processes keep all schedules")
+
+
+def test_run_schedule_skips_unchanged_files():
+    """Test repeated runs only analyze new and changed files."""
+    from scheduler import add_schedule, run_schedule
+    from tests.als_fixtures import build_als
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root, db_path, schedules_path, log_path = _scan_fixture(tmpdir)
+        schedule, _ = add_schedule(str(root / "Album"), "hourly", schedules_path=schedules_path)
+
+        def run(full=False):
+            result, _ = run_schedule(schedule.id, schedules_path, quiet=True,
+                                     db_path=db_path, log_path=log_path, full=full)
+            assert result.success, result.error_message
+            return (result.files_scanned, result.files_failed, result.files_skipped)
+
+        assert run() == (2, 0, 0)
+        assert run() == (0, 0, 2)
+
+        build_als(root / "Album" / "song.als", clips_per_track=3)
+        assert run() == (1, 0, 1)
+        assert run(full=True) == (2, 0, 0)
+
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 4 and "2 unchanged" in lines[1]
+
+    print("  ✓ Run schedule skips unchanged files")
+
+
+def test_full_flag_reaches_run_schedule():
+    """Test --full on the schedule commands forces a full rescan."""
+    from click.testing import CliRunner
+    import scheduler
+    import schedule_daemon    # Binds the real run_schedule before it is patched
+
+    sys.path.insert(0, str(src_path.parent))
+    import als_doctor
+
+    result = scheduler.ScheduleRunResult(schedule_id="schedule_a", schedule_name="A", success=True)
+    schedule = scheduler.Schedule(id="schedule_a", name="A", folder_path="/music",
+                                  frequency="daily")
+    database = Mock(is_initialized=Mock(return_value=True))
+
+    with patch.object(scheduler, "run_schedule", return_value=(result, "")) as run, \
+            patch.object(scheduler, "get_schedule_by_id", return_value=(schedule, "")), \
+            patch.object(scheduler, "check_due_schedules", return_value=[schedule]), \
+            patch.object(schedule_daemon, "is_daemon_running", return_value=False), \
+            patch.object(als_doctor, "get_db", return_value=database):
+        runner = CliRunner()
+        for args in (["schedule", "run", "schedule_a"], ["schedule", "run-due"]):
+            for full in (False, True):
+                outcome = runner.invoke(als_doctor.cli, ["--no-color"] + args
+                                        + (["--full"] if full else []))
+                assert outcome.exit_code == 0, outcome.output
+                assert run.call_args.kwargs["full"] is full
+
+    print("  ✓ --full reaches run_schedule")
+
+
+def test_daemon_runs_due_schedules():
+    """Test the daemon runs due schedules and queues their next slot."""
+    from scheduler import add_schedule, next_run_at
+    from schedule_daemon import ScheduleDaemon, is_daemon_running
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root, db_path, schedules_path, log_path = _scan_fixture(tmpdir)
+        state_path = root / "daemon.json"
+        schedule, _ = add_schedule(str(root / "Album"), "daily", run_at_time="03:00",
+                                   schedules_path=schedules_path)
+
+        daemon = ScheduleDaemon(schedules_path, db_path, log_path, state_path)
+        daemon.start()
+        try:
+            assert is_daemon_running(state_path)
+            assert daemon.tick() == [schedule.id]
+            assert daemon.wait_idle(timeout=30)
+
+            run = daemon.history[-1]
+            assert run.result.success and run.result.files_scanned == 2
+            assert "Album" in log_path.read_text()
+
+            # Next slot is tomorrow's 03:00; the run's own schedules.json update changes nothing
+            when, queued = daemon.queued()[0]
+            assert queued.id == schedule.id
+            assert when == next_run_at(queued, run.started_at)
+            assert daemon.tick() == []
+
+            # Disabling the schedule drops it from the queue
+            from scheduler import enable_schedule
+            enable_schedule(schedule.id, enabled=False, schedules_path=schedules_path)
+            daemon.reload(force=True)
+            assert daemon.queued() == []
+        finally:
+            daemon.shutdown()
+
+        assert not is_daemon_running(state_path)
+
+    print("  ✓ Daemon runs due schedules")
+
+
+def test_daemon_serializes_overlapping_folders():
+    """Test schedules over overlapping folders never run together."""
+    from scheduler import add_schedule
+    from schedule_daemon import ScheduleDaemon
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root, db_path, schedules_path, log_path = _scan_fixture(tmpdir)
+        album, _ = add_schedule(str(root / "Album"), "hourly", schedules_path=schedules_path)
+        singles, _ = add_schedule(str(root / "Album" / "Singles"), "hourly", name="Singles",
+                                  schedules_path=schedules_path)
+
+        daemon = ScheduleDaemon(schedules_path, db_path, log_path, root / "daemon.json",
+                                max_concurrent=2)
+        daemon.start()
+        try:
+            assert daemon.tick() == [album.id]
+            assert daemon.wait_idle(timeout=30)
+            assert daemon.tick() == [singles.id]
+            assert daemon.wait_idle(timeout=30)
+        finally:
+            daemon.shutdown()
+
+        # The shared manifest already covered the Singles song in the Album run
+        results = [run.result for run in daemon.history]
+        assert [(r.files_scanned, r.files_skipped) for r in results] == [(2, 0), (0, 1)]
+
+    print("  ✓ Daemon serializes overlapping folders")
+
+
+def test_daemon_sleeps_while_due_schedule_is_blocked():
+    """Test a due schedule blocked by a running one does not spin the loop."""
+    import threading
+    import time
+    import schedule_daemon
+    from scheduler import add_schedule, ScheduleRunResult
+    from schedule_daemon import ScheduleDaemon
+
+    def slow_run(schedule_id, *args, **kwargs):
+        time.sleep(1.0)
+        return ScheduleRunResult(schedule_id, "", success=True), "ok"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        schedules_path = root / "schedules.json"
+        first, _ = add_schedule(str(root), "daily", name="First", schedules_path=schedules_path)
+        second, _ = add_schedule(str(root), "daily", name="Second", schedules_path=schedules_path)
+
+        daemon = ScheduleDaemon(schedules_path, state_path=root / "daemon.json",
+                                max_concurrent=1, tick_seconds=5.0)
+        ticks = []
+        tick = daemon.tick
+        daemon.tick = lambda now=None: ticks.append(now) or tick(now)
+
+        with patch.object(schedule_daemon, "run_schedule", slow_run):
+            thread = threading.Thread(target=daemon.run_forever)
+            thread.start()
+            try:
+                deadline = time.monotonic() + 10
+                while len(daemon.history) < 2 and time.monotonic() < deadline:
+                    time.sleep(0.05)
+            finally:
+                daemon.stop()
+                thread.join(timeout=10)
+
+        assert [run.schedule_id for run in daemon.history] == [first.id, second.id]
+        # One tick to start each run and one as each run ends, not a busy loop
+        assert len(ticks) <= 5
+
+    print("  ✓ Daemon sleeps while a due schedule is blocked")
+
+
 def run_all_tests():
     """Run all scheduler tests."""
     print("=" * 60)
@@ -785,6 +1030,13 @@ def run_all_tests():
         test_log_run,
         test_schedule_with_time_options,
         test_schedule_folder_missing_on_check,
+        test_next_run_at,
+        test_concurrent_processes_keep_all_schedules,
+        test_run_schedule_skips_unchanged_files,
+        test_full_flag_reaches_run_schedule,
+        test_daemon_runs_due_schedules,
+        test_daemon_serializes_overlapping_folders,
+        test_daemon_sleeps_while_due_schedule_is_blocked,
     ]
 
     passed = 0
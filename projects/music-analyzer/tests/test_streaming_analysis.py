@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for bounded-memory streaming analysis.
+
+The streaming path must agree with the in-memory AnalysisContext /
+AudioAnalyzer path within the tolerances documented in
+streaming_analysis, independent of block size.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import librosa
+import soundfile as sf
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from analysis_context import AnalysisContext
+from audio_analyzer import AudioAnalyzer
+from loudness_meter import measure_loudness
+from streaming_analysis import StreamingFeatures
+
+
+SR = 22050
+
+
+@pytest.fixture(scope="module")
+def mix_path(tmp_path_factory):
+    """12s stereo loop: kick + hats, a pad entering at 6s, and a clipped burst."""
+    rng = np.random.default_rng(0)
+    t = np.arange(SR * 12) / SR
+    kick = 0.8 * np.sin(2 * np.pi * 55 * t) * np.exp(-(t % 0.4667) * 20)
+    hats = rng.normal(0, 0.05, len(t)) * ((t % 0.2333) < 0.02)
+    pad = 0.2 * (t > 6)
+    left = kick + hats + pad * np.sin(2 * np.pi * 440 * t)
+    right = kick + 0.5 * hats + pad * np.sin(2 * np.pi * 660 * t)
+    left[SR * 8:SR * 8 + 200] *= 2.0
+    y = np.stack([left, right]).clip(-1, 1).astype(np.float32)
+
+    path = tmp_path_factory.mktemp("streaming") / "mix.wav"
+    sf.write(str(path), y.T, SR, subtype='FLOAT')
+    return str(path)
+
+
+@pytest.mark.parametrize("block_seconds", [0.25, 5.0])
+def test_features_match_in_memory(mix_path, block_seconds):
+    """Levels, correlation and frame features match the full-buffer computation."""
+    ctx = AnalysisContext.from_file(mix_path)
+    features = StreamingFeatures.from_file(mix_path, block_seconds=block_seconds)
+
+    assert features.n_samples == ctx.y.shape[1]
+    assert features.max_peak == pytest.approx(float(np.abs(ctx.y).max()))
+    assert features.mono_rms == pytest.approx(float(np.sqrt(np.mean(ctx.mono ** 2))), rel=1e-5)
+    assert features.correlation == pytest.approx(float(np.corrcoef(ctx.y)[0, 1]), abs=1e-6)
+    assert features.clip_count == int((np.abs(ctx.y).max(axis=0) >= 0.99).sum())
+
+    assert np.allclose(features.spectral_centroid, ctx.spectral_centroid(), rtol=1e-4)
+    assert np.allclose(features.rms, librosa.feature.rms(y=ctx.mono)[0], rtol=1e-4, atol=1e-7)
+    bin_power = np.mean(ctx.magnitude(4096) ** 2, axis=1)
+    assert np.allclose(features.bin_power, bin_power, rtol=1e-3, atol=1e-6 * bin_power.max())
+
+    # Onset envelope: same framing, 80 dB floor from the running maximum
+    onset = ctx.onset_envelope()
+    assert len(features.onset_envelope) == len(onset)
+    assert np.corrcoef(features.onset_envelope, onset)[0, 1] > 0.99
+
+
+def test_loudness_matches_in_memory(mix_path):
+    """The streamed meter gives the same BS.1770 result as the whole-buffer one."""
+    ctx = AnalysisContext.from_file(mix_path)
+    features = StreamingFeatures.from_file(mix_path, block_seconds=1.0)
+    expected = measure_loudness(ctx.audio_data, SR)
+
+    assert features.loudness.integrated_lufs == pytest.approx(expected.integrated_lufs, abs=1e-6)
+    assert features.loudness.loudness_range_lu == pytest.approx(expected.loudness_range_lu, abs=1e-6)
+    assert features.loudness.true_peak_db == pytest.approx(expected.true_peak_db, abs=1e-6)
+
+
+def test_analyze_streaming_matches(mix_path):
+    """AudioAnalyzer.analyze(streaming=True) reproduces the core metrics."""
+    analyzer = AudioAnalyzer()
+    full = analyzer.analyze(mix_path)
+    streamed = analyzer.analyze(mix_path, streaming=True)
+
+    assert streamed.channels == full.channels
+    assert streamed.duration_seconds == pytest.approx(full.duration_seconds)
+    assert streamed.clipping.clip_count == full.clipping.clip_count
+    assert streamed.clipping.clip_positions == pytest.approx(full.clipping.clip_positions)
+    assert streamed.dynamics.crest_factor_db == pytest.approx(full.dynamics.crest_factor_db, abs=0.01)
+    assert streamed.stereo.correlation == pytest.approx(full.stereo.correlation, abs=1e-6)
+    assert streamed.frequency.bass_energy == pytest.approx(full.frequency.bass_energy, abs=0.01)
+    assert streamed.frequency.spectral_centroid_hz == pytest.approx(full.frequency.spectral_centroid_hz, rel=1e-4)
+    assert streamed.loudness.integrated_lufs == pytest.approx(full.loudness.integrated_lufs, abs=1e-6)
+    assert streamed.loudness.true_peak_db == pytest.approx(full.loudness.true_peak_db, abs=1e-6)
+    assert streamed.detected_tempo == pytest.approx(full.detected_tempo, abs=1.0)
+
+
+def test_sections_streaming_matches(mix_path):
+    """Streaming sections find the same boundaries, types and issues."""
+    analyzer = AudioAnalyzer()
+    full = analyzer.analyze_sections(mix_path, min_section_length=3.0)
+    streamed = analyzer.analyze_sections(mix_path, min_section_length=3.0, streaming=True)
+
+    assert len(streamed.sections) == len(full.sections)
+    for a, b in zip(full.sections, streamed.sections):
+        assert b.section_type == a.section_type
+        assert b.start_time == pytest.approx(a.start_time)
+        assert b.avg_rms_db == pytest.approx(a.avg_rms_db, abs=0.1)
+        assert b.peak_db == pytest.approx(a.peak_db, abs=0.1)
+        assert [i.issue_type for i in b.issues] == [i.issue_type for i in a.issues]
+
+
+def test_sections_share_context(mix_path):
+    """Sections reuse one full-track STFT from a shared context."""
+    analyzer = AudioAnalyzer()
+    ctx = AnalysisContext.from_file(mix_path)
+    shared = analyzer.analyze_sections(mix_path, min_section_length=3.0, context=ctx)
+    solo = analyzer.analyze_sections(mix_path, min_section_length=3.0)
+
+    assert list(ctx._magnitudes) == [(2048, 512)]
+    assert [s.section_type for s in shared.sections] == [s.section_type for s in solo.sections]
+    assert [s.avg_rms_db for s in shared.sections] == [s.avg_rms_db for s in solo.sections]
+
+
+def test_streaming_missing_file():
+    """Missing files raise FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        StreamingFeatures.from_file("/nonexistent/file.wav")
@@ -605,6 +605,184 @@ def test_folder_watcher_double_start():
     print("  ✓ FolderWatcher double start handling")
 
 
+def test_debounced_queue_wait_ready():
+    """wait_ready sleeps until the debounce deadline and wakes on close."""
+    from watcher import DebouncedQueue, WatchEvent
+
+    queue = DebouncedQueue(debounce_seconds=0.1)
+    assert queue.wait_ready(timeout=0.05) == []
+
+    first = datetime.now()
+    queue.add_event(WatchEvent(file_path="/test/file.als", event_type="modified", timestamp=first))
+    queue.add_event(WatchEvent(file_path="/test/file.als", event_type="modified"))
+
+    start = time.monotonic()
+    ready = queue.wait_ready(timeout=2.0)
+    assert 0.05 < time.monotonic() - start < 1.0
+    assert len(ready) == 1 and ready[0].first_seen == first
+    assert queue.coalesced_count == 1
+
+    waiter = threading.Thread(target=queue.wait_ready)
+    waiter.start()
+    queue.close()
+    waiter.join(timeout=2.0)
+    assert not waiter.is_alive()
+
+    print("  ✓ DebouncedQueue wait_ready")
+
+
+def _pipeline_watcher(tmpdir, analyze, **kwargs):
+    """FolderWatcher whose analysis is replaced by analyze(event) -> WatchResult."""
+    from watcher import FolderWatcher
+
+    watcher = FolderWatcher(
+        folder_path=tmpdir, debounce_seconds=0.05, quiet=True, save_to_db=False,
+        log_path=str(Path(tmpdir) / "watch.log"), **kwargs
+    )
+    watcher._analyze = lambda event: (analyze(event), None)
+    watcher.start(blocking=False)
+    return watcher
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_folder_watcher_pipeline_runs_files_concurrently():
+    """Different files are analyzed in parallel, one file never twice at once."""
+    from watcher import WatchEvent, WatchResult
+
+    lock = threading.Lock()
+    running, peak, runs = set(), [0], []
+
+    def analyze(event):
+        with lock:
+            assert event.file_path not in running
+            running.add(event.file_path)
+            peak[0] = max(peak[0], len(running))
+            runs.append(event.file_path)
+        time.sleep(0.2)
+        with lock:
+            running.discard(event.file_path)
+        return WatchResult(file_path=event.file_path, success=True, health_score=90, grade="A", total_issues=0)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        notified = []
+        watcher = _pipeline_watcher(tmpdir, analyze, workers=3, on_result=notified.append)
+        try:
+            queue = watcher._event_handler.queue
+            for name in ("a.als", "b.als", "c.als"):
+                queue.add_event(WatchEvent(file_path=f"/test/{name}", event_type="modified"))
+
+            # a.als changes again while it is being analyzed
+            assert _wait_for(lambda: "/test/a.als" in running)
+            queue.add_event(WatchEvent(file_path="/test/a.als", event_type="modified"))
+
+            assert _wait_for(lambda: len(notified) == 4)
+        finally:
+            stats = watcher.stop()
+
+        assert peak[0] == 3
+        assert sorted(runs) == ["/test/a.als", "/test/a.als", "/test/b.als", "/test/c.als"]
+        assert stats.files_analyzed == 4 and stats.in_flight == 0
+        assert len(stats.latencies) == 4
+        assert 0.2 <= stats.latency_p50 <= stats.latency_p99 < 5.0
+        assert "OK | a.als" in (Path(tmpdir) / "watch.log").read_text()
+
+    print("  ✓ FolderWatcher pipeline concurrency")
+
+
+def test_folder_watcher_backpressure():
+    """A full work queue holds the dispatcher back until workers catch up."""
+    from watcher import WatchEvent, WatchResult
+
+    release = threading.Event()
+
+    def analyze(event):
+        release.wait(timeout=5.0)
+        return WatchResult(file_path=event.file_path, success=True, health_score=50, grade="C", total_issues=2)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        watcher = _pipeline_watcher(tmpdir, analyze, workers=1, max_queue=1)
+        try:
+            queue = watcher._event_handler.queue
+            for i in range(4):
+                queue.add_event(WatchEvent(file_path=f"/test/song{i}.als", event_type="modified"))
+
+            # One file analyzing, one queued, the dispatcher blocked on the third
+            assert _wait_for(lambda: watcher.stats.backpressure_waits >= 1)
+            assert _wait_for(lambda: (watcher.stats.in_flight, watcher.stats.queue_depth) == (1, 1))
+            time.sleep(0.1)
+            assert watcher.stats.files_analyzed == 0 and watcher.stats.pending_events == 0
+
+            release.set()
+            assert _wait_for(lambda: watcher.stats.files_analyzed == 4)
+        finally:
+            release.set()
+            stats = watcher.stop()
+
+        assert stats.max_queue_depth == 1
+
+    print("  ✓ FolderWatcher backpressure")
+
+
+def test_process_workers_invalidate_their_als_cache():
+    """Process workers re-read a file rewritten with the same size and mtime."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from watcher import FolderWatcher, WatchEvent
+
+    sys.path.insert(0, str(src_path.parent))
+    from tests.als_fixtures import build_als
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        als_path = build_als(Path(tmpdir) / "song.als", gzipped=False)
+        watcher = FolderWatcher(folder_path=tmpdir, quiet=True, save_to_db=False,
+                                log_path=str(Path(tmpdir) / "watch.log"), executor='process')
+        watcher._process_pool = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context('spawn')
+        )
+        try:
+            event = WatchEvent(file_path=str(als_path), event_type="modified")
+            _, before = watcher._analyze(event)
+
+            # Enable the plugins without changing size or mtime
+            stat = als_path.stat()
+            data = als_path.read_bytes().replace(b'Value="false"/></On><PluginDesc>',
+                                                 b'Value="true" /></On><PluginDesc>')
+            als_path.write_bytes(data)
+            os.utime(als_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert als_path.stat().st_size == stat.st_size
+
+            _, after = watcher._analyze(event)
+        finally:
+            watcher._process_pool.shutdown()
+
+        assert before.disabled_devices > 0
+        assert after.disabled_devices == 0
+
+    print("  ✓ Process workers invalidate their .als cache")
+
+
+def test_watch_stats_latency_percentiles():
+    """Nearest-rank percentiles over the recorded latencies."""
+    from watcher import WatchStats
+
+    stats = WatchStats(started_at=datetime.now(), folder_path="/test")
+    assert stats.latency_p50 is None
+
+    stats.latencies.extend(float(i) for i in range(1, 101))
+    assert stats.latency_p50 == 50.0
+    assert stats.latency_p95 == 95.0
+    assert stats.latency_percentile(100) == 100.0
+    assert stats.latency_percentile(0) == 1.0
+
+    print("  ✓ WatchStats latency percentiles")
+
+
 def run_all_tests():
     """Run all watcher tests."""
     print("=" * 60)
@@ -636,6 +814,11 @@ def run_all_tests():
         test_folder_watcher_log_file_creation,
         test_watch_stats_uptime_formatting,
         test_folder_watcher_double_start,
+        test_debounced_queue_wait_ready,
+        test_folder_watcher_pipeline_runs_files_concurrently,
+        test_folder_watcher_backpressure,
+        test_process_workers_invalidate_their_als_cache,
+        test_watch_stats_latency_percentiles,
     ]
 
     passed = 0
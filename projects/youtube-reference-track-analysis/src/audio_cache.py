@@ -0,0 +1,39 @@
+"""
+Audio Loading Module
+
+Decodes audio through the music-analyzer PCM cache, so a track is decoded
+(and resampled) once per sample rate and later loads are memory-mapped.
+Returned arrays are read-only.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Add music-analyzer src to the end of the path for the shared PCM cache, so
+# its modules (e.g. database) never shadow this project's
+music_analyzer_path = Path(__file__).parent.parent.parent / "music-analyzer" / "src"
+if str(music_analyzer_path) not in sys.path:
+    sys.path.append(str(music_analyzer_path))
+
+
+def load_audio(
+    audio_path,
+    sr: Optional[int] = 22050,
+    mono: bool = True,
+    offset: float = 0.0,
+    duration: Optional[float] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    Drop-in replacement for librosa.load backed by the PCM cache.
+
+    Falls back to librosa.load if the music-analyzer project is not present.
+    """
+    try:
+        from pcm_cache import load_audio as cached_load
+    except ImportError:
+        import librosa
+        return librosa.load(str(audio_path), sr=sr, mono=mono, offset=offset, duration=duration)
+    return cached_load(str(audio_path), sr=sr, mono=mono, offset=offset, duration=duration)
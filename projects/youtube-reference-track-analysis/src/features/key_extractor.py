@@ -9,6 +9,11 @@ from pathlib import Path
 from typing import Optional, List, Tuple
 import numpy as np
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 
 @dataclass
 class KeyFeatures:
@@ -163,7 +168,7 @@ def extract_key(audio_path: Path, use_edma: bool = True) -> Optional[KeyFeatures
 
     try:
         # Load audio
-        y, sr = librosa.load(str(audio_path), sr=22050, mono=True)
+        y, sr = load_audio(str(audio_path), sr=22050, mono=True)
 
         # Extract chroma features
         chroma = librosa.feature.chroma_cqt(y=y, sr=sr)
@@ -265,7 +270,7 @@ def extract_key_over_time(
 
     try:
         # Load full audio
-        y, sr = librosa.load(str(audio_path), sr=22050, mono=True)
+        y, sr = load_audio(str(audio_path), sr=22050, mono=True)
         segment_samples = int(segment_duration * sr)
 
         results = []
@@ -11,6 +11,11 @@ from pathlib import Path
 from typing import Optional, List, Tuple
 import numpy as np
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 
 @dataclass
 class LoudnessFeatures:
@@ -45,7 +50,7 @@ def load_audio_for_loudness(audio_path: Path) -> Tuple[np.ndarray, int]:
 
     # Load with librosa (handles M4A via audioread)
     # Use sr=None to preserve original sample rate
-    audio, sr = librosa.load(str(audio_path), sr=None, mono=False)
+    audio, sr = load_audio(str(audio_path), sr=None, mono=False)
 
     # librosa returns (channels, samples) or (samples,) for mono
     # pyloudnorm expects (samples, channels) or (samples,)
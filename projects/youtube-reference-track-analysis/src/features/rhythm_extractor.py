@@ -10,6 +10,11 @@ from pathlib import Path
 from typing import Optional, List, Tuple
 import numpy as np
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 
 @dataclass
 class RhythmFeatures:
@@ -46,7 +51,7 @@ def extract_rhythm(audio_path: Path) -> Optional[RhythmFeatures]:
 
     try:
         # Load audio (mono, 22050 Hz default for librosa)
-        y, sr = librosa.load(str(audio_path), sr=22050, mono=True)
+        y, sr = load_audio(str(audio_path), sr=22050, mono=True)
 
         # Get tempo and beat frames
         tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr)
@@ -11,6 +11,11 @@ from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 import numpy as np
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 
 @dataclass
 class SpectralFeatures:
@@ -70,7 +75,7 @@ def extract_spectral_features(audio_path: Path) -> Optional[SpectralFeatures]:
 
     try:
         # Load audio (mono for spectral analysis)
-        y, sr = librosa.load(str(audio_path), sr=44100, mono=True)
+        y, sr = load_audio(str(audio_path), sr=44100, mono=True)
 
         # Compute STFT
         n_fft = 2048
@@ -281,7 +286,7 @@ def get_spectral_profile_over_time(
         return []
 
     try:
-        y, sr = librosa.load(str(audio_path), sr=44100, mono=True)
+        y, sr = load_audio(str(audio_path), sr=44100, mono=True)
 
         segment_samples = int(segment_duration * sr)
         results = []
@@ -11,6 +11,11 @@ from pathlib import Path
 from typing import Optional, List, Tuple
 import numpy as np
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 
 @dataclass
 class StereoFeatures:
@@ -55,7 +60,7 @@ def load_stereo_audio(audio_path: Path) -> Tuple[np.ndarray, int]:
 
     # Load with librosa (handles M4A via audioread)
     # mono=False to preserve stereo
-    audio, sr = librosa.load(str(audio_path), sr=None, mono=False)
+    audio, sr = load_audio(str(audio_path), sr=None, mono=False)
 
     # librosa returns (channels, samples) for stereo, (samples,) for mono
     if audio.ndim == 1:
@@ -32,6 +32,11 @@ sys.path.insert(0, str(db_path))
 
 from database import YTStem
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 
 # Formats that soundfile (libsndfile) can handle natively
 NATIVE_FORMATS = {'.wav', '.flac', '.ogg', '.aiff'}
@@ -203,7 +208,7 @@ def analyze_stem(stem_path: Path, stem_type: str) -> Optional[StemFeatures]:
 
     try:
         # Load audio
-        y, sr = librosa.load(str(stem_path), sr=22050, mono=True)
+        y, sr = load_audio(str(stem_path), sr=22050, mono=True)
 
         # Calculate metrics
         # Peak dB
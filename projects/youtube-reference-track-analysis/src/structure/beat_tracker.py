@@ -10,6 +10,11 @@ from pathlib import Path
 from typing import Optional, List, Tuple
 import numpy as np
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 
 @dataclass
 class BeatInfo:
@@ -50,7 +55,7 @@ def track_beats(
 
     try:
         # Load audio
-        y, sr = librosa.load(str(audio_path), sr=22050, mono=True)
+        y, sr = load_audio(str(audio_path), sr=22050, mono=True)
 
         # Set tempo prior if hint provided
         prior = None
@@ -190,7 +195,7 @@ def estimate_downbeats_with_energy(
 
     try:
         # Load audio
-        y, sr = librosa.load(str(audio_path), sr=22050, mono=True)
+        y, sr = load_audio(str(audio_path), sr=22050, mono=True)
 
         # Get energy at each beat
         beat_energies = []
@@ -13,6 +13,11 @@ from pathlib import Path
 from typing import Optional, List, Tuple
 import numpy as np
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 
 @dataclass
 class EnergyProfile:
@@ -62,7 +67,7 @@ def extract_energy_profile(
 
     try:
         # Load audio
-        y, sr = librosa.load(str(audio_path), sr=22050, mono=True)
+        y, sr = load_audio(str(audio_path), sr=22050, mono=True)
         duration = len(y) / sr
 
         # Design filters for frequency bands
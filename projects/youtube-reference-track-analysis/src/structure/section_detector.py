@@ -13,6 +13,11 @@ from pathlib import Path
 from typing import Optional, List, Tuple
 import numpy as np
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 # Add shared module to path
 _shared_path = Path(__file__).parents[4] / "shared"
 if str(_shared_path) not in sys.path:
@@ -263,7 +268,7 @@ def detect_sections_librosa_fallback(
 
     try:
         # Load audio
-        y, sr = librosa.load(str(audio_path), sr=22050, mono=True)
+        y, sr = load_audio(str(audio_path), sr=22050, mono=True)
         duration = len(y) / sr
 
         # Compute novelty function (spectral flux)
@@ -389,7 +394,7 @@ def identify_buildup_sections(
 
     try:
         # Load audio for energy analysis
-        y, sr = librosa.load(str(audio_path), sr=22050, mono=True)
+        y, sr = load_audio(str(audio_path), sr=22050, mono=True)
 
         # Calculate energy for each section
         energies = []
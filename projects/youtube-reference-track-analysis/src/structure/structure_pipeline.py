@@ -18,6 +18,11 @@ from .bar_mapper import (
     quantize_sections_to_bars
 )
 
+try:
+    from ..audio_cache import load_audio
+except ImportError:
+    from audio_cache import load_audio
+
 
 @dataclass
 class StructureFeatures:
@@ -126,7 +131,7 @@ def extract_structure(
         # Try to get duration from audio file
         try:
             import librosa
-            y, sr = librosa.load(str(audio_path), sr=22050, mono=True, duration=5)
+            y, sr = load_audio(str(audio_path), sr=22050, mono=True, duration=5)
             duration = librosa.get_duration(y=y, sr=sr) * (len(y) / (5 * sr))  # Estimate
         except Exception:
             duration = 0